@@ -8,6 +8,7 @@ from sse_starlette.sse import EventSourceResponse
 from typing import List
 from uuid import UUID
 
+from app.core.metrics import track_sse
 from app.db.database import get_db
 from app.models.schemas import AgentCreate, AgentUpdate, AgentResponse, PreviewRequest
 from app.services import agent_crud
@@ -211,4 +212,4 @@ Present your opening argument for this position. Be persuasive, logical, and str
                 "data": json.dumps({"error": str(e)})
             }
 
-    return EventSourceResponse(event_generator())
+    return EventSourceResponse(track_sse(event_generator(), "preview"))
@@ -1,12 +1,13 @@
 """
 Debate API Endpoints
 """
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, Query, status, Depends
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from typing import List
+from typing import List, Optional
 
+from app.core.config import settings
 from app.db.database import get_db
 from app.models.schemas import (
     DebateStartRequest, DebateStartResponse,
@@ -14,10 +15,12 @@ from app.models.schemas import (
 )
 from app.services.run_crud import (
     create_run, get_run_with_agents, update_run_status,
-    get_all_runs, get_run_by_id, get_turns_by_run_id
+    get_all_runs, get_run_by_id, get_turns_by_run_id, swapped_run_kwargs
 )
-from app.services import agent_crud, run_crud
+from app.services import agent_crud, bias, run_crud
+from app.services.residency import residency
 from app.graph.executor import execute_debate_with_streaming
+from app.graph.scoring import get_parse_stats
 
 router = APIRouter()
 
@@ -34,6 +37,14 @@ Start a new debate between two agents with a judge.
 - All three agents (A, B, Judge) must exist
 - Positions must be opposite (one FOR, one AGAINST)
 
+The run's models are loaded in the background right away
+(`OLLAMA_WARMUP_ON_START`), so the first phase does not pay the model load time.
+
+**Judge panel:** `agent_j_id` may be a list of judges. Every scoring and
+verdict call then goes to all judges concurrently and their scores are
+combined per criterion (`config.panel_aggregation`: `mean`, `median` or
+`trimmed_mean`); the first judge is the primary judge.
+
 **Returns:**
 - `run_id` - UUID of the created debate run
 - `stream_url` - SSE endpoint to stream the debate execution
@@ -58,7 +69,7 @@ async def start_debate(
     # Validate agents exist
     agent_a = await agent_crud.get_agent_by_id(db, debate_config.agent_a_id)
     agent_b = await agent_crud.get_agent_by_id(db, debate_config.agent_b_id)
-    agent_j = await agent_crud.get_agent_by_id(db, debate_config.agent_j_id)
+    judge_ids = debate_config.judge_ids
 
     if not agent_a:
         raise HTTPException(
@@ -70,11 +81,20 @@ async def start_debate(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Agent B with ID {debate_config.agent_b_id} not found"
         )
-    if not agent_j:
+    if not judge_ids:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Judge agent with ID {debate_config.agent_j_id} not found"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="At least one judge agent is required"
         )
+    judge_models = []
+    for judge_id in judge_ids:
+        judge = await agent_crud.get_agent_by_id(db, judge_id)
+        if not judge:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Judge agent with ID {judge_id} not found"
+            )
+        judge_models.append(judge.model)
 
     # Validate positions are opposite
     if debate_config.position_a == debate_config.position_b:
@@ -83,19 +103,28 @@ async def start_debate(
             detail="Agent A and Agent B must have opposite positions (one FOR, one AGAINST)"
         )
 
+    # A judge panel is kept in the config; agent_j_id is the primary judge
+    config = debate_config.config
+    if len(judge_ids) > 1:
+        config = {**(config or {}), "judge_panel": [str(judge_id) for judge_id in judge_ids]}
+
     # Create run
     run = await create_run(
         db=db,
         topic=debate_config.topic,
         agent_a_id=debate_config.agent_a_id,
         agent_b_id=debate_config.agent_b_id,
-        agent_j_id=debate_config.agent_j_id,
+        agent_j_id=judge_ids[0],
         position_a=debate_config.position_a,
         position_b=debate_config.position_b,
-        config=debate_config.config,
+        config=config,
         rubric=debate_config.rubric
     )
 
+    # Load the run's models while the client connects to the stream
+    if settings.OLLAMA_WARMUP_ON_START:
+        residency.warm([agent_a.model, agent_b.model, *judge_models])
+
     return DebateStartResponse(
         run_id=str(run.run_id),
         status="pending",
@@ -112,9 +141,11 @@ Execute and stream a debate via Server-Sent Events (SSE).
 **SSE Event Types:**
 | Event | Description |
 |-------|-------------|
+| `plan` | Execution plan built from the run config (nodes, dependencies, parallel groups) |
 | `phase_start` | New phase begins (opening, rebuttal, summary, verdict) |
 | `token` | Individual token from LLM generation |
-| `score` | Scoring results after debate phase |
+| `violation` | Forbidden phrase generated (when `forbidden_phrase_enforcement` is `flag` or `regenerate`) |
+| `score` | Scoring results after debate phase (`partial: true` while streaming) |
 | `phase_end` | Phase completed |
 | `verdict` | Final judgment with winner |
 | `run_complete` | Debate finished successfully |
@@ -134,8 +165,10 @@ async def stream_debate(
     Stream debate execution via Server-Sent Events (SSE).
 
     Executes the complete debate graph and streams real-time events:
+    - plan: Execution plan built from the run config
     - phase_start: When a new phase begins
     - token: Individual tokens as they're generated (for debater arguments)
+    - violation: Forbidden phrase detected while a debater turn streams
     - score: Scoring results after each phase
     - phase_end: When a phase completes
     - verdict: Final verdict and winner announcement
@@ -227,7 +260,8 @@ async def get_run(run_id: UUID, db: AsyncSession = Depends(get_db)):
         result_json=run.result_json,
         status=run.status,
         created_at=run.created_at,
-        finished_at=run.finished_at
+        finished_at=run.finished_at,
+        swap_of_run_id=run.swap_of_run_id
     )
 
 
@@ -265,6 +299,24 @@ async def get_run_turns(run_id: UUID, db: AsyncSession = Depends(get_db)):
     return turns
 
 
+@router.get(
+    "/runs/{run_id}/swaps",
+    response_model=List[RunResponse],
+    summary="List swap tests of a run",
+    description="Runs created as position-swapped copies of this run (swap tests or tournament swaps), oldest first.",
+)
+async def get_run_swaps(run_id: UUID, db: AsyncSession = Depends(get_db)):
+    """Get the swap tests created from a run."""
+    run = await get_run_by_id(db, run_id)
+    if not run:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Run {run_id} not found"
+        )
+
+    return await run_crud.get_swap_runs(db, run_id)
+
+
 @router.delete(
     "/runs/{run_id}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -329,17 +381,7 @@ async def create_swap_test(
         )
 
     # Create swapped run: Agent A ↔ B, Position A ↔ B
-    swapped = await create_run(
-        db=db,
-        topic=original.topic,
-        agent_a_id=original.agent_b_id,    # B → A
-        agent_b_id=original.agent_a_id,    # A → B
-        agent_j_id=original.agent_j_id,    # Judge unchanged
-        position_a=original.position_b,    # B's position → A
-        position_b=original.position_a,    # A's position → B
-        config=original.config_json,
-        rubric=original.rubric_json
-    )
+    swapped = await create_run(db=db, **swapped_run_kwargs(original))
 
     return DebateStartResponse(
         run_id=str(swapped.run_id),
@@ -475,3 +517,52 @@ async def compare_swap_test(
         },
         "analysis": analysis
     }
+
+
+@router.get(
+    "/bias/report",
+    summary="Batch position-bias report",
+    description="""
+Position-bias audit over all completed runs of a judge, judge model or topic
+set, computed from one query over the runs' score columns.
+
+Swap pairs (a run and its swap test, linked by `swap_of_run_id`) are joined
+by primary key. Because the agents keep their sides when swapped, a pair
+isolates the A/B slot:
+
+| Field | Meaning |
+|-------|---------|
+| `position_win_rate` | Win rate of slot A and B over decisive runs (Wilson 95% CI) |
+| `side_win_rate` | Win rate of FOR and AGAINST over decisive runs (Wilson 95% CI) |
+| `pairs.position_bias_rate` | Share of decisive pairs where the same slot won both runs |
+| `score_delta.a_minus_b_paired` | Mean A−B total per pair (agent skill cancels), 95% CI |
+| `score_delta.for_minus_against` | Mean FOR−AGAINST total per run, 95% CI |
+    """,
+)
+async def get_bias_report(
+    judge_id: Optional[UUID] = Query(None, description="Only runs judged by this agent"),
+    model: Optional[str] = Query(None, description="Only runs judged by agents using this model"),
+    topic: Optional[List[str]] = Query(None, description="Only runs on these topics (repeatable)"),
+    db: AsyncSession = Depends(get_db)
+):
+    """Compute position win rates, pair outcomes and score deltas."""
+    return await bias.position_bias_report(db, judge_id=judge_id, model=model, topics=topic)
+
+
+@router.get(
+    "/scoring/stats",
+    summary="Judge scoring parse statistics",
+    description="""
+Parse outcomes of judge score replies per judge model and stage since the
+worker started.
+
+| Outcome | Meaning |
+|---------|---------|
+| `ok` | Valid on the first reply |
+| `repaired` | Valid after the single repair request |
+| `failed` | Still invalid; default scores were used (`parse_failed` in turn scores) |
+    """,
+)
+async def get_scoring_stats():
+    """Get judge score parse outcomes and failure rates."""
+    return {"stats": get_parse_stats()}
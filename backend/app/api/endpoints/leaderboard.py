@@ -0,0 +1,40 @@
+"""
+Leaderboard API Endpoints
+"""
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+
+from app.db.database import get_db
+from app.models.schemas import LeaderboardEntry, RatingRecomputeResponse
+from app.services import ratings
+
+router = APIRouter()
+
+
+@router.get(
+    "/",
+    response_model=List[LeaderboardEntry],
+    summary="Get agent leaderboard",
+    description="Debaters ranked by Elo rating. Ratings are updated when a run completes, "
+                "so this reads a precomputed table and never scans the runs.",
+)
+async def get_leaderboard(
+    limit: int = Query(50, ge=1, le=500, description="Maximum number of entries"),
+    offset: int = Query(0, ge=0, description="Number of entries to skip"),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get a page of the leaderboard"""
+    return await ratings.get_leaderboard(db, limit=limit, offset=offset)
+
+
+@router.post(
+    "/recompute",
+    response_model=RatingRecomputeResponse,
+    summary="Recompute ratings",
+    description="Rebuild all ratings by replaying every completed run in finishing order. "
+                "Use after changing RATING_K_FACTOR or RATING_INITIAL.",
+)
+async def recompute_leaderboard(db: AsyncSession = Depends(get_db)):
+    """Recompute ratings from run history"""
+    return await ratings.recompute_ratings(db)
@@ -5,6 +5,7 @@ from fastapi import APIRouter, HTTPException
 import httpx
 
 from app.core.config import settings
+from app.services.residency import residency
 
 router = APIRouter()
 
@@ -108,3 +109,22 @@ async def get_status():
             "url": settings.OLLAMA_BASE_URL,
             "error": str(e)
         }
+
+
+@router.get(
+    "/residency",
+    summary="Model residency",
+    description="""
+Models used by this server, most recently used first, with model load times
+reported by Ollama (`load_duration`).
+
+**Fields:**
+- `warming` - a warm-up request (debate start) is loading the model
+- `calls` - Ollama calls made with the model
+- `cold_loads` - calls that had to load the model first (load took over 100 ms)
+- `last_load_ms` / `total_load_ms` - load time of the last call / of all calls
+    """,
+)
+async def get_residency():
+    """Get model residency state"""
+    return {"models": residency.snapshot()}
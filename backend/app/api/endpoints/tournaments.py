@@ -0,0 +1,151 @@
+"""
+Tournament API Endpoints
+"""
+import asyncio
+import json
+from fastapi import APIRouter, HTTPException, status, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from sse_starlette.sse import EventSourceResponse
+from typing import List
+from uuid import UUID
+
+from app.core.metrics import track_sse
+from app.db.database import get_db
+from app.graph.executor import HEARTBEAT_INTERVAL
+from app.graph.tournament import Tournament, get_tournament, list_tournaments, start_tournament
+from app.models.schemas import TournamentCreateRequest, TournamentResponse
+from app.services import agent_crud
+
+router = APIRouter()
+
+
+def _get_or_404(tournament_id: UUID) -> Tournament:
+    tournament = get_tournament(str(tournament_id))
+    if not tournament:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Tournament {tournament_id} not found"
+        )
+    return tournament
+
+
+@router.post(
+    "/",
+    status_code=status.HTTP_201_CREATED,
+    response_model=TournamentResponse,
+    summary="Start tournament",
+    description="""
+Start a tournament between a set of agents. Runs are created and executed in
+the background; no `/stream` call is needed per run.
+
+**Formats:**
+- `round_robin` - every pair of agents debates each topic
+- `swiss` - each round pairs agents with similar points who have not met yet
+
+With `swap_positions` every debate is also run swapped (as `POST /debate/runs/{id}/swap`).
+Up to `max_parallel_runs` debates run at once, ordered so that runs using the
+same models are scheduled together.
+    """,
+)
+async def create_tournament(
+    request: TournamentCreateRequest,
+    db: AsyncSession = Depends(get_db)
+):
+    """Validate the agents and start a tournament"""
+    agent_ids = list(dict.fromkeys(request.agent_ids))
+    if len(agent_ids) < 2:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="A tournament needs at least two different agents"
+        )
+
+    models = {}
+    for agent_id in agent_ids:
+        agent = await agent_crud.get_agent_by_id(db, agent_id)
+        if not agent:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Agent with ID {agent_id} not found"
+            )
+        models[str(agent_id)] = agent.model
+
+    if not await agent_crud.get_agent_by_id(db, request.agent_j_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Judge agent with ID {request.agent_j_id} not found"
+        )
+
+    tournament = start_tournament(Tournament(
+        agents=models,
+        topics=request.topics,
+        judge_id=str(request.agent_j_id),
+        format=request.format,
+        rounds=request.rounds,
+        swap_positions=request.swap_positions,
+        max_parallel_runs=request.max_parallel_runs,
+        config=request.config,
+        rubric=request.rubric
+    ))
+    return tournament.snapshot()
+
+
+@router.get(
+    "/",
+    response_model=List[TournamentResponse],
+    summary="List tournaments",
+    description="Tournaments started since the server started, newest first.",
+)
+async def get_tournaments():
+    """List tournaments"""
+    return [tournament.snapshot() for tournament in list_tournaments()]
+
+
+@router.get(
+    "/{tournament_id}",
+    response_model=TournamentResponse,
+    summary="Get tournament",
+    description="Current standings and the state of every scheduled run.",
+)
+async def get_tournament_endpoint(tournament_id: UUID):
+    """Get tournament state"""
+    return _get_or_404(tournament_id).snapshot()
+
+
+@router.get(
+    "/{tournament_id}/stream",
+    summary="Stream tournament (SSE)",
+    description="""
+Follow a tournament via Server-Sent Events (SSE).
+
+**SSE Event Types:**
+| Event | Description |
+|-------|-------------|
+| `standings` | Current tournament state (first event) |
+| `round_start` | Round's runs were created |
+| `run_result` | A run finished (`run` entry and updated `standings`) |
+| `tournament_complete` | Final tournament state |
+    """,
+)
+async def stream_tournament(tournament_id: UUID):
+    """Stream tournament progress via Server-Sent Events (SSE)."""
+    tournament = _get_or_404(tournament_id)
+
+    async def event_generator():
+        queue = tournament.subscribe()
+        try:
+            yield {"event": "standings", "data": json.dumps(tournament.snapshot())}
+            if tournament.finished:
+                return
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_INTERVAL)
+                except asyncio.TimeoutError:
+                    yield {"event": "heartbeat", "data": "{}"}
+                    continue
+                if event is None:
+                    break
+                yield event
+        finally:
+            tournament.unsubscribe(queue)
+
+    return EventSourceResponse(track_sse(event_generator(), "tournament"))
@@ -3,11 +3,13 @@ API Routes
 """
 from fastapi import APIRouter
 
-from app.api.endpoints import agents, debate, ollama
+from app.api.endpoints import agents, debate, leaderboard, ollama, tournaments
 
 api_router = APIRouter()
 
 # Include endpoint routers
 api_router.include_router(agents.router, prefix="/agents", tags=["agents"])
 api_router.include_router(debate.router, prefix="/debate", tags=["debate"])
+api_router.include_router(tournaments.router, prefix="/tournaments", tags=["tournaments"])
+api_router.include_router(leaderboard.router, prefix="/leaderboard", tags=["leaderboard"])
 api_router.include_router(ollama.router, prefix="/ollama", tags=["ollama"])
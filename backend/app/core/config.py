@@ -26,10 +26,46 @@ class Settings(BaseSettings):
     # Ollama
     OLLAMA_BASE_URL: str = "http://localhost:11434"
     OLLAMA_TIMEOUT: int = 120  # seconds
+    OLLAMA_DEFAULT_NUM_CTX: int = 4096  # Context size Ollama uses when a model sets no num_ctx
+    OLLAMA_KEEP_ALIVE: str = "30m"  # How long models stay loaded after a call ("" = Ollama's default, "-1" = forever)
+    OLLAMA_WARMUP_ON_START: bool = True  # Load a run's models when the debate is started
+
+    # Metrics
+    METRICS_ENABLED: bool = True  # Expose Prometheus metrics at /metrics
+    METRICS_LOOP_LAG_INTERVAL: float = 0.5  # Seconds between event-loop lag probes
+
+    # Tracing
+    TRACING_EXPORTER: str = ""  # "" (off), "json" (JSON Lines file) or "otlp" (OTLP/HTTP collector)
+    TRACING_JSON_PATH: str = "traces.jsonl"
+    TRACING_OTLP_ENDPOINT: str = "http://localhost:4318"
+    TRACING_SERVICE_NAME: str = "vs-arena-backend"
     
     # LLM Settings
     DEFAULT_TEMPERATURE: float = 0.7
     DEFAULT_MAX_TOKENS: int = 1024
+
+    # Debate execution
+    DEBATE_MAX_PARALLEL_NODES: int = 1  # 1 = one phase at a time (what the arena UI streams); 0 = unlimited
+    DEBATE_CONVERSATION_MODE: bool = False  # Debaters keep an /api/chat history (KV cache reuse)
+    DEBATE_FORBIDDEN_PHRASE_ENFORCEMENT: str = "off"  # "off", "flag" or "regenerate"
+    DEBATE_MAX_REGENERATIONS: int = 1  # Regenerations per turn in "regenerate" mode
+    DEBATE_NEW_ARGUMENT_DETECTION: str = "lexical"  # "lexical" (flagged spans only) or "judge" (full transcript)
+    DEBATE_PERSISTENCE_MODE: str = "write_behind"  # "write_behind" (batched) or "immediate"
+    DEBATE_PERSIST_FLUSH_INTERVAL: float = 5.0  # Max seconds a buffered turn write waits
+    DEBATE_CONTEXT_LENGTH: int = 0  # Prompt budget override in tokens (0 = ask Ollama per model)
+    DEBATE_PANEL_AGGREGATION: str = "median"  # Judge panel scores: "mean", "median" or "trimmed_mean"
+    DEBATE_PANEL_TRIM_FRACTION: float = 0.2  # Share of panel scores dropped at each end by "trimmed_mean"
+    DEBATE_SCORE_BATCHING: bool = False  # Batch scoring requests of concurrent debates per judge model
+    DEBATE_SCORE_BATCH_WINDOW_MS: int = 50  # How long a scoring request waits for others to batch with
+    DEBATE_SCORE_BATCH_MAX: int = 4  # Scoring requests per batched judge call
+
+    # Leaderboard (Elo)
+    RATING_INITIAL: float = 1000.0  # Rating of an agent's first debate
+    RATING_K_FACTOR: float = 32.0  # Maximum rating change per debate
+
+    # Tournaments
+    TOURNAMENT_MAX_PARALLEL_RUNS: int = 2  # Debates of a tournament running at once
+    TOURNAMENT_RETENTION_SECONDS: int = 3600  # Finished tournaments kept in memory
     
     class Config:
         env_file = ".env"
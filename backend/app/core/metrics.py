@@ -0,0 +1,300 @@
+"""
+Prometheus Metrics
+
+A minimal in-process metrics registry rendered in the Prometheus text
+exposition format at ``/metrics``. Updating a metric is a dict lookup and
+an addition under a lock, so it stays on in production; gauges whose value
+lives elsewhere (the DB pool) are read through callbacks only when scraped.
+
+The arena's metrics are defined at the bottom of this module.
+"""
+import asyncio
+import logging
+import math
+import threading
+from abc import ABC, abstractmethod
+from contextlib import aclosing
+from contextvars import ContextVar
+from typing import AsyncIterator, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Default histogram buckets (seconds)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def _labels(names: Sequence[str], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric(ABC):
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+
+    @abstractmethod
+    def samples(self) -> List[str]:
+        """Sample lines in the text exposition format."""
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{_labels(self.labelnames, key)} {_format_value(v)}" for key, v in items]
+
+
+class Gauge(_Metric):
+    """Value that goes up and down, or is read from a callback when scraped."""
+    type_name = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        callback: Optional[Callable[[], Iterable[Tuple[Dict[str, str], float]]]] = None
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self.callback = callback
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[str]:
+        if self.callback is not None:
+            try:
+                items = [(self._key(labels), value) for labels, value in self.callback()]
+            except Exception as e:
+                logger.warning(f"Failed to collect {self.name}: {e}")
+                items = []
+        else:
+            with self._lock:
+                items = list(self._values.items())
+        return [f"{self.name}{_labels(self.labelnames, key)} {_format_value(v)}" for key, v in items]
+
+
+class Histogram(_Metric):
+    """Observations counted into cumulative buckets."""
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        # Per label set: [bucket counts..., sum, count]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0.0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+                    break
+            state[-2] += value
+            state[-1] += 1
+
+    def count(self, **labels: str) -> float:
+        state = self._values.get(self._key(labels))
+        return state[-1] if state else 0.0
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = [(key, list(state)) for key, state in self._values.items()]
+        lines = []
+        for key, state in items:
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, state):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {_format_value(cumulative)}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_format_value(state[-2])}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {_format_value(state[-1])}")
+        return lines
+
+
+class Registry:
+    """Metrics rendered together at ``/metrics``."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = (), callback=None) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames, callback))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text format."""
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.header())
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+# Debate phase of the running node ("opening", "score_rebuttal", ...), set by the engine
+current_phase: ContextVar[str] = ContextVar("current_phase", default="other")
+
+OLLAMA_CALL_SECONDS = registry.histogram(
+    "arena_ollama_call_duration_seconds",
+    "Latency of the successful attempt of an Ollama call (retries: arena_ollama_retries_total)",
+    ("model", "phase"),
+)
+OLLAMA_TOKENS_PER_SECOND = registry.histogram(
+    "arena_ollama_tokens_per_second",
+    "Generation speed reported by Ollama (eval_count / eval_duration)",
+    ("model", "phase"),
+    buckets=(1, 2, 5, 10, 20, 30, 50, 75, 100, 150, 200, 400),
+)
+OLLAMA_RETRIES = registry.counter(
+    "arena_ollama_retries_total",
+    "Ollama calls retried after a connection error or timeout",
+    ("model", "reason"),
+)
+OLLAMA_FAILURES = registry.counter(
+    "arena_ollama_failures_total",
+    "Ollama calls that failed after all retries",
+    ("model", "reason"),
+)
+ACTIVE_DEBATES = registry.gauge(
+    "arena_active_debates",
+    "Debates currently executing",
+)
+SSE_SUBSCRIBERS = registry.gauge(
+    "arena_sse_subscribers",
+    "Open Server-Sent Event streams",
+    ("stream",),
+)
+EVENT_LOOP_LAG = registry.histogram(
+    "arena_event_loop_lag_seconds",
+    "Delay of the event loop in running a scheduled wake-up",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+)
+DB_POOL_CHECKOUT_SECONDS = registry.histogram(
+    "arena_db_pool_checkout_wait_seconds",
+    "Time spent waiting for a database connection from the pool",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+SCORE_PARSE_OUTCOMES = registry.counter(
+    "arena_judge_score_parse_total",
+    "Judge score replies by parse outcome (ok, repaired, failed)",
+    ("model", "stage", "outcome"),
+)
+SCORE_PARSE_FALLBACKS = registry.counter(
+    "arena_score_parse_fallbacks_total",
+    "Judge replies replaced by default scores in parse_json_scores",
+)
+
+
+def observe_ollama_call(model: str, seconds: float, stats: Optional[Dict] = None) -> None:
+    """Record a successful Ollama call and its generation speed."""
+    phase = current_phase.get()
+    OLLAMA_CALL_SECONDS.observe(seconds, model=model, phase=phase)
+    if stats and stats.get("eval_count") and stats.get("eval_duration"):
+        OLLAMA_TOKENS_PER_SECOND.observe(
+            stats["eval_count"] / (stats["eval_duration"] / 1e9), model=model, phase=phase
+        )
+
+
+async def monitor_event_loop_lag(interval: float = 0.5) -> None:
+    """Measure event-loop lag until cancelled (started with the app)."""
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        EVENT_LOOP_LAG.observe(max(0.0, loop.time() - expected))
+
+
+async def track_sse(events: AsyncIterator[Dict[str, str]], stream: str) -> AsyncIterator[Dict[str, str]]:
+    """Count an open SSE stream ("debate", "tournament", "preview") while it is consumed."""
+    SSE_SUBSCRIBERS.inc(stream=stream)
+    try:
+        async with aclosing(events):
+            async for event in events:
+                yield event
+    finally:
+        SSE_SUBSCRIBERS.dec(stream=stream)
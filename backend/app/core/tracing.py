@@ -0,0 +1,326 @@
+"""
+Debate Tracing
+
+Lightweight nested spans showing where a debate's time goes:
+
+    debate.run
+    ├── <node name> (e.g. score_rebuttal_a; attribute queue_ms)
+    │   └── ollama.generate / ollama.stream
+    │       └── ollama.load, ollama.prompt_eval, ollama.eval
+    └── db.write_turns
+
+The SSE relay of a run is a separate ``sse.relay`` span in the same trace.
+A run's trace ID is its ``run_id`` (hex, without dashes) and every span
+carries a ``run_id`` attribute.
+
+Finished traces go to the exporter selected by ``TRACING_EXPORTER``:
+``json`` appends one JSON object per span to ``TRACING_JSON_PATH``, ``otlp``
+posts OTLP/HTTP JSON to ``TRACING_OTLP_ENDPOINT`` (an OpenTelemetry
+Collector, Jaeger, Tempo, ...). Exports run in a worker thread. With no
+exporter configured, spans are not recorded at all.
+"""
+import asyncio
+import json
+import logging
+import secrets
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+from uuid import UUID
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+EXPORTERS = ("json", "otlp")
+
+# Ollama durations (nanoseconds) shown as child spans of an Ollama call, in order
+OLLAMA_PHASES = (
+    ("ollama.load", "load_duration"),
+    ("ollama.prompt_eval", "prompt_eval_duration"),
+    ("ollama.eval", "eval_duration"),
+)
+
+
+class Span:
+    """A timed operation within a trace."""
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent: Optional["Span"] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+        start_ns: Optional[int] = None
+    ):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent.span_id if parent else None
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.start_ns = start_ns or time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.error: Optional[str] = None
+        # Spans of the local root are exported together when it ends
+        self._root = parent._root if parent else self
+        self._finished: List["Span"] = []
+        self._exported = False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def end(self, end_ns: Optional[int] = None, error: Optional[BaseException] = None) -> None:
+        """Finish the span (ending twice has no effect)."""
+        if self.end_ns is not None:
+            return
+        self.end_ns = end_ns or time.time_ns()
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+        root = self._root
+        if root._exported:
+            # Outlived its root (e.g. a cancelled background task)
+            _export([self])
+            return
+        root._finished.append(self)
+        if root is self:
+            self._exported = True
+            _export(self._finished)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_id,
+            "name": self.name,
+            "start_time_unix_nano": self.start_ns,
+            "end_time_unix_nano": self.end_ns,
+            "duration_ms": round((self.end_ns - self.start_ns) / 1e6, 3) if self.end_ns else None,
+            "attributes": self.attributes,
+            "status": "error" if self.error else "ok",
+            "error": self.error,
+        }
+
+
+class _NoopSpan:
+    """Stand-in returned while tracing is disabled."""
+    trace_id = span_id = parent_id = None
+    attributes: Dict[str, Any] = {}
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def end(self, end_ns: Optional[int] = None, error: Optional[BaseException] = None) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+_pending_exports: set = set()
+
+
+def tracing_enabled() -> bool:
+    return settings.TRACING_EXPORTER in EXPORTERS
+
+
+def run_trace_id(run_id: str) -> Optional[str]:
+    """Trace ID of a run (its UUID as 32 hex characters; None if not a UUID)."""
+    try:
+        return UUID(str(run_id)).hex
+    except ValueError:
+        return None
+
+
+def start_span(name: str, trace_id: Optional[str] = None, start_ns: Optional[int] = None, **attributes: Any):
+    """
+    Start a span without making it current (for async generators and spans
+    finished elsewhere). End it with ``span.end()``.
+
+    Only runs are traced: without ``trace_id`` the span is a child of the
+    current span, and nothing is recorded outside of a trace (agent
+    previews, API requests).
+
+    Args:
+        name: Span name
+        trace_id: Start a new local root in this trace instead of a child of
+            the current span
+        start_ns: Start time (defaults to now)
+        **attributes: Span attributes
+
+    Returns:
+        The span, or a no-op span while tracing is disabled
+    """
+    if not tracing_enabled():
+        return NOOP_SPAN
+    parent = None if trace_id else _current_span.get()
+    if parent is not None:
+        trace_id = parent.trace_id
+        if "run_id" in parent.attributes:
+            attributes.setdefault("run_id", parent.attributes["run_id"])
+    elif trace_id is None:
+        return NOOP_SPAN
+    return Span(name, trace_id, parent, attributes, start_ns)
+
+
+@contextmanager
+def span(name: str, trace_id: Optional[str] = None, **attributes: Any) -> Iterator[Any]:
+    """Run a block in a span that is the parent of spans started inside it."""
+    current = start_span(name, trace_id, **attributes)
+    if current is NOOP_SPAN:
+        yield current
+        return
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.end(error=e)
+        raise
+    finally:
+        _current_span.reset(token)
+        current.end()
+
+
+def end_ollama_span(
+    ollama_span,
+    stats: Optional[Dict[str, Any]],
+    error: Optional[BaseException] = None,
+    **attributes: Any
+) -> None:
+    """
+    Finish an Ollama call span with Ollama's counters.
+
+    Model load, prompt evaluation and generation become child spans, laid
+    out back to back so that they end with the call. ``error`` marks a call
+    that failed (after its retries) or was cancelled.
+    """
+    if ollama_span is NOOP_SPAN:
+        return
+    end_ns = time.time_ns()
+    stats = stats or {}
+    for key in ("prompt_eval_count", "eval_count"):
+        if key in stats:
+            ollama_span.set_attribute(key, stats[key])
+    for key, value in attributes.items():
+        ollama_span.set_attribute(key, value)
+
+    start = end_ns - sum(stats.get(field) or 0 for _, field in OLLAMA_PHASES)
+    for name, field in OLLAMA_PHASES:
+        duration = stats.get(field)
+        if not duration:
+            continue
+        phase = Span(name, ollama_span.trace_id, ollama_span, start_ns=max(start, ollama_span.start_ns))
+        phase.end(max(start + duration, phase.start_ns))
+        start += duration
+    ollama_span.end(end_ns, error=error)
+
+
+def _export(spans: List[Span]) -> None:
+    exporter = build_exporter()
+    if exporter is None or not spans:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        exporter(spans)
+        return
+    task = loop.create_task(asyncio.to_thread(exporter, spans))
+    _pending_exports.add(task)
+    task.add_done_callback(_pending_exports.discard)
+
+
+async def flush() -> None:
+    """Wait for exports in flight (tests, shutdown)."""
+    if _pending_exports:
+        await asyncio.gather(*list(_pending_exports), return_exceptions=True)
+
+
+def build_exporter():
+    """Exporter for the configured ``TRACING_EXPORTER`` (None when disabled)."""
+    if settings.TRACING_EXPORTER == "json":
+        return JsonFileExporter(settings.TRACING_JSON_PATH)
+    if settings.TRACING_EXPORTER == "otlp":
+        return OtlpHttpExporter(settings.TRACING_OTLP_ENDPOINT, settings.TRACING_SERVICE_NAME)
+    return None
+
+
+class JsonFileExporter:
+    """Appends finished spans to a JSON Lines file."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def __call__(self, spans: List[Span]) -> None:
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                for s in spans:
+                    f.write(json.dumps(s.to_dict(), default=str) + "\n")
+        except OSError as e:
+            logger.warning(f"Failed to write {len(spans)} spans to {self.path}: {e}")
+
+
+class OtlpHttpExporter:
+    """Posts finished spans to an OTLP/HTTP endpoint (JSON encoding)."""
+
+    def __init__(self, endpoint: str, service_name: str):
+        self.url = endpoint.rstrip("/") + "/v1/traces"
+        self.service_name = service_name
+
+    def __call__(self, spans: List[Span]) -> None:
+        try:
+            response = httpx.post(self.url, json=otlp_payload(spans, self.service_name), timeout=5.0)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.warning(f"Failed to export {len(spans)} spans to {self.url}: {e}")
+
+
+def otlp_payload(spans: List[Span], service_name: str) -> Dict[str, Any]:
+    """
+    Encode spans as an OTLP ``ExportTraceServiceRequest`` (JSON mapping).
+
+    Args:
+        spans: Finished spans
+        service_name: ``service.name`` resource attribute
+
+    Returns:
+        Request body for ``POST /v1/traces``
+    """
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [_otlp_attribute("service.name", service_name)]},
+            "scopeSpans": [{
+                "scope": {"name": __name__},
+                "spans": [
+                    {
+                        "traceId": s.trace_id,
+                        "spanId": s.span_id,
+                        **({"parentSpanId": s.parent_id} if s.parent_id else {}),
+                        "name": s.name,
+                        "kind": 1,  # SPAN_KIND_INTERNAL
+                        "startTimeUnixNano": str(s.start_ns),
+                        "endTimeUnixNano": str(s.end_ns),
+                        "attributes": [
+                            _otlp_attribute(key, value)
+                            for key, value in s.attributes.items() if value is not None
+                        ],
+                        "status": {"code": 2, "message": s.error} if s.error else {"code": 1},
+                    }
+                    for s in spans
+                ],
+            }],
+        }]
+    }
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        encoded = {"boolValue": value}
+    elif isinstance(value, int):
+        encoded = {"intValue": str(value)}
+    elif isinstance(value, float):
+        encoded = {"doubleValue": value}
+    else:
+        encoded = {"stringValue": str(value)}
+    return {"key": key, "value": encoded}
@@ -1,24 +1,57 @@
 """
 Database connection and session management
 """
+import time
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from typing import AsyncGenerator
 
+from app.core import metrics
 from app.core.config import settings
 
 # Convert postgresql:// to postgresql+asyncpg://
 DATABASE_URL = settings.DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
 
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Connection pool recording how long checkouts wait for a connection."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            metrics.DB_POOL_CHECKOUT_SECONDS.observe(time.perf_counter() - started)
+
+
 # Create async SQLAlchemy engine
 engine = create_async_engine(
     DATABASE_URL,
+    poolclass=TimedQueuePool,
     pool_pre_ping=True,
     pool_size=10,
     max_overflow=20,
     echo=settings.DEBUG,
 )
 
+
+def _pool_usage():
+    pool = engine.pool
+    return [
+        ({"state": "size"}, pool.size()),
+        ({"state": "checked_out"}, pool.checkedout()),
+        ({"state": "overflow"}, pool.overflow()),
+    ]
+
+
+metrics.registry.gauge(
+    "arena_db_pool_connections",
+    "Database pool size, checked-out connections and overflow",
+    ("state",),
+    callback=_pool_usage,
+)
+
 # Create async SessionLocal class
 AsyncSessionLocal = async_sessionmaker(
     engine,
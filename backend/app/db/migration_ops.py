@@ -0,0 +1,114 @@
+"""
+Online Migration Operations
+
+Helpers for Alembic revisions (``backend/migrations``) that must not lock
+the arena's tables while it is serving debates. Every operation is
+idempotent, so a revision that failed halfway can simply be re-run.
+
+- ``create_index_concurrently`` / ``drop_index_concurrently``: index builds
+  without write locks. ``CONCURRENTLY`` cannot run in a transaction, so they
+  run in Alembic's autocommit block. A failed concurrent build leaves an
+  INVALID index behind; it is dropped and rebuilt on the next run.
+- ``backfill_in_batches``: UPDATE a large table in small committed batches
+  so row locks are held briefly and progress survives interruptions.
+  Offline SQL gets one unbatched UPDATE.
+"""
+import logging
+from typing import Optional, Sequence
+
+from alembic import context, op
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BACKFILL_BATCH_SIZE = 1000
+
+
+def _index_state(name: str) -> Optional[bool]:
+    """Whether an index exists and is valid (None if missing or offline)."""
+    if context.is_offline_mode():
+        return None
+    return op.get_bind().execute(
+        text(
+            "SELECT i.indisvalid FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE c.relname = :name AND pg_catalog.pg_table_is_visible(c.oid)"
+        ),
+        {"name": name},
+    ).scalar()
+
+
+def create_index_concurrently(
+    name: str,
+    table: str,
+    columns: Sequence[str],
+    where: Optional[str] = None
+) -> None:
+    """
+    Build an index without blocking writes (no-op if it already exists).
+
+    Args:
+        name: Index name
+        table: Table name
+        columns: Column expressions (e.g. ``["run_id", "created_at DESC"]``)
+        where: Optional partial index predicate (SQL)
+    """
+    with op.get_context().autocommit_block():
+        if _index_state(name) is False:
+            logger.warning(f"Rebuilding invalid index {name} left by an interrupted build")
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+        predicate = f" WHERE {where}" if where else ""
+        op.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+            f"ON {table} ({', '.join(columns)}){predicate}"
+        )
+
+
+def drop_index_concurrently(name: str) -> None:
+    """Drop an index without blocking reads or writes (no-op if missing)."""
+    with op.get_context().autocommit_block():
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def backfill_in_batches(
+    table: str,
+    key: str,
+    assignments: str,
+    pending: str,
+    batch_size: int = DEFAULT_BACKFILL_BATCH_SIZE
+) -> int:
+    """
+    Update rows in committed batches until none are pending.
+
+    ``pending`` must stop matching a row once it is updated; this makes the
+    backfill resumable and idempotent. Offline (``--sql``) the loop cannot
+    run, so a single unbatched UPDATE is emitted instead.
+
+    Args:
+        table: Table name
+        key: Primary key column
+        assignments: SET clause (e.g. ``"elo = 1000"``)
+        pending: Predicate selecting rows still to update (e.g. ``"elo IS NULL"``)
+        batch_size: Rows per batch
+
+    Returns:
+        Number of rows updated (0 offline)
+    """
+    if context.is_offline_mode():
+        op.execute(f"UPDATE {table} SET {assignments} WHERE {pending}")
+        return 0
+
+    statement = text(
+        f"UPDATE {table} SET {assignments} WHERE {key} IN ("
+        f"SELECT {key} FROM {table} WHERE {pending} LIMIT :batch_size)"
+    )
+    total = 0
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        while True:
+            updated = bind.execute(statement, {"batch_size": batch_size}).rowcount
+            if not updated:
+                break
+            total += updated
+            logger.info(f"Backfilled {total} rows of {table}")
+    return total
@@ -2,13 +2,30 @@
 LangGraph Debate Orchestration Module
 
 This module provides the complete BP Lite debate workflow orchestration using LangGraph.
+
+The LangGraph graph is only needed for graph-based runs, so ``debate_graph``
+and ``create_debate_graph`` are resolved on first access; importing this
+package (e.g. from API workers) does not import LangGraph.
 """
-from app.graph.graph import debate_graph, create_debate_graph
+from typing import Any
+
 from app.graph.state import DebateState, Turn
 
 __all__ = [
     "debate_graph",
     "create_debate_graph",
+    "get_debate_graph",
     "DebateState",
     "Turn"
 ]
+
+_LAZY_GRAPH_ATTRS = {"debate_graph", "create_debate_graph", "get_debate_graph"}
+
+
+def __getattr__(name: str) -> Any:
+    """Import graph attributes (and LangGraph) on first use."""
+    if name in _LAZY_GRAPH_ATTRS:
+        from app.graph import graph
+
+        return getattr(graph, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
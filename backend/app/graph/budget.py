@@ -0,0 +1,222 @@
+"""
+Prompt Token Budgeting
+
+Keeps transcript-heavy prompts (rebuttals in later rounds, summaries, summary
+scoring, verdict) within the model's context window. Each model's context
+length is fetched once from Ollama (``/api/show``) and cached.
+
+When the transcript does not fit, the most recent turns are kept verbatim and
+older turns are compacted into extractive excerpts (lead sentences of each
+paragraph). Excerpts are deterministic and cached, so a turn compacted for one
+prompt is not recomputed for the next.
+"""
+import logging
+import math
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.services.ollama import get_model_info
+
+logger = logging.getLogger(__name__)
+
+# Rough tokens-per-character ratio for English text with BPE tokenizers
+CHARS_PER_TOKEN = 4
+
+# Tokens kept free for chat templates and estimation error
+SAFETY_MARGIN_TOKENS = 128
+
+# Recent turns kept verbatim before older turns are compacted
+KEEP_RECENT_TURNS = 2
+
+# Smallest excerpt worth keeping for a compacted turn
+MIN_EXCERPT_TOKENS = 32
+
+EXCERPT_SEPARATOR = " [...] "
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+# Context length per model, fetched once per process
+_context_lengths: Dict[str, int] = {}
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a text."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def _context_length_from_info(info: Optional[Dict[str, Any]]) -> int:
+    """
+    Get the effective context length from an ``/api/show`` response.
+
+    Ollama only uses the model's full context when ``num_ctx`` is set in its
+    parameters; otherwise it runs with its default context size.
+    """
+    if not info:
+        return settings.OLLAMA_DEFAULT_NUM_CTX
+
+    match = re.search(r"^num_ctx\s+(\d+)", info.get("parameters", ""), re.MULTILINE)
+    if match:
+        return int(match.group(1))
+
+    model_context = next(
+        (
+            value for key, value in (info.get("model_info") or {}).items()
+            if key.endswith(".context_length") and isinstance(value, int)
+        ),
+        None,
+    )
+    if model_context:
+        return min(model_context, settings.OLLAMA_DEFAULT_NUM_CTX)
+    return settings.OLLAMA_DEFAULT_NUM_CTX
+
+
+async def get_context_length(model: str) -> int:
+    """
+    Get a model's context length in tokens (cached per model once Ollama
+    answered; the fallback for an unavailable model is not cached).
+
+    ``DEBATE_CONTEXT_LENGTH`` overrides the value reported by Ollama.
+
+    Args:
+        model: Ollama model name
+
+    Returns:
+        Context length in tokens
+    """
+    if settings.DEBATE_CONTEXT_LENGTH:
+        return settings.DEBATE_CONTEXT_LENGTH
+
+    if model in _context_lengths:
+        return _context_lengths[model]
+
+    info = await get_model_info(model)
+    context_length = _context_length_from_info(info)
+    if info is not None:
+        _context_lengths[model] = context_length
+        logger.info(f"Context length for {model}: {context_length} tokens")
+    return context_length
+
+
+@lru_cache(maxsize=512)
+def extract_excerpt(text: str, max_tokens: int) -> str:
+    """
+    Compact a turn into an extractive excerpt of at most ``max_tokens``.
+
+    Lead sentences of each paragraph are picked first (they usually state
+    the claim), then the remaining sentences in order. Selected sentences
+    keep their original order.
+
+    Args:
+        text: Turn content
+        max_tokens: Token budget for the excerpt
+
+    Returns:
+        Excerpt (the text itself if it already fits)
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    sentences: List[str] = []
+    leads: List[int] = []
+    for paragraph in text.split("\n"):
+        paragraph_sentences = [s.strip() for s in _SENTENCE_END.split(paragraph) if s.strip()]
+        if paragraph_sentences:
+            leads.append(len(sentences))
+            sentences.extend(paragraph_sentences)
+
+    lead_set = set(leads)
+    priority = leads + [i for i in range(len(sentences)) if i not in lead_set]
+
+    budget_chars = max_tokens * CHARS_PER_TOKEN
+    selected: List[int] = []
+    used = 0
+    for index in priority:
+        cost = len(sentences[index]) + len(EXCERPT_SEPARATOR)
+        if used + cost <= budget_chars:
+            selected.append(index)
+            used += cost
+
+    if not selected:
+        # A single sentence longer than the budget: hard cut
+        return text[:max(0, budget_chars - len(EXCERPT_SEPARATOR))] + EXCERPT_SEPARATOR.rstrip()
+
+    return EXCERPT_SEPARATOR.join(sentences[i] for i in sorted(selected))
+
+
+def compact_turns(turns: List[str], budget_tokens: int) -> List[str]:
+    """
+    Fit a transcript into a token budget.
+
+    The last ``KEEP_RECENT_TURNS`` turns stay verbatim when possible; older
+    turns share the remaining budget as extractive excerpts. If the recent
+    turns alone exceed the budget, every turn is excerpted evenly.
+
+    Args:
+        turns: Turn contents in debate order
+        budget_tokens: Tokens available for the whole transcript
+
+    Returns:
+        Turn contents (same length and order), compacted as needed
+    """
+    sizes = [estimate_tokens(turn) for turn in turns]
+    if sum(sizes) <= budget_tokens or not turns:
+        return list(turns)
+
+    recent_count = min(KEEP_RECENT_TURNS, len(turns))
+    older, recent = turns[:-recent_count], turns[-recent_count:]
+    older_budget = budget_tokens - sum(sizes[-recent_count:])
+
+    if older and older_budget >= MIN_EXCERPT_TOKENS * len(older):
+        share = older_budget // len(older)
+        return [extract_excerpt(turn, share) for turn in older] + list(recent)
+
+    share = max(MIN_EXCERPT_TOKENS, budget_tokens // len(turns))
+    return [extract_excerpt(turn, share) for turn in turns]
+
+
+async def fits_context(model: str, texts: List[str], reserved_tokens: int) -> bool:
+    """
+    Whether texts sent as they are fit the model's context window.
+
+    Args:
+        model: Ollama model the texts are sent to
+        texts: Prompt texts (e.g. chat message contents)
+        reserved_tokens: Tokens needed besides the texts (generated tokens)
+    """
+    context_length = await get_context_length(model)
+    return sum(map(estimate_tokens, texts)) + reserved_tokens + SAFETY_MARGIN_TOKENS <= context_length
+
+
+async def fit_transcript(
+    model: str,
+    turns: List[str],
+    reserved_tokens: int
+) -> List[str]:
+    """
+    Compact transcript turns so the prompt fits the model's context window.
+
+    Args:
+        model: Ollama model the prompt is sent to
+        turns: Transcript turn contents in debate order
+        reserved_tokens: Tokens needed besides the transcript (system prompt,
+            prompt template, generated tokens)
+
+    Returns:
+        Turn contents, compacted when the full transcript would not fit
+    """
+    if not turns:
+        return []
+
+    context_length = await get_context_length(model)
+    budget = context_length - reserved_tokens - SAFETY_MARGIN_TOKENS
+    fitted = compact_turns(turns, max(budget, MIN_EXCERPT_TOKENS * len(turns)))
+
+    if fitted != turns:
+        logger.info(
+            f"Compacted transcript of {len(turns)} turns for {model} "
+            f"({sum(map(estimate_tokens, turns))} -> {sum(map(estimate_tokens, fitted))} "
+            f"tokens, budget {budget})"
+        )
+    return fitted
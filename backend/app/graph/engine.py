@@ -0,0 +1,491 @@
+"""
+Debate Execution Engine
+
+Single execution engine for debates. It builds the execution plan from the
+run config, schedules the plan's node DAG (``max_parallel_nodes`` at a
+time; one by default, which is what the arena UI streams), persists
+turns and emits SSE-shaped events through a callback.
+
+The same engine drives the SSE endpoint (which relays events to the client)
+and batch jobs (which pass no callback). Node implementations live in
+``app.graph.nodes`` and are shared with the LangGraph graph.
+"""
+import asyncio
+import json
+import logging
+import time
+from typing import Dict, Any, List, Tuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import metrics, tracing
+from app.core.config import settings
+from app.graph.state import DebateState, TurnLog, apply_update
+from app.graph.persistence import TurnWriter
+from app.graph.plan import ExecutionPlan, PlanNode, build_execution_plan
+from app.graph.timing import NodeTimer, summarize_run_timing
+from app.graph.nodes.debater import debater_node
+from app.graph.nodes.judge import judge_intro_node, score_node, verdict_node
+from app.graph.nodes.utils import EventEmitter, discard_event
+from app.graph.score_batching import score_batcher, score_batching_enabled
+from app.services.residency import residency
+from app.services.run_crud import get_run_with_agents, update_run_status
+
+logger = logging.getLogger(__name__)
+
+# Node implementation per plan node kind
+NODE_HANDLERS = {
+    "judge_intro": judge_intro_node,
+    "debater": debater_node,
+    "score": score_node,
+    "judge_verdict": verdict_node,
+}
+
+
+class NodeExecutionError(RuntimeError):
+    """A plan node failed; carries the phase it failed in."""
+
+    def __init__(self, phase: str, error: Exception):
+        super().__init__(str(error))
+        self.phase = phase
+
+
+async def initialize_debate_state(run_id: str, db: AsyncSession) -> DebateState:
+    """
+    Initialize DebateState from database.
+
+    Args:
+        run_id: UUID of the run
+        db: Database session
+
+    Returns:
+        Initialized DebateState ready for graph execution
+    """
+    # Fetch run with all agents
+    run_data = await get_run_with_agents(db, UUID(run_id))
+    if not run_data:
+        raise ValueError(f"Run {run_id} not found")
+
+    run = run_data["run"]
+    # Agents are already dicts from get_run_with_agents
+    agent_a_dict = run_data["agent_a"]
+    agent_b_dict = run_data["agent_b"]
+    agent_j_dict = run_data["agent_j"]
+
+    # Initialize state
+    state: DebateState = {
+        "run_id": str(run.run_id),
+        "topic": run.topic,
+        "position_a": run.position_a,
+        "position_b": run.position_b,
+        "agent_a": agent_a_dict,
+        "agent_b": agent_b_dict,
+        "agent_j": agent_j_dict,
+        "judge_panel": run_data.get("judge_panel") or [agent_j_dict],
+        "config": run.config_json or {"rounds": 3, "max_tokens_per_turn": 1024},
+        "rubric": run.rubric_json or {
+            "argumentation_weight": 35,
+            "rebuttal_weight": 30,
+            "delivery_weight": 20,
+            "strategy_weight": 15
+        },
+        "current_phase": "judge_intro",
+        "turns": TurnLog(),
+        "scores_a": {},
+        "scores_b": {},
+        "winner": None,
+        "verdict": None,
+        "status": "pending"
+    }
+
+    return state
+
+
+def _max_parallel_nodes(config: Dict[str, Any]) -> int:
+    """Concurrency cap for plan execution (0 = unlimited)."""
+    value = config.get("max_parallel_nodes", settings.DEBATE_MAX_PARALLEL_NODES)
+    try:
+        return max(0, int(value))
+    except (TypeError, ValueError):
+        return settings.DEBATE_MAX_PARALLEL_NODES
+
+
+async def execute_node(
+    node: PlanNode,
+    plan: ExecutionPlan,
+    state: DebateState,
+    emit: EventEmitter = discard_event
+) -> Dict[str, Any]:
+    """
+    Execute a single plan node.
+
+    Args:
+        node: Plan node to execute
+        plan: Execution plan the node belongs to
+        state: Current debate state (must contain the node's dependencies)
+        emit: Callback receiving token events
+
+    Returns:
+        Partial state update produced by the node
+    """
+    # Labels the node's Ollama calls in the metrics
+    token = metrics.current_phase.set(node_phase_label(node))
+    try:
+        return await NODE_HANDLERS[node["kind"]](node, plan, state, emit)
+    finally:
+        metrics.current_phase.reset(token)
+
+
+def node_phase_label(node: PlanNode) -> str:
+    """Low-cardinality phase of a node ("opening", "score_rebuttal", "judge_verdict", ...)."""
+    if node["kind"] == "score":
+        return f"score_{node['stage']}"
+    if node["kind"] == "debater":
+        return node["stage"]
+    return node["kind"]
+
+
+async def run_debate(
+    run_id: str,
+    db: AsyncSession,
+    emit: EventEmitter = discard_event
+) -> DebateState:
+    """
+    Execute a debate run end-to-end.
+
+    Initializes state from the database, runs the execution plan, persists
+    turns and updates the run status. Events (plan, phase_start, token,
+    score, phase_end, verdict, run_complete, error) are passed to ``emit``.
+
+    Args:
+        run_id: UUID of the run to execute
+        db: Database session (held for the entire debate)
+        emit: Callback receiving SSE events (omit for batch runs)
+
+    Returns:
+        Final debate state
+
+    Raises:
+        Exception: Re-raised after the run was marked failed and an ``error``
+            event was emitted
+    """
+    state = None
+    metrics.ACTIVE_DEBATES.inc()
+    with tracing.span("debate.run", trace_id=tracing.run_trace_id(run_id), run_id=run_id) as run_span:
+        try:
+            # Initialize state
+            state = await initialize_debate_state(run_id, db)
+            plan = build_execution_plan(state["config"])
+            logger.info(
+                f"Starting debate execution for run {run_id} "
+                f"({len(plan)} nodes, {plan.rebuttal_rounds} rebuttal rounds)"
+            )
+
+            # Update run status to running
+            await update_run_status(db, UUID(run_id), "running")
+
+            await emit({"event": "plan", "data": json.dumps(plan.to_dict())})
+
+            state = await run_plan(plan, state, db, emit)
+
+            # Send final verdict
+            await emit({
+                "event": "verdict",
+                "data": json.dumps({
+                    "winner": state["winner"],
+                    "final_scores": {
+                        "a": state["scores_a"],
+                        "b": state["scores_b"]
+                    },
+                    "reasoning": state["verdict"]
+                })
+            })
+
+            # Update run status to completed
+            await update_run_status(
+                db,
+                UUID(run_id),
+                "completed",
+                result_json={
+                    "winner": state["winner"],
+                    "scores_a": state["scores_a"],
+                    "scores_b": state["scores_b"],
+                    "verdict": state["verdict"],
+                    "timing": state.get("timing")
+                }
+            )
+
+            # Send completion event
+            await emit({
+                "event": "run_complete",
+                "data": json.dumps({
+                    "run_id": run_id,
+                    "status": "completed",
+                    "winner": state["winner"]
+                })
+            })
+
+            run_span.set_attribute("winner", state["winner"])
+            logger.info(f"Debate execution completed for run {run_id}")
+            return state
+
+        except Exception as e:
+            logger.error(f"Debate execution failed for run {run_id}: {e}", exc_info=True)
+
+            # Send error event
+            await emit({
+                "event": "error",
+                "data": json.dumps({
+                    "code": "DEBATE_ERROR",
+                    "message": str(e),
+                    "phase": getattr(e, "phase", None) or (
+                        state.get("current_phase", "unknown") if state else "unknown"
+                    )
+                })
+            })
+
+            # Update run status to failed
+            try:
+                await update_run_status(db, UUID(run_id), "failed")
+            except Exception as db_error:
+                logger.error(f"Failed to update run status: {db_error}")
+            raise
+
+        finally:
+            metrics.ACTIVE_DEBATES.dec()
+
+
+async def run_plan(
+    plan: ExecutionPlan,
+    state: DebateState,
+    db: AsyncSession,
+    emit: EventEmitter = discard_event
+) -> DebateState:
+    """
+    Schedule the plan's node DAG, up to ``max_parallel_nodes`` nodes at a time.
+
+    Every node whose dependencies are complete is started immediately (up to
+    the ``max_parallel_nodes`` cap), in canonical order. When more than one
+    node may run at once, nodes on the most recently used model start first
+    to avoid model swaps; one at a time, the canonical order is kept. Nodes return state
+    updates which are merged here, one at a time, and buffered in a
+    ``TurnWriter`` (see ``app.graph.persistence``); nodes never touch the
+    database session. Buffered writes are flushed at phase boundaries, on the
+    flush timer and synchronously for the verdict.
+
+    Args:
+        plan: Execution plan for the run
+        state: Initialized debate state
+        db: Database session
+        emit: Callback receiving SSE events
+
+    Returns:
+        Final debate state
+    """
+    max_parallel = _max_parallel_nodes(state["config"])
+    writer = TurnWriter(state["run_id"], db, mode=state["config"].get("persistence_mode"))
+    done: set = set()
+    running: Dict[asyncio.Task, str] = {}
+    timers: Dict[str, NodeTimer] = {}
+    node_timing: Dict[str, Dict[str, Any]] = {}
+    # When each node's dependencies completed (time spent queued behind the cap)
+    ready_since: Dict[str, float] = {}
+    started = time.perf_counter()
+    judge_models = _batched_judge_models(state)
+    score_batcher.join(judge_models)
+
+    try:
+        while len(done) < len(plan):
+            ready = plan.ready(done, running.values())
+            if max_parallel != 1:
+                # Several nodes may run at once: start those on loaded models first.
+                # One at a time keeps the canonical order the UI shows progress in.
+                ready = residency.prefer_resident(ready, lambda n: _node_model(plan[n], state))
+            for name in ready:
+                ready_since.setdefault(name, time.perf_counter())
+            for name in ready:
+                if max_parallel and len(running) >= max_parallel:
+                    break
+                node = plan[name]
+                logger.info(f"Executing node: {name}")
+                state = {**state, "current_phase": name}
+                await emit({
+                    "event": "phase_start",
+                    "data": json.dumps({
+                        "phase": name,
+                        "agent_id": _get_agent_id_for_node(node, state)
+                    })
+                })
+                timer = timers[name] = NodeTimer()
+                queued_ms = (timer.started - ready_since.pop(name, timer.started)) * 1000
+                task = asyncio.create_task(_traced_node(node, plan, state, timer.wrap(emit), queued_ms))
+                task.add_done_callback(lambda _, timer=timer: timer.stop())
+                running[task] = name
+
+            if not running:
+                raise RuntimeError("Execution plan has unsatisfiable dependencies")
+
+            finished, _ = await asyncio.wait(
+                running, timeout=writer.seconds_until_due(), return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in sorted(finished, key=lambda t: plan.order.index(running[t])):
+                name = running.pop(task)
+                try:
+                    update = task.result()
+                except Exception as e:
+                    raise NodeExecutionError(name, e) from e
+                update, node_timing[name] = _record_node_timing(plan[name], update, timers.pop(name))
+                state = await _apply_node_update(plan[name], state, update, writer, emit)
+                done.add(name)
+                await writer.node_finished(
+                    plan.phase_complete(name, done),
+                    synchronous=plan[name]["kind"] == "judge_verdict"
+                )
+            if writer.seconds_until_due() == 0:
+                await writer.flush()
+
+        await writer.close()
+        state = {
+            **state,
+            "timing": summarize_run_timing(node_timing, (time.perf_counter() - started) * 1000)
+        }
+    except Exception:
+        # Keep the turns that did complete
+        try:
+            await writer.close()
+        except Exception as flush_error:
+            logger.error(f"Failed to persist buffered turns: {flush_error}")
+            writer.cancel()
+        raise
+    finally:
+        score_batcher.leave(judge_models)
+        for task in running:
+            task.cancel()
+
+    return state
+
+
+async def _traced_node(
+    node: PlanNode,
+    plan: ExecutionPlan,
+    state: DebateState,
+    emit: EventEmitter,
+    queued_ms: float
+) -> Dict[str, Any]:
+    """Execute a node in its own span (parent of its Ollama calls)."""
+    with tracing.span(
+        node["name"],
+        kind=node["kind"],
+        phase=node_phase_label(node),
+        model=_node_model(node, state),
+        queue_ms=round(queued_ms, 1)
+    ):
+        return await execute_node(node, plan, state, emit)
+
+
+def _record_node_timing(
+    node: PlanNode,
+    update: Dict[str, Any],
+    timer: NodeTimer
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Add the executor's timing of a node to the metadata of its turn.
+
+    Debater and judge turns get ``timing``; a scored turn (returned by its
+    score node) gets ``score_timing`` next to its ``score_ollama_stats``.
+    The turn is copied, since the node's update is not modified.
+
+    Returns:
+        Update with the timed turn, and the node timing with its Ollama
+        counters for the run rollup
+    """
+    timing = timer.to_dict()
+    new_turns = update.get("turns", [])
+    if not new_turns:
+        return update, {"kind": node["kind"], **timing, "ollama_stats": None}
+
+    turn = new_turns[-1]
+    scored = node["kind"] == "score"
+    metadata = {**turn["metadata"], "score_timing" if scored else "timing": timing}
+    update = {**update, "turns": [*new_turns[:-1], {**turn, "metadata": metadata}]}
+    ollama_stats = metadata.get("score_ollama_stats" if scored else "ollama_stats")
+    return update, {"kind": node["kind"], **timing, "ollama_stats": ollama_stats}
+
+
+async def _apply_node_update(
+    node: PlanNode,
+    state: DebateState,
+    update: Dict[str, Any],
+    writer: TurnWriter,
+    emit: EventEmitter
+) -> DebateState:
+    """Merge a node's state update, buffer its writes and emit completion events."""
+    merged = apply_update(state, update)
+    new_turns = update.get("turns", [])
+    name = node["name"]
+    turn_id = new_turns[-1]["turn_id"] if new_turns else None
+
+    if node["kind"] == "score":
+        # Scored turn already buffered (or written) for its debater node;
+        # persist the patched metadata
+        target_turn, = new_turns
+        writer.patch_metadata(turn_id, target_turn["metadata"])
+        await emit({
+            "event": "score",
+            "data": json.dumps({
+                "phase": name,
+                "scores": target_turn["metadata"].get("scores", {}),
+                "agent": node["side"]
+            })
+        })
+    else:
+        for turn in new_turns:
+            writer.add_turn(turn)
+
+    if node["kind"] in ("judge_intro", "judge_verdict") and new_turns:
+        # Judge turns are not streamed; send the complete result
+        await emit({
+            "event": "token",
+            "data": json.dumps({
+                "turn_id": turn_id,
+                "phase": name,
+                "content": new_turns[-1]["content"],
+                "complete": True
+            })
+        })
+
+    phase_end = {"phase": name, "turn_id": turn_id}
+    if node["kind"] == "debater" and new_turns:
+        # Lets clients verify prompt-eval savings (e.g. in conversation mode)
+        ollama_stats = new_turns[-1]["metadata"].get("ollama_stats", {})
+        phase_end["prompt_eval_count"] = ollama_stats.get("prompt_eval_count")
+        # Model load time of the turn (nanoseconds; large when the model was not loaded)
+        phase_end["load_duration"] = ollama_stats.get("load_duration")
+    await emit({"event": "phase_end", "data": json.dumps(phase_end)})
+
+    return merged
+
+
+def _node_model(node: PlanNode, state: DebateState) -> str:
+    """Get the model a node's agent runs on."""
+    if node["kind"] != "debater":
+        return state["agent_j"]["model"]
+    return (state["agent_a"] if node["side"] == "A" else state["agent_b"])["model"]
+
+
+def _batched_judge_models(state: DebateState) -> List[str]:
+    """Judge models the run's scoring requests are batched on (none without batching)."""
+    if not score_batching_enabled(state["config"]):
+        return []
+    return [judge["model"] for judge in state.get("judge_panel") or [state["agent_j"]]]
+
+
+def _get_agent_id_for_node(node: PlanNode, state: DebateState) -> str:
+    """Get the ID of the agent speaking in a node."""
+    if node["kind"] != "debater":
+        return state["agent_j"]["agent_id"]
+    elif node["side"] == "A":
+        return state["agent_a"]["agent_id"]
+    else:
+        return state["agent_b"]["agent_id"]
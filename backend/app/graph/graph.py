@@ -1,39 +1,40 @@
 """
 LangGraph Debate Flow Definition
 
-This module defines the complete BP Lite debate workflow graph with 14 nodes:
+This module compiles the debate execution plan into a LangGraph StateGraph.
+The default plan is the BP Lite workflow with 14 nodes:
 - 1 judge introduction
 - 6 debater nodes (opening, rebuttal, summary for A and B)
 - 7 judge scoring/verdict nodes
+
+Nodes are the same implementations the debate engine runs (see
+``app.graph.engine``); plan dependencies become graph edges, so independent
+nodes run as parallel branches.
 """
-from langgraph.graph import StateGraph, END
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from langgraph.graph import StateGraph, START, END
 
 from app.graph.state import DebateState
-from app.graph.nodes.debater import (
-    opening_a,
-    opening_b,
-    rebuttal_a,
-    rebuttal_b,
-    summary_a,
-    summary_b
-)
-from app.graph.nodes.judge import (
-    judge_intro,
-    score_opening_a,
-    score_opening_b,
-    score_rebuttal_a,
-    score_rebuttal_b,
-    score_summary_a,
-    score_summary_b,
-    judge_verdict
-)
-
-
-def create_debate_graph() -> StateGraph:
+from app.graph.plan import ExecutionPlan, PlanNode, build_execution_plan
+from app.graph.engine import execute_node
+
+
+def _bind_node(node: PlanNode, plan: ExecutionPlan):
+    """Wrap a plan node as a LangGraph node function."""
+    async def run(state: DebateState) -> Dict[str, Any]:
+        return await execute_node(node, plan, state)
+
+    run.__name__ = node["name"]
+    return run
+
+
+def create_debate_graph(config: Optional[Dict[str, Any]] = None) -> StateGraph:
     """
-    Create the BP Lite debate workflow graph.
+    Create the debate workflow graph for a run configuration.
 
-    Flow:
+    Default flow (``rounds=3``):
     1. judge_intro - Judge introduces rules and scoring criteria
     2. opening_a - Agent A presents opening argument
     3. score_opening_a - Judge scores Agent A's opening
@@ -49,50 +50,48 @@ def create_debate_graph() -> StateGraph:
     13. score_summary_b - Judge scores Agent B's summary
     14. judge_verdict - Judge delivers final verdict and announces winner
 
+    Args:
+        config: Run configuration (see ``build_execution_plan``)
+
     Returns:
         Compiled StateGraph ready for execution
     """
+    plan = build_execution_plan(config)
+
     # Initialize graph with DebateState
     graph = StateGraph(DebateState)
 
-    # Add all 14 nodes
-    graph.add_node("judge_intro", judge_intro)
-    graph.add_node("opening_a", opening_a)
-    graph.add_node("score_opening_a", score_opening_a)
-    graph.add_node("opening_b", opening_b)
-    graph.add_node("score_opening_b", score_opening_b)
-    graph.add_node("rebuttal_a", rebuttal_a)
-    graph.add_node("score_rebuttal_a", score_rebuttal_a)
-    graph.add_node("rebuttal_b", rebuttal_b)
-    graph.add_node("score_rebuttal_b", score_rebuttal_b)
-    graph.add_node("summary_a", summary_a)
-    graph.add_node("score_summary_a", score_summary_a)
-    graph.add_node("summary_b", summary_b)
-    graph.add_node("score_summary_b", score_summary_b)
-    graph.add_node("judge_verdict", judge_verdict)
-
-    # Set entry point
-    graph.set_entry_point("judge_intro")
-
-    # Define sequential edges (BP Lite flow)
-    graph.add_edge("judge_intro", "opening_a")
-    graph.add_edge("opening_a", "score_opening_a")
-    graph.add_edge("score_opening_a", "opening_b")
-    graph.add_edge("opening_b", "score_opening_b")
-    graph.add_edge("score_opening_b", "rebuttal_a")
-    graph.add_edge("rebuttal_a", "score_rebuttal_a")
-    graph.add_edge("score_rebuttal_a", "rebuttal_b")
-    graph.add_edge("rebuttal_b", "score_rebuttal_b")
-    graph.add_edge("score_rebuttal_b", "summary_a")
-    graph.add_edge("summary_a", "score_summary_a")
-    graph.add_edge("score_summary_a", "summary_b")
-    graph.add_edge("summary_b", "score_summary_b")
-    graph.add_edge("score_summary_b", "judge_verdict")
+    for name in plan.order:
+        graph.add_node(name, _bind_node(plan[name], plan))
+
+    # A node with several dependencies waits for all of them
+    for name in plan.order:
+        depends_on = plan[name]["depends_on"]
+        if not depends_on:
+            graph.add_edge(START, name)
+        elif len(depends_on) == 1:
+            graph.add_edge(depends_on[0], name)
+        else:
+            graph.add_edge(depends_on, name)
     graph.add_edge("judge_verdict", END)
 
     # Compile and return
     return graph.compile()
 
 
-# Singleton instance for import
-debate_graph = create_debate_graph()
+@lru_cache(maxsize=1)
+def get_debate_graph() -> StateGraph:
+    """
+    Get the default debate graph, compiling it on first use.
+
+    Returns:
+        Compiled StateGraph for the default run configuration
+    """
+    return create_debate_graph()
+
+
+def __getattr__(name: str) -> Any:
+    """Keep ``debate_graph`` importable without compiling it at import time."""
+    if name == "debate_graph":
+        return get_debate_graph()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
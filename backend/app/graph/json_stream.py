@@ -0,0 +1,107 @@
+"""
+Incremental JSON Object Parser
+
+Parses a JSON object as it streams in and reports each top-level member as
+soon as its value is complete, so callers can act on partial results (emit
+score categories, stop generation once required fields are present) without
+waiting for the whole response.
+"""
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class IncrementalJSONParser:
+    """
+    Streaming parser for a single top-level JSON object.
+
+    Text before the opening brace (and after the closing one) is ignored.
+    Only string/escape state and nesting depth are tracked per character;
+    completed members are decoded with ``json.loads``.
+
+    Example:
+        parser = IncrementalJSONParser()
+        for chunk in chunks:
+            for key, value in parser.feed(chunk):
+                ...
+            if parser.complete:
+                break
+    """
+
+    def __init__(self):
+        self.members: Dict[str, Any] = {}
+        self.complete = False
+        self._buffer: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._member_start: Optional[int] = None  # Buffer index of the current member
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        Consume a chunk of streamed text.
+
+        Args:
+            chunk: Next piece of the response
+
+        Returns:
+            Top-level (key, value) members completed by this chunk
+        """
+        completed: List[Tuple[str, Any]] = []
+        if self.complete:
+            return completed
+
+        for char in chunk:
+            if self._depth == 0:
+                # Skip leading chatter until the object starts
+                if char == "{":
+                    self._depth = 1
+                    self._buffer.append(char)
+                    self._member_start = len(self._buffer)
+                continue
+
+            index = len(self._buffer)
+            self._buffer.append(char)
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 1:
+                    # Nested value closed: the member is complete
+                    self._finish_member(index + 1, completed)
+                elif self._depth == 0:
+                    self._finish_member(index, completed)
+                    self.complete = True
+                    break
+            elif char == "," and self._depth == 1:
+                self._finish_member(index, completed)
+                self._member_start = index + 1
+
+        return completed
+
+    def _finish_member(self, end: int, completed: List[Tuple[str, Any]]) -> None:
+        """Decode the member between the member start and ``end``."""
+        if self._member_start is None:
+            return
+        text = "".join(self._buffer[self._member_start:end]).strip()
+        self._member_start = None
+        if not text:
+            return
+        try:
+            member = json.loads("{" + text + "}")
+        except json.JSONDecodeError:
+            return
+        for key, value in member.items():
+            self.members[key] = value
+            completed.append((key, value))
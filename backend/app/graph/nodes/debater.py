@@ -1,376 +1,413 @@
 """
 Debater Node Implementations
+
+A single streaming implementation serves every debater node of the execution
+plan (openings, cross-examinations, rebuttal rounds and summaries). It is used
+by both the debate engine (API and batch runs) and the LangGraph graph.
+
+In conversation mode (``config_json.conversation_mode`` or
+``DEBATE_CONVERSATION_MODE``) each debater keeps one ``/api/chat`` history for
+the whole debate instead of receiving a freshly built prompt that repeats the
+transcript. The history is rebuilt from state on every turn and earlier
+messages render byte-identically, so Ollama only evaluates the new messages.
+A history that no longer fits the model's context window is not truncated;
+the turn falls back to the fitted ``/api/generate`` prompt instead.
+
+Forbidden phrases are matched on the token stream. With
+``forbidden_phrase_enforcement`` set to "flag" a ``violation`` event is sent
+on each hit; with "regenerate" the offending attempt is also stopped and the
+turn regenerated (up to ``max_regenerations`` times) with the phrases named.
+A ``turn_reset`` event tells clients to discard the tokens streamed so far.
 """
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 from uuid import uuid4
 from datetime import datetime
+from contextlib import aclosing
+import json
 import logging
 
+from app.core.config import settings
 from app.graph.state import DebateState, Turn
+from app.graph.plan import ExecutionPlan, PlanNode, phase_name
+from app.graph.budget import estimate_tokens, fit_transcript, fits_context
+from app.graph.phrases import PhraseScanner, matcher_for_persona
 from app.graph.prompts.debater_prompts import (
     build_opening_prompt,
+    build_cross_exam_prompt,
     build_rebuttal_prompt,
-    build_summary_prompt
+    build_summary_prompt,
+    build_conversation_brief,
+    build_conversation_turn,
+    build_regeneration_note
 )
 from app.graph.nodes.utils import (
+    EventEmitter,
     stream_ollama_with_retry,
-    build_system_prompt
+    build_system_prompt,
+    get_phase_turns
 )
 
 logger = logging.getLogger(__name__)
 
 
-async def opening_a(state: DebateState) -> DebateState:
-    """
-    Generate Agent A's opening argument.
-
-    Streams the response and creates a turn in the debate state.
+async def _build_debater_prompt(
+    node: PlanNode,
+    plan: ExecutionPlan,
+    state: DebateState,
+    reserved_tokens: int = 0
+) -> str:
     """
-    agent_a = state["agent_a"]
+    Build the prompt for a debater node (``/api/generate`` mode).
 
-    # Build prompt
-    system_prompt = build_system_prompt(agent_a["persona_json"])
-    prompt = build_opening_prompt(
-        topic=state["topic"],
-        position=state["position_a"],
-        persona=agent_a["persona_json"]
-    )
-
-    # Stream generation with retry
-    turn_id = str(uuid4())
-    content_chunks = []
+    Transcript sections (summary context, earlier exchanges) are compacted to
+    fit the debater model's context window.
 
-    logger.info(f"Generating opening argument for Agent A (turn_id: {turn_id})")
+    Args:
+        node: Debater node from the execution plan
+        plan: Execution plan
+        state: Current debate state
+        reserved_tokens: Tokens needed outside the prompt (system prompt,
+            generated tokens)
 
-    try:
-        async for chunk in stream_ollama_with_retry(
-            model=agent_a["model"],
-            prompt=prompt,
-            system=system_prompt,
-            temperature=agent_a["params_json"].get("temperature", 0.7),
-            max_tokens=agent_a["params_json"].get("max_tokens", 1024),
-            max_retries=3
-        ):
-            content_chunks.append(chunk)
-    except Exception as e:
-        logger.error(f"Failed to generate opening_a: {e}")
-        state["status"] = "failed"
-        raise
-
-    full_content = "".join(content_chunks)
-
-    # Create turn
-    turn: Turn = {
-        "turn_id": turn_id,
-        "agent_id": agent_a["agent_id"],
-        "phase": "opening_a",
-        "role": "debater",
-        "content": full_content,
-        "targets": [],
-        "metadata": {
-            "timestamp": datetime.utcnow().isoformat(),
-            "model": agent_a["model"]
-        }
-    }
-
-    # Update state
-    return {
-        **state,
-        "turns": state["turns"] + [turn],
-        "current_phase": "score_opening_a"
-    }
-
-
-async def opening_b(state: DebateState) -> DebateState:
-    """Generate Agent B's opening argument."""
-    agent_b = state["agent_b"]
-
-    system_prompt = build_system_prompt(agent_b["persona_json"])
-    prompt = build_opening_prompt(
-        topic=state["topic"],
-        position=state["position_b"],
-        persona=agent_b["persona_json"]
+    Returns:
+        Prompt for the debater
+    """
+    stage = node["stage"]
+    agent_label = node["side"]
+    opponent_label = "B" if agent_label == "A" else "A"
+    agent = state["agent_a"] if agent_label == "A" else state["agent_b"]
+    position = state["position_a"] if agent_label == "A" else state["position_b"]
+
+    if stage == "opening":
+        return build_opening_prompt(
+            topic=state["topic"],
+            position=position,
+            persona=agent["persona_json"]
+        )
+
+    if stage == "summary":
+        all_turns = get_phase_turns(state, plan.debater_ancestors(node["name"]))
+        template_tokens = estimate_tokens(build_summary_prompt(
+            topic=state["topic"],
+            position=position,
+            persona=agent["persona_json"],
+            all_debate_turns=[]
+        ))
+        return build_summary_prompt(
+            topic=state["topic"],
+            position=position,
+            persona=agent["persona_json"],
+            all_debate_turns=await fit_transcript(
+                agent["model"],
+                [t["content"] for t in all_turns],
+                reserved_tokens + template_tokens
+            )
+        )
+
+    own_opening, opponent_opening = get_phase_turns(
+        state, [phase_name("opening", agent_label), phase_name("opening", opponent_label)]
     )
 
-    turn_id = str(uuid4())
-    content_chunks = []
-
-    logger.info(f"Generating opening argument for Agent B (turn_id: {turn_id})")
-
-    try:
-        async for chunk in stream_ollama_with_retry(
-            model=agent_b["model"],
-            prompt=prompt,
-            system=system_prompt,
-            temperature=agent_b["params_json"].get("temperature", 0.7),
-            max_tokens=agent_b["params_json"].get("max_tokens", 1024),
-            max_retries=3
-        ):
-            content_chunks.append(chunk)
-    except Exception as e:
-        logger.error(f"Failed to generate opening_b: {e}")
-        state["status"] = "failed"
-        raise
-
-    full_content = "".join(content_chunks)
-
-    turn: Turn = {
-        "turn_id": turn_id,
-        "agent_id": agent_b["agent_id"],
-        "phase": "opening_b",
-        "role": "debater",
-        "content": full_content,
-        "targets": [],
-        "metadata": {
-            "timestamp": datetime.utcnow().isoformat(),
-            "model": agent_b["model"]
-        }
-    }
-
-    return {
-        **state,
-        "turns": state["turns"] + [turn],
-        "current_phase": "score_opening_b"
-    }
-
-
-async def rebuttal_a(state: DebateState) -> DebateState:
-    """Generate Agent A's rebuttal."""
-    agent_a = state["agent_a"]
-
-    # Get previous turns
-    opening_a_turn = next((t for t in state["turns"] if t["phase"] == "opening_a"), None)
-    opening_b_turn = next((t for t in state["turns"] if t["phase"] == "opening_b"), None)
-
-    if not opening_a_turn:
-        raise ValueError("opening_a turn not found in state - execution order may be corrupted")
-    if not opening_b_turn:
-        raise ValueError("opening_b turn not found in state - execution order may be corrupted")
-
-    system_prompt = build_system_prompt(agent_a["persona_json"])
-    prompt = build_rebuttal_prompt(
+    if stage == "cross_exam":
+        return build_cross_exam_prompt(
+            topic=state["topic"],
+            position=position,
+            persona=agent["persona_json"],
+            opponent_opening=opponent_opening["content"],
+            own_opening=own_opening["content"]
+        )
+
+    # Rebuttal: earlier exchanges (cross-examination, previous rounds) as context
+    openings = {own_opening["phase"], opponent_opening["phase"]}
+    exchange_phases = [n for n in plan.debater_ancestors(node["name"]) if n not in openings]
+    template_tokens = estimate_tokens(build_rebuttal_prompt(
         topic=state["topic"],
-        position=state["position_a"],
-        persona=agent_a["persona_json"],
-        opponent_opening=opening_b_turn["content"],
-        own_opening=opening_a_turn["content"]
+        position=position,
+        persona=agent["persona_json"],
+        opponent_opening=opponent_opening["content"],
+        own_opening=own_opening["content"]
+    ))
+    return build_rebuttal_prompt(
+        topic=state["topic"],
+        position=position,
+        persona=agent["persona_json"],
+        opponent_opening=opponent_opening["content"],
+        own_opening=own_opening["content"],
+        previous_exchanges=await fit_transcript(
+            agent["model"],
+            [t["content"] for t in get_phase_turns(state, exchange_phases)],
+            reserved_tokens + template_tokens
+        )
     )
 
-    turn_id = str(uuid4())
-    content_chunks = []
-
-    logger.info(f"Generating rebuttal for Agent A (turn_id: {turn_id})")
-
-    try:
-        async for chunk in stream_ollama_with_retry(
-            model=agent_a["model"],
-            prompt=prompt,
-            system=system_prompt,
-            temperature=agent_a["params_json"].get("temperature", 0.7),
-            max_tokens=agent_a["params_json"].get("max_tokens", 1024),
-            max_retries=3
-        ):
-            content_chunks.append(chunk)
-    except Exception as e:
-        logger.error(f"Failed to generate rebuttal_a: {e}")
-        state["status"] = "failed"
-        raise
-
-    full_content = "".join(content_chunks)
-
-    turn: Turn = {
-        "turn_id": turn_id,
-        "agent_id": agent_a["agent_id"],
-        "phase": "rebuttal_a",
-        "role": "debater",
-        "content": full_content,
-        "targets": [opening_b_turn["turn_id"]],  # Targeting opponent's opening
-        "metadata": {
-            "timestamp": datetime.utcnow().isoformat(),
-            "model": agent_a["model"]
-        }
-    }
-
-    return {
-        **state,
-        "turns": state["turns"] + [turn],
-        "current_phase": "score_rebuttal_a"
-    }
-
 
-async def rebuttal_b(state: DebateState) -> DebateState:
-    """Generate Agent B's rebuttal."""
-    agent_b = state["agent_b"]
-
-    # Get previous turns
-    opening_a_turn = next((t for t in state["turns"] if t["phase"] == "opening_a"), None)
-    opening_b_turn = next((t for t in state["turns"] if t["phase"] == "opening_b"), None)
-
-    if not opening_a_turn:
-        raise ValueError("opening_a turn not found in state - execution order may be corrupted")
-    if not opening_b_turn:
-        raise ValueError("opening_b turn not found in state - execution order may be corrupted")
-
-    system_prompt = build_system_prompt(agent_b["persona_json"])
-    prompt = build_rebuttal_prompt(
-        topic=state["topic"],
-        position=state["position_b"],
-        persona=agent_b["persona_json"],
-        opponent_opening=opening_a_turn["content"],
-        own_opening=opening_b_turn["content"]
+def _debater_targets(node: PlanNode, state: DebateState) -> List[str]:
+    """IDs of the opponent turns a debater node responds to."""
+    opponent_label = "B" if node["side"] == "A" else "A"
+    if node["stage"] == "rebuttal" and node["round"] > 1:
+        # Later rounds answer the opponent's previous rebuttal
+        phase = phase_name("rebuttal", opponent_label, node["round"] - 1)
+    elif node["stage"] in ("cross_exam", "rebuttal"):
+        phase = phase_name("opening", opponent_label)
+    else:
+        return []
+    target, = get_phase_turns(state, [phase])
+    return [target["turn_id"]]
+
+
+def _enforcement_mode(state: DebateState) -> str:
+    """Forbidden phrase enforcement: "off", "flag" or "regenerate"."""
+    mode = state["config"].get(
+        "forbidden_phrase_enforcement", settings.DEBATE_FORBIDDEN_PHRASE_ENFORCEMENT
     )
+    return mode if mode in ("off", "flag", "regenerate") else "off"
 
-    turn_id = str(uuid4())
-    content_chunks = []
-
-    logger.info(f"Generating rebuttal for Agent B (turn_id: {turn_id})")
 
+def _max_regenerations(state: DebateState) -> int:
+    """Regeneration attempts allowed per turn in "regenerate" mode."""
     try:
-        async for chunk in stream_ollama_with_retry(
-            model=agent_b["model"],
-            prompt=prompt,
-            system=system_prompt,
-            temperature=agent_b["params_json"].get("temperature", 0.7),
-            max_tokens=agent_b["params_json"].get("max_tokens", 1024),
-            max_retries=3
-        ):
-            content_chunks.append(chunk)
-    except Exception as e:
-        logger.error(f"Failed to generate rebuttal_b: {e}")
-        state["status"] = "failed"
-        raise
-
-    full_content = "".join(content_chunks)
-
-    turn: Turn = {
-        "turn_id": turn_id,
-        "agent_id": agent_b["agent_id"],
-        "phase": "rebuttal_b",
-        "role": "debater",
-        "content": full_content,
-        "targets": [opening_a_turn["turn_id"]],
-        "metadata": {
-            "timestamp": datetime.utcnow().isoformat(),
-            "model": agent_b["model"]
-        }
-    }
-
-    return {
-        **state,
-        "turns": state["turns"] + [turn],
-        "current_phase": "score_rebuttal_b"
-    }
-
-
-async def summary_a(state: DebateState) -> DebateState:
-    """Generate Agent A's summary (Whip Speech)."""
-    agent_a = state["agent_a"]
+        return max(0, int(state["config"].get("max_regenerations", settings.DEBATE_MAX_REGENERATIONS)))
+    except (TypeError, ValueError):
+        return settings.DEBATE_MAX_REGENERATIONS
 
-    # Get all debate turns for context
-    all_turns = [t["content"] for t in state["turns"] if t["role"] == "debater"]
 
-    system_prompt = build_system_prompt(agent_a["persona_json"])
-    prompt = build_summary_prompt(
-        topic=state["topic"],
-        position=state["position_a"],
-        persona=agent_a["persona_json"],
-        all_debate_turns=all_turns
-    )
-
-    turn_id = str(uuid4())
-    content_chunks = []
+def _conversation_mode(state: DebateState) -> bool:
+    """Whether debaters keep a chat history instead of rebuilt prompts."""
+    return bool(state["config"].get("conversation_mode", settings.DEBATE_CONVERSATION_MODE))
 
-    logger.info(f"Generating summary for Agent A (turn_id: {turn_id})")
 
-    try:
-        async for chunk in stream_ollama_with_retry(
-            model=agent_a["model"],
-            prompt=prompt,
-            system=system_prompt,
-            temperature=agent_a["params_json"].get("temperature", 0.7),
-            max_tokens=agent_a["params_json"].get("max_tokens", 1024),
-            max_retries=3
-        ):
-            content_chunks.append(chunk)
-    except Exception as e:
-        logger.error(f"Failed to generate summary_a: {e}")
-        state["status"] = "failed"
-        raise
-
-    full_content = "".join(content_chunks)
+def _build_conversation_messages(
+    node: PlanNode,
+    plan: ExecutionPlan,
+    state: DebateState
+) -> List[Dict[str, str]]:
+    """
+    Build a debater's chat history up to and including the current request.
 
-    turn: Turn = {
-        "turn_id": turn_id,
-        "agent_id": agent_a["agent_id"],
-        "phase": "summary_a",
-        "role": "debater",
-        "content": full_content,
-        "targets": [],
-        "metadata": {
-            "timestamp": datetime.utcnow().isoformat(),
-            "model": agent_a["model"]
-        }
-    }
+    Each of the debater's speeches is requested by a user message carrying
+    the opponent speeches delivered since the previous request, followed by
+    the speech itself as the assistant reply. Because the plan and earlier
+    turns are fixed, every message except the last is identical to what was
+    sent on the previous turn.
 
-    return {
-        **state,
-        "turns": state["turns"] + [turn],
-        "current_phase": "score_summary_a"
-    }
+    Returns:
+        Messages for ``/api/chat`` (system message first)
+    """
+    agent_label = node["side"]
+    agent = state["agent_a"] if agent_label == "A" else state["agent_b"]
+    position = state["position_a"] if agent_label == "A" else state["position_b"]
+
+    messages = [
+        {"role": "system", "content": build_system_prompt(agent["persona_json"])},
+        {"role": "user", "content": build_conversation_brief(
+            topic=state["topic"],
+            position=position,
+            persona=agent["persona_json"]
+        )},
+    ]
+
+    own_nodes = [
+        n for n in plan.debater_ancestors(node["name"]) if plan[n]["side"] == agent_label
+    ] + [node["name"]]
+    shown = set()
+    for own in own_nodes:
+        unseen = [
+            n for n in plan.debater_ancestors(own)
+            if plan[n]["side"] != agent_label and n not in shown
+        ]
+        shown.update(unseen)
+        opponent_turns = [
+            (plan[t["phase"]]["stage"], t["content"]) for t in get_phase_turns(state, unseen)
+        ]
+        messages.append({
+            "role": "user",
+            "content": build_conversation_turn(plan[own]["stage"], opponent_turns)
+        })
+        if own != node["name"]:
+            own_turn, = get_phase_turns(state, [own])
+            messages.append({"role": "assistant", "content": own_turn["content"]})
+
+    return messages
+
+
+def _with_regeneration_note(
+    prompt: str,
+    messages: Optional[List[Dict[str, str]]],
+    phrases: List[str]
+) -> Tuple[str, Optional[List[Dict[str, str]]]]:
+    """
+    Add the regeneration note to a debater request.
 
+    The note goes last, after the transcript and the per-turn instructions
+    (the end of the prompt, or of the final user message), so the discarded
+    attempt's request stays a byte-identical prefix of the retry and Ollama
+    reuses its cache.
 
-async def summary_b(state: DebateState) -> DebateState:
-    """Generate Agent B's summary (Whip Speech)."""
-    agent_b = state["agent_b"]
+    Returns:
+        Tuple of (prompt, messages) for the retry
+    """
+    note = build_regeneration_note(phrases)
+    if messages is None:
+        return f"{prompt}\n\n{note}", None
+    last = messages[-1]
+    return prompt, messages[:-1] + [{**last, "content": f"{last['content']}\n\n{note}"}]
+
+
+async def debater_node(
+    node: PlanNode,
+    plan: ExecutionPlan,
+    state: DebateState,
+    emit: EventEmitter
+) -> Dict[str, Any]:
+    """
+    Generate a debater turn with real-time token streaming.
 
-    # Get all debate turns for context
-    all_turns = [t["content"] for t in state["turns"] if t["role"] == "debater"]
+    Args:
+        node: Debater node from the execution plan
+        plan: Execution plan
+        state: Current debate state
+        emit: Callback receiving SSE token events
 
-    system_prompt = build_system_prompt(agent_b["persona_json"])
-    prompt = build_summary_prompt(
-        topic=state["topic"],
-        position=state["position_b"],
-        persona=agent_b["persona_json"],
-        all_debate_turns=all_turns
-    )
+    Returns:
+        State update with the new turn
+    """
+    node_name = node["name"]
+    agent = state["agent_a"] if node["side"] == "A" else state["agent_b"]
+
+    system_prompt = build_system_prompt(agent["persona_json"])
+
+    max_tokens = agent["params_json"].get("max_tokens", 1024)
+    if state["config"].get("max_tokens_per_turn"):
+        max_tokens = min(max_tokens, int(state["config"]["max_tokens_per_turn"]))
+
+    messages = None
+    if _conversation_mode(state):
+        messages = _build_conversation_messages(node, plan, state)
+        if not await fits_context(agent["model"], [m["content"] for m in messages], max_tokens):
+            logger.warning(
+                f"Chat history for {node_name} exceeds the context of {agent['model']}, "
+                "using a fitted prompt instead"
+            )
+            messages = None
+    conversation_mode = messages is not None
+    if conversation_mode:
+        # The chat history replaces the rebuilt prompt, which is not needed
+        prompt = ""
+    else:
+        prompt = await _build_debater_prompt(
+            node, plan, state, reserved_tokens=estimate_tokens(system_prompt) + max_tokens
+        )
+    targets = _debater_targets(node, state)
 
     turn_id = str(uuid4())
-    content_chunks = []
-
-    logger.info(f"Generating summary for Agent B (turn_id: {turn_id})")
-
-    try:
-        async for chunk in stream_ollama_with_retry(
-            model=agent_b["model"],
-            prompt=prompt,
-            system=system_prompt,
-            temperature=agent_b["params_json"].get("temperature", 0.7),
-            max_tokens=agent_b["params_json"].get("max_tokens", 1024),
-            max_retries=3
-        ):
-            content_chunks.append(chunk)
-    except Exception as e:
-        logger.error(f"Failed to generate summary_b: {e}")
-        state["status"] = "failed"
-        raise
-
-    full_content = "".join(content_chunks)
+    enforcement = _enforcement_mode(state)
+    matcher = matcher_for_persona(agent["persona_json"])
+    max_attempts = 1
+    if enforcement == "regenerate" and matcher:
+        max_attempts += _max_regenerations(state)
+    avoided_phrases: List[str] = []
+
+    logger.info(f"Generating {node_name} (turn_id: {turn_id})")
+
+    for attempt in range(1, max_attempts + 1):
+        attempt_prompt, attempt_messages = prompt, messages
+        if avoided_phrases:
+            attempt_prompt, attempt_messages = _with_regeneration_note(prompt, messages, avoided_phrases)
+
+        # Forbidden phrases are matched as tokens arrive (no re-scan when scoring)
+        scanner = PhraseScanner(matcher)
+        content_chunks = []
+        stats: Dict[str, Any] = {}
+        can_regenerate = attempt < max_attempts
+
+        async def report(violations) -> bool:
+            """Emit live violations; True if the attempt should be regenerated."""
+            for violation in violations:
+                logger.info(f"Forbidden phrase in {node_name}: {violation['phrase']!r}")
+                if enforcement != "off":
+                    await emit({
+                        "event": "violation",
+                        "data": json.dumps({
+                            "turn_id": turn_id,
+                            "phase": node_name,
+                            "phrase": violation["phrase"],
+                            "context": violation["context"],
+                            "attempt": attempt,
+                            "action": "regenerate" if can_regenerate else "flag"
+                        })
+                    })
+            return bool(violations) and can_regenerate
+
+        regenerate = False
+        try:
+            async with aclosing(stream_ollama_with_retry(
+                model=agent["model"],
+                prompt=attempt_prompt,
+                system=system_prompt,
+                temperature=agent["params_json"].get("temperature", 0.7),
+                max_tokens=max_tokens,
+                max_retries=3,
+                messages=attempt_messages,
+                stats=stats
+            )) as stream:
+                async for chunk in stream:
+                    content_chunks.append(chunk)
+
+                    # Stream token to frontend
+                    await emit({
+                        "event": "token",
+                        "data": json.dumps({
+                            "turn_id": turn_id,
+                            "phase": node_name,
+                            "content": chunk
+                        })
+                    })
+
+                    if await report(scanner.feed(chunk)):
+                        # Stop generating the offending attempt right away
+                        regenerate = True
+                        break
+        except Exception as e:
+            logger.error(f"Failed to generate {node_name}: {e}")
+            raise
+
+        if not regenerate:
+            regenerate = await report(scanner.finish())
+        if not regenerate:
+            break
+
+        avoided_phrases.extend(
+            v["phrase"] for v in scanner.violations if v["phrase"] not in avoided_phrases
+        )
+        logger.info(f"Regenerating {node_name} without {avoided_phrases} (attempt {attempt + 1})")
+        # The discarded attempt was already streamed; clients clear the turn
+        await emit({
+            "event": "turn_reset",
+            "data": json.dumps({
+                "turn_id": turn_id,
+                "phase": node_name,
+                "attempt": attempt + 1,
+                "reason": "forbidden_phrases",
+                "phrases": avoided_phrases
+            })
+        })
 
     turn: Turn = {
         "turn_id": turn_id,
-        "agent_id": agent_b["agent_id"],
-        "phase": "summary_b",
+        "agent_id": agent["agent_id"],
+        "phase": node_name,
         "role": "debater",
-        "content": full_content,
-        "targets": [],
+        "content": "".join(content_chunks),
+        "targets": targets,
         "metadata": {
             "timestamp": datetime.utcnow().isoformat(),
-            "model": agent_b["model"]
+            "model": agent["model"],
+            "round": node["round"],
+            "prompt_mode": "chat" if conversation_mode else "generate",
+            "forbidden_phrases_detected": scanner.violations,
+            "regenerations": attempt - 1,
+            "ollama_stats": stats
         }
     }
 
-    return {
-        **state,
-        "turns": state["turns"] + [turn],
-        "current_phase": "score_summary_b"
-    }
+    return {"turns": [turn]}
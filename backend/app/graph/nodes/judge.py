@@ -1,12 +1,36 @@
 """
 Judge Node Implementations
+
+Judge introduction, per-turn scoring and final verdict nodes. These are the
+only implementations; the debate engine (API and batch runs) and the
+LangGraph graph both execute them.
 """
-from typing import Dict, Any
+from typing import Dict, Any, Awaitable, Callable, List, Optional, Tuple
 from uuid import uuid4
 from datetime import datetime
+from contextlib import aclosing
+import asyncio
+import json
 import logging
 
+from app.core.config import settings
 from app.graph.state import DebateState, Turn
+from app.graph.plan import ExecutionPlan, PlanNode, phase_name
+from app.graph.budget import estimate_tokens, fit_transcript
+from app.graph.json_stream import IncrementalJSONParser
+from app.graph.novelty import detect_new_content
+from app.graph.panel import aggregate_scores, panel_aggregation, score_variance
+from app.graph.score_batching import score_batcher, score_batching_enabled
+from app.graph.timing import add_stats
+from app.graph.phrases import matcher_for_persona
+from app.graph.scoring import (
+    ScoreParseError,
+    build_repair_prompt,
+    parse_stage_scores,
+    record_parse_outcome,
+    required_score_fields,
+    score_json_schema
+)
 from app.graph.prompts.judge_prompts import (
     build_judge_intro_prompt,
     build_scoring_prompt_opening,
@@ -15,16 +39,80 @@ from app.graph.prompts.judge_prompts import (
     build_verdict_prompt
 )
 from app.graph.nodes.utils import (
+    EventEmitter,
     call_ollama_with_retry,
+    stream_ollama_with_retry,
     build_system_prompt,
-    parse_json_scores,
-    detect_forbidden_phrases
+    get_phase_turns,
+    parse_json_scores
 )
 
 logger = logging.getLogger(__name__)
 
+SCORING_SYSTEM_PROMPT = "You are a fair and objective debate judge. Provide scores in valid JSON format."
+VERDICT_SYSTEM_PROMPT = "You are a fair and objective debate judge delivering your final verdict."
+SUMMARY_SCORING_SYSTEM_PROMPT = (
+    "You are a fair and objective debate judge. Check for new arguments and forbidden phrases. "
+    "Provide scores in valid JSON format."
+)
+SCORING_MAX_TOKENS = 512
+VERDICT_MAX_TOKENS = 1024
+
+
+def _new_argument_detection(state: DebateState) -> str:
+    """How summaries are checked for new arguments: "lexical" or "judge"."""
+    mode = state["config"].get("new_argument_detection", settings.DEBATE_NEW_ARGUMENT_DETECTION)
+    return mode if mode in ("lexical", "judge") else "lexical"
+
 
-async def judge_intro(state: DebateState) -> DebateState:
+def _judges(state: DebateState) -> List[Dict[str, Any]]:
+    """Judges of the run, primary judge first (more than one = panel mode)."""
+    return state.get("judge_panel") or [state["agent_j"]]
+
+
+async def _fit_per_model(
+    judges: List[Dict[str, Any]],
+    turns: List[str],
+    reserved_tokens: int
+) -> Dict[str, List[str]]:
+    """Transcript fitted to the context window of each distinct judge model."""
+    models = list(dict.fromkeys(judge["model"] for judge in judges))
+    fitted = await asyncio.gather(*(fit_transcript(model, turns, reserved_tokens) for model in models))
+    return dict(zip(models, fitted))
+
+
+async def _gather_panel(
+    judges: List[Dict[str, Any]],
+    call: Callable[[Dict[str, Any]], Awaitable[Any]],
+    what: str
+) -> List[Tuple[Dict[str, Any], Any]]:
+    """
+    Run one judge call per panel member concurrently.
+
+    A failure of the primary judge is raised; other judges that fail are
+    logged and left out.
+
+    Returns:
+        (judge, result) pairs of the judges that answered, primary first
+    """
+    results = await asyncio.gather(*(call(judge) for judge in judges), return_exceptions=True)
+    if isinstance(results[0], BaseException):
+        raise results[0]
+    answered = []
+    for judge, result in zip(judges, results):
+        if isinstance(result, BaseException):
+            logger.warning(f"Panel judge {judge['agent_id']} ({judge['model']}) failed {what}: {result}")
+            continue
+        answered.append((judge, result))
+    return answered
+
+
+async def judge_intro_node(
+    node: PlanNode,
+    plan: ExecutionPlan,
+    state: DebateState,
+    emit: EventEmitter
+) -> Dict[str, Any]:
     """
     Generate judge introduction and rules explanation.
     """
@@ -37,6 +125,7 @@ async def judge_intro(state: DebateState) -> DebateState:
     )
 
     turn_id = str(uuid4())
+    stats: Dict[str, Any] = {}
 
     logger.info(f"Generating judge intro (turn_id: {turn_id})")
 
@@ -47,11 +136,11 @@ async def judge_intro(state: DebateState) -> DebateState:
             system=system_prompt,
             temperature=0.5,  # Lower for consistency
             max_tokens=512,
-            max_retries=3
+            max_retries=3,
+            stats=stats
         )
     except Exception as e:
         logger.error(f"Failed to generate judge_intro: {e}")
-        state["status"] = "failed"
         raise
 
     turn: Turn = {
@@ -63,463 +152,438 @@ async def judge_intro(state: DebateState) -> DebateState:
         "targets": [],
         "metadata": {
             "timestamp": datetime.utcnow().isoformat(),
-            "model": agent_j["model"]
+            "model": agent_j["model"],
+            "ollama_stats": stats
         }
     }
 
     return {
-        **state,
-        "turns": state["turns"] + [turn],
-        "current_phase": "opening_a",
+        "turns": [turn],
         "status": "running"
     }
 
 
-async def score_opening_a(state: DebateState) -> DebateState:
-    """Score Agent A's opening argument."""
-    agent_j = state["agent_j"]
-    agent_a = state["agent_a"]
-
-    # Get the opening turn
-    opening_turn = next((t for t in state["turns"] if t["phase"] == "opening_a"), None)
-    if not opening_turn:
-        raise ValueError("opening_a turn not found in state - execution order may be corrupted")
-
-    # Detect forbidden phrase violations
-    forbidden_phrases = agent_a["persona_json"].get("forbidden_phrases", [])
-    violations = detect_forbidden_phrases(opening_turn["content"], forbidden_phrases)
-
-    if violations:
-        phrases = [v["phrase"] for v in violations]
-        logger.info(f"Detected {len(violations)} forbidden phrase violations in opening_a: {phrases}")
-
-    prompt = build_scoring_prompt_opening(
-        turn_content=opening_turn["content"],
-        rubric=state["rubric"],
-        agent_name=agent_a["name"],
-        forbidden_phrases=forbidden_phrases,
-        detected_violations=violations
-    )
-
-    logger.info(f"Scoring opening_a")
-
-    try:
-        response = await call_ollama_with_retry(
-            model=agent_j["model"],
-            prompt=prompt,
-            system="You are a fair and objective debate judge. Provide scores in valid JSON format.",
-            temperature=0.3,  # Low for consistency
-            max_tokens=512,
-            max_retries=3
-        )
-    except Exception as e:
-        logger.error(f"Failed to score opening_a: {e}")
-        state["status"] = "failed"
-        raise
-
-    # Parse scores
-    scores = parse_json_scores(response, default_score=7)
-
-    # Calculate weighted scores
-    rubric = state["rubric"]
-    weighted_scores = {
-        "argumentation": scores.get("argumentation", {}).get("total", 21) * (rubric.get("argumentation_weight", 35) / 100),
-        "delivery": scores.get("delivery", {}).get("total", 14) * (rubric.get("delivery_weight", 20) / 100),
-        "strategy": scores.get("strategy", {}).get("total", 7) * (rubric.get("strategy_weight", 15) / 100),
-        "rebuttal": 0,  # Not applicable for opening
-        "total": scores.get("total", 42)
-    }
-
-    # Update turn metadata
-    for turn in state["turns"]:
-        if turn["turn_id"] == opening_turn["turn_id"]:
-            turn["metadata"]["scores"] = scores
-            turn["metadata"]["forbidden_phrases_detected"] = violations
-            break
-
-    return {
-        **state,
-        "scores_a": weighted_scores,
-        "current_phase": "opening_b"
-    }
+async def score_node(
+    node: PlanNode,
+    plan: ExecutionPlan,
+    state: DebateState,
+    emit: EventEmitter
+) -> Dict[str, Any]:
+    """
+    Score a debater turn (opening, rebuttal round or summary).
 
+    The scored turn is returned with the scores and any detected forbidden
+    phrases added to a copy of its metadata (the turns reducer replaces it).
 
-async def score_opening_b(state: DebateState) -> DebateState:
-    """Score Agent B's opening argument."""
+    Returns:
+        State update with the scored turn (with its new metadata) and the
+        weighted score delta for the scored debater
+    """
     agent_j = state["agent_j"]
-    agent_b = state["agent_b"]
-
-    opening_turn = next((t for t in state["turns"] if t["phase"] == "opening_b"), None)
-    if not opening_turn:
-        raise ValueError("opening_b turn not found in state - execution order may be corrupted")
-
-    # Detect forbidden phrase violations
-    forbidden_phrases = agent_b["persona_json"].get("forbidden_phrases", [])
-    violations = detect_forbidden_phrases(opening_turn["content"], forbidden_phrases)
-
-    if violations:
-        phrases = [v["phrase"] for v in violations]
-        logger.info(f"Detected {len(violations)} forbidden phrase violations in opening_b: {phrases}")
-
-    prompt = build_scoring_prompt_opening(
-        turn_content=opening_turn["content"],
-        rubric=state["rubric"],
-        agent_name=agent_b["name"],
-        forbidden_phrases=forbidden_phrases,
-        detected_violations=violations
-    )
-
-    logger.info(f"Scoring opening_b")
-
-    try:
-        response = await call_ollama_with_retry(
-            model=agent_j["model"],
-            prompt=prompt,
-            system="You are a fair and objective debate judge. Provide scores in valid JSON format.",
-            temperature=0.3,
-            max_tokens=512,
-            max_retries=3
-        )
-    except Exception as e:
-        logger.error(f"Failed to score opening_b: {e}")
-        state["status"] = "failed"
-        raise
-
-    scores = parse_json_scores(response, default_score=7)
-
     rubric = state["rubric"]
-    weighted_scores = {
-        "argumentation": scores.get("argumentation", {}).get("total", 21) * (rubric.get("argumentation_weight", 35) / 100),
-        "delivery": scores.get("delivery", {}).get("total", 14) * (rubric.get("delivery_weight", 20) / 100),
-        "strategy": scores.get("strategy", {}).get("total", 7) * (rubric.get("strategy_weight", 15) / 100),
-        "rebuttal": 0,
-        "total": scores.get("total", 42)
-    }
-
-    for turn in state["turns"]:
-        if turn["turn_id"] == opening_turn["turn_id"]:
-            turn["metadata"]["scores"] = scores
-            turn["metadata"]["forbidden_phrases_detected"] = violations
-            break
-
-    return {
-        **state,
-        "scores_b": weighted_scores,
-        "current_phase": "rebuttal_a"
-    }
-
-
-async def score_rebuttal_a(state: DebateState) -> DebateState:
-    """Score Agent A's rebuttal."""
-    agent_j = state["agent_j"]
-    agent_a = state["agent_a"]
-
-    rebuttal_turn = next((t for t in state["turns"] if t["phase"] == "rebuttal_a"), None)
-    opening_b_turn = next((t for t in state["turns"] if t["phase"] == "opening_b"), None)
+    stage = node["stage"]
+    agent_label = node["side"]
+    agent = state["agent_a"] if agent_label == "A" else state["agent_b"]
 
-    if not rebuttal_turn:
-        raise ValueError("rebuttal_a turn not found in state - execution order may be corrupted")
-    if not opening_b_turn:
-        raise ValueError("opening_b turn not found in state - execution order may be corrupted")
+    turn_to_score, = get_phase_turns(state, [node["target"]])
 
-    # Detect forbidden phrase violations
-    forbidden_phrases = agent_a["persona_json"].get("forbidden_phrases", [])
-    violations = detect_forbidden_phrases(rebuttal_turn["content"], forbidden_phrases)
+    # Forbidden phrase violations (found while the turn streamed, if available)
+    forbidden_phrases = agent["persona_json"].get("forbidden_phrases", [])
+    violations = turn_to_score["metadata"].get("forbidden_phrases_detected")
+    if violations is None:
+        violations = matcher_for_persona(agent["persona_json"]).find(turn_to_score["content"])
 
     if violations:
         phrases = [v["phrase"] for v in violations]
-        logger.info(f"Detected {len(violations)} forbidden phrase violations in rebuttal_a: {phrases}")
-
-    prompt = build_scoring_prompt_rebuttal(
-        turn_content=rebuttal_turn["content"],
-        rubric=state["rubric"],
-        agent_name=agent_a["name"],
-        opponent_opening=opening_b_turn["content"],
-        forbidden_phrases=forbidden_phrases,
-        detected_violations=violations
-    )
-
-    logger.info(f"Scoring rebuttal_a")
-
-    try:
-        response = await call_ollama_with_retry(
-            model=agent_j["model"],
-            prompt=prompt,
-            system="You are a fair and objective debate judge. Provide scores in valid JSON format.",
-            temperature=0.3,
-            max_tokens=512,
-            max_retries=3
+        logger.info(f"Detected {len(violations)} forbidden phrase violations in {node['target']}: {phrases}")
+
+    judges = _judges(state)
+    system_prompt = SCORING_SYSTEM_PROMPT
+    new_argument_spans = None
+    prompts: Optional[Dict[str, str]] = None  # Per judge model, when fitted to its context
+    if stage == "opening":
+        prompt = build_scoring_prompt_opening(
+            turn_content=turn_to_score["content"],
+            rubric=rubric,
+            agent_name=agent["name"],
+            forbidden_phrases=forbidden_phrases,
+            detected_violations=violations
         )
-    except Exception as e:
-        logger.error(f"Failed to score rebuttal_a: {e}")
-        state["status"] = "failed"
-        raise
-
-    scores = parse_json_scores(response, default_score=7)
-
-    rubric = state["rubric"]
-    current_scores = state["scores_a"]
-
-    # Add rebuttal scores
-    rebuttal_score = scores.get("rebuttal", {}).get("total", 21) * (rubric.get("rebuttal_weight", 30) / 100)
-    current_scores["rebuttal"] = current_scores.get("rebuttal", 0) + rebuttal_score
-    current_scores["total"] = current_scores.get("total", 0) + scores.get("total", 35)
-
-    for turn in state["turns"]:
-        if turn["turn_id"] == rebuttal_turn["turn_id"]:
-            turn["metadata"]["scores"] = scores
-            turn["metadata"]["forbidden_phrases_detected"] = violations
-            break
-
-    return {
-        **state,
-        "scores_a": current_scores,
-        "current_phase": "rebuttal_b"
-    }
-
-
-async def score_rebuttal_b(state: DebateState) -> DebateState:
-    """Score Agent B's rebuttal."""
-    agent_j = state["agent_j"]
-    agent_b = state["agent_b"]
-
-    rebuttal_turn = next((t for t in state["turns"] if t["phase"] == "rebuttal_b"), None)
-    opening_a_turn = next((t for t in state["turns"] if t["phase"] == "opening_a"), None)
-
-    if not rebuttal_turn:
-        raise ValueError("rebuttal_b turn not found in state - execution order may be corrupted")
-    if not opening_a_turn:
-        raise ValueError("opening_a turn not found in state - execution order may be corrupted")
-
-    # Detect forbidden phrase violations
-    forbidden_phrases = agent_b["persona_json"].get("forbidden_phrases", [])
-    violations = detect_forbidden_phrases(rebuttal_turn["content"], forbidden_phrases)
-
-    if violations:
-        phrases = [v["phrase"] for v in violations]
-        logger.info(f"Detected {len(violations)} forbidden phrase violations in rebuttal_b: {phrases}")
-
-    prompt = build_scoring_prompt_rebuttal(
-        turn_content=rebuttal_turn["content"],
-        rubric=state["rubric"],
-        agent_name=agent_b["name"],
-        opponent_opening=opening_a_turn["content"],
-        forbidden_phrases=forbidden_phrases,
-        detected_violations=violations
-    )
-
-    logger.info(f"Scoring rebuttal_b")
-
-    try:
-        response = await call_ollama_with_retry(
-            model=agent_j["model"],
-            prompt=prompt,
-            system="You are a fair and objective debate judge. Provide scores in valid JSON format.",
-            temperature=0.3,
-            max_tokens=512,
-            max_retries=3
+    elif stage == "rebuttal":
+        opponent_opening, = get_phase_turns(state, [phase_name("opening", "B" if agent_label == "A" else "A")])
+        prompt = build_scoring_prompt_rebuttal(
+            turn_content=turn_to_score["content"],
+            rubric=rubric,
+            agent_name=agent["name"],
+            opponent_opening=opponent_opening["content"],
+            forbidden_phrases=forbidden_phrases,
+            detected_violations=violations
         )
-    except Exception as e:
-        logger.error(f"Failed to score rebuttal_b: {e}")
-        state["status"] = "failed"
-        raise
-
-    scores = parse_json_scores(response, default_score=7)
-
-    rubric = state["rubric"]
-    current_scores = state["scores_b"]
-
-    rebuttal_score = scores.get("rebuttal", {}).get("total", 21) * (rubric.get("rebuttal_weight", 30) / 100)
-    current_scores["rebuttal"] = current_scores.get("rebuttal", 0) + rebuttal_score
-    current_scores["total"] = current_scores.get("total", 0) + scores.get("total", 35)
-
-    for turn in state["turns"]:
-        if turn["turn_id"] == rebuttal_turn["turn_id"]:
-            turn["metadata"]["scores"] = scores
-            turn["metadata"]["forbidden_phrases_detected"] = violations
-            break
-
-    return {
-        **state,
-        "scores_b": current_scores,
-        "current_phase": "summary_a"
-    }
-
-
-async def score_summary_a(state: DebateState) -> DebateState:
-    """Score Agent A's summary."""
-    agent_j = state["agent_j"]
-    agent_a = state["agent_a"]
-
-    summary_turn = next((t for t in state["turns"] if t["phase"] == "summary_a"), None)
-    if not summary_turn:
-        raise ValueError("summary_a turn not found in state - execution order may be corrupted")
-
-    # Get all previous debate turns (excluding judge turns)
-    previous_turns = [t["content"] for t in state["turns"] if t["role"] == "debater" and t["phase"] != "summary_a"]
-
-    # Detect forbidden phrase violations
-    forbidden_phrases = agent_a["persona_json"].get("forbidden_phrases", [])
-    violations = detect_forbidden_phrases(summary_turn["content"], forbidden_phrases)
-
-    if violations:
-        phrases = [v["phrase"] for v in violations]
-        logger.info(f"Detected {len(violations)} forbidden phrase violations in summary_a: {phrases}")
-
-    prompt = build_scoring_prompt_summary(
-        turn_content=summary_turn["content"],
-        rubric=state["rubric"],
-        agent_name=agent_a["name"],
-        all_previous_turns=previous_turns,
-        forbidden_phrases=forbidden_phrases,
-        detected_violations=violations
-    )
-
-    logger.info(f"Scoring summary_a")
+    else:  # summary
+        previous_phases = [n for n in plan.debater_ancestors(node["name"]) if n != node["target"]]
+        previous_turns = [t["content"] for t in get_phase_turns(state, previous_phases)]
+        system_prompt = SUMMARY_SCORING_SYSTEM_PROMPT
+        summary_kwargs = dict(
+            turn_content=turn_to_score["content"],
+            rubric=rubric,
+            agent_name=agent["name"],
+            forbidden_phrases=forbidden_phrases,
+            detected_violations=violations
+        )
+        if _new_argument_detection(state) == "lexical":
+            # Only the spans that did not appear before are sent to the judge
+            new_argument_spans = detect_new_content(turn_to_score["content"], previous_turns)
+            logger.info(f"Flagged {len(new_argument_spans)} potentially new spans in {node['target']}")
+            prompt = build_scoring_prompt_summary(
+                all_previous_turns=[],
+                flagged_spans=[span["text"] for span in new_argument_spans],
+                **summary_kwargs
+            )
+        else:
+            template_tokens = estimate_tokens(
+                build_scoring_prompt_summary(all_previous_turns=[], **summary_kwargs)
+            )
+            fitted = await _fit_per_model(
+                judges,
+                previous_turns,
+                estimate_tokens(system_prompt) + template_tokens + SCORING_MAX_TOKENS
+            )
+            prompts = {
+                model: build_scoring_prompt_summary(all_previous_turns=turns, **summary_kwargs)
+                for model, turns in fitted.items()
+            }
 
+    logger.info(f"Scoring {node['target']}")
+
+    async def emit_partial(scores: Dict[str, Any]) -> None:
+        await emit({
+            "event": "score",
+            "data": json.dumps({
+                "phase": node["name"],
+                "scores": scores,
+                "agent": agent_label,
+                "partial": True
+            })
+        })
+
+    if prompts is None:
+        prompts = {judge["model"]: prompt for judge in judges}
+
+    panel = None
+    batched = score_batching_enabled(state["config"])
+    stats: Dict[str, Any] = {}
     try:
-        response = await call_ollama_with_retry(
-            model=agent_j["model"],
-            prompt=prompt,
-            system="You are a fair and objective debate judge. Check for new arguments and forbidden phrases. Provide scores in valid JSON format.",
-            temperature=0.3,
-            max_tokens=512,
-            max_retries=3
-        )
+        if len(judges) == 1:
+            scores = await _request_scores(
+                stage, agent_j["model"], prompts[agent_j["model"]], system_prompt,
+                on_partial=emit_partial, batched=batched, stats=stats
+            )
+        else:
+            scores, panel = await _request_panel_scores(
+                stage, judges, prompts, system_prompt, panel_aggregation(state["config"]),
+                emit_partial, batched=batched, stats=stats
+            )
     except Exception as e:
-        logger.error(f"Failed to score summary_a: {e}")
-        state["status"] = "failed"
+        logger.error(f"Failed to score {node['target']}: {e}")
         raise
 
-    scores = parse_json_scores(response, default_score=7)
-
-    rubric = state["rubric"]
-    current_scores = state["scores_a"]
-
-    # Add summary scores (with potential penalty)
-    strategy_score = scores.get("strategy", {}).get("total", 7) * (rubric.get("strategy_weight", 15) / 100)
-    current_scores["strategy"] = current_scores.get("strategy", 0) + strategy_score
-    current_scores["total"] = current_scores.get("total", 0) + scores.get("total", 28)
-
-    for turn in state["turns"]:
-        if turn["turn_id"] == summary_turn["turn_id"]:
-            turn["metadata"]["scores"] = scores
-            turn["metadata"]["new_arguments_detected"] = scores.get("new_arguments_detected", False)
-            turn["metadata"]["forbidden_phrases_detected"] = violations
-            break
+    # Weighted score deltas (added to the running totals by the state reducer)
+    if stage == "opening":
+        score_delta = {
+            "argumentation": scores.get("argumentation", {}).get("total", 21) * (rubric.get("argumentation_weight", 35) / 100),
+            "delivery": scores.get("delivery", {}).get("total", 14) * (rubric.get("delivery_weight", 20) / 100),
+            "strategy": scores.get("strategy", {}).get("total", 7) * (rubric.get("strategy_weight", 15) / 100),
+            "rebuttal": 0,  # Not applicable for opening
+            "total": scores.get("total", 42)
+        }
+    elif stage == "rebuttal":
+        score_delta = {
+            "rebuttal": scores.get("rebuttal", {}).get("total", 21) * (rubric.get("rebuttal_weight", 30) / 100),
+            "total": scores.get("total", 35)
+        }
+    else:  # summary (with potential penalty)
+        score_delta = {
+            "strategy": scores.get("strategy", {}).get("total", 7) * (rubric.get("strategy_weight", 15) / 100),
+            "total": scores.get("total", 28)
+        }
 
-    return {
-        **state,
-        "scores_a": current_scores,
-        "current_phase": "summary_b"
+    # Return the scored turn with new metadata; the logged turn may already
+    # be buffered for writing, so it is not modified
+    metadata = {
+        **turn_to_score["metadata"],
+        "scores": scores,
+        "forbidden_phrases_detected": violations,
+        "score_ollama_stats": stats
     }
+    if panel is not None:
+        metadata["panel"] = panel
+    if stage == "summary":
+        metadata["new_arguments_detected"] = scores.get("new_arguments_detected", False)
+        if new_argument_spans is not None:
+            metadata["new_argument_spans"] = new_argument_spans
+
+    update: Dict[str, Any] = {
+        "turns": [{**turn_to_score, "metadata": metadata}],
+        "scores_a" if agent_label == "A" else "scores_b": score_delta
+    }
+    if node["name"] == "score_summary_b":
+        update["status"] = "judging"
+    return update
+
+
+async def _stream_scores(
+    stage: str,
+    model: str,
+    prompt: str,
+    system_prompt: str,
+    on_partial: Callable[[Dict[str, Any]], Awaitable[None]],
+    stats: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Stream a score reply, reporting each top-level field as it completes.
 
+    Generation is cancelled as soon as every required field is present, so
+    trailing text (or a long justification) is not generated.
 
-async def score_summary_b(state: DebateState) -> DebateState:
-    """Score Agent B's summary."""
-    agent_j = state["agent_j"]
-    agent_b = state["agent_b"]
-
-    summary_turn = next((t for t in state["turns"] if t["phase"] == "summary_b"), None)
-    if not summary_turn:
-        raise ValueError("summary_b turn not found in state - execution order may be corrupted")
-
-    previous_turns = [t["content"] for t in state["turns"] if t["role"] == "debater" and t["phase"] != "summary_b"]
-
-    # Detect forbidden phrase violations
-    forbidden_phrases = agent_b["persona_json"].get("forbidden_phrases", [])
-    violations = detect_forbidden_phrases(summary_turn["content"], forbidden_phrases)
-
-    if violations:
-        phrases = [v["phrase"] for v in violations]
-        logger.info(f"Detected {len(violations)} forbidden phrase violations in summary_b: {phrases}")
-
-    prompt = build_scoring_prompt_summary(
-        turn_content=summary_turn["content"],
-        rubric=state["rubric"],
-        agent_name=agent_b["name"],
-        all_previous_turns=previous_turns,
-        forbidden_phrases=forbidden_phrases,
-        detected_violations=violations
+    Returns:
+        Reply text to validate (the parsed fields once the required ones
+        are complete, the raw text otherwise)
+    """
+    parser = IncrementalJSONParser()
+    required = required_score_fields(stage)
+    chunks = []
+
+    async with aclosing(stream_ollama_with_retry(
+        model=model,
+        prompt=prompt,
+        system=system_prompt,
+        temperature=0.3,  # Low for consistency
+        max_tokens=SCORING_MAX_TOKENS,
+        max_retries=3,
+        response_format=score_json_schema(stage),
+        stats=stats
+    )) as stream:
+        async for chunk in stream:
+            chunks.append(chunk)
+            if parser.feed(chunk):
+                await on_partial(dict(parser.members))
+            if parser.complete or required <= parser.members.keys():
+                break
+
+    if parser.complete or required <= parser.members.keys():
+        return json.dumps(parser.members)
+    return "".join(chunks)
+
+
+async def _discard_partial(scores: Dict[str, Any]) -> None:
+    return None
+
+
+async def _request_scores(
+    stage: str,
+    model: str,
+    prompt: str,
+    system_prompt: str,
+    on_partial: Callable[[Dict[str, Any]], Awaitable[None]] = _discard_partial,
+    batched: bool = False,
+    stats: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Request schema-constrained scores from the judge.
+
+    The stage's score schema is passed as Ollama's ``format`` and the reply
+    is streamed (see ``_stream_scores``). An invalid reply gets a single
+    repair request quoting the validation error; if that also fails, default
+    scores flagged with ``parse_failed`` are returned.
+
+    With ``batched``, the request is first offered to the score batcher
+    (see ``app.graph.score_batching``); partial fields are not reported for
+    scores that come back from a batch.
+
+    Args:
+        stage: Debate stage being scored
+        model: Judge model
+        prompt: Scoring prompt
+        system_prompt: Judge system prompt
+        on_partial: Receives the fields parsed so far as each one completes
+        batched: Batch the request with concurrent debates' requests
+        stats: Optional dict the Ollama counters of the requests are added to
+            (a stream stopped early reports none; batched requests neither)
+
+    Returns:
+        Validated scores dictionary
+    """
+    if batched:
+        scores = await score_batcher.score(stage, model, prompt, system_prompt)
+        if scores is not None:
+            return scores
+
+    stats = {} if stats is None else stats
+    schema = score_json_schema(stage)
+    call_stats: Dict[str, Any] = {}
+    response = await _stream_scores(stage, model, prompt, system_prompt, on_partial, call_stats)
+    add_stats(stats, call_stats)
+    try:
+        scores = parse_stage_scores(stage, response)
+        record_parse_outcome(model, stage, "ok")
+        return scores
+    except ScoreParseError as e:
+        logger.info(f"Invalid {stage} scores from {model}, requesting repair: {e}")
+        error = str(e)
+
+    call_stats = {}
+    repaired = await call_ollama_with_retry(
+        model=model,
+        prompt=build_repair_prompt(stage, response, error),
+        system=system_prompt,
+        temperature=0.0,
+        max_tokens=SCORING_MAX_TOKENS,
+        max_retries=3,
+        response_format=schema,
+        stats=call_stats
     )
-
-    logger.info(f"Scoring summary_b")
-
+    add_stats(stats, call_stats)
     try:
-        response = await call_ollama_with_retry(
-            model=agent_j["model"],
-            prompt=prompt,
-            system="You are a fair and objective debate judge. Check for new arguments and forbidden phrases. Provide scores in valid JSON format.",
-            temperature=0.3,
-            max_tokens=512,
-            max_retries=3
+        scores = parse_stage_scores(stage, repaired)
+        record_parse_outcome(model, stage, "repaired")
+        return scores
+    except ScoreParseError:
+        record_parse_outcome(model, stage, "failed")
+
+    scores = parse_json_scores("", default_score=7)
+    scores["parse_failed"] = True
+    return scores
+
+
+async def _request_panel_scores(
+    stage: str,
+    judges: List[Dict[str, Any]],
+    prompts: Dict[str, str],
+    system_prompt: str,
+    method: str,
+    on_partial: Callable[[Dict[str, Any]], Awaitable[None]] = _discard_partial,
+    batched: bool = False,
+    stats: Optional[Dict[str, Any]] = None
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Request scores from every panel judge concurrently and aggregate them.
+
+    Only the primary judge reports partial scores. Judges whose reply could
+    not be parsed (default scores) are left out of the aggregate unless no
+    judge produced valid scores.
+
+    Args:
+        stage: Debate stage being scored
+        judges: Panel judges, primary first
+        prompts: Scoring prompt per judge model
+        system_prompt: Judge system prompt
+        method: Aggregation method ("mean", "median", "trimmed_mean")
+        on_partial: Receives the primary judge's fields as they complete
+        batched: Batch the requests with concurrent debates' requests
+        stats: Optional dict the Ollama counters of all judges are added to
+
+    Returns:
+        (aggregated scores, panel metadata with per-judge scores and the
+        inter-judge variance)
+    """
+    judge_stats: Dict[str, Dict[str, Any]] = {judge["agent_id"]: {} for judge in judges}
+
+    async def score(judge: Dict[str, Any]) -> Dict[str, Any]:
+        return await _request_scores(
+            stage,
+            judge["model"],
+            prompts[judge["model"]],
+            system_prompt,
+            on_partial=on_partial if judge is judges[0] else _discard_partial,
+            batched=batched,
+            stats=judge_stats[judge["agent_id"]]
         )
-    except Exception as e:
-        logger.error(f"Failed to score summary_b: {e}")
-        state["status"] = "failed"
-        raise
-
-    scores = parse_json_scores(response, default_score=7)
-
-    rubric = state["rubric"]
-    current_scores = state["scores_b"]
-
-    strategy_score = scores.get("strategy", {}).get("total", 7) * (rubric.get("strategy_weight", 15) / 100)
-    current_scores["strategy"] = current_scores.get("strategy", 0) + strategy_score
-    current_scores["total"] = current_scores.get("total", 0) + scores.get("total", 28)
-
-    for turn in state["turns"]:
-        if turn["turn_id"] == summary_turn["turn_id"]:
-            turn["metadata"]["scores"] = scores
-            turn["metadata"]["new_arguments_detected"] = scores.get("new_arguments_detected", False)
-            turn["metadata"]["forbidden_phrases_detected"] = violations
-            break
 
-    return {
-        **state,
-        "scores_b": current_scores,
-        "current_phase": "judge_verdict",
-        "status": "judging"
+    answered = await _gather_panel(judges, score, f"scoring {stage}")
+    if stats is not None:
+        for judge_stat in judge_stats.values():
+            add_stats(stats, judge_stat)
+    valid = [scores for _, scores in answered if not scores.get("parse_failed")]
+    counted = valid or [scores for _, scores in answered]
+
+    aggregated = aggregate_scores(counted, method)
+    if not valid:
+        aggregated["parse_failed"] = True
+    panel = {
+        "aggregation": method,
+        "judges": [
+            {
+                "agent_id": judge["agent_id"],
+                "model": judge["model"],
+                "scores": scores,
+                "ollama_stats": judge_stats[judge["agent_id"]],
+            }
+            for judge, scores in answered
+        ],
+        "counted": len(counted),
+        "variance": score_variance(counted),
     }
+    return aggregated, panel
 
 
-async def judge_verdict(state: DebateState) -> DebateState:
-    """Generate final verdict and determine winner."""
+async def verdict_node(
+    node: PlanNode,
+    plan: ExecutionPlan,
+    state: DebateState,
+    emit: EventEmitter
+) -> Dict[str, Any]:
+    """
+    Generate final verdict and determine winner.
+
+    With a judge panel every judge writes a verdict concurrently; the
+    primary judge's is the run's verdict and the others are kept in the
+    turn metadata. The winner follows the (aggregated) scores.
+    """
     agent_j = state["agent_j"]
-    agent_a = state["agent_a"]
-    agent_b = state["agent_b"]
+    judges = _judges(state)
 
     # Get all debate turns
-    all_turns = [t["content"] for t in state["turns"] if t["role"] == "debater"]
-
-    prompt = build_verdict_prompt(
-        topic=state["topic"],
-        position_a=state["position_a"],
-        position_b=state["position_b"],
-        agent_a_name=agent_a["name"],
-        agent_b_name=agent_b["name"],
-        scores_a=state["scores_a"],
-        scores_b=state["scores_b"],
-        all_turns=all_turns
+    all_turns = get_phase_turns(state, plan.debater_ancestors(node["name"]))
+
+    verdict_args = {
+        "topic": state["topic"],
+        "position_a": state["position_a"],
+        "position_b": state["position_b"],
+        "agent_a_name": state["agent_a"]["name"],
+        "agent_b_name": state["agent_b"]["name"],
+        "scores_a": state["scores_a"],
+        "scores_b": state["scores_b"],
+    }
+    template_tokens = estimate_tokens(build_verdict_prompt(**verdict_args, all_turns=[]))
+    fitted = await _fit_per_model(
+        judges,
+        [t["content"] for t in all_turns],
+        estimate_tokens(VERDICT_SYSTEM_PROMPT) + template_tokens + VERDICT_MAX_TOKENS
     )
 
     turn_id = str(uuid4())
 
-    logger.info(f"Generating final verdict (turn_id: {turn_id})")
+    logger.info(f"Generating final verdict (turn_id: {turn_id}, judges: {len(judges)})")
 
-    try:
-        content = await call_ollama_with_retry(
-            model=agent_j["model"],
-            prompt=prompt,
-            system="You are a fair and objective debate judge delivering your final verdict.",
+    judge_stats: Dict[str, Dict[str, Any]] = {judge["agent_id"]: {} for judge in judges}
+
+    async def write_verdict(judge: Dict[str, Any]) -> str:
+        return await call_ollama_with_retry(
+            model=judge["model"],
+            prompt=build_verdict_prompt(**verdict_args, all_turns=fitted[judge["model"]]),
+            system=VERDICT_SYSTEM_PROMPT,
             temperature=0.5,
-            max_tokens=1024,
-            max_retries=3
+            max_tokens=VERDICT_MAX_TOKENS,
+            max_retries=3,
+            stats=judge_stats[judge["agent_id"]]
         )
+
+    try:
+        verdicts = await _gather_panel(judges, write_verdict, "the verdict")
     except Exception as e:
         logger.error(f"Failed to generate verdict: {e}")
-        state["status"] = "failed"
         raise
+    content = verdicts[0][1]
 
     # Determine winner
     score_a = state["scores_a"].get("total", 0)
@@ -543,6 +607,7 @@ async def judge_verdict(state: DebateState) -> DebateState:
         "metadata": {
             "timestamp": datetime.utcnow().isoformat(),
             "model": agent_j["model"],
+            "ollama_stats": judge_stats[agent_j["agent_id"]],
             "winner": winner,
             "final_scores": {
                 "a": state["scores_a"],
@@ -550,10 +615,19 @@ async def judge_verdict(state: DebateState) -> DebateState:
             }
         }
     }
+    if len(judges) > 1:
+        turn["metadata"]["panel_verdicts"] = [
+            {
+                "agent_id": judge["agent_id"],
+                "model": judge["model"],
+                "content": verdict,
+                "ollama_stats": judge_stats[judge["agent_id"]],
+            }
+            for judge, verdict in verdicts[1:]
+        ]
 
     return {
-        **state,
-        "turns": state["turns"] + [turn],
+        "turns": [turn],
         "winner": winner,
         "verdict": content,
         "current_phase": "completed",
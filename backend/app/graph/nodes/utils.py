@@ -3,13 +3,29 @@ Utility functions for debate nodes
 """
 import asyncio
 import logging
-from typing import AsyncGenerator, Dict, Any, List, TypedDict
+import time
+from contextlib import aclosing
+from typing import AsyncGenerator, Awaitable, Callable, Dict, Any, List, Optional, Union
 import httpx
 
-from app.services.ollama import stream_ollama, call_ollama
+from app.core import tracing
+from app.core.metrics import OLLAMA_FAILURES, OLLAMA_RETRIES, SCORE_PARSE_FALLBACKS, observe_ollama_call
+from app.services.ollama import stream_ollama, stream_ollama_chat, call_ollama
+from app.services.residency import residency
+from app.graph.scoring import ScoreParseError, extract_json_object
+from app.graph.phrases import ViolationInfo, get_phrase_matcher
+from app.graph.state import TurnLog
 
 logger = logging.getLogger(__name__)
 
+# Callback receiving SSE events ({"event": ..., "data": ...}) from running nodes
+EventEmitter = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+async def discard_event(event: Dict[str, Any]) -> None:
+    """EventEmitter that drops events (LangGraph runs, batch jobs)."""
+    return None
+
 
 async def stream_ollama_with_retry(
     model: str,
@@ -17,7 +33,10 @@ async def stream_ollama_with_retry(
     system: str = None,
     temperature: float = 0.7,
     max_tokens: int = 1024,
-    max_retries: int = 3
+    max_retries: int = 3,
+    messages: Optional[List[Dict[str, str]]] = None,
+    stats: Optional[Dict[str, Any]] = None,
+    response_format: Optional[Union[str, Dict[str, Any]]] = None
 ) -> AsyncGenerator[str, None]:
     """
     Stream from Ollama with exponential backoff retry.
@@ -29,50 +48,102 @@ async def stream_ollama_with_retry(
         temperature: Temperature parameter
         max_tokens: Max tokens to generate
         max_retries: Maximum retry attempts
+        messages: Chat history; when given, ``/api/chat`` is used and
+            prompt/system are ignored
+        stats: Optional dict filled with Ollama's counters (prompt_eval_count, ...)
+        response_format: Ollama ``format`` option ("json" or a JSON schema)
 
     Yields:
         Text chunks as they're generated
 
     Raises:
-        httpx.HTTPError: If all retries fail
+        httpx.HTTPError: If all retries fail, or the stream fails after
+            chunks were yielded (not retried)
     """
-    for attempt in range(max_retries):
-        try:
-            async for chunk in stream_ollama(
-                model=model,
-                prompt=prompt,
-                system=system,
-                temperature=temperature,
-                max_tokens=max_tokens
-            ):
-                yield chunk
-            return  # Success
-
-        except httpx.ConnectError as e:
-            if attempt < max_retries - 1:
-                wait_time = 2 ** attempt  # 1s, 2s, 4s
-                logger.warning(
-                    f"Ollama connection failed, retry {attempt+1}/{max_retries} in {wait_time}s: {e}"
-                )
-                await asyncio.sleep(wait_time)
-            else:
-                logger.error(f"Ollama connection failed after {max_retries} attempts")
-                raise
-
-        except httpx.TimeoutException as e:
-            if attempt < max_retries - 1:
-                wait_time = (2 ** attempt) * 1.5  # 1.5s, 3s, 6s
-                logger.warning(
-                    f"Ollama timeout, retry {attempt+1}/{max_retries} in {wait_time}s: {e}"
-                )
-                await asyncio.sleep(wait_time)
-            else:
-                logger.error(f"Ollama timeout after {max_retries} attempts")
+    stats = {} if stats is None else stats
+    span = tracing.start_span("ollama.stream", model=model, chat=messages is not None)
+    attempts, error = 0, None
+    try:
+        for attempt in range(max_retries):
+            attempts = attempt + 1
+            started = time.perf_counter()
+            received = False
+            try:
+                if messages is not None:
+                    stream = stream_ollama_chat(
+                        model=model,
+                        messages=messages,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        stats=stats
+                    )
+                else:
+                    stream = stream_ollama(
+                        model=model,
+                        prompt=prompt,
+                        system=system,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        stats=stats,
+                        response_format=response_format
+                    )
+                # Closing this generator early also stops the Ollama request
+                succeeded = False
+                try:
+                    async with aclosing(stream):
+                        async for chunk in stream:
+                            received = True
+                            yield chunk
+                    succeeded = True
+                except GeneratorExit:
+                    succeeded = True  # The caller stopped reading early
+                    raise
+                finally:
+                    if succeeded:
+                        residency.record_call(model, stats)
+                        observe_ollama_call(model, time.perf_counter() - started, stats)
+                return  # Success
+
+            # Once chunks were yielded a retry would stream the reply again from
+            # the start, so a failure mid-stream is raised instead
+            except httpx.ConnectError as e:
+                if attempt < max_retries - 1 and not received:
+                    wait_time = 2 ** attempt  # 1s, 2s, 4s
+                    logger.warning(
+                        f"Ollama connection failed, retry {attempt+1}/{max_retries} in {wait_time}s: {e}"
+                    )
+                    OLLAMA_RETRIES.inc(model=model, reason="connect")
+                    await asyncio.sleep(wait_time)
+                else:
+                    logger.error(f"Ollama connection failed after {attempt + 1} attempts (mid-stream: {received})")
+                    OLLAMA_FAILURES.inc(model=model, reason="connect")
+                    raise
+
+            except httpx.TimeoutException as e:
+                if attempt < max_retries - 1 and not received:
+                    wait_time = (2 ** attempt) * 1.5  # 1.5s, 3s, 6s
+                    logger.warning(
+                        f"Ollama timeout, retry {attempt+1}/{max_retries} in {wait_time}s: {e}"
+                    )
+                    OLLAMA_RETRIES.inc(model=model, reason="timeout")
+                    await asyncio.sleep(wait_time)
+                else:
+                    logger.error(f"Ollama timeout after {attempt + 1} attempts (mid-stream: {received})")
+                    OLLAMA_FAILURES.inc(model=model, reason="timeout")
+                    raise
+
+            except Exception as e:
+                logger.error(f"Unexpected error streaming from Ollama: {e}")
+                OLLAMA_FAILURES.inc(model=model, reason="error")
                 raise
-
-        except Exception as e:
-            logger.error(f"Unexpected error streaming from Ollama: {e}")
-            raise
+    except GeneratorExit:
+        raise  # The caller stopped reading
+    except BaseException as e:
+        error = e  # Retries exhausted, failed mid-stream or cancelled
+        raise
+    finally:
+        # One span per call, ended with the outcome of its last attempt
+        tracing.end_ollama_span(span, stats, error=error, attempts=attempts)
 
 
 async def call_ollama_with_retry(
@@ -81,7 +152,9 @@ async def call_ollama_with_retry(
     system: str = None,
     temperature: float = 0.3,
     max_tokens: int = 1024,
-    max_retries: int = 3
+    max_retries: int = 3,
+    stats: Optional[Dict[str, Any]] = None,
+    response_format: Optional[Union[str, Dict[str, Any]]] = None
 ) -> str:
     """
     Call Ollama with exponential backoff retry.
@@ -93,6 +166,8 @@ async def call_ollama_with_retry(
         temperature: Temperature parameter
         max_tokens: Max tokens to generate
         max_retries: Maximum retry attempts
+        stats: Optional dict filled with Ollama's counters (prompt_eval_count, ...)
+        response_format: Ollama ``format`` option ("json" or a JSON schema)
 
     Returns:
         Generated text response
@@ -100,40 +175,61 @@ async def call_ollama_with_retry(
     Raises:
         httpx.HTTPError: If all retries fail
     """
-    for attempt in range(max_retries):
-        try:
-            response = await call_ollama(
-                model=model,
-                prompt=prompt,
-                system=system,
-                temperature=temperature,
-                max_tokens=max_tokens
-            )
-            return response
-
-        except httpx.ConnectError as e:
-            if attempt < max_retries - 1:
-                wait_time = 2 ** attempt
-                logger.warning(
-                    f"Ollama connection failed, retry {attempt+1}/{max_retries} in {wait_time}s"
-                )
-                await asyncio.sleep(wait_time)
-            else:
-                raise
-
-        except httpx.TimeoutException as e:
-            if attempt < max_retries - 1:
-                wait_time = (2 ** attempt) * 1.5
-                logger.warning(
-                    f"Ollama timeout, retry {attempt+1}/{max_retries} in {wait_time}s"
+    stats = {} if stats is None else stats
+    span = tracing.start_span("ollama.generate", model=model)
+    attempts, error = 0, None
+    try:
+        for attempt in range(max_retries):
+            attempts = attempt + 1
+            started = time.perf_counter()
+            try:
+                response = await call_ollama(
+                    model=model,
+                    prompt=prompt,
+                    system=system,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    stats=stats,
+                    response_format=response_format
                 )
-                await asyncio.sleep(wait_time)
-            else:
+                residency.record_call(model, stats)
+                observe_ollama_call(model, time.perf_counter() - started, stats)
+                return response
+
+            except httpx.ConnectError as e:
+                if attempt < max_retries - 1:
+                    wait_time = 2 ** attempt
+                    logger.warning(
+                        f"Ollama connection failed, retry {attempt+1}/{max_retries} in {wait_time}s"
+                    )
+                    OLLAMA_RETRIES.inc(model=model, reason="connect")
+                    await asyncio.sleep(wait_time)
+                else:
+                    OLLAMA_FAILURES.inc(model=model, reason="connect")
+                    raise
+
+            except httpx.TimeoutException as e:
+                if attempt < max_retries - 1:
+                    wait_time = (2 ** attempt) * 1.5
+                    logger.warning(
+                        f"Ollama timeout, retry {attempt+1}/{max_retries} in {wait_time}s"
+                    )
+                    OLLAMA_RETRIES.inc(model=model, reason="timeout")
+                    await asyncio.sleep(wait_time)
+                else:
+                    OLLAMA_FAILURES.inc(model=model, reason="timeout")
+                    raise
+
+            except Exception as e:
+                logger.error(f"Unexpected error calling Ollama: {e}")
+                OLLAMA_FAILURES.inc(model=model, reason="error")
                 raise
-
-        except Exception as e:
-            logger.error(f"Unexpected error calling Ollama: {e}")
-            raise
+    except BaseException as e:
+        error = e  # Retries exhausted or cancelled
+        raise
+    finally:
+        # One span per call, ended with the outcome of its last attempt
+        tracing.end_ollama_span(span, stats, error=error, attempts=attempts)
 
 
 def build_system_prompt(persona: Dict[str, Any]) -> str:
@@ -193,6 +289,30 @@ def get_agent_for_phase(phase: str, state: Dict[str, Any]) -> Dict[str, Any]:
         raise ValueError(f"Unknown phase: {phase}")
 
 
+def get_phase_turns(state: Dict[str, Any], phases: List[str]) -> List[Dict[str, Any]]:
+    """
+    Get the turns for the given phases, in the given order.
+
+    Args:
+        state: Current debate state
+        phases: Phase names (e.g., ["opening_a", "opening_b"])
+
+    Returns:
+        Matching turns
+
+    Raises:
+        ValueError: If a phase has no turn yet
+    """
+    turns = TurnLog.of(state["turns"])
+    found = []
+    for phase in phases:
+        turn = turns.by_phase(phase)
+        if turn is None:
+            raise ValueError(f"{phase} turn not found in state - execution order may be corrupted")
+        found.append(turn)
+    return found
+
+
 def parse_json_scores(response: str, default_score: int = 7) -> Dict[str, Any]:
     """
     Parse JSON scores from judge response with fallback.
@@ -204,23 +324,15 @@ def parse_json_scores(response: str, default_score: int = 7) -> Dict[str, Any]:
     Returns:
         Scores dictionary
     """
-    import json
-    import re
-
     try:
-        # Try direct JSON parse
-        return json.loads(response)
-    except json.JSONDecodeError:
-        # Try to extract JSON from response
-        json_match = re.search(r'\{[^{}]*\}', response, re.DOTALL)
-        if json_match:
-            try:
-                return json.loads(json_match.group())
-            except:
-                pass
+        # Direct parse or first (possibly nested) object embedded in text
+        return extract_json_object(response)
+    except ScoreParseError:
+        pass
 
     # Fallback to default scores
     logger.warning(f"Failed to parse JSON scores, using defaults")
+    SCORE_PARSE_FALLBACKS.inc()
     return {
         "argumentation": {"total": default_score * 3},
         "delivery": {"total": default_score * 2},
@@ -230,52 +342,27 @@ def parse_json_scores(response: str, default_score: int = 7) -> Dict[str, Any]:
     }
 
 
-class ViolationInfo(TypedDict):
-    """Type definition for forbidden phrase violation."""
-    phrase: str
-    context: str
-
-
-def detect_forbidden_phrases(content: str, forbidden_phrases: List[str]) -> List[ViolationInfo]:
+def detect_forbidden_phrases(
+    content: str,
+    forbidden_phrases: List[str],
+    word_boundary: bool = False,
+    casefold: bool = True
+) -> List[ViolationInfo]:
     """
     Detect forbidden phrases in content using case-insensitive matching.
 
+    Uses a precompiled matcher cached per phrase set (see ``app.graph.phrases``).
+
     Args:
         content: Text content to check
         forbidden_phrases: List of phrases to detect
+        word_boundary: Only match whole words
+        casefold: Match with Unicode case folding
 
     Returns:
-        List of violations with phrase and context
+        List of violations with phrase and context, in text order
     """
-    violations: List[ViolationInfo] = []
     if not forbidden_phrases:
-        return violations
-
-    content_lower = content.lower()
-
-    for phrase in forbidden_phrases:
-        # Skip empty or whitespace-only phrases
-        if not phrase or not phrase.strip():
-            continue
-
-        phrase_lower = phrase.lower()
-        # Find all occurrences
-        start_idx = 0
-        while True:
-            idx = content_lower.find(phrase_lower, start_idx)
-            if idx == -1:
-                break
-
-            # Extract context around the phrase (30 chars before and after)
-            context_start = max(0, idx - 30)
-            context_end = min(len(content), idx + len(phrase) + 30)
-            context = content[context_start:context_end]
-
-            violations.append({
-                "phrase": phrase,
-                "context": f"...{context}..."
-            })
-
-            start_idx = idx + 1  # Move past this occurrence
-
-    return violations
+        return []
+    matcher = get_phrase_matcher(tuple(forbidden_phrases), word_boundary, casefold)
+    return matcher.find(content)
@@ -0,0 +1,115 @@
+"""
+New Argument Detection
+
+Lexical detector for content in a summary that did not appear in earlier
+turns. Each summary sentence is compared against the debate so far by word
+shingle containment (the share of the sentence's word n-grams found in prior
+turns) and content-word coverage (the share of its content words used
+before). A sentence low on both is flagged as potentially new.
+
+The judge then only receives the flagged spans instead of the whole
+transcript when scoring summaries. Detection is deterministic and runs
+locally; shingle sets of prior turns are cached per turn content.
+"""
+import re
+import zlib
+from functools import lru_cache
+from typing import FrozenSet, Iterable, List, Tuple, TypedDict
+
+# Word n-gram size for shingles
+SHINGLE_SIZE = 3
+
+# A sentence is flagged when less than this share of its shingles appeared before...
+MAX_SHINGLE_CONTAINMENT = 0.3
+
+# ...and at least this share of its content words is new
+MIN_NEW_WORD_RATIO = 0.5
+
+# Sentences with fewer content words are never flagged (greetings, signposting)
+MIN_CONTENT_WORDS = 5
+
+_WORD = re.compile(r"\w+")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+|\n+")
+
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been
+before being below between both but by can could did do does doing down during each
+few for from further had has have having he her here hers him his how i if in into is
+it its itself just me more most my no nor not now of off on once only or other our
+ours out over own same she should so some such than that the their theirs them then
+there these they this those through to too under until up very was we were what when
+where which while who whom why will with would you your yours
+""".split())
+
+
+class FlaggedSpan(TypedDict):
+    """Summary sentence flagged as potentially new content."""
+    text: str
+    shingle_containment: float
+    new_word_ratio: float
+
+
+def _content_words(text: str) -> List[str]:
+    """Lower-cased words without stopwords."""
+    return [w for w in _WORD.findall(text.lower()) if w not in STOPWORDS]
+
+
+def _shingles(words: List[str]) -> FrozenSet[int]:
+    """Hashed word n-grams (a single shingle for shorter texts)."""
+    if not words:
+        return frozenset()
+    if len(words) < SHINGLE_SIZE:
+        return frozenset({zlib.crc32(" ".join(words).encode())})
+    return frozenset(
+        zlib.crc32(" ".join(words[i:i + SHINGLE_SIZE]).encode())
+        for i in range(len(words) - SHINGLE_SIZE + 1)
+    )
+
+
+@lru_cache(maxsize=256)
+def _turn_features(text: str) -> Tuple[FrozenSet[int], FrozenSet[str]]:
+    """Shingles and vocabulary of a prior turn (cached per content)."""
+    words = _content_words(text)
+    return _shingles(words), frozenset(words)
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split a text into sentences (and lines)."""
+    return [s.strip() for s in _SENTENCE_END.split(text) if s.strip()]
+
+
+def detect_new_content(summary: str, previous_turns: Iterable[str]) -> List[FlaggedSpan]:
+    """
+    Find summary sentences that do not appear in earlier turns.
+
+    Args:
+        summary: Summary turn content
+        previous_turns: Contents of the debate turns before the summary
+
+    Returns:
+        Flagged sentences in summary order
+    """
+    prior_shingles: set = set()
+    prior_words: set = set()
+    for turn in previous_turns:
+        shingles, words = _turn_features(turn)
+        prior_shingles |= shingles
+        prior_words |= words
+
+    flagged: List[FlaggedSpan] = []
+    for sentence in split_sentences(summary):
+        words = _content_words(sentence)
+        if len(words) < MIN_CONTENT_WORDS:
+            continue
+
+        shingles = _shingles(words)
+        containment = len(shingles & prior_shingles) / len(shingles)
+        new_word_ratio = sum(w not in prior_words for w in words) / len(words)
+
+        if containment < MAX_SHINGLE_CONTAINMENT and new_word_ratio >= MIN_NEW_WORD_RATIO:
+            flagged.append({
+                "text": sentence,
+                "shingle_containment": round(containment, 3),
+                "new_word_ratio": round(new_word_ratio, 3),
+            })
+    return flagged
@@ -0,0 +1,105 @@
+"""
+Judge Panel Aggregation
+
+A run can be judged by a panel instead of a single judge (``agent_j_id`` given
+as a list). Every scoring and verdict call is sent to all judges at once and
+the per-judge scores are combined here, criterion by criterion, with the
+mean, the median or a trimmed mean. The spread between judges is kept as the
+population variance of each category total.
+"""
+import math
+import statistics
+from typing import Any, Dict, List, Sequence
+
+from app.core.config import settings
+
+AGGREGATION_METHODS = ("mean", "median", "trimmed_mean")
+
+
+def panel_aggregation(config: Dict[str, Any]) -> str:
+    """Aggregation method of a run: "mean", "median" or "trimmed_mean"."""
+    method = config.get("panel_aggregation", settings.DEBATE_PANEL_AGGREGATION)
+    return method if method in AGGREGATION_METHODS else "median"
+
+
+def trimmed_mean(values: Sequence[float], fraction: float = None) -> float:
+    """
+    Mean after dropping the highest and lowest values.
+
+    ``fraction`` of the values is dropped at each end (at least one when
+    there are three or more), so a single outlier judge cannot move the
+    result.
+    """
+    if fraction is None:
+        fraction = settings.DEBATE_PANEL_TRIM_FRACTION
+    ordered = sorted(values)
+    n = len(ordered)
+    if n < 3:
+        return statistics.fmean(ordered)
+    k = min(max(1, math.floor(n * fraction)), (n - 1) // 2)
+    return statistics.fmean(ordered[k:n - k])
+
+
+def aggregate(values: Sequence[float], method: str) -> float:
+    """Combine one criterion's scores from several judges."""
+    if method == "mean":
+        return statistics.fmean(values)
+    if method == "trimmed_mean":
+        return trimmed_mean(values)
+    return float(statistics.median(values))
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def aggregate_scores(panel_scores: List[Dict[str, Any]], method: str) -> Dict[str, Any]:
+    """
+    Combine the validated scores of every judge into one scores dictionary.
+
+    Numbers are aggregated per field (recursing into categories), flags are
+    decided by majority, lists are merged, and any other field (e.g. the
+    justification) is taken from the first judge.
+
+    Args:
+        panel_scores: Scores per judge, primary judge first
+        method: Aggregation method
+
+    Returns:
+        Scores with the same shape as a single judge's
+    """
+    first = panel_scores[0]
+    combined: Dict[str, Any] = {}
+    for key, value in first.items():
+        values = [scores[key] for scores in panel_scores if key in scores]
+        if isinstance(value, dict):
+            combined[key] = aggregate_scores([v for v in values if isinstance(v, dict)], method)
+        elif isinstance(value, bool):
+            combined[key] = sum(bool(v) for v in values) * 2 > len(values)
+        elif _is_number(value):
+            combined[key] = aggregate([v for v in values if _is_number(v)], method)
+        elif isinstance(value, list):
+            combined[key] = list(dict.fromkeys(item for v in values for item in v))
+        else:
+            combined[key] = value
+    return combined
+
+
+def score_variance(panel_scores: List[Dict[str, Any]]) -> Dict[str, float]:
+    """
+    Inter-judge variance of the overall total and of each category total.
+
+    Args:
+        panel_scores: Scores per judge
+
+    Returns:
+        Population variance per total ("total", "argumentation", ...)
+    """
+    totals: Dict[str, List[float]] = {}
+    for scores in panel_scores:
+        for key, value in scores.items():
+            if key == "total" and _is_number(value):
+                totals.setdefault("total", []).append(value)
+            elif isinstance(value, dict) and _is_number(value.get("total")):
+                totals.setdefault(key, []).append(value["total"])
+    return {key: statistics.pvariance(values) for key, values in totals.items()}
@@ -0,0 +1,187 @@
+"""
+Write-Behind Turn Persistence
+
+Buffers a debate's turns and turn metadata patches and writes them in
+batches: one multi-row INSERT for new turns and one executemany UPDATE for
+metadata, committed together. A turn and the scores patched into it before
+a flush are written by a single INSERT.
+
+Modes (``persistence_mode`` run config, ``DEBATE_PERSISTENCE_MODE``):
+- ``write_behind`` (default): the engine flushes at phase boundaries and
+  when the oldest buffered write is ``DEBATE_PERSIST_FLUSH_INTERVAL``
+  seconds old. Flushes run in the background, off the node scheduling
+  path; only the verdict is flushed synchronously, so a completed run never
+  reports success before its turns are stored.
+- ``immediate``: every node's writes are flushed and awaited right away.
+"""
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import tracing
+from app.core.config import settings
+from app.graph.state import Turn
+from app.models.turn import Turn as TurnModel
+
+logger = logging.getLogger(__name__)
+
+PERSISTENCE_MODES = ("write_behind", "immediate")
+
+
+async def write_turn_batch(
+    db: AsyncSession,
+    run_id: str,
+    turns: List[Turn],
+    metadata_patches: Dict[str, Dict[str, Any]]
+) -> None:
+    """
+    Insert turns and overwrite turn metadata in one transaction.
+
+    Args:
+        db: Database session
+        run_id: Run UUID
+        turns: New turns to insert
+        metadata_patches: turn_id -> complete metadata for already stored turns
+    """
+    if turns:
+        await db.execute(insert(TurnModel), [
+            {
+                "turn_id": UUID(turn["turn_id"]),
+                "run_id": UUID(run_id),
+                "agent_id": UUID(turn["agent_id"]),
+                "phase": turn["phase"],
+                "role": turn["role"],
+                "content": turn["content"],
+                "targets": turn["targets"],  # Keep as strings for JSONB serialization
+                "metadata_json": turn["metadata"],
+            }
+            for turn in turns
+        ])
+    if metadata_patches:
+        # ORM bulk UPDATE by primary key (executemany)
+        await db.execute(update(TurnModel), [
+            {"turn_id": UUID(turn_id), "metadata_json": metadata}
+            for turn_id, metadata in metadata_patches.items()
+        ])
+    await db.commit()
+
+
+class TurnWriter:
+    """
+    Buffer for a run's turn writes.
+
+    The session is only used by flushes, and flushes are chained, so the
+    session is never used concurrently.
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        db: AsyncSession,
+        mode: Optional[str] = None,
+        flush_interval: Optional[float] = None
+    ):
+        self.run_id = run_id
+        self.db = db
+        self.mode = mode if mode in PERSISTENCE_MODES else settings.DEBATE_PERSISTENCE_MODE
+        self.flush_interval = (
+            settings.DEBATE_PERSIST_FLUSH_INTERVAL if flush_interval is None else flush_interval
+        )
+        self._turns: Dict[str, Turn] = {}
+        self._patches: Dict[str, Dict[str, Any]] = {}
+        self._oldest: Optional[float] = None
+        self._flush_task: Optional[asyncio.Task] = None
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered writes."""
+        return len(self._turns) + len(self._patches)
+
+    def add_turn(self, turn: Turn) -> None:
+        """Buffer a new turn."""
+        self._turns[turn["turn_id"]] = turn
+        self._touch()
+
+    def patch_metadata(self, turn_id: str, metadata: Dict[str, Any]) -> None:
+        """
+        Buffer a turn's complete metadata.
+
+        Turns still waiting to be inserted take the new metadata, so no
+        separate UPDATE is needed for them. The buffered turn is replaced by
+        a copy rather than modified, since the state still references it.
+        """
+        if turn_id in self._turns:
+            self._turns[turn_id] = {**self._turns[turn_id], "metadata": metadata}
+        else:
+            self._patches[turn_id] = metadata
+        self._touch()
+
+    def _touch(self) -> None:
+        if self._oldest is None:
+            self._oldest = asyncio.get_running_loop().time()
+
+    def seconds_until_due(self) -> Optional[float]:
+        """Seconds until the flush timer expires (None with an empty buffer)."""
+        if self._oldest is None:
+            return None
+        elapsed = asyncio.get_running_loop().time() - self._oldest
+        return max(0.0, self.flush_interval - elapsed)
+
+    async def node_finished(self, phase_complete: bool, synchronous: bool = False) -> None:
+        """
+        Flush according to the mode after a node's writes were buffered.
+
+        Args:
+            phase_complete: The node finished its debate phase
+            synchronous: Wait until the writes are committed (verdicts)
+        """
+        if self.mode == "immediate" or synchronous:
+            await self.flush(wait=True)
+        elif phase_complete or self.seconds_until_due() == 0:
+            await self.flush()
+
+    async def flush(self, wait: bool = False) -> None:
+        """
+        Write the buffered turns and patches.
+
+        Args:
+            wait: Await the commit instead of flushing in the background
+
+        Raises:
+            Exception: A failed earlier background flush is re-raised here
+        """
+        previous = self._flush_task
+        if self.pending:
+            turns = list(self._turns.values())
+            patches = self._patches
+            self._turns, self._patches, self._oldest = {}, {}, None
+            self._flush_task = asyncio.create_task(self._write(previous, turns, patches))
+        if self._flush_task is not None and (wait or self._flush_task.done()):
+            task, self._flush_task = self._flush_task, None
+            await task
+
+    async def _write(
+        self,
+        previous: Optional[asyncio.Task],
+        turns: List[Turn],
+        patches: Dict[str, Dict[str, Any]]
+    ) -> None:
+        if previous is not None:
+            await previous
+        logger.debug(f"Flushing {len(turns)} turns and {len(patches)} metadata patches for run {self.run_id}")
+        with tracing.span("db.write_turns", turns=len(turns), patches=len(patches)):
+            await write_turn_batch(self.db, self.run_id, turns, patches)
+
+    async def close(self) -> None:
+        """Flush everything still buffered and wait for it to be committed."""
+        await self.flush(wait=True)
+
+    def cancel(self) -> None:
+        """Stop a background flush (used when the run already failed)."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
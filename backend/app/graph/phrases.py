@@ -0,0 +1,249 @@
+"""
+Forbidden Phrase Matching
+
+All of a persona's forbidden phrases are compiled into a single alternation
+regex (longest phrase first) and cached per phrase set, so a text is scanned
+once regardless of the number of phrases. ``PhraseScanner`` runs the same
+matcher incrementally over a token stream, carrying state across chunk
+boundaries, so violations are known as soon as they are generated.
+
+Options:
+- ``casefold`` (default True): Unicode case folding ("STRASSE" matches "straße")
+- ``word_boundary`` (default False): only match whole words ("ban" does not
+  match "banner")
+"""
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TypedDict
+
+# Characters of context kept on each side of a match
+CONTEXT_CHARS = 30
+
+
+class ViolationInfo(TypedDict):
+    """Type definition for forbidden phrase violation."""
+    phrase: str
+    context: str
+
+
+def _fold(text: str, casefold: bool) -> Tuple[str, Optional[List[int]]]:
+    """
+    Case-fold a text and map folded positions back to the original.
+
+    Returns:
+        Tuple of (folded text, folded index -> original index), where the
+        map is None when folding kept every character's length
+    """
+    if not casefold:
+        return text, None
+    folded = text.casefold()
+    if len(folded) == len(text):
+        return folded, None
+
+    # Some characters expand when folded ("ß" -> "ss")
+    parts = []
+    index_map: List[int] = []
+    for index, char in enumerate(text):
+        folded_char = char.casefold()
+        parts.append(folded_char)
+        index_map.extend([index] * len(folded_char))
+    return "".join(parts), index_map
+
+
+class PhraseMatcher:
+    """
+    Precompiled multi-phrase matcher.
+
+    Every start position is tried (zero-width lookahead), so overlapping
+    occurrences are all reported; when several phrases start at the same
+    position, the longest one is reported.
+    """
+
+    def __init__(self, phrases: Sequence[str], word_boundary: bool = False, casefold: bool = True):
+        self.casefold = casefold
+        self.word_boundary = word_boundary
+
+        # Folded phrase -> phrase as configured (first one wins on duplicates)
+        self._phrases: Dict[str, str] = {}
+        for phrase in phrases:
+            if phrase and phrase.strip():
+                self._phrases.setdefault(phrase.casefold() if casefold else phrase, phrase)
+
+        self.max_length = max((len(p) for p in self._phrases), default=0)
+        self.pattern: Optional[re.Pattern] = None
+        if self._phrases:
+            alternation = "|".join(
+                re.escape(p) for p in sorted(self._phrases, key=len, reverse=True)
+            )
+            if word_boundary:
+                alternation = rf"(?<!\w)(?:{alternation})(?!\w)"
+            self.pattern = re.compile(rf"(?=({alternation}))")
+
+    @property
+    def lookahead(self) -> int:
+        """Characters a streamed match may still need beyond its start."""
+        return self.max_length + (1 if self.word_boundary else 0)
+
+    def __bool__(self) -> bool:
+        return self.pattern is not None
+
+    def iter_matches(self, folded: str, pos: int = 0):
+        """Yield (folded start, folded end, configured phrase) from ``pos``."""
+        if self.pattern is None:
+            return
+        for match in self.pattern.finditer(folded, pos):
+            yield match.start(1), match.end(1), self._phrases[match.group(1)]
+
+    def find(self, text: str) -> List[ViolationInfo]:
+        """
+        Find every forbidden phrase occurrence in a text.
+
+        Args:
+            text: Text content to check
+
+        Returns:
+            Violations in text order, with surrounding context
+        """
+        if self.pattern is None or not text:
+            return []
+        folded, index_map = _fold(text, self.casefold)
+        return [
+            _violation(text, *_to_original(start, end, index_map), phrase)
+            for start, end, phrase in self.iter_matches(folded)
+        ]
+
+
+class PhraseScanner:
+    """
+    Incremental matcher over a stream of text chunks.
+
+    A match is reported once enough text follows its start to rule out a
+    longer phrase (or a word character, with ``word_boundary``), so matches
+    spanning chunk boundaries are found exactly once. Call ``finish()`` at
+    the end of the stream.
+    """
+
+    def __init__(self, matcher: PhraseMatcher):
+        self.matcher = matcher
+        self._chunks: List[str] = []
+        self._folded = ""
+        self._index_map: List[int] = []
+        self._length = 0
+        self._scan_pos = 0
+        self._matches: List[Tuple[int, int, str]] = []
+
+    @property
+    def text(self) -> str:
+        """Text received so far."""
+        return "".join(self._chunks)
+
+    def feed(self, chunk: str) -> List[ViolationInfo]:
+        """
+        Consume a chunk of streamed text.
+
+        Args:
+            chunk: Next piece of generated text
+
+        Returns:
+            Violations that became certain with this chunk (context limited
+            to the text received so far)
+        """
+        if not self.matcher or not chunk:
+            self._chunks.append(chunk)
+            self._length += len(chunk)
+            return []
+
+        folded, chunk_map = _fold(chunk, self.matcher.casefold)
+        offset = self._length
+        self._chunks.append(chunk)
+        self._folded += folded
+        if chunk_map is None:
+            self._index_map.extend(range(offset, offset + len(chunk)))
+        else:
+            self._index_map.extend(offset + i for i in chunk_map)
+        self._length += len(chunk)
+
+        return self._scan(len(self._folded) - self.matcher.lookahead)
+
+    def finish(self) -> List[ViolationInfo]:
+        """Report matches held back at the end of the stream."""
+        if not self.matcher:
+            return []
+        return self._scan(len(self._folded))
+
+    @property
+    def violations(self) -> List[ViolationInfo]:
+        """All violations found so far, with context from the full text."""
+        text = self.text
+        return [
+            _violation(text, *_to_original(start, end, self._index_map), phrase)
+            for start, end, phrase in self._matches
+        ]
+
+    def _scan(self, limit: int) -> List[ViolationInfo]:
+        if limit <= self._scan_pos:
+            return []
+
+        new_matches = []
+        for start, end, phrase in self.matcher.iter_matches(self._folded, self._scan_pos):
+            if start >= limit:
+                break
+            new_matches.append((start, end, phrase))
+        self._scan_pos = limit
+        if not new_matches:
+            return []
+
+        self._matches.extend(new_matches)
+        text = self.text
+        return [
+            _violation(text, *_to_original(start, end, self._index_map), phrase)
+            for start, end, phrase in new_matches
+        ]
+
+
+def _to_original(start: int, end: int, index_map: Optional[List[int]]) -> Tuple[int, int]:
+    """Map a folded match span to the original text."""
+    if index_map is None:
+        return start, end
+    return index_map[start], index_map[end - 1] + 1
+
+
+def _violation(text: str, start: int, end: int, phrase: str) -> ViolationInfo:
+    """Build a violation with surrounding context."""
+    context = text[max(0, start - CONTEXT_CHARS):min(len(text), end + CONTEXT_CHARS)]
+    return {"phrase": phrase, "context": f"...{context}..."}
+
+
+@lru_cache(maxsize=256)
+def get_phrase_matcher(
+    phrases: Tuple[str, ...],
+    word_boundary: bool = False,
+    casefold: bool = True
+) -> PhraseMatcher:
+    """
+    Get the compiled matcher for a phrase set (cached).
+
+    Args:
+        phrases: Forbidden phrases (tuple, for caching)
+        word_boundary: Only match whole words
+        casefold: Match with Unicode case folding
+
+    Returns:
+        Compiled PhraseMatcher
+    """
+    return PhraseMatcher(phrases, word_boundary=word_boundary, casefold=casefold)
+
+
+def matcher_for_persona(persona: Dict[str, Any]) -> PhraseMatcher:
+    """
+    Get the matcher for an agent persona's forbidden phrases.
+
+    Matching options are read from ``persona["forbidden_phrase_matching"]``
+    (``word_boundary``, ``casefold``).
+    """
+    options = persona.get("forbidden_phrase_matching") or {}
+    return get_phrase_matcher(
+        tuple(persona.get("forbidden_phrases") or ()),
+        word_boundary=bool(options.get("word_boundary", False)),
+        casefold=bool(options.get("casefold", True)),
+    )
@@ -0,0 +1,288 @@
+"""
+Debate Execution Plan
+
+Builds the node DAG for a debate from the run's ``config_json`` instead of a
+fixed 14-node sequence.
+
+Config keys honored:
+- ``rounds``: speeches per debater, counting the opening and the summary.
+  ``rounds=3`` (the default) is the classic BP Lite flow with one rebuttal
+  round; every extra round adds another rebuttal round.
+- ``cross_examination``: adds a cross-examination turn per debater between
+  the openings and the first rebuttal round.
+- ``score_each_turn``: when False, only the summaries are scored (the summary
+  scoring prompt already sees the whole debate).
+
+Dependencies reflect the data each node actually reads, so nodes that do not
+depend on each other (e.g. both openings, or a score and the next speech) can
+run concurrently.
+"""
+from typing import Any, Dict, Iterable, List, Literal, Optional, Set, TypedDict
+
+NodeKind = Literal["judge_intro", "debater", "score", "judge_verdict"]
+Stage = Literal["opening", "cross_exam", "rebuttal", "summary"]
+
+DEFAULT_ROUNDS = 3
+MIN_ROUNDS = 2
+MAX_ROUNDS = 10
+
+
+class PlanNode(TypedDict):
+    """Single node of the execution plan"""
+    name: str  # Node name, also used as the turn phase ("rebuttal2_a", "score_opening_b", ...)
+    kind: NodeKind
+    stage: Optional[Stage]  # Debate stage for debater/score nodes
+    side: Optional[Literal["A", "B"]]  # Debater the node belongs to (or scores)
+    round: int  # Rebuttal round (1-based), 0 for non-rebuttal nodes
+    target: Optional[str]  # Scored debater node (score nodes only)
+    depends_on: List[str]
+
+
+def phase_name(stage: Stage, side: str, round_number: int = 0) -> str:
+    """
+    Build the phase name for a debater turn.
+
+    The first rebuttal round keeps the historical ``rebuttal_a``/``rebuttal_b``
+    names; later rounds are numbered (``rebuttal2_a``).
+    """
+    suffix = side.lower()
+    if stage == "rebuttal" and round_number > 1:
+        return f"rebuttal{round_number}_{suffix}"
+    return f"{stage}_{suffix}"
+
+
+class ExecutionPlan:
+    """
+    Node DAG for a single debate.
+
+    Nodes are kept in a canonical topological order which matches the
+    historical sequential flow, so running the plan one node at a time
+    reproduces the original BP Lite order.
+    """
+
+    def __init__(self, nodes: List[PlanNode]):
+        self.nodes: Dict[str, PlanNode] = {node["name"]: node for node in nodes}
+        self.order: List[str] = [node["name"] for node in nodes]
+        self.rebuttal_rounds = max((n["round"] for n in nodes), default=0)
+        self._validate()
+
+    def _validate(self) -> None:
+        """Ensure every dependency exists and precedes its dependent node."""
+        seen: Set[str] = set()
+        for name in self.order:
+            for dep in self.nodes[name]["depends_on"]:
+                if dep not in self.nodes:
+                    raise ValueError(f"Node {name} depends on unknown node {dep}")
+                if dep not in seen:
+                    raise ValueError(f"Node {name} is ordered before its dependency {dep}")
+            seen.add(name)
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.nodes
+
+    def __getitem__(self, name: str) -> PlanNode:
+        return self.nodes[name]
+
+    def ready(self, done: Iterable[str], started: Iterable[str] = ()) -> List[str]:
+        """
+        Get nodes whose dependencies are all complete.
+
+        Args:
+            done: Names of completed nodes
+            started: Names of nodes already scheduled (excluded from result)
+
+        Returns:
+            Ready node names in canonical order
+        """
+        done_set = set(done)
+        skip = done_set | set(started)
+        return [
+            name for name in self.order
+            if name not in skip and all(dep in done_set for dep in self.nodes[name]["depends_on"])
+        ]
+
+    def parallel_groups(self) -> List[List[str]]:
+        """
+        Group nodes into dependency levels.
+
+        All nodes within a level only depend on nodes of earlier levels and
+        may run concurrently.
+        """
+        levels: Dict[str, int] = {}
+        for name in self.order:
+            deps = self.nodes[name]["depends_on"]
+            levels[name] = 1 + max((levels[d] for d in deps), default=-1)
+
+        groups: List[List[str]] = [[] for _ in range(max(levels.values(), default=-1) + 1)]
+        for name in self.order:
+            groups[levels[name]].append(name)
+        return groups
+
+    def ancestors(self, name: str) -> List[str]:
+        """All transitive dependencies of a node, in canonical order."""
+        pending = list(self.nodes[name]["depends_on"])
+        found: Set[str] = set()
+        while pending:
+            dep = pending.pop()
+            if dep not in found:
+                found.add(dep)
+                pending.extend(self.nodes[dep]["depends_on"])
+        return [n for n in self.order if n in found]
+
+    def debater_ancestors(self, name: str) -> List[str]:
+        """Debater nodes a node transitively depends on, in canonical order."""
+        return [n for n in self.ancestors(name) if self.nodes[n]["kind"] == "debater"]
+
+    def debater_nodes(self) -> List[PlanNode]:
+        """Debater nodes in canonical order."""
+        return [self.nodes[n] for n in self.order if self.nodes[n]["kind"] == "debater"]
+
+    def score_node_for(self, target: str) -> Optional[PlanNode]:
+        """Get the score node for a debater node, if the plan scores it."""
+        return self.nodes.get(f"score_{target}")
+
+    def phase_complete(self, name: str, done: Iterable[str]) -> bool:
+        """
+        Whether completing ``name`` finished its debate phase.
+
+        A phase is a stage (and rebuttal round) with its debater and score
+        nodes; the judge intro and verdict are phases of their own.
+        """
+        node = self.nodes[name]
+        if node["stage"] is None:
+            return True
+        done = set(done)
+        return all(
+            other in done for other in self.order
+            if self.nodes[other]["stage"] == node["stage"]
+            and self.nodes[other]["round"] == node["round"]
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable description of the plan (for SSE/clients)."""
+        return {
+            "nodes": [
+                {
+                    "name": name,
+                    "kind": self.nodes[name]["kind"],
+                    "depends_on": self.nodes[name]["depends_on"],
+                }
+                for name in self.order
+            ],
+            "parallel_groups": self.parallel_groups(),
+        }
+
+
+def _coerce_rounds(value: Any) -> int:
+    """Clamp the configured number of rounds to the supported range."""
+    try:
+        rounds = int(value)
+    except (TypeError, ValueError):
+        rounds = DEFAULT_ROUNDS
+    return max(MIN_ROUNDS, min(MAX_ROUNDS, rounds))
+
+
+def build_execution_plan(config: Optional[Dict[str, Any]] = None) -> ExecutionPlan:
+    """
+    Build the debate node DAG from a run configuration.
+
+    Args:
+        config: Run ``config_json`` (rounds, cross_examination, score_each_turn)
+
+    Returns:
+        ExecutionPlan with dependencies between nodes
+    """
+    config = config or {}
+    rounds = _coerce_rounds(config.get("rounds", DEFAULT_ROUNDS))
+    rebuttal_rounds = rounds - 2
+    cross_examination = bool(config.get("cross_examination", False))
+    score_each_turn = bool(config.get("score_each_turn", True))
+
+    nodes: List[PlanNode] = []
+    debater_turns: List[str] = []
+    score_nodes: List[str] = []
+
+    def add_debater(stage: Stage, side: str, round_number: int, depends_on: List[str]) -> str:
+        name = phase_name(stage, side, round_number)
+        nodes.append({
+            "name": name,
+            "kind": "debater",
+            "stage": stage,
+            "side": side,
+            "round": round_number,
+            "target": None,
+            "depends_on": depends_on,
+        })
+        debater_turns.append(name)
+        return name
+
+    def add_score(target: str, stage: Stage, side: str, round_number: int,
+                  depends_on: List[str]) -> None:
+        name = f"score_{target}"
+        nodes.append({
+            "name": name,
+            "kind": "score",
+            "stage": stage,
+            "side": side,
+            "round": round_number,
+            "target": target,
+            "depends_on": depends_on,
+        })
+        score_nodes.append(name)
+
+    nodes.append({
+        "name": "judge_intro",
+        "kind": "judge_intro",
+        "stage": None,
+        "side": None,
+        "round": 0,
+        "target": None,
+        "depends_on": [],
+    })
+
+    # Openings follow the judge's introduction
+    openings = {}
+    for side in ("A", "B"):
+        openings[side] = add_debater("opening", side, 0, ["judge_intro"])
+        if score_each_turn:
+            add_score(openings[side], "opening", side, 0, [openings[side]])
+    both_openings = [openings["A"], openings["B"]]
+
+    # Cross-examination questions the opponent's opening
+    previous_round = list(both_openings)
+    if cross_examination:
+        cross = [add_debater("cross_exam", side, 0, list(both_openings)) for side in ("A", "B")]
+        previous_round = cross
+
+    # Each rebuttal round answers the round before it
+    for round_number in range(1, rebuttal_rounds + 1):
+        current_round = []
+        for side in ("A", "B"):
+            depends_on = list(dict.fromkeys(both_openings + previous_round))
+            name = add_debater("rebuttal", side, round_number, depends_on)
+            current_round.append(name)
+            if score_each_turn:
+                opponent_opening = openings["B" if side == "A" else "A"]
+                add_score(name, "rebuttal", side, round_number, [name, opponent_opening])
+        previous_round = current_round
+
+    # Summaries weigh the full transcript; B's summary also answers A's
+    summary_a = add_debater("summary", "A", 0, list(debater_turns))
+    add_score(summary_a, "summary", "A", 0, list(debater_turns))
+    summary_b = add_debater("summary", "B", 0, list(debater_turns))
+    add_score(summary_b, "summary", "B", 0, list(debater_turns))
+
+    nodes.append({
+        "name": "judge_verdict",
+        "kind": "judge_verdict",
+        "stage": None,
+        "side": None,
+        "round": 0,
+        "target": None,
+        "depends_on": list(debater_turns) + score_nodes,
+    })
+
+    return ExecutionPlan(nodes)
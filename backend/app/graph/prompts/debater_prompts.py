@@ -1,7 +1,7 @@
 """
 Debater Prompt Templates
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 
 
 def build_opening_prompt(topic: str, position: str, persona: Dict[str, Any]) -> str:
@@ -49,7 +49,8 @@ def build_rebuttal_prompt(
     position: str,
     persona: Dict[str, Any],
     opponent_opening: str,
-    own_opening: str
+    own_opening: str,
+    previous_exchanges: List[str] = None
 ) -> str:
     """
     Generate rebuttal prompt with context from previous turns.
@@ -60,6 +61,7 @@ def build_rebuttal_prompt(
         persona: Agent persona configuration
         opponent_opening: Opponent's opening argument
         own_opening: Own opening argument
+        previous_exchanges: Cross-examination and earlier rebuttal turns, in order
 
     Returns:
         Formatted prompt string
@@ -67,6 +69,16 @@ def build_rebuttal_prompt(
     forbidden = persona.get("forbidden_phrases", [])
     forbidden_text = f"\n\nForbidden: {', '.join(forbidden)}" if forbidden else ""
 
+    exchanges_text = ""
+    if previous_exchanges:
+        exchanges = "\n\n".join([
+            f"[Exchange {i+1}] {turn}" for i, turn in enumerate(previous_exchanges)
+        ])
+        exchanges_text = f"""
+
+=== PREVIOUS EXCHANGES ===
+{exchanges}"""
+
     return f"""Topic: {topic}
 Your Position: {position}
 
@@ -74,7 +86,7 @@ Your Position: {position}
 {opponent_opening}
 
 === YOUR OPENING ARGUMENT ===
-{own_opening}
+{own_opening}{exchanges_text}
 
 Your task: Rebut the opponent's argument.
 
@@ -91,6 +103,52 @@ Length: Aim for 250-400 words.
 Present your rebuttal now:"""
 
 
+def build_cross_exam_prompt(
+    topic: str,
+    position: str,
+    persona: Dict[str, Any],
+    opponent_opening: str,
+    own_opening: str
+) -> str:
+    """
+    Generate cross-examination prompt targeting the opponent's opening.
+
+    Args:
+        topic: Debate topic
+        position: Debater's position
+        persona: Agent persona configuration
+        opponent_opening: Opponent's opening argument
+        own_opening: Own opening argument
+
+    Returns:
+        Formatted prompt string
+    """
+    forbidden = persona.get("forbidden_phrases", [])
+    forbidden_text = f"\n\nForbidden: {', '.join(forbidden)}" if forbidden else ""
+
+    return f"""Topic: {topic}
+Your Position: {position}
+
+=== OPPONENT'S OPENING ARGUMENT ===
+{opponent_opening}
+
+=== YOUR OPENING ARGUMENT ===
+{own_opening}
+
+Your task: Cross-examine the opponent.
+
+Requirements (Cross-Examination):
+1. Ask 2-3 pointed questions about the opponent's core claims
+2. Target unsupported assumptions, weak evidence, or internal contradictions
+3. After each question, briefly state what it exposes
+4. Do not introduce new arguments for your own side
+5. Stay respectful - no personal attacks{forbidden_text}
+
+Length: Aim for 150-250 words.
+
+Present your cross-examination now:"""
+
+
 def build_summary_prompt(
     topic: str,
     position: str,
@@ -140,3 +198,130 @@ Requirements (BP Lite - Summary/Whip):
 Length: Aim for 200-350 words.
 
 Present your summary now:"""
+
+
+def build_regeneration_note(phrases: List[str]) -> str:
+    """
+    Generate the instruction appended when a turn is regenerated.
+
+    Args:
+        phrases: Forbidden phrases used by the discarded attempt(s)
+
+    Returns:
+        Formatted instruction
+    """
+    quoted = ", ".join(f'"{phrase}"' for phrase in phrases)
+    return (
+        f"IMPORTANT: A previous draft of this speech used forbidden phrases ({quoted}) and was "
+        "discarded. Write the speech again without using them or close variants."
+    )
+
+
+# Conversation mode (``/api/chat``): a debater keeps one chat history for the
+# whole debate. The brief and every earlier request must render identically on
+# each turn so Ollama can reuse the KV cache for the shared prefix.
+
+CONVERSATION_STAGE_LABELS = {
+    "opening": "OPENING ARGUMENT",
+    "cross_exam": "CROSS-EXAMINATION",
+    "rebuttal": "REBUTTAL",
+    "summary": "CLOSING SUMMARY",
+}
+
+CONVERSATION_STAGE_INSTRUCTIONS = {
+    "opening": """Your task: Present a strong opening argument.
+
+Requirements (BP Lite - Opening):
+1. Define key terms relevant to the debate
+2. Present 2-3 core arguments with clear reasoning
+3. Use evidence, examples, or logical frameworks to support your claims
+4. Establish a clear position framework
+
+Length: Aim for 300-500 words.
+
+Present your opening argument now:""",
+    "cross_exam": """Your task: Cross-examine the opponent.
+
+Requirements (Cross-Examination):
+1. Ask 2-3 pointed questions about the opponent's core claims
+2. Target unsupported assumptions, weak evidence, or internal contradictions
+3. After each question, briefly state what it exposes
+4. Do not introduce new arguments for your own side
+
+Length: Aim for 150-250 words.
+
+Present your cross-examination now:""",
+    "rebuttal": """Your task: Rebut the opponent's argument.
+
+Requirements (BP Lite - Rebuttal):
+1. Identify the opponent's core claims and weakest points
+2. Target their arguments with direct refutation
+3. Expose logical flaws, unsupported assumptions, or weak evidence
+4. Maintain consistency with your earlier speeches
+5. Do not use strawman arguments or personal attacks
+
+Length: Aim for 250-400 words.
+
+Present your rebuttal now:""",
+    "summary": """Your task: Deliver a closing summary (Whip Speech).
+
+Requirements (BP Lite - Summary/Whip):
+1. **NO NEW ARGUMENTS** - This is strictly forbidden and will result in penalties
+2. Weigh your arguments against the opponent's (comparative analysis)
+3. Explain why your side wins (impact comparison, bigger picture)
+4. Provide a memorable closing statement
+
+Length: Aim for 200-350 words.
+
+Present your summary now:""",
+}
+
+
+def build_conversation_brief(topic: str, position: str, persona: Dict[str, Any]) -> str:
+    """
+    Generate the first user message of a debater's chat history.
+
+    Args:
+        topic: Debate topic
+        position: Debater's position
+        persona: Agent persona configuration
+
+    Returns:
+        Formatted message (identical for every turn of the debate)
+    """
+    forbidden = persona.get("forbidden_phrases", [])
+    forbidden_text = f"\n\nForbidden phrases (never use): {', '.join(forbidden)}" if forbidden else ""
+
+    return f"""You are {persona.get('name', 'a debater')}.
+
+Persona:
+- Tone: {persona.get('tone', 'formal')}
+- Values: {', '.join(persona.get('values', ['logic', 'evidence']))}
+- Thinking Style: {persona.get('thinking_style', 'analytical')}
+- Speaking Style: {persona.get('speaking_style', 'structured')}
+
+Debate Topic: {topic}
+Your Position: {position}
+
+This is a BP Lite debate. I will ask you for each of your speeches in turn and
+show you your opponent's speeches as they are delivered.{forbidden_text}"""
+
+
+def build_conversation_turn(stage: str, opponent_turns: List[Tuple[str, str]]) -> str:
+    """
+    Generate the user message requesting a debater's next speech.
+
+    Args:
+        stage: Debate stage of the requested speech
+        opponent_turns: (stage, content) of opponent speeches delivered since
+            the debater's previous speech, in order
+
+    Returns:
+        Formatted message
+    """
+    sections = [
+        f"=== OPPONENT'S {CONVERSATION_STAGE_LABELS[turn_stage]} ===\n{content}"
+        for turn_stage, content in opponent_turns
+    ]
+    sections.append(CONVERSATION_STAGE_INSTRUCTIONS[stage])
+    return "\n\n".join(sections)
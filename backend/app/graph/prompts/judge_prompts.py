@@ -1,7 +1,7 @@
 """
 Judge Prompt Templates
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import json
 
 
@@ -224,7 +224,8 @@ def build_scoring_prompt_summary(
     agent_name: str,
     all_previous_turns: List[str],
     forbidden_phrases: List[str] = None,
-    detected_violations: List[Dict[str, str]] = None
+    detected_violations: List[Dict[str, str]] = None,
+    flagged_spans: Optional[List[str]] = None
 ) -> str:
     """
     Generate scoring prompt for summary arguments.
@@ -236,13 +237,39 @@ def build_scoring_prompt_summary(
         all_previous_turns: All previous debate turns for new argument detection
         forbidden_phrases: List of phrases the agent should not use
         detected_violations: Pre-detected forbidden phrase violations
+        flagged_spans: Summary sentences flagged as new by lexical detection;
+            when given, they replace the previous turns in the prompt
 
     Returns:
         Formatted prompt string
     """
-    debate_context = "\n\n".join([
-        f"[Turn {i+1}] {turn}" for i, turn in enumerate(all_previous_turns)
-    ])
+    if flagged_spans is None:
+        context_section = "=== PREVIOUS DEBATE TURNS ===\n" + "\n\n".join([
+            f"[Turn {i+1}] {turn}" for i, turn in enumerate(all_previous_turns)
+        ])
+        new_argument_check = (
+            "Check if the summary introduces NEW arguments, evidence, or examples "
+            "not mentioned in previous turns."
+        )
+    elif flagged_spans:
+        context_section = (
+            "=== POTENTIALLY NEW CONTENT ===\n"
+            "These sentences of the summary share little wording with any previous turn:\n"
+            + "\n".join(f"  - {span}" for span in flagged_spans)
+        )
+        new_argument_check = (
+            "Decide whether any POTENTIALLY NEW CONTENT introduces a NEW argument, evidence, "
+            "or example (a rephrased earlier point is not new)."
+        )
+    else:
+        context_section = (
+            "=== POTENTIALLY NEW CONTENT ===\n"
+            "None - every sentence of the summary restates content from previous turns."
+        )
+        new_argument_check = (
+            "No new content was detected; only apply the new argument penalty if the "
+            "summary clearly introduces a new argument, evidence, or example."
+        )
 
     # Build forbidden phrases section if violations detected
     violation_section = ""
@@ -268,8 +295,7 @@ No violations were detected in this summary.
 
     return f"""You are scoring {agent_name}'s summary (Whip Speech).
 
-=== PREVIOUS DEBATE TURNS ===
-{debate_context}
+{context_section}
 
 === SUMMARY TO SCORE ===
 {turn_content}
@@ -287,7 +313,7 @@ Scoring Criteria (0-10 for each sub-criterion):
 **Delivery ({rubric.get('delivery_weight', 20)}%)**
 - Impact (0-10): Memorability and closing strength
 
-**IMPORTANT**: Check if the summary introduces NEW arguments, evidence, or examples not mentioned in previous turns. This is strictly forbidden in BP Lite format.
+**IMPORTANT**: {new_argument_check} New arguments are strictly forbidden in BP Lite format.
 
 Provide your scores in this exact JSON format:
 {{
@@ -311,6 +337,28 @@ Provide your scores in this exact JSON format:
 Respond with ONLY the JSON, no additional text:"""
 
 
+def build_batch_scoring_prompt(prompts: List[str]) -> str:
+    """
+    Combine several scoring requests (from concurrent debates) into one prompt.
+
+    Args:
+        prompts: Complete scoring prompts of the same stage
+
+    Returns:
+        Formatted prompt asking for one score object per item, in order
+    """
+    items = "\n\n".join(
+        f"=== ITEM {i + 1} ===\n{prompt}" for i, prompt in enumerate(prompts)
+    )
+    return f"""You will score {len(prompts)} unrelated debate turns. Each item below is a complete, independent scoring request; judge every item on its own and do not compare items.
+
+{items}
+
+=== END OF ITEMS ===
+
+Respond with ONLY a JSON object of the form {{"items": [...]}} holding exactly {len(prompts)} score objects, one per item, in item order. Each score object uses the JSON format its item asks for."""
+
+
 def build_verdict_prompt(
     topic: str,
     position_a: str,
@@ -0,0 +1,181 @@
+"""
+Batched Judge Scoring
+
+When many debates run at once, each scoring node sends its own request to
+the judge model. With batching enabled, scoring requests for the same judge
+model, stage and system prompt that arrive within a short window are sent
+as one multi-item prompt whose reply is constrained to an array of score
+objects (``batch_score_json_schema``). Each item of the reply is validated
+on its own and handed back to the debate that asked for it.
+
+Running debates that batch their scoring register their judge models
+(``join``/``leave``, done by the engine). A request for a model no other
+debate is using is returned at once instead of waiting for the window.
+
+A request that ends up alone in its window, or whose item in the batched
+reply is missing or invalid, is returned as ``None`` so the caller falls
+back to the regular streamed request (with its repair step).
+"""
+import asyncio
+import json
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.graph.nodes.utils import call_ollama_with_retry
+from app.graph.prompts.judge_prompts import build_batch_scoring_prompt
+from app.graph.scoring import (
+    ScoreParseError,
+    batch_score_json_schema,
+    extract_json_object,
+    parse_stage_scores,
+    record_parse_outcome
+)
+
+logger = logging.getLogger(__name__)
+
+# Generated tokens allowed per item of a batched reply
+BATCH_ITEM_MAX_TOKENS = 512
+
+BatchKey = Tuple[str, str, str]  # (model, stage, system prompt)
+
+
+def score_batching_enabled(config: Dict[str, Any]) -> bool:
+    """Whether a run's scoring requests may be batched with other debates."""
+    return bool(config.get("score_batching", settings.DEBATE_SCORE_BATCHING))
+
+
+@dataclass
+class _Batch:
+    prompts: List[str] = field(default_factory=list)
+    futures: List[asyncio.Future] = field(default_factory=list)
+    timer: Optional[asyncio.TimerHandle] = None
+
+
+class ScoreBatcher:
+    """
+    Collects concurrent scoring requests and dispatches them together.
+
+    Args:
+        window: Seconds the first request of a batch waits for others
+        max_batch: Items per batch; a full batch is dispatched at once
+    """
+
+    def __init__(self, window: Optional[float] = None, max_batch: Optional[int] = None):
+        self.window = settings.DEBATE_SCORE_BATCH_WINDOW_MS / 1000 if window is None else window
+        self.max_batch = settings.DEBATE_SCORE_BATCH_MAX if max_batch is None else max_batch
+        self._pending: Dict[BatchKey, _Batch] = {}
+        self._debates: Counter = Counter()  # Judge model -> running debates batching with it
+        self._tasks: Set[asyncio.Task] = set()
+
+    def join(self, models: Iterable[str]) -> None:
+        """Register a running debate whose scoring requests go to ``models``."""
+        self._debates.update(set(models))
+
+    def leave(self, models: Iterable[str]) -> None:
+        """Unregister a debate registered with ``join``."""
+        self._debates.subtract(set(models))
+        self._debates += Counter()  # Drop models no debate uses anymore
+
+    async def score(
+        self,
+        stage: str,
+        model: str,
+        prompt: str,
+        system_prompt: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Score a prompt as part of a batch.
+
+        Args:
+            stage: Debate stage being scored
+            model: Judge model
+            prompt: Scoring prompt
+            system_prompt: Judge system prompt
+
+        Returns:
+            Validated scores, or None if the request has to be sent on its own
+        """
+        key = (model, stage, system_prompt)
+        loop = asyncio.get_running_loop()
+        batch = self._pending.get(key)
+        if batch is None:
+            if self._debates[model] <= 1:
+                # No other debate could join this batch
+                return None
+            batch = self._pending[key] = _Batch()
+            batch.timer = loop.call_later(self.window, self._dispatch, key)
+
+        future = loop.create_future()
+        batch.prompts.append(prompt)
+        batch.futures.append(future)
+        if len(batch.prompts) >= self.max_batch:
+            batch.timer.cancel()
+            self._dispatch(key)
+        return await future
+
+    def _dispatch(self, key: BatchKey) -> None:
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        if len(batch.prompts) == 1:
+            batch.futures[0].set_result(None)
+            return
+        task = asyncio.create_task(self._send(key, batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, key: BatchKey, batch: _Batch) -> None:
+        model, stage, system_prompt = key
+        count = len(batch.prompts)
+        logger.info(f"Scoring {count} {stage} turns in one request to {model}")
+        try:
+            items = await self._request(model, stage, system_prompt, batch.prompts)
+        except Exception as e:
+            logger.warning(f"Batched {stage} scoring with {model} failed, scoring separately: {e}")
+            items = [None] * count
+
+        for future, item in zip(batch.futures, items):
+            if not future.done():
+                future.set_result(item)
+
+    async def _request(
+        self,
+        model: str,
+        stage: str,
+        system_prompt: str,
+        prompts: List[str]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Send one batched request and validate each returned item."""
+        response = await call_ollama_with_retry(
+            model=model,
+            prompt=build_batch_scoring_prompt(prompts),
+            system=system_prompt,
+            temperature=0.3,  # Low for consistency
+            max_tokens=BATCH_ITEM_MAX_TOKENS * len(prompts),
+            max_retries=3,
+            response_format=batch_score_json_schema(stage, len(prompts))
+        )
+        items = extract_json_object(response).get("items")
+        if not isinstance(items, list):
+            raise ScoreParseError("Batched reply has no items array")
+
+        results: List[Optional[Dict[str, Any]]] = []
+        for i in range(len(prompts)):
+            if i >= len(items) or not isinstance(items[i], dict):
+                results.append(None)
+                continue
+            try:
+                scores = parse_stage_scores(stage, json.dumps(items[i]))
+            except ScoreParseError as e:
+                logger.info(f"Invalid item {i + 1} in batched {stage} scores from {model}: {e}")
+                results.append(None)
+                continue
+            record_parse_outcome(model, stage, "ok")
+            results.append(scores)
+        return results
+
+
+score_batcher = ScoreBatcher()
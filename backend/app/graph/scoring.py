@@ -0,0 +1,287 @@
+"""
+Structured Judge Scoring
+
+Pydantic score models per debate stage. Their JSON schemas are passed to
+Ollama's ``format`` option so the judge is constrained to valid output, and
+replies are validated against the same models. Parse outcomes are counted per
+model and stage to track how often judge output has to be repaired or
+replaced by default scores.
+"""
+import json
+import logging
+from collections import Counter
+from functools import lru_cache
+from typing import Annotated, Any, Dict, List, Optional, Type
+
+from pydantic import BaseModel, Field, ValidationError, model_validator
+
+from app.core.metrics import SCORE_PARSE_OUTCOMES
+
+logger = logging.getLogger(__name__)
+
+# Sub-criterion score and penalty field types
+Criterion = Annotated[int, Field(ge=0, le=10)]
+Penalty = Annotated[int, Field(le=0)]
+
+
+class ScoreCategory(BaseModel):
+    """Rubric category; ``total`` defaults to the sum of its criteria."""
+    total: Optional[float] = None
+
+    @model_validator(mode="after")
+    def _fill_total(self) -> "ScoreCategory":
+        if self.total is None:
+            self.total = float(sum(
+                value for name, value in self
+                if name != "total" and isinstance(value, (int, float))
+            ))
+        return self
+
+
+class StageScores(BaseModel):
+    """
+    Base of every stage's scores.
+
+    Each stage declares its criteria first, then ``forbidden_phrases_detected``,
+    ``total`` and ``justification``: the judge writes fields in schema order,
+    so the total follows the criteria it adds up.
+    """
+
+
+class OpeningArgumentation(ScoreCategory):
+    logic: Criterion
+    originality: Criterion
+    evidence: Criterion
+
+
+class OpeningDelivery(ScoreCategory):
+    clarity: Criterion
+    structure: Criterion
+
+
+class OpeningStrategy(ScoreCategory):
+    position_setup: Criterion
+    forbidden_phrase_penalty: Penalty = 0
+
+
+class OpeningScores(StageScores):
+    argumentation: OpeningArgumentation
+    delivery: OpeningDelivery
+    strategy: OpeningStrategy
+    forbidden_phrases_detected: List[str] = []
+    total: float
+    justification: str = ""
+
+
+class RebuttalCategory(ScoreCategory):
+    targeting: Criterion
+    effectiveness: Criterion
+    reconstruction: Criterion
+
+
+class RebuttalArgumentation(ScoreCategory):
+    consistency: Criterion
+
+
+class RebuttalDelivery(ScoreCategory):
+    clarity: Criterion
+
+
+class PenaltyOnlyStrategy(ScoreCategory):
+    forbidden_phrase_penalty: Penalty = 0
+
+
+class RebuttalScores(StageScores):
+    rebuttal: RebuttalCategory
+    argumentation: RebuttalArgumentation
+    delivery: RebuttalDelivery
+    strategy: PenaltyOnlyStrategy
+    forbidden_phrases_detected: List[str] = []
+    total: float
+    justification: str = ""
+
+
+class SummaryStrategy(ScoreCategory):
+    weighing: Criterion
+    new_argument_penalty: Penalty = 0
+    forbidden_phrase_penalty: Penalty = 0
+
+
+class SummaryArgumentation(ScoreCategory):
+    synthesis: Criterion
+
+
+class SummaryDelivery(ScoreCategory):
+    impact: Criterion
+
+
+class SummaryScores(StageScores):
+    strategy: SummaryStrategy
+    argumentation: SummaryArgumentation
+    delivery: SummaryDelivery
+    new_arguments_detected: bool
+    forbidden_phrases_detected: List[str] = []
+    total: float
+    justification: str = ""
+
+
+SCORE_MODELS: Dict[str, Type[StageScores]] = {
+    "opening": OpeningScores,
+    "rebuttal": RebuttalScores,
+    "summary": SummaryScores,
+}
+
+# (model, stage, outcome) -> count; outcome is "ok", "repaired" or "failed"
+_parse_outcomes: Counter = Counter()
+
+
+class ScoreParseError(ValueError):
+    """Judge reply could not be parsed into the stage's score model."""
+
+
+@lru_cache(maxsize=None)
+def score_json_schema(stage: str) -> Dict[str, Any]:
+    """
+    JSON schema of a stage's score model (for Ollama's ``format`` option).
+
+    Category ``total`` fields are omitted; they are computed on validation.
+    """
+    schema = SCORE_MODELS[stage].model_json_schema()
+    for definition in schema.get("$defs", {}).values():
+        definition.get("properties", {}).pop("total", None)
+    return schema
+
+
+def batch_score_json_schema(stage: str, count: int) -> Dict[str, Any]:
+    """
+    JSON schema of a batched reply: ``{"items": [...]}`` with ``count`` scores.
+
+    Args:
+        stage: Debate stage of every item
+        count: Number of items in the batch
+    """
+    item = dict(score_json_schema(stage))  # The stage schema is cached; do not mutate it
+    definitions = item.pop("$defs", {})
+    schema: Dict[str, Any] = {
+        "type": "object",
+        "properties": {
+            "items": {"type": "array", "items": item, "minItems": count, "maxItems": count}
+        },
+        "required": ["items"],
+    }
+    if definitions:
+        schema["$defs"] = definitions
+    return schema
+
+
+@lru_cache(maxsize=None)
+def required_score_fields(stage: str) -> frozenset:
+    """Top-level fields a stage's scores need before generation can stop."""
+    return frozenset(
+        name for name, field in SCORE_MODELS[stage].model_fields.items() if field.is_required()
+    )
+
+
+def extract_json_object(text: str) -> Dict[str, Any]:
+    """
+    Extract the first JSON object embedded in a text.
+
+    Unlike a regex, ``JSONDecoder.raw_decode`` handles nested objects.
+
+    Raises:
+        ScoreParseError: If the text contains no JSON object
+    """
+    decoder = json.JSONDecoder()
+    start = text.find("{")
+    while start != -1:
+        try:
+            value, _ = decoder.raw_decode(text, start)
+            if isinstance(value, dict):
+                return value
+        except json.JSONDecodeError:
+            pass
+        start = text.find("{", start + 1)
+    raise ScoreParseError("No JSON object found in judge response")
+
+
+def parse_stage_scores(stage: str, response: str) -> Dict[str, Any]:
+    """
+    Parse and validate a judge reply against the stage's score model.
+
+    Args:
+        stage: Debate stage ("opening", "rebuttal", "summary")
+        response: Raw judge reply
+
+    Returns:
+        Validated scores (category totals filled in)
+
+    Raises:
+        ScoreParseError: If the reply is not valid JSON or fails validation
+    """
+    try:
+        data = extract_json_object(response)
+        return SCORE_MODELS[stage].model_validate(data).model_dump()
+    except ValidationError as e:
+        errors = "; ".join(
+            f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}" for err in e.errors()
+        )
+        raise ScoreParseError(errors) from e
+
+
+def build_repair_prompt(stage: str, response: str, error: str) -> str:
+    """
+    Build a prompt asking the judge to fix an invalid score reply.
+
+    Args:
+        stage: Debate stage being scored
+        response: The invalid reply
+        error: Validation error message
+
+    Returns:
+        Formatted prompt string
+    """
+    return f"""Your previous scoring reply was invalid.
+
+=== PREVIOUS REPLY ===
+{response[:2000]}
+
+=== PROBLEM ===
+{error}
+
+Return the same scores as a single JSON object matching this schema:
+{json.dumps(score_json_schema(stage))}
+
+Respond with ONLY the JSON, no additional text:"""
+
+
+def record_parse_outcome(model: str, stage: str, outcome: str) -> None:
+    """Count a scoring parse outcome ("ok", "repaired" or "failed")."""
+    _parse_outcomes[(model, stage, outcome)] += 1
+    SCORE_PARSE_OUTCOMES.inc(model=model, stage=stage, outcome=outcome)
+    if outcome == "failed":
+        logger.warning(f"Judge {model} produced unparseable {stage} scores")
+
+
+def get_parse_stats() -> List[Dict[str, Any]]:
+    """
+    Scoring parse outcomes per judge model and stage since process start.
+
+    Returns:
+        One entry per (model, stage) with counts and failure rate
+    """
+    grouped: Dict[tuple, Dict[str, int]] = {}
+    for (model, stage, outcome), count in _parse_outcomes.items():
+        grouped.setdefault((model, stage), {"ok": 0, "repaired": 0, "failed": 0})[outcome] += count
+
+    stats = []
+    for (model, stage), counts in sorted(grouped.items()):
+        total = sum(counts.values())
+        stats.append({
+            "model": model,
+            "stage": stage,
+            **counts,
+            "total": total,
+            "repair_rate": (counts["repaired"] + counts["failed"]) / total,
+            "failure_rate": counts["failed"] / total,
+        })
+    return stats
@@ -1,7 +1,9 @@
 """
 LangGraph State Definitions for VS Arena Debate Flow
 """
-from typing import TypedDict, Literal, Optional, List, Dict, Any
+from bisect import bisect_left
+from collections.abc import Sequence
+from typing import Annotated, TypedDict, Literal, Optional, List, Dict, Any, Iterable, Iterator
 
 
 class Turn(TypedDict):
@@ -15,8 +17,139 @@ class Turn(TypedDict):
     metadata: Dict[str, Any]  # Scores, timestamps, etc.
 
 
+class TurnLog(Sequence):
+    """
+    Append-only turn list indexed by phase, turn_id and role.
+
+    Lookups are O(1) instead of scanning the transcript. Appending returns a
+    new log that shares storage with the old one: each log only sees the
+    first ``len(log)`` turns, so earlier states stay unchanged while the
+    newest log is extended without copying. Appending to a log that is not
+    the newest copies it first.
+
+    A turn whose turn_id is already logged replaces the logged turn (how
+    scoring nodes return a turn with patched metadata); the log is copied
+    first so earlier states keep the old turn.
+    """
+    __slots__ = ("_turns", "_length", "_by_phase", "_by_id", "_by_role")
+
+    def __init__(self, turns: Iterable[Turn] = ()):
+        self._turns: List[Turn] = []
+        self._length = 0
+        self._by_phase: Dict[str, int] = {}
+        self._by_id: Dict[str, int] = {}
+        self._by_role: Dict[str, List[int]] = {}
+        self._append(turns)
+
+    @classmethod
+    def of(cls, turns: Optional[Iterable[Turn]]) -> "TurnLog":
+        """Return ``turns`` if already a TurnLog, otherwise index them."""
+        return turns if isinstance(turns, TurnLog) else cls(turns or ())
+
+    def _append(self, turns: Iterable[Turn]) -> None:
+        for turn in turns:
+            position = self._by_id.get(turn["turn_id"])
+            if position is not None:
+                self._turns[position] = turn
+                continue
+            position = len(self._turns)
+            self._turns.append(turn)
+            self._by_phase[turn["phase"]] = position
+            self._by_id[turn["turn_id"]] = position
+            self._by_role.setdefault(turn["role"], []).append(position)
+        self._length = len(self._turns)
+
+    def extend(self, turns: Iterable[Turn]) -> "TurnLog":
+        """
+        Return a new log with ``turns`` appended (this log is not modified).
+
+        Args:
+            turns: Turns to append (or to replace, by turn_id)
+
+        Returns:
+            Extended log
+        """
+        turns = list(turns)
+        replaces = any(turn["turn_id"] in self._by_id for turn in turns)
+        if self._length == len(self._turns) and not replaces:
+            log = TurnLog.__new__(TurnLog)
+            log._turns = self._turns
+            log._by_phase = self._by_phase
+            log._by_id = self._by_id
+            log._by_role = self._by_role
+            log._length = self._length
+        else:
+            log = TurnLog(self)
+        log._append(turns)
+        return log
+
+    def __add__(self, turns: Iterable[Turn]) -> "TurnLog":
+        return self.extend(turns)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._turns[:self._length][index]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("turn index out of range")
+        return self._turns[index]
+
+    def __iter__(self) -> Iterator[Turn]:
+        for index in range(self._length):
+            yield self._turns[index]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (TurnLog, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"TurnLog({[t['phase'] for t in self]})"
+
+    def _visible(self, position: Optional[int]) -> Optional[Turn]:
+        if position is None or position >= self._length:
+            return None
+        return self._turns[position]
+
+    def by_phase(self, phase: str) -> Optional[Turn]:
+        """Turn of a phase, or None if not generated yet."""
+        return self._visible(self._by_phase.get(phase))
+
+    def by_id(self, turn_id: str) -> Optional[Turn]:
+        """Turn with the given turn_id, or None."""
+        return self._visible(self._by_id.get(turn_id))
+
+    def by_role(self, role: str) -> List[Turn]:
+        """Turns of a role ("debater" or "judge") in order."""
+        positions = self._by_role.get(role, [])
+        return [self._turns[i] for i in positions[:bisect_left(positions, self._length)]]
+
+
+def append_turns(current: Optional[Iterable[Turn]], new: Optional[Iterable[Turn]]) -> TurnLog:
+    """Reducer appending a node's turns to the indexed turn log."""
+    return TurnLog.of(current).extend(new or ())
+
+
+def add_scores(current: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """Reducer adding a scoring node's delta to the running score totals."""
+    totals = dict(current or {})
+    for key, value in (delta or {}).items():
+        totals[key] = totals.get(key, 0) + value
+    return totals
+
+
 class DebateState(TypedDict):
-    """Complete debate state managed by LangGraph"""
+    """
+    Complete debate state managed by LangGraph.
+
+    Nodes return partial updates. ``turns`` are appended to an indexed
+    ``TurnLog`` and score deltas are added (see the Annotated reducers);
+    every other key is replaced.
+    """
     # Run metadata
     run_id: str
     topic: str
@@ -27,6 +160,7 @@ class DebateState(TypedDict):
     agent_a: Dict[str, Any]
     agent_b: Dict[str, Any]
     agent_j: Dict[str, Any]
+    judge_panel: List[Dict[str, Any]]  # agent_j first; more than one judge = panel mode
 
     # Configuration
     config: Dict[str, Any]  # rounds, max_tokens, etc.
@@ -34,13 +168,35 @@ class DebateState(TypedDict):
 
     # Execution state
     current_phase: str
-    turns: List[Turn]
+    turns: Annotated[TurnLog, append_turns]
 
     # Scoring state
-    scores_a: Dict[str, Any]
-    scores_b: Dict[str, Any]
+    scores_a: Annotated[Dict[str, Any], add_scores]
+    scores_b: Annotated[Dict[str, Any], add_scores]
 
     # Final results
     winner: Optional[Literal["A", "B", "DRAW"]]
     verdict: Optional[str]
+    timing: Optional[Dict[str, Any]]  # Run timing rollup (see app.graph.timing), set by the engine
     status: Literal["pending", "running", "judging", "completed", "failed"]
+
+
+def apply_update(state: DebateState, update: Dict[str, Any]) -> DebateState:
+    """
+    Merge a node's partial update into the state using the same reducers as
+    the LangGraph graph.
+
+    Args:
+        state: Current debate state
+        update: Partial update returned by a node
+
+    Returns:
+        New state (the input state is not modified)
+    """
+    merged: DebateState = {**state, **update}
+    if "turns" in update:
+        merged["turns"] = append_turns(state["turns"], update["turns"])
+    for score_key in ("scores_a", "scores_b"):
+        if score_key in update:
+            merged[score_key] = add_scores(state[score_key], update[score_key])
+    return merged
@@ -0,0 +1,110 @@
+"""
+Debate Timing
+
+Where a debate's time goes. Ollama reports its counters in the final frame
+of every call (``ollama_stats`` in turn metadata: load, prompt evaluation
+and generation durations in nanoseconds, token counts). The executor adds
+its own view of each node: end-to-end latency and time to the first
+streamed event. ``summarize_run_timing`` rolls both up per node kind for
+the run's ``result_json``.
+"""
+import time
+from typing import Any, Dict, Optional
+
+from app.graph.nodes.utils import EventEmitter
+
+# Ollama counters summed by the rollup ("*_duration" in nanoseconds)
+OLLAMA_DURATIONS = ("total_duration", "load_duration", "prompt_eval_duration", "eval_duration")
+OLLAMA_COUNTS = ("prompt_eval_count", "eval_count")
+
+# Streamed events that count as a node's first output
+FIRST_OUTPUT_EVENTS = ("token", "score")
+
+
+def add_stats(total: Dict[str, Any], stats: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Add one call's Ollama counters to ``total`` (for nodes making several calls)."""
+    for key, value in (stats or {}).items():
+        if isinstance(value, (int, float)):
+            total[key] = total.get(key, 0) + value
+    return total
+
+
+class NodeTimer:
+    """Measures one node from the executor: latency and first streamed output."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.first_output: Optional[float] = None
+        self.finished: Optional[float] = None
+
+    def wrap(self, emit: EventEmitter) -> EventEmitter:
+        """EventEmitter that notes when the node first streams output."""
+        async def timed_emit(event: Dict[str, Any]) -> None:
+            if self.first_output is None and event.get("event") in FIRST_OUTPUT_EVENTS:
+                self.first_output = time.perf_counter()
+            await emit(event)
+        return timed_emit
+
+    def stop(self) -> None:
+        if self.finished is None:
+            self.finished = time.perf_counter()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Latency and time to first output in milliseconds."""
+        finished = self.finished if self.finished is not None else time.perf_counter()
+        return {
+            "latency_ms": round((finished - self.started) * 1000, 1),
+            "time_to_first_token_ms": (
+                round((self.first_output - self.started) * 1000, 1)
+                if self.first_output is not None else None
+            ),
+        }
+
+
+def summarize_run_timing(nodes: Dict[str, Dict[str, Any]], wall_ms: float) -> Dict[str, Any]:
+    """
+    Roll up per-node timing and Ollama counters for a run.
+
+    Args:
+        nodes: Per node name: ``kind``, ``latency_ms``,
+            ``time_to_first_token_ms`` and ``ollama_stats``
+        wall_ms: Wall-clock time of the whole plan
+
+    Returns:
+        Wall time, per-kind totals and Ollama time split into model load,
+        prompt evaluation and generation (milliseconds)
+    """
+    by_kind: Dict[str, Dict[str, Any]] = {}
+    ollama: Dict[str, Any] = {}
+    for node in nodes.values():
+        kind = by_kind.setdefault(node["kind"], {"nodes": 0, "latency_ms": 0.0, "ollama": {}})
+        kind["nodes"] += 1
+        kind["latency_ms"] += node.get("latency_ms") or 0.0
+        add_stats(kind["ollama"], node.get("ollama_stats"))
+        add_stats(ollama, node.get("ollama_stats"))
+
+    for kind in by_kind.values():
+        kind["latency_ms"] = round(kind["latency_ms"], 1)
+        kind["ollama"] = _ollama_summary(kind["ollama"])
+
+    return {
+        "wall_ms": round(wall_ms, 1),
+        "nodes": {
+            name: {key: node.get(key) for key in ("kind", "latency_ms", "time_to_first_token_ms")}
+            for name, node in nodes.items()
+        },
+        "by_kind": by_kind,
+        "ollama": _ollama_summary(ollama),
+    }
+
+
+def _ollama_summary(stats: Dict[str, Any]) -> Dict[str, Any]:
+    summary: Dict[str, Any] = {
+        f"{field[:-len('_duration')]}_ms": round(stats.get(field, 0) / 1e6, 1)
+        for field in OLLAMA_DURATIONS
+    }
+    for field in OLLAMA_COUNTS:
+        summary[field] = stats.get(field, 0)
+    eval_seconds = stats.get("eval_duration", 0) / 1e9
+    summary["tokens_per_second"] = round(stats.get("eval_count", 0) / eval_seconds, 1) if eval_seconds else None
+    return summary
@@ -0,0 +1,402 @@
+"""
+Tournament Runner
+
+Runs many debates between a set of agents without a client driving each
+``/start`` + ``/stream`` pair:
+
+- ``round_robin``: every pair of agents meets once per topic (one round).
+- ``swiss``: each round pairs agents with equal or similar points who have
+  not met yet; the next round is paired once the current one finished.
+
+With ``swap_positions`` every debate is also run position-swapped (the same
+swap as ``POST /runs/{id}/swap``), so both agents argue both sides.
+
+Runs are executed by a pool of ``max_parallel_runs`` workers (default
+``TOURNAMENT_MAX_PARALLEL_RUNS``), each with its own database session. The
+run queue is ordered by the debaters' models, so consecutive and concurrent
+runs mostly use the same models and Ollama reloads as few models as
+possible.
+
+Standings are updated as each run completes and pushed to subscribers as
+SSE events (``round_start``, ``run_result``, ``tournament_complete``).
+Tournaments are kept in memory (finished ones for
+``TOURNAMENT_RETENTION_SECONDS``) and cancelled on shutdown; their runs are
+ordinary runs in the database (and update the Elo leaderboard).
+"""
+import asyncio
+import json
+import logging
+import math
+from collections import deque
+from datetime import datetime, timedelta
+from itertools import combinations
+from typing import (
+    Any, Callable, Deque, Dict, FrozenSet, List, Literal, Optional, Sequence, Set, Tuple, TypedDict
+)
+from uuid import UUID, uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.database import AsyncSessionLocal
+from app.graph.engine import run_debate
+from app.services.run_crud import create_run, swapped_run_kwargs
+
+logger = logging.getLogger(__name__)
+
+TournamentFormat = Literal["round_robin", "swiss"]
+TOURNAMENT_FORMATS = ("round_robin", "swiss")
+
+Pairing = Tuple[str, str]
+SessionFactory = Callable[[], AsyncSession]
+
+# Points per debate (a Swiss bye counts as a win)
+WIN_POINTS = 1.0
+DRAW_POINTS = 0.5
+
+
+class Standing(TypedDict):
+    """Aggregate results of one agent"""
+    agent_id: str
+    points: float
+    wins: int
+    losses: int
+    draws: int
+    byes: int
+    runs: int  # Finished debates (failed runs are not counted)
+
+
+class TournamentRun(TypedDict):
+    """Single scheduled debate of a tournament"""
+    run_id: str
+    round: int
+    topic: str
+    agent_a_id: str
+    agent_b_id: str
+    swap_of_run_id: Optional[str]  # Original run of a position-swapped copy
+    status: str  # pending, running, completed, failed
+    winner: Optional[str]  # "A", "B" or "DRAW"
+
+
+def round_robin_pairings(agent_ids: Sequence[str]) -> List[Pairing]:
+    """Every pair of agents once, in input order."""
+    return list(combinations(agent_ids, 2))
+
+
+def default_swiss_rounds(agent_count: int) -> int:
+    """Rounds needed to separate the field (ceil(log2(n)), at least one)."""
+    return max(1, math.ceil(math.log2(max(agent_count, 2))))
+
+
+def swiss_pairings(
+    ranking: Sequence[Standing],
+    played: Set[FrozenSet[str]]
+) -> Tuple[List[Pairing], Optional[str]]:
+    """
+    Pair a Swiss round.
+
+    Agents are taken from the top of the ranking and paired with the next
+    highest agent they have not met; a rematch is only used when no new
+    opponent is left. With an odd field the lowest-ranked agent without a
+    bye sits the round out.
+
+    Args:
+        ranking: Standings, best first
+        played: Pairs that already met
+
+    Returns:
+        (pairings, agent with the bye or None)
+    """
+    pool = [standing["agent_id"] for standing in ranking]
+    bye = None
+    if len(pool) % 2:
+        candidates = [s["agent_id"] for s in ranking if s["byes"] == 0] or pool
+        bye = candidates[-1]
+        pool.remove(bye)
+
+    pairings: List[Pairing] = []
+    while pool:
+        agent = pool.pop(0)
+        opponent = next((o for o in pool if frozenset((agent, o)) not in played), pool[0])
+        pool.remove(opponent)
+        pairings.append((agent, opponent))
+    return pairings, bye
+
+
+def order_by_model(pairings: Sequence[Pairing], models: Dict[str, str]) -> List[Pairing]:
+    """
+    Group pairings that use the same pair of models.
+
+    The sort is stable, so the original order is kept within a group.
+    """
+    return sorted(pairings, key=lambda pairing: tuple(sorted(models[a] for a in pairing)))
+
+
+class Tournament:
+    """
+    A tournament's schedule, standings and subscribers.
+
+    Args:
+        agents: agent_id -> model name of the competing agents
+        topics: Debate topics (every pairing debates each topic)
+        judge_id: Judge agent for all runs
+        format: "round_robin" or "swiss"
+        rounds: Swiss rounds (default: ceil(log2(agent count)))
+        swap_positions: Also run every debate position-swapped
+        max_parallel_runs: Concurrent runs (default TOURNAMENT_MAX_PARALLEL_RUNS)
+        config: Run config for every debate
+        rubric: Scoring rubric for every debate
+    """
+
+    def __init__(
+        self,
+        agents: Dict[str, str],
+        topics: Sequence[str],
+        judge_id: str,
+        format: TournamentFormat = "round_robin",
+        rounds: Optional[int] = None,
+        swap_positions: bool = True,
+        max_parallel_runs: Optional[int] = None,
+        config: Optional[Dict[str, Any]] = None,
+        rubric: Optional[Dict[str, Any]] = None
+    ):
+        self.tournament_id = str(uuid4())
+        self.agents = dict(agents)
+        self.topics = list(topics)
+        self.judge_id = judge_id
+        self.format = format
+        self.total_rounds = (
+            1 if format == "round_robin" else rounds or default_swiss_rounds(len(agents))
+        )
+        self.swap_positions = swap_positions
+        self.max_parallel_runs = max(1, max_parallel_runs or settings.TOURNAMENT_MAX_PARALLEL_RUNS)
+        self.config = config
+        self.rubric = rubric
+        self.status = "pending"
+        self.current_round = 0
+        self.created_at = datetime.utcnow()
+        self.finished_at: Optional[datetime] = None
+        self.runs: List[TournamentRun] = []
+        self.standings: Dict[str, Standing] = {
+            agent_id: {"agent_id": agent_id, "points": 0.0, "wins": 0, "losses": 0,
+                       "draws": 0, "byes": 0, "runs": 0}
+            for agent_id in self.agents
+        }
+        self._played: Set[FrozenSet[str]] = set()
+        self._listeners: List[asyncio.Queue] = []
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("completed", "failed")
+
+    def ranking(self) -> List[Standing]:
+        """Standings by points, then wins; ties keep the entry order."""
+        order = {agent_id: i for i, agent_id in enumerate(self.agents)}
+        return sorted(
+            self.standings.values(),
+            key=lambda s: (-s["points"], -s["wins"], order[s["agent_id"]])
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-serializable state of the tournament."""
+        return {
+            "tournament_id": self.tournament_id,
+            "format": self.format,
+            "status": self.status,
+            "round": self.current_round,
+            "total_rounds": self.total_rounds,
+            "topics": self.topics,
+            "agent_j_id": self.judge_id,
+            "max_parallel_runs": self.max_parallel_runs,
+            "standings": self.ranking(),
+            "runs": self.runs,
+            "created_at": self.created_at.isoformat(),
+        }
+
+    # Subscribers
+
+    def subscribe(self) -> asyncio.Queue:
+        """Queue receiving the tournament's events (None after the last one)."""
+        queue: asyncio.Queue = asyncio.Queue()
+        self._listeners.append(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        if queue in self._listeners:
+            self._listeners.remove(queue)
+
+    def _publish(self, event: Optional[str], data: Optional[Dict[str, Any]] = None) -> None:
+        message = None if event is None else {"event": event, "data": json.dumps(data)}
+        for queue in self._listeners:
+            queue.put_nowait(message)
+
+    # Execution
+
+    async def run(self, session_factory: SessionFactory = AsyncSessionLocal) -> None:
+        """
+        Play all rounds. Errors are logged and end the tournament as failed.
+
+        Args:
+            session_factory: Creates the sessions for run creation and execution
+        """
+        self.status = "running"
+        try:
+            for round_number in range(1, self.total_rounds + 1):
+                self.current_round = round_number
+                pairings = self._pair_round()
+                async with session_factory() as db:
+                    scheduled = await self._create_runs(db, round_number, pairings)
+                self._publish("round_start", {"round": round_number, "runs": len(scheduled)})
+                logger.info(
+                    f"Tournament {self.tournament_id} round {round_number}/{self.total_rounds}: "
+                    f"{len(scheduled)} runs, {self.max_parallel_runs} in parallel"
+                )
+                await self._execute(scheduled, session_factory)
+            self.status = "completed"
+        except Exception as e:
+            logger.error(f"Tournament {self.tournament_id} failed: {e}", exc_info=True)
+            self.status = "failed"
+        finally:
+            if self.status == "running":  # Cancelled
+                self.status = "failed"
+            self.finished_at = datetime.utcnow()
+            self._publish("tournament_complete", self.snapshot())
+            self._publish(None)
+
+    def _pair_round(self) -> List[Pairing]:
+        if self.format == "round_robin":
+            pairings = round_robin_pairings(list(self.agents))
+        else:
+            pairings, bye = swiss_pairings(self.ranking(), self._played)
+            if bye is not None:
+                self.standings[bye]["points"] += WIN_POINTS
+                self.standings[bye]["byes"] += 1
+        self._played.update(frozenset(pairing) for pairing in pairings)
+        return order_by_model(pairings, self.agents)
+
+    async def _create_runs(
+        self,
+        db: AsyncSession,
+        round_number: int,
+        pairings: List[Pairing]
+    ) -> List[TournamentRun]:
+        """Create the round's runs (each followed by its swapped copy)."""
+        scheduled: List[TournamentRun] = []
+        for agent_a_id, agent_b_id in pairings:
+            for topic in self.topics:
+                run = await create_run(
+                    db=db,
+                    topic=topic,
+                    agent_a_id=UUID(agent_a_id),
+                    agent_b_id=UUID(agent_b_id),
+                    agent_j_id=UUID(self.judge_id),
+                    position_a="FOR",
+                    position_b="AGAINST",
+                    config=self.config,
+                    rubric=self.rubric
+                )
+                runs = [run]
+                if self.swap_positions:
+                    runs.append(await create_run(db=db, **swapped_run_kwargs(run)))
+                for created in runs:
+                    swap_of = created.swap_of_run_id
+                    scheduled.append({
+                        "run_id": str(created.run_id),
+                        "round": round_number,
+                        "topic": topic,
+                        "agent_a_id": str(created.agent_a_id),
+                        "agent_b_id": str(created.agent_b_id),
+                        "swap_of_run_id": str(swap_of) if swap_of else None,
+                        "status": "pending",
+                        "winner": None,
+                    })
+        self.runs.extend(scheduled)
+        return scheduled
+
+    async def _execute(self, scheduled: List[TournamentRun], session_factory: SessionFactory) -> None:
+        """Run the queue in order with at most ``max_parallel_runs`` at a time."""
+        queue: Deque[TournamentRun] = deque(scheduled)
+
+        async def worker() -> None:
+            while queue:
+                await self._play(queue.popleft(), session_factory)
+
+        await asyncio.gather(*(worker() for _ in range(min(self.max_parallel_runs, len(queue)))))
+
+    async def _play(self, entry: TournamentRun, session_factory: SessionFactory) -> None:
+        entry["status"] = "running"
+        try:
+            async with session_factory() as db:
+                state = await run_debate(entry["run_id"], db)
+        except Exception as e:
+            # run_debate already marked the run failed; the tournament goes on
+            logger.warning(f"Tournament {self.tournament_id} run {entry['run_id']} failed: {e}")
+            entry["status"] = "failed"
+        else:
+            entry["status"] = "completed"
+            entry["winner"] = state["winner"]
+            self._record(entry)
+        self._publish("run_result", {"run": entry, "standings": self.ranking()})
+
+    def _record(self, entry: TournamentRun) -> None:
+        a = self.standings[entry["agent_a_id"]]
+        b = self.standings[entry["agent_b_id"]]
+        outcomes = {"A": (a, b), "B": (b, a)}
+        if entry["winner"] in outcomes:
+            winner, loser = outcomes[entry["winner"]]
+            winner["points"] += WIN_POINTS
+            winner["wins"] += 1
+            loser["losses"] += 1
+        else:
+            for standing in (a, b):
+                standing["points"] += DRAW_POINTS
+                standing["draws"] += 1
+        a["runs"] += 1
+        b["runs"] += 1
+
+
+# Running and finished tournaments of this process
+_tournaments: Dict[str, Tournament] = {}
+_tasks: Set[asyncio.Task] = set()
+
+
+def _evict_finished() -> None:
+    """Forget tournaments that finished more than TOURNAMENT_RETENTION_SECONDS ago."""
+    cutoff = datetime.utcnow() - timedelta(seconds=settings.TOURNAMENT_RETENTION_SECONDS)
+    for tournament_id, tournament in list(_tournaments.items()):
+        if tournament.finished_at is not None and tournament.finished_at < cutoff:
+            del _tournaments[tournament_id]
+
+
+def start_tournament(
+    tournament: Tournament,
+    session_factory: SessionFactory = AsyncSessionLocal
+) -> Tournament:
+    """Register a tournament and play it in the background."""
+    _evict_finished()
+    _tournaments[tournament.tournament_id] = tournament
+    task = asyncio.create_task(tournament.run(session_factory))
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+    return tournament
+
+
+def get_tournament(tournament_id: str) -> Optional[Tournament]:
+    _evict_finished()
+    return _tournaments.get(tournament_id)
+
+
+def list_tournaments() -> List[Tournament]:
+    """Tournaments of this process, newest first."""
+    _evict_finished()
+    return sorted(_tournaments.values(), key=lambda t: t.created_at, reverse=True)
+
+
+async def shutdown_tournaments() -> None:
+    """Cancel the tournaments still playing and wait for their workers to stop."""
+    tasks = list(_tasks)
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        logger.info(f"Cancelling {len(tasks)} running tournaments")
+        await asyncio.gather(*tasks, return_exceptions=True)
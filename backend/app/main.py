@@ -1,12 +1,15 @@
 """
 VS Arena Backend - FastAPI Application
 """
-from fastapi import FastAPI
+import asyncio
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
+from app.core import metrics, tracing
 from app.core.config import settings
 from app.api.routes import api_router
+from app.graph.tournament import shutdown_tournaments
 
 
 @asynccontextmanager
@@ -14,9 +17,18 @@ async def lifespan(app: FastAPI):
     """Application lifespan handler"""
     # Startup
     print("🚀 VS Arena Backend starting...")
+    lag_monitor = None
+    if settings.METRICS_ENABLED:
+        lag_monitor = asyncio.create_task(metrics.monitor_event_loop_lag(settings.METRICS_LOOP_LAG_INTERVAL))
     yield
     # Shutdown
     print("👋 VS Arena Backend shutting down...")
+    await shutdown_tournaments()
+    if lag_monitor is not None:
+        lag_monitor.cancel()
+        with suppress(asyncio.CancelledError):
+            await lag_monitor
+    await tracing.flush()
 
 
 app = FastAPI(
@@ -31,12 +43,17 @@ VS Arena is an AI-powered debate platform where customizable LLM agents engage i
 - **Debate Execution**: Run structured debates with real-time SSE streaming
 - **Judging System**: Automated scoring with detailed rubrics
 - **Bias Detection**: Swap tests to analyze position bias
+- **Tournaments**: Round-robin and Swiss brackets run in the background
+- **Leaderboard**: Elo ratings of debaters, updated as runs complete
 
 ### SSE Event Types
 When streaming debates, the following events are emitted:
+- `plan` - Execution plan (nodes, dependencies, parallel groups)
 - `phase_start` - Debate phase begins
 - `token` - Streamed token from LLM
-- `score` - Phase scoring result
+- `violation` - Forbidden phrase generated (with `forbidden_phrase_enforcement` enabled)
+- `turn_reset` - Discard the turn's streamed tokens; it is being regenerated
+- `score` - Phase scoring result (`partial: true` while the judge's reply streams)
 - `phase_end` - Phase completion
 - `verdict` - Final judgment
 - `run_complete` - Debate finished
@@ -53,6 +70,14 @@ When streaming debates, the following events are emitted:
             "name": "debate",
             "description": "Debate execution and management. Start debates, stream progress, retrieve results, and analyze bias.",
         },
+        {
+            "name": "tournaments",
+            "description": "Round-robin and Swiss tournaments. Schedule many debates between agents and follow the standings.",
+        },
+        {
+            "name": "leaderboard",
+            "description": "Elo ratings of debate agents, updated as runs complete.",
+        },
         {
             "name": "ollama",
             "description": "Ollama LLM service integration. Check available models and server status.",
@@ -90,3 +115,11 @@ async def root():
 async def health():
     """Health check endpoint"""
     return {"status": "healthy"}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics():
+    """Prometheus metrics (text exposition format)"""
+    if not settings.METRICS_ENABLED:
+        return Response(status_code=404)
+    return Response(metrics.registry.render(), media_type=metrics.CONTENT_TYPE)
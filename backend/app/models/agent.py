@@ -1,7 +1,7 @@
 """
 Agent SQLAlchemy Model
 """
-from sqlalchemy import Column, String, TIMESTAMP, func
+from sqlalchemy import Column, Index, String, TIMESTAMP, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 import uuid
 
@@ -18,3 +18,7 @@ class Agent(Base):
     params_json = Column(JSONB, nullable=False, default=dict)
     created_at = Column(TIMESTAMP, server_default=func.now())
     updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index("idx_agents_created_at", created_at.desc()),
+    )
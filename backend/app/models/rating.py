@@ -0,0 +1,27 @@
+"""
+Agent Rating SQLAlchemy Model
+"""
+from sqlalchemy import Column, Float, ForeignKey, Index, Integer, TIMESTAMP, func
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.db.database import Base
+
+
+class AgentRating(Base):
+    """One row per rated debater, maintained by app.services.ratings."""
+    __tablename__ = "agent_ratings"
+
+    agent_id = Column(
+        UUID(as_uuid=True), ForeignKey("agents.agent_id", ondelete="CASCADE"), primary_key=True
+    )
+    rating = Column(Float, nullable=False)
+    games = Column(Integer, nullable=False, default=0)
+    wins = Column(Integer, nullable=False, default=0)
+    losses = Column(Integer, nullable=False, default=0)
+    draws = Column(Integer, nullable=False, default=0)
+    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        # Leaderboard pages: ordered by rating, agent_id breaks ties
+        Index("idx_agent_ratings_rating", rating.desc(), agent_id),
+    )
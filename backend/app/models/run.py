@@ -1,12 +1,15 @@
 """
 Run SQLAlchemy Model
 """
-from sqlalchemy import Column, String, Text, TIMESTAMP, ForeignKey, func
+from sqlalchemy import Column, Index, String, Text, TIMESTAMP, ForeignKey, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 import uuid
 
 from app.db.database import Base
 
+# Statuses of runs that have not finished (covered by a partial index)
+ACTIVE_RUN_STATUSES = ("pending", "running")
+
 
 class Run(Base):
     __tablename__ = "runs"
@@ -24,3 +27,26 @@ class Run(Base):
     status = Column(String(20), nullable=False, default="pending")
     created_at = Column(TIMESTAMP, server_default=func.now())
     finished_at = Column(TIMESTAMP, nullable=True)
+    # Run this one is the position-swapped copy of (swap tests, tournaments)
+    swap_of_run_id = Column(
+        UUID(as_uuid=True), ForeignKey("runs.run_id", ondelete="SET NULL"), nullable=True
+    )
+
+    __table_args__ = (
+        Index("idx_runs_created_at", created_at.desc()),
+        # Finished runs dominate the table; only active ones are looked up by
+        # status, newest first
+        Index(
+            "idx_runs_active", created_at.desc(),
+            postgresql_where=status.in_(ACTIVE_RUN_STATUSES),
+        ),
+        # Agent history and leaderboard queries
+        Index("idx_runs_agent_a_id", "agent_a_id"),
+        Index("idx_runs_agent_b_id", "agent_b_id"),
+        Index("idx_runs_agent_j_id", "agent_j_id"),
+        # Swap pair lookups; most runs are not swaps
+        Index(
+            "idx_runs_swap_of_run_id", swap_of_run_id,
+            postgresql_where=swap_of_run_id.isnot(None),
+        ),
+    )
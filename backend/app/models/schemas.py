@@ -2,7 +2,7 @@
 Pydantic schemas for API request/response validation
 """
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, Literal, List
+from typing import Optional, Dict, Any, Literal, List, Union
 from uuid import UUID
 from datetime import datetime
 
@@ -173,6 +173,10 @@ class RunResponse(BaseModel):
     )
     created_at: datetime = Field(..., description="Creation timestamp")
     finished_at: Optional[datetime] = Field(None, description="Completion timestamp")
+    swap_of_run_id: Optional[UUID] = Field(
+        None,
+        description="Original run if this run is its position-swapped copy",
+    )
 
     class Config:
         from_attributes = True
@@ -200,6 +204,10 @@ class RunDetailResponse(BaseModel):
     )
     created_at: datetime = Field(..., description="Creation timestamp")
     finished_at: Optional[datetime] = Field(None, description="Completion timestamp")
+    swap_of_run_id: Optional[UUID] = Field(
+        None,
+        description="Original run if this run is its position-swapped copy",
+    )
 
 
 # Turn Schemas
@@ -237,6 +245,112 @@ class TurnResponse(BaseModel):
         from_attributes = True
 
 
+# Leaderboard Schemas
+class LeaderboardEntry(BaseModel):
+    """Schema for one leaderboard row - a debater's Elo rating"""
+    rank: int = Field(..., description="1-based position by rating", examples=[1])
+    agent_id: UUID = Field(..., description="Agent UUID")
+    name: str = Field(..., description="Agent name", examples=["Logical Analyst"])
+    model: str = Field(..., description="Ollama model name", examples=["llama3"])
+    rating: float = Field(..., description="Elo rating", examples=[1043.5])
+    games: int = Field(..., description="Rated debates")
+    wins: int = Field(..., description="Debates won")
+    losses: int = Field(..., description="Debates lost")
+    draws: int = Field(..., description="Debates drawn")
+
+
+class RatingRecomputeResponse(BaseModel):
+    """Schema for a full ratings recompute"""
+    agents: int = Field(..., description="Number of rated agents")
+    runs: int = Field(..., description="Number of completed runs replayed")
+
+
+# Tournament Schemas
+class TournamentCreateRequest(BaseModel):
+    """Schema for starting a tournament"""
+    agent_ids: List[UUID] = Field(
+        ...,
+        min_length=2,
+        description="Competing agents (duplicates are ignored)",
+    )
+    topics: List[str] = Field(
+        ...,
+        min_length=1,
+        description="Debate topics; every pairing debates each topic",
+        examples=[["Artificial intelligence will benefit humanity more than harm it"]],
+    )
+    agent_j_id: UUID = Field(..., description="Judge agent's UUID for all runs")
+    format: Literal["round_robin", "swiss"] = Field(
+        "round_robin",
+        description="round_robin: every pair meets once; swiss: rounds of similarly ranked pairs",
+    )
+    rounds: Optional[int] = Field(
+        None,
+        ge=1,
+        le=20,
+        description="Swiss rounds (default: ceil(log2(agent count))); ignored for round_robin",
+    )
+    swap_positions: bool = Field(
+        True,
+        description="Also run every debate with agents and positions swapped",
+    )
+    max_parallel_runs: Optional[int] = Field(
+        None,
+        ge=1,
+        le=32,
+        description="Debates running at once (default TOURNAMENT_MAX_PARALLEL_RUNS)",
+    )
+    config: Optional[Dict[str, Any]] = Field(
+        default_factory=lambda: {"rounds": 3, "max_tokens_per_turn": 1024},
+        description="Debate configuration for every run",
+    )
+    rubric: Optional[Dict[str, Any]] = Field(
+        None,
+        description="Scoring rubric weights for every run",
+    )
+
+
+class TournamentStanding(BaseModel):
+    """Schema for one agent's tournament results"""
+    agent_id: UUID = Field(..., description="Agent UUID")
+    points: float = Field(..., description="1 per win (or bye), 0.5 per draw")
+    wins: int = Field(..., description="Debates won")
+    losses: int = Field(..., description="Debates lost")
+    draws: int = Field(..., description="Debates drawn")
+    byes: int = Field(..., description="Swiss rounds sat out")
+    runs: int = Field(..., description="Finished debates")
+
+
+class TournamentRunEntry(BaseModel):
+    """Schema for a scheduled tournament debate"""
+    run_id: UUID = Field(..., description="Run UUID")
+    round: int = Field(..., description="Tournament round (1-based)")
+    topic: str = Field(..., description="Debate topic")
+    agent_a_id: UUID = Field(..., description="Agent A's UUID")
+    agent_b_id: UUID = Field(..., description="Agent B's UUID")
+    swap_of_run_id: Optional[UUID] = Field(
+        None,
+        description="Original run if this run is its position-swapped copy",
+    )
+    status: str = Field(..., description="pending, running, completed, failed")
+    winner: Optional[str] = Field(None, description="A, B or DRAW", examples=["A"])
+
+
+class TournamentResponse(BaseModel):
+    """Schema for tournament state and standings"""
+    tournament_id: UUID = Field(..., description="Unique tournament identifier")
+    format: str = Field(..., description="round_robin or swiss")
+    status: str = Field(..., description="pending, running, completed, failed")
+    round: int = Field(..., description="Current round (0 before the first)")
+    total_rounds: int = Field(..., description="Rounds to play")
+    topics: List[str] = Field(..., description="Debate topics")
+    agent_j_id: UUID = Field(..., description="Judge agent's UUID")
+    max_parallel_runs: int = Field(..., description="Debates running at once")
+    standings: List[TournamentStanding] = Field(..., description="Standings, best first")
+    runs: List[TournamentRunEntry] = Field(..., description="Scheduled runs in execution order")
+    created_at: datetime = Field(..., description="Creation timestamp")
+
+
 # Debate Schemas
 class DebateStartRequest(BaseModel):
     """
@@ -263,10 +377,16 @@ class DebateStartRequest(BaseModel):
     )
     agent_a_id: UUID = Field(..., description="Agent A's UUID")
     agent_b_id: UUID = Field(..., description="Agent B's UUID")
-    agent_j_id: UUID = Field(..., description="Judge agent's UUID")
+    agent_j_id: Union[UUID, List[UUID]] = Field(
+        ...,
+        description=(
+            "Judge agent's UUID, or a list of judge UUIDs for a judge panel "
+            "(the first one is the primary judge)"
+        ),
+    )
     config: Optional[Dict[str, Any]] = Field(
         default_factory=lambda: {"rounds": 3, "max_tokens_per_turn": 1024},
-        description="Debate configuration (rounds, max_tokens_per_turn)",
+        description="Debate configuration (rounds, max_tokens_per_turn, panel_aggregation)",
     )
     rubric: Optional[Dict[str, Any]] = Field(
         default_factory=lambda: {
@@ -278,6 +398,13 @@ class DebateStartRequest(BaseModel):
         description="Scoring rubric weights (must sum to 100)",
     )
 
+    @property
+    def judge_ids(self) -> List[UUID]:
+        """Distinct judge IDs, primary judge first"""
+        if isinstance(self.agent_j_id, list):
+            return list(dict.fromkeys(self.agent_j_id))
+        return [self.agent_j_id]
+
 
 class DebateStartResponse(BaseModel):
     """Schema for debate start response - returned after starting a debate"""
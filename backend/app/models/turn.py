@@ -1,7 +1,7 @@
 """
 Turn SQLAlchemy Model
 """
-from sqlalchemy import Column, String, Text, TIMESTAMP, ForeignKey, func
+from sqlalchemy import Column, Index, String, Text, TIMESTAMP, ForeignKey, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 import uuid
 
@@ -21,3 +21,8 @@ class Turn(Base):
     # Use metadata_json attribute name to avoid SQLAlchemy reserved 'metadata' attribute
     metadata_json = Column("metadata", JSONB, default=dict)
     created_at = Column(TIMESTAMP, server_default=func.now())
+
+    __table_args__ = (
+        # get_turns_by_run_id: filter by run, ordered by creation time
+        Index("idx_turns_run_id_created_at", "run_id", "created_at"),
+    )
@@ -2,7 +2,7 @@
 Agent CRUD Operations
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select, update
 from typing import List, Optional
 from uuid import UUID
 import uuid
@@ -24,45 +24,55 @@ async def get_agent_by_id(db: AsyncSession, agent_id: UUID) -> Optional[Agent]:
 
 
 async def create_agent(db: AsyncSession, agent_data: AgentCreate) -> Agent:
-    """Create a new agent"""
-    agent = Agent(
-        agent_id=uuid.uuid4(),
-        name=agent_data.name,
-        model=agent_data.model,
-        persona_json=agent_data.persona_json,
-        params_json=agent_data.params_json,
+    """Create a new agent (INSERT ... RETURNING, one round-trip)"""
+    result = await db.execute(
+        insert(Agent)
+        .values(
+            agent_id=uuid.uuid4(),
+            name=agent_data.name,
+            model=agent_data.model,
+            persona_json=agent_data.persona_json,
+            params_json=agent_data.params_json,
+        )
+        .returning(Agent)
     )
-    db.add(agent)
+    agent = result.scalar_one()
     await db.commit()
-    await db.refresh(agent)
     return agent
 
 
 async def update_agent(
     db: AsyncSession, agent_id: UUID, agent_data: AgentUpdate
 ) -> Optional[Agent]:
-    """Update an agent"""
-    agent = await get_agent_by_id(db, agent_id)
-    if not agent:
-        return None
-
+    """Update an agent (UPDATE ... RETURNING, one round-trip)"""
     # Update only provided fields
     update_data = agent_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(agent, field, value)
+    if not update_data:
+        return await get_agent_by_id(db, agent_id)
+
+    result = await db.execute(
+        update(Agent)
+        .where(Agent.agent_id == agent_id)
+        .values(**update_data)
+        .returning(Agent)
+        .execution_options(populate_existing=True)
+    )
+    agent = result.scalar_one_or_none()
+    if not agent:
+        return None
 
     await db.commit()
-    await db.refresh(agent)
     return agent
 
 
 async def delete_agent(db: AsyncSession, agent_id: UUID) -> bool:
     """Delete an agent"""
-    agent = await get_agent_by_id(db, agent_id)
-    if not agent:
+    result = await db.execute(
+        delete(Agent).where(Agent.agent_id == agent_id).returning(Agent.agent_id)
+    )
+    if result.scalar_one_or_none() is None:
         return False
 
-    await db.delete(agent)
     await db.commit()
     return True
 
@@ -73,14 +83,17 @@ async def clone_agent(db: AsyncSession, agent_id: UUID) -> Optional[Agent]:
     if not original:
         return None
 
-    cloned = Agent(
-        agent_id=uuid.uuid4(),
-        name=f"{original.name} (Copy)",
-        model=original.model,
-        persona_json=original.persona_json.copy() if original.persona_json else {},
-        params_json=original.params_json.copy() if original.params_json else {},
+    result = await db.execute(
+        insert(Agent)
+        .values(
+            agent_id=uuid.uuid4(),
+            name=f"{original.name} (Copy)",
+            model=original.model,
+            persona_json=original.persona_json.copy() if original.persona_json else {},
+            params_json=original.params_json.copy() if original.params_json else {},
+        )
+        .returning(Agent)
     )
-    db.add(cloned)
+    cloned = result.scalar_one()
     await db.commit()
-    await db.refresh(cloned)
     return cloned
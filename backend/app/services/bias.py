@@ -0,0 +1,260 @@
+"""
+Batch Position-Bias Report
+
+Audits a judge (or every judge of a model, or a set of topics) over all of
+its swap pairs at once, instead of one ``/runs/{id}/compare/{swap_id}``
+request per pair.
+
+A swap pair is a completed run and its swapped copy (``POST
+/runs/{id}/swap``, or tournaments with ``swap_positions``), linked by the
+copy's ``swap_of_run_id``: same topic and judge, with the agents (and their
+sides) trading the A and B slots. Each agent keeps its side, so a pair
+isolates the slot: if the same slot wins both runs the judge favoured that
+position; if the same agent wins both, skill decided.
+
+Everything is computed in one pass over the score columns of the matching
+completed runs, fetched with a single query that joins each swap to its
+original by primary key (the verdict texts and turns are never loaded).
+"""
+import math
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.models.agent import Agent
+from app.models.run import Run
+
+# Debate sides (DebateStartRequest positions)
+SIDES = ("FOR", "AGAINST")
+
+# Two-sided 95% normal quantile
+Z_95 = 1.959963984540054
+
+
+class ScoreRow(NamedTuple):
+    """Score columns of a completed run (and of its original, for swaps)"""
+    run_id: UUID
+    swap_of_run_id: Optional[UUID]
+    position_a: str
+    position_b: str
+    winner: Optional[str]
+    total_a: Optional[float]
+    total_b: Optional[float]
+    # Set when the run is the swap of a completed run
+    original_winner: Optional[str] = None
+    original_total_a: Optional[float] = None
+    original_total_b: Optional[float] = None
+
+
+def wilson_interval(
+    successes: int,
+    trials: int,
+    z: float = Z_95
+) -> Tuple[Optional[float], Optional[float]]:
+    """Wilson score interval of a proportion ((None, None) without trials)."""
+    if trials == 0:
+        return None, None
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    center = (p + z * z / (2 * trials)) / denominator
+    margin = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+def _rate(successes: int, trials: int) -> Dict[str, Any]:
+    low, high = wilson_interval(successes, trials)
+    return {
+        "wins": successes,
+        "rate": successes / trials if trials else None,
+        "ci_low": low,
+        "ci_high": high,
+    }
+
+
+class _Moments:
+    """Running count, mean and variance (Welford)."""
+
+    __slots__ = ("n", "mean", "m2")
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value: float) -> None:
+        self.n += 1
+        delta = value - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (value - self.mean)
+
+    def summary(self, z: float = Z_95) -> Dict[str, Any]:
+        """Mean with a normal-approximation confidence interval."""
+        if self.n == 0:
+            return {"n": 0, "mean": None, "ci_low": None, "ci_high": None}
+        margin = z * math.sqrt(self.m2 / (self.n - 1) / self.n) if self.n > 1 else None
+        return {
+            "n": self.n,
+            "mean": self.mean,
+            "ci_low": self.mean - margin if margin is not None else None,
+            "ci_high": self.mean + margin if margin is not None else None,
+        }
+
+
+def analyze_score_rows(rows: Iterable[ScoreRow]) -> Dict[str, Any]:
+    """
+    Compute the bias report from completed runs.
+
+    Every swap row carries its original's result, so a pair is evaluated
+    when its swap is seen; a run with several swap tests is in several
+    pairs.
+
+    Args:
+        rows: Score rows
+
+    Returns:
+        Win rates per slot and side with Wilson intervals, pair outcomes,
+        and score deltas with confidence intervals
+    """
+    runs = decisive = draws = 0
+    slot_wins = {"A": 0, "B": 0}
+    side_wins = {side: 0 for side in SIDES}
+    side_delta = _Moments()  # FOR minus AGAINST total, per run
+    slot_delta = _Moments()  # A minus B, averaged over each pair (agent skill cancels)
+    pairs = position_biased = consistent = inconclusive = 0
+    biased_toward = {"A": 0, "B": 0}
+    paired_runs = set()
+
+    for row in rows:
+        runs += 1
+        winner = row.winner
+        if winner in ("A", "B"):
+            decisive += 1
+            slot_wins[winner] += 1
+            side = row.position_a if winner == "A" else row.position_b
+            if side in side_wins:
+                side_wins[side] += 1
+        elif winner == "DRAW":
+            draws += 1
+
+        scored = row.total_a is not None and row.total_b is not None
+        if scored:
+            delta = row.total_a - row.total_b
+            side_delta.add(delta if row.position_a == "FOR" else -delta)
+
+        if row.original_winner is None:
+            continue
+        pairs += 1
+        paired_runs.update((row.run_id, row.swap_of_run_id))
+        if row.original_winner in ("A", "B") and winner in ("A", "B"):
+            if row.original_winner == winner:
+                position_biased += 1
+                biased_toward[winner] += 1
+            else:
+                consistent += 1
+        else:
+            inconclusive += 1
+        if scored and row.original_total_a is not None and row.original_total_b is not None:
+            slot_delta.add((row.original_total_a - row.original_total_b + delta) / 2)
+
+    decisive_pairs = position_biased + consistent
+    return {
+        "runs": runs,
+        "draws": draws,
+        "position_win_rate": {slot: _rate(slot_wins[slot], decisive) for slot in ("A", "B")},
+        "side_win_rate": {side: _rate(side_wins[side], decisive) for side in SIDES},
+        "pairs": {
+            "total": pairs,
+            "unpaired_runs": runs - len(paired_runs),
+            "position_biased": position_biased,
+            "biased_toward": biased_toward,
+            "consistent": consistent,
+            "inconclusive": inconclusive,
+            "position_bias_rate": _rate(position_biased, decisive_pairs),
+        },
+        "score_delta": {
+            "a_minus_b_paired": slot_delta.summary(),
+            "for_minus_against": side_delta.summary(),
+        },
+    }
+
+
+async def fetch_score_rows(
+    db: AsyncSession,
+    judge_id: Optional[UUID] = None,
+    model: Optional[str] = None,
+    topics: Optional[Sequence[str]] = None
+) -> List[ScoreRow]:
+    """
+    Fetch the score columns of completed runs (one query).
+
+    Swaps are joined to their completed original through its primary key.
+
+    Args:
+        db: Database session
+        judge_id: Only runs judged by this agent
+        model: Only runs judged by agents using this model
+        topics: Only runs on these topics
+
+    Returns:
+        Score rows
+    """
+    original = aliased(Run)
+    query = (
+        select(
+            Run.run_id,
+            Run.swap_of_run_id,
+            Run.position_a,
+            Run.position_b,
+            Run.result_json["winner"].astext.label("winner"),
+            Run.result_json[("scores_a", "total")].as_float().label("total_a"),
+            Run.result_json[("scores_b", "total")].as_float().label("total_b"),
+            original.result_json["winner"].astext.label("original_winner"),
+            original.result_json[("scores_a", "total")].as_float().label("original_total_a"),
+            original.result_json[("scores_b", "total")].as_float().label("original_total_b"),
+        )
+        .outerjoin(original, and_(
+            original.run_id == Run.swap_of_run_id,
+            original.status == "completed",
+        ))
+        .where(Run.status == "completed")
+    )
+    if judge_id is not None:
+        query = query.where(Run.agent_j_id == judge_id)
+    if model is not None:
+        query = query.join(Agent, Agent.agent_id == Run.agent_j_id).where(Agent.model == model)
+    if topics:
+        query = query.where(Run.topic.in_(topics))
+
+    result = await db.execute(query)
+    return list(result.all())
+
+
+async def position_bias_report(
+    db: AsyncSession,
+    judge_id: Optional[UUID] = None,
+    model: Optional[str] = None,
+    topics: Optional[Sequence[str]] = None
+) -> Dict[str, Any]:
+    """
+    Build the position-bias report for the selected runs.
+
+    Args:
+        db: Database session
+        judge_id: Only runs judged by this agent
+        model: Only runs judged by agents using this model
+        topics: Only runs on these topics
+
+    Returns:
+        Report from ``analyze_score_rows`` with the applied filters
+    """
+    rows = await fetch_score_rows(db, judge_id=judge_id, model=model, topics=topics)
+    report = analyze_score_rows(rows)
+    report["filters"] = {
+        "judge_id": str(judge_id) if judge_id else None,
+        "model": model,
+        "topics": list(topics) if topics else None,
+    }
+    return report
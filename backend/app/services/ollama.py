@@ -5,12 +5,40 @@ Provides wrapper functions for interacting with Ollama API
 import httpx
 import json
 import logging
-from typing import AsyncGenerator, Optional, Dict, Any
+from contextlib import aclosing
+from typing import AsyncGenerator, Callable, Optional, Dict, Any, List, Union
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Counters reported by Ollama in the final ("done") response
+OLLAMA_STATS_FIELDS = (
+    "total_duration",
+    "load_duration",
+    "prompt_eval_count",
+    "prompt_eval_duration",
+    "eval_count",
+    "eval_duration",
+)
+
+
+def _keep_alive(payload: Dict[str, Any], keep_alive: Optional[str] = None) -> Dict[str, Any]:
+    """Add the ``keep_alive`` option (how long Ollama keeps the model loaded)."""
+    keep_alive = settings.OLLAMA_KEEP_ALIVE if keep_alive is None else keep_alive
+    if keep_alive:
+        payload["keep_alive"] = keep_alive
+    return payload
+
+
+def _collect_stats(data: Dict[str, Any], stats: Optional[Dict[str, Any]]) -> None:
+    """Copy Ollama's generation counters from a done frame into ``stats``."""
+    if stats is None:
+        return
+    for field in OLLAMA_STATS_FIELDS:
+        if field in data:
+            stats[field] = data[field]
+
 
 async def call_ollama(
     model: str,
@@ -18,6 +46,8 @@ async def call_ollama(
     system: Optional[str] = None,
     temperature: Optional[float] = None,
     max_tokens: Optional[int] = None,
+    stats: Optional[Dict[str, Any]] = None,
+    response_format: Optional[Union[str, Dict[str, Any]]] = None,
 ) -> str:
     """
     Call Ollama API and return the complete response.
@@ -28,6 +58,9 @@ async def call_ollama(
         system: System prompt (optional)
         temperature: Temperature parameter (default from settings)
         max_tokens: Max tokens to generate (default from settings)
+        stats: Optional dict filled with Ollama's counters (prompt_eval_count, ...)
+        response_format: Ollama ``format`` option - "json" or a JSON schema the
+            output is constrained to (optional)
 
     Returns:
         Generated text response
@@ -50,6 +83,9 @@ async def call_ollama(
 
     if system:
         payload["system"] = system
+    if response_format:
+        payload["format"] = response_format
+    _keep_alive(payload)
 
     try:
         async with httpx.AsyncClient(timeout=settings.OLLAMA_TIMEOUT) as client:
@@ -59,6 +95,7 @@ async def call_ollama(
             )
             response.raise_for_status()
             data = response.json()
+            _collect_stats(data, stats)
             return data.get("response", "")
 
     except httpx.ConnectError as e:
@@ -72,22 +109,72 @@ async def call_ollama(
         raise
 
 
+async def _stream_ollama_endpoint(
+    path: str,
+    payload: Dict[str, Any],
+    extract: Callable[[Dict[str, Any]], Optional[str]],
+    stats: Optional[Dict[str, Any]] = None,
+) -> AsyncGenerator[str, None]:
+    """
+    Stream an Ollama endpoint and yield the text of each response line.
+
+    Args:
+        path: API path ("/api/generate" or "/api/chat")
+        payload: Request payload
+        extract: Returns the text chunk of a response line (or None)
+        stats: Optional dict filled with Ollama's counters from the done frame
+
+    Yields:
+        Text chunks as they are generated
+    """
+    async with httpx.AsyncClient(timeout=settings.OLLAMA_TIMEOUT) as client:
+        async with client.stream(
+            "POST",
+            f"{settings.OLLAMA_BASE_URL}{path}",
+            json=payload
+        ) as response:
+            response.raise_for_status()
+
+            async for line in response.aiter_lines():
+                if line.strip():
+                    try:
+                        data = json.loads(line)
+                        chunk = extract(data)
+                        if chunk is not None:
+                            yield chunk
+
+                        # Check if generation is done
+                        if data.get("done", False):
+                            _collect_stats(data, stats)
+                            break
+                    except json.JSONDecodeError:
+                        logger.warning(f"Failed to decode JSON: {line}")
+                        continue
+
+
 async def stream_ollama(
     model: str,
     prompt: str,
     system: Optional[str] = None,
     temperature: Optional[float] = None,
     max_tokens: Optional[int] = None,
+    stats: Optional[Dict[str, Any]] = None,
+    response_format: Optional[Union[str, Dict[str, Any]]] = None,
 ) -> AsyncGenerator[str, None]:
     """
     Call Ollama API with streaming and yield response chunks.
 
+    Closing the generator early (``aclose()``) closes the HTTP stream, which
+    makes Ollama stop generating.
+
     Args:
         model: Model name (e.g., "llama3", "qwen2.5")
         prompt: User prompt
         system: System prompt (optional)
         temperature: Temperature parameter (default from settings)
         max_tokens: Max tokens to generate (default from settings)
+        stats: Optional dict filled with Ollama's counters (prompt_eval_count, ...)
+        response_format: Ollama ``format`` option - "json" or a JSON schema (optional)
 
     Yields:
         Text chunks as they are generated
@@ -110,29 +197,16 @@ async def stream_ollama(
 
     if system:
         payload["system"] = system
+    if response_format:
+        payload["format"] = response_format
+    _keep_alive(payload)
 
     try:
-        async with httpx.AsyncClient(timeout=settings.OLLAMA_TIMEOUT) as client:
-            async with client.stream(
-                "POST",
-                f"{settings.OLLAMA_BASE_URL}/api/generate",
-                json=payload
-            ) as response:
-                response.raise_for_status()
-
-                async for line in response.aiter_lines():
-                    if line.strip():
-                        try:
-                            data = json.loads(line)
-                            if "response" in data:
-                                yield data["response"]
-
-                            # Check if generation is done
-                            if data.get("done", False):
-                                break
-                        except json.JSONDecodeError:
-                            logger.warning(f"Failed to decode JSON: {line}")
-                            continue
+        async with aclosing(_stream_ollama_endpoint(
+            "/api/generate", payload, lambda data: data.get("response"), stats
+        )) as stream:
+            async for chunk in stream:
+                yield chunk
 
     except httpx.ConnectError as e:
         logger.error(f"Ollama connection error: {e}")
@@ -145,6 +219,91 @@ async def stream_ollama(
         raise
 
 
+async def stream_ollama_chat(
+    model: str,
+    messages: List[Dict[str, str]],
+    temperature: Optional[float] = None,
+    max_tokens: Optional[int] = None,
+    stats: Optional[Dict[str, Any]] = None,
+) -> AsyncGenerator[str, None]:
+    """
+    Stream a chat completion from Ollama's ``/api/chat`` endpoint.
+
+    Ollama reuses its KV cache for the longest prefix shared with the
+    previous request on the same model, so callers that only append to a
+    byte-identical message history avoid re-processing earlier turns.
+
+    Args:
+        model: Model name (e.g., "llama3", "qwen2.5")
+        messages: Chat history ({"role": ..., "content": ...}), system message first
+        temperature: Temperature parameter (default from settings)
+        max_tokens: Max tokens to generate (default from settings)
+        stats: Optional dict filled with Ollama's counters (prompt_eval_count, ...)
+
+    Yields:
+        Text chunks as they are generated
+
+    Raises:
+        httpx.HTTPError: If the request fails
+    """
+    temperature = settings.DEFAULT_TEMPERATURE if temperature is None else temperature
+    max_tokens = settings.DEFAULT_MAX_TOKENS if max_tokens is None else max_tokens
+
+    payload = {
+        "model": model,
+        "messages": messages,
+        "stream": True,
+        "options": {
+            "temperature": temperature,
+            "num_predict": max_tokens,
+        }
+    }
+    _keep_alive(payload)
+
+    try:
+        async with aclosing(_stream_ollama_endpoint(
+            "/api/chat", payload, lambda data: data.get("message", {}).get("content"), stats
+        )) as stream:
+            async for chunk in stream:
+                yield chunk
+
+    except httpx.ConnectError as e:
+        logger.error(f"Ollama connection error: {e}")
+        raise
+    except httpx.HTTPError as e:
+        logger.error(f"Ollama HTTP error: {e}")
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error streaming chat from Ollama: {e}")
+        raise
+
+
+async def load_model(model: str, keep_alive: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Load a model into memory without generating anything.
+
+    A generate request with an empty prompt makes Ollama load the model and
+    keep it for ``keep_alive``.
+
+    Args:
+        model: Model name
+        keep_alive: How long to keep the model loaded (default from settings)
+
+    Returns:
+        Ollama's counters for the request (``load_duration`` in nanoseconds)
+
+    Raises:
+        httpx.HTTPError: If the request fails
+    """
+    payload = _keep_alive({"model": model, "prompt": "", "stream": False}, keep_alive)
+    async with httpx.AsyncClient(timeout=settings.OLLAMA_TIMEOUT) as client:
+        response = await client.post(f"{settings.OLLAMA_BASE_URL}/api/generate", json=payload)
+        response.raise_for_status()
+        stats: Dict[str, Any] = {}
+        _collect_stats(response.json(), stats)
+        return stats
+
+
 async def get_model_info(model: str) -> Optional[Dict[str, Any]]:
     """
     Get information about a specific model.
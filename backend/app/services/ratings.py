@@ -0,0 +1,245 @@
+"""
+Agent Ratings (Elo Leaderboard)
+
+Debaters are rated with Elo from the verdicts of completed runs. Ratings
+live in the ``agent_ratings`` table, one row per agent, so the leaderboard
+is an index scan instead of an aggregation over ``runs.result_json``.
+
+- ``record_result``: incremental update, called by ``update_run_status``
+  in the transaction that marks a run completed.
+- ``recompute_ratings``: rebuilds the table from history in one pass over
+  the completed runs (needed after changing the K factor, or to rate runs
+  that finished before the table existed).
+
+Both paths apply the same ``apply_result`` fold, so a recompute reproduces
+the incrementally maintained table. Judges are not rated.
+"""
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.agent import Agent
+from app.models.rating import AgentRating
+from app.models.run import Run
+
+logger = logging.getLogger(__name__)
+
+# Score of agent A for each verdict
+WINNER_SCORES = {"A": 1.0, "B": 0.0, "DRAW": 0.5}
+
+RatingRecord = Dict[str, Any]
+
+
+def expected_score(rating_a: float, rating_b: float) -> float:
+    """Probability of A beating B under the Elo model."""
+    return 1.0 / (1.0 + 10 ** ((rating_b - rating_a) / 400.0))
+
+
+def new_record(agent_id: UUID) -> RatingRecord:
+    """Rating record of an agent without rated debates."""
+    return {
+        "agent_id": agent_id,
+        "rating": settings.RATING_INITIAL,
+        "games": 0,
+        "wins": 0,
+        "losses": 0,
+        "draws": 0,
+    }
+
+
+def is_rated(agent_a_id: UUID, agent_b_id: UUID, winner: Optional[str]) -> bool:
+    """Whether a run counts for the ratings (a verdict between two agents)."""
+    return winner in WINNER_SCORES and agent_a_id != agent_b_id
+
+
+def apply_result(
+    record_a: RatingRecord,
+    record_b: RatingRecord,
+    winner: str,
+    k_factor: Optional[float] = None
+) -> None:
+    """
+    Update two rating records in place with a debate verdict.
+
+    Args:
+        record_a: Agent A's record
+        record_b: Agent B's record
+        winner: "A", "B" or "DRAW"
+        k_factor: Elo K factor (defaults to RATING_K_FACTOR)
+    """
+    k = settings.RATING_K_FACTOR if k_factor is None else k_factor
+    score_a = WINNER_SCORES[winner]
+    delta = k * (score_a - expected_score(record_a["rating"], record_b["rating"]))
+    record_a["rating"] += delta
+    record_b["rating"] -= delta
+
+    for record, score in ((record_a, score_a), (record_b, 1.0 - score_a)):
+        record["games"] += 1
+        if score == 1.0:
+            record["wins"] += 1
+        elif score == 0.0:
+            record["losses"] += 1
+        else:
+            record["draws"] += 1
+
+
+def replay_results(
+    results: Iterable[Tuple[UUID, UUID, str]],
+    k_factor: Optional[float] = None
+) -> Dict[UUID, RatingRecord]:
+    """
+    Fold a chronological sequence of verdicts into rating records.
+
+    Args:
+        results: (agent_a_id, agent_b_id, winner) tuples, oldest first
+        k_factor: Elo K factor (defaults to RATING_K_FACTOR)
+
+    Returns:
+        agent_id -> rating record
+    """
+    records: Dict[UUID, RatingRecord] = {}
+    for agent_a_id, agent_b_id, winner in results:
+        if not is_rated(agent_a_id, agent_b_id, winner):
+            continue
+        record_a = records.setdefault(agent_a_id, new_record(agent_a_id))
+        record_b = records.setdefault(agent_b_id, new_record(agent_b_id))
+        apply_result(record_a, record_b, winner, k_factor)
+    return records
+
+
+def _insert_missing(agent_ids: List[UUID]):
+    statement = insert(AgentRating).values([new_record(agent_id) for agent_id in agent_ids])
+    return statement.on_conflict_do_nothing(index_elements=[AgentRating.agent_id])
+
+
+def _upsert(records: List[RatingRecord]):
+    statement = insert(AgentRating).values(records)
+    return statement.on_conflict_do_update(
+        index_elements=[AgentRating.agent_id],
+        set_={
+            "rating": statement.excluded.rating,
+            "games": statement.excluded.games,
+            "wins": statement.excluded.wins,
+            "losses": statement.excluded.losses,
+            "draws": statement.excluded.draws,
+            "updated_at": func.now(),
+        },
+    )
+
+
+async def record_result(db: AsyncSession, run: Run) -> None:
+    """
+    Apply a completed run's verdict to its debaters' ratings.
+
+    Creates missing rating rows first (``ON CONFLICT DO NOTHING``) so that
+    ``FOR UPDATE`` has rows to lock even for an agent's first debate, then
+    locks both and writes them back with one upsert. The locked rows are
+    re-read into the session (``populate_existing``) rather than served from
+    objects it already holds. The caller commits, so the rating change lands
+    atomically with the run's status.
+
+    Args:
+        db: Database session
+        run: Run that was just marked completed (with result_json)
+    """
+    winner = (run.result_json or {}).get("winner")
+    if not is_rated(run.agent_a_id, run.agent_b_id, winner):
+        return
+
+    agent_ids = [run.agent_a_id, run.agent_b_id]
+    await db.execute(_insert_missing(agent_ids))
+    result = await db.execute(
+        select(AgentRating)
+        .where(AgentRating.agent_id.in_(agent_ids))
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    stored = {
+        row.agent_id: {column: getattr(row, column) for column in new_record(row.agent_id)}
+        for row in result.scalars().all()
+    }
+    record_a, record_b = stored[run.agent_a_id], stored[run.agent_b_id]
+    apply_result(record_a, record_b, winner)
+
+    await db.execute(_upsert([record_a, record_b]))
+    logger.debug(
+        f"Rated run {run.run_id}: {run.agent_a_id}={record_a['rating']:.1f}, "
+        f"{run.agent_b_id}={record_b['rating']:.1f}"
+    )
+
+
+async def recompute_ratings(db: AsyncSession) -> Dict[str, int]:
+    """
+    Rebuild the ratings table from all completed runs.
+
+    Reads only the three columns the fold needs, in finishing order, and
+    replaces the table with one DELETE and one multi-row INSERT. The table is
+    locked first (``EXCLUSIVE`` still allows leaderboard reads), so a
+    concurrent ``record_result`` waits and applies its run on top of the
+    rebuilt table instead of being lost or counted twice.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Counts of rated agents and runs considered
+    """
+    await db.execute(text(f"LOCK TABLE {AgentRating.__tablename__} IN EXCLUSIVE MODE"))
+    result = await db.execute(
+        select(Run.agent_a_id, Run.agent_b_id, Run.result_json["winner"].astext)
+        .where(Run.status == "completed")
+        .order_by(Run.finished_at.asc(), Run.run_id)
+    )
+    rows = result.all()
+    records = replay_results(rows)
+
+    await db.execute(delete(AgentRating))
+    if records:
+        await db.execute(insert(AgentRating), list(records.values()))
+    await db.commit()
+
+    logger.info(f"Recomputed ratings of {len(records)} agents from {len(rows)} completed runs")
+    return {"agents": len(records), "runs": len(rows)}
+
+
+async def get_leaderboard(db: AsyncSession, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
+    """
+    Get a page of rated agents, highest rating first.
+
+    Served from ``agent_ratings`` by its rating index; cost depends on the
+    page size, not on the number of runs.
+
+    Args:
+        db: Database session
+        limit: Maximum number of entries
+        offset: Number of entries to skip
+
+    Returns:
+        Leaderboard entries with rank and agent name/model
+    """
+    result = await db.execute(
+        select(AgentRating, Agent.name, Agent.model)
+        .join(Agent, Agent.agent_id == AgentRating.agent_id)
+        .order_by(AgentRating.rating.desc(), AgentRating.agent_id)
+        .limit(limit)
+        .offset(offset)
+    )
+    return [
+        {
+            "rank": offset + position,
+            "agent_id": rating.agent_id,
+            "name": name,
+            "model": model,
+            "rating": rating.rating,
+            "games": rating.games,
+            "wins": rating.wins,
+            "losses": rating.losses,
+            "draws": rating.draws,
+        }
+        for position, (rating, name, model) in enumerate(result.all(), start=1)
+    ]
@@ -0,0 +1,125 @@
+"""
+Model Residency
+
+Keeps track of which Ollama models this process used recently and loads a
+run's models ahead of time. The first call to a model that is not loaded
+pays its load time; when agents A, B and the judge use different models,
+Ollama may also unload one between phases.
+
+- ``warm`` loads the models of a run when it is started (empty-prompt
+  generate requests, which also pin the model for ``OLLAMA_KEEP_ALIVE``)
+- ``prefer_resident`` orders queued work so that nodes using the most
+  recently used (still loaded) model run first
+- ``record_call`` collects Ollama's ``load_duration`` per call, so cold
+  loads show up per model
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar
+
+from app.services.ollama import load_model
+
+logger = logging.getLogger(__name__)
+
+# Calls whose load_duration exceeds this loaded the model (nanoseconds)
+COLD_LOAD_NS = 100_000_000
+
+T = TypeVar("T")
+
+
+class ModelResidency:
+    """Recently used models, warm-ups in flight and load times per model."""
+
+    def __init__(self):
+        self._last_used: Dict[str, float] = {}
+        self._warming: Dict[str, asyncio.Task] = {}
+        self._loads: Dict[str, Dict[str, Any]] = {}
+
+    def warm(self, models: Iterable[str]) -> List[asyncio.Task]:
+        """
+        Start loading models in the background.
+
+        Models already being loaded are not requested twice. Warm-up is best
+        effort; failures are only logged.
+
+        Args:
+            models: Model names (duplicates are ignored)
+
+        Returns:
+            Warm-up tasks started by this call
+        """
+        tasks = []
+        for model in dict.fromkeys(models):
+            if model in self._warming:
+                continue
+            task = asyncio.create_task(self._warm(model))
+            self._warming[model] = task
+            tasks.append(task)
+        return tasks
+
+    async def _warm(self, model: str) -> None:
+        try:
+            stats = await load_model(model)
+            self.record_call(model, stats)
+            logger.info(f"Warmed {model} in {stats.get('load_duration', 0) / 1e6:.0f} ms")
+        except Exception as e:
+            logger.warning(f"Failed to warm {model}: {e}")
+        finally:
+            self._warming.pop(model, None)
+
+    def record_call(self, model: str, stats: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Record a finished Ollama call (marks the model as loaded).
+
+        Args:
+            model: Model name
+            stats: Ollama's counters of the call (``load_duration`` is used)
+        """
+        self._last_used[model] = time.time()
+        load = self._loads.setdefault(model, {"calls": 0, "cold_loads": 0, "load_ns": 0, "last_load_ns": None})
+        load["calls"] += 1
+        load_duration = (stats or {}).get("load_duration")
+        if load_duration is not None:
+            load["last_load_ns"] = load_duration
+            load["load_ns"] += load_duration
+            if load_duration > COLD_LOAD_NS:
+                load["cold_loads"] += 1
+
+    def prefer_resident(self, items: List[T], model_of: Callable[[T], str]) -> List[T]:
+        """
+        Order work so that items using the most recently used model come first.
+
+        The sort is stable: items of the same model (or of models not used
+        yet) keep their order.
+
+        Args:
+            items: Queued work (e.g. ready plan nodes)
+            model_of: Model an item runs on
+
+        Returns:
+            Reordered items
+        """
+        return sorted(items, key=lambda item: -self._last_used.get(model_of(item), 0.0))
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Per-model residency state, most recently used first."""
+        models = set(self._last_used) | set(self._warming)
+        entries = []
+        for model in sorted(models, key=lambda m: -self._last_used.get(m, 0.0)):
+            load = self._loads.get(model, {})
+            last_used = self._last_used.get(model)
+            entries.append({
+                "model": model,
+                "last_used": datetime.fromtimestamp(last_used, timezone.utc).isoformat() if last_used else None,
+                "warming": model in self._warming,
+                "calls": load.get("calls", 0),
+                "cold_loads": load.get("cold_loads", 0),
+                "last_load_ms": load["last_load_ns"] / 1e6 if load.get("last_load_ns") is not None else None,
+                "total_load_ms": load.get("load_ns", 0) / 1e6,
+            })
+        return entries
+
+
+residency = ModelResidency()
@@ -2,15 +2,20 @@
 Run CRUD Operations
 """
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from typing import Optional, Dict, Any
+from sqlalchemy import delete, insert, or_, select, update
+from typing import Optional, Dict, Any, List
 from uuid import UUID
 from datetime import datetime
+import logging
 import uuid
 
-from app.models.run import Run
+from app.core import tracing
+from app.models.run import ACTIVE_RUN_STATUSES, Run
 from app.models.agent import Agent
 from app.models.turn import Turn
+from app.services import ratings
+
+logger = logging.getLogger(__name__)
 
 
 async def create_run(
@@ -22,10 +27,11 @@ async def create_run(
     position_a: str,
     position_b: str,
     config: Dict[str, Any] = None,
-    rubric: Dict[str, Any] = None
+    rubric: Dict[str, Any] = None,
+    swap_of_run_id: Optional[UUID] = None
 ) -> Run:
-    """Create a new debate run"""
-    run = Run(
+    """Create a new debate run (INSERT ... RETURNING, one round-trip)"""
+    values = dict(
         run_id=uuid.uuid4(),
         topic=topic,
         agent_a_id=agent_a_id,
@@ -43,22 +49,69 @@ async def create_run(
             "delivery_weight": 20,
             "strategy_weight": 15
         },
-        status="pending"
+        status="pending",
+        swap_of_run_id=swap_of_run_id
     )
-    db.add(run)
+    result = await db.execute(insert(Run).values(**values).returning(Run))
+    run = result.scalar_one()
     await db.commit()
-    await db.refresh(run)
     return run
 
 
+def swapped_run_kwargs(run: Run) -> Dict[str, Any]:
+    """
+    ``create_run`` arguments for the position-swapped copy of a run.
+
+    Agent A and B trade places and positions; topic, judge, config and
+    rubric are kept, so any change in the verdict is due to position. The
+    copy records its original in ``swap_of_run_id``.
+    """
+    return dict(
+        topic=run.topic,
+        agent_a_id=run.agent_b_id,    # B → A
+        agent_b_id=run.agent_a_id,    # A → B
+        agent_j_id=run.agent_j_id,    # Judge unchanged
+        position_a=run.position_b,    # B's position → A
+        position_b=run.position_a,    # A's position → B
+        config=run.config_json,
+        rubric=run.rubric_json,
+        swap_of_run_id=run.run_id
+    )
+
+
 async def get_run_by_id(db: AsyncSession, run_id: UUID) -> Optional[Run]:
     """Get run by ID"""
     result = await db.execute(select(Run).where(Run.run_id == run_id))
     return result.scalar_one_or_none()
 
 
+def _agent_dict(agent: Agent) -> Dict[str, Any]:
+    return {
+        "agent_id": str(agent.agent_id),
+        "name": agent.name,
+        "model": agent.model,
+        "persona_json": agent.persona_json,
+        "params_json": agent.params_json,
+        "created_at": agent.created_at,
+        "updated_at": agent.updated_at
+    }
+
+
+def judge_panel_ids(run: Run) -> List[str]:
+    """Judge IDs of a run, primary judge (``agent_j_id``) first."""
+    primary = str(run.agent_j_id)
+    panel = (run.config_json or {}).get("judge_panel") or []
+    return [primary] + [str(judge_id) for judge_id in panel if str(judge_id) != primary]
+
+
 async def get_run_with_agents(db: AsyncSession, run_id: UUID) -> Optional[Dict[str, Any]]:
-    """Fetch run with all agent details"""
+    """
+    Fetch run with all agent details.
+
+    ``judge_panel`` lists every judge of the run (just ``agent_j`` unless
+    the run was started with a judge panel); panel judges that no longer
+    exist are left out.
+    """
     result = await db.execute(select(Run).where(Run.run_id == run_id))
     run = result.scalar_one_or_none()
     if not run:
@@ -72,35 +125,20 @@ async def get_run_with_agents(db: AsyncSession, run_id: UUID) -> Optional[Dict[s
     if not all([agent_a, agent_b, agent_j]):
         return None
 
+    judge_panel = [_agent_dict(agent_j)]
+    for judge_id in judge_panel_ids(run)[1:]:
+        judge = await db.get(Agent, UUID(judge_id))
+        if judge is None:
+            logger.warning(f"Panel judge {judge_id} of run {run_id} not found, skipping")
+            continue
+        judge_panel.append(_agent_dict(judge))
+
     return {
         "run": run,
-        "agent_a": {
-            "agent_id": str(agent_a.agent_id),
-            "name": agent_a.name,
-            "model": agent_a.model,
-            "persona_json": agent_a.persona_json,
-            "params_json": agent_a.params_json,
-            "created_at": agent_a.created_at,
-            "updated_at": agent_a.updated_at
-        },
-        "agent_b": {
-            "agent_id": str(agent_b.agent_id),
-            "name": agent_b.name,
-            "model": agent_b.model,
-            "persona_json": agent_b.persona_json,
-            "params_json": agent_b.params_json,
-            "created_at": agent_b.created_at,
-            "updated_at": agent_b.updated_at
-        },
-        "agent_j": {
-            "agent_id": str(agent_j.agent_id),
-            "name": agent_j.name,
-            "model": agent_j.model,
-            "persona_json": agent_j.persona_json,
-            "params_json": agent_j.params_json,
-            "created_at": agent_j.created_at,
-            "updated_at": agent_j.updated_at
-        }
+        "agent_a": _agent_dict(agent_a),
+        "agent_b": _agent_dict(agent_b),
+        "agent_j": judge_panel[0],
+        "judge_panel": judge_panel
     }
 
 
@@ -110,20 +148,40 @@ async def update_run_status(
     status: str,
     result_json: Dict[str, Any] = None
 ) -> Optional[Run]:
-    """Update run status and optionally result"""
-    run = await db.get(Run, run_id)
-    if not run:
-        return None
-
-    run.status = status
-    if result_json:
-        run.result_json = result_json
-    if status == "completed":
-        run.finished_at = datetime.utcnow()
-
-    await db.commit()
-    await db.refresh(run)
-    return run
+    """
+    Update run status and optionally result (UPDATE ... RETURNING, one round-trip).
+
+    Completing a run with a verdict also updates its debaters' ratings in
+    the same transaction. A run is completed (and rated) only once: marking
+    an already completed run completed again changes nothing.
+
+    Returns:
+        The updated run, or None if it does not exist (or was already completed)
+    """
+    with tracing.span("db.update_run_status", status=status):
+        values: Dict[str, Any] = {"status": status}
+        if result_json:
+            values["result_json"] = result_json
+        if status == "completed":
+            values["finished_at"] = datetime.utcnow()
+
+        statement = update(Run).where(Run.run_id == run_id)
+        if status == "completed":
+            statement = statement.where(Run.status != "completed")
+        result = await db.execute(
+            statement
+            .values(**values)
+            .returning(Run)
+            .execution_options(populate_existing=True)
+        )
+        run = result.scalar_one_or_none()
+        if not run:
+            return None
+
+        if status == "completed":
+            await ratings.record_result(db, run)
+        await db.commit()
+        return run
 
 
 async def get_all_runs(db: AsyncSession) -> list[Run]:
@@ -132,13 +190,46 @@ async def get_all_runs(db: AsyncSession) -> list[Run]:
     return list(result.scalars().all())
 
 
+async def get_active_runs(db: AsyncSession) -> list[Run]:
+    """Get runs that have not finished, newest first"""
+    result = await db.execute(
+        select(Run)
+        .where(Run.status.in_(ACTIVE_RUN_STATUSES))
+        .order_by(Run.created_at.desc())
+    )
+    return list(result.scalars().all())
+
+
+async def get_runs_for_agent(db: AsyncSession, agent_id: UUID) -> list[Run]:
+    """Get runs an agent took part in (as debater or judge), newest first"""
+    result = await db.execute(
+        select(Run)
+        .where(or_(
+            Run.agent_a_id == agent_id,
+            Run.agent_b_id == agent_id,
+            Run.agent_j_id == agent_id,
+        ))
+        .order_by(Run.created_at.desc())
+    )
+    return list(result.scalars().all())
+
+
+async def get_swap_runs(db: AsyncSession, run_id: UUID) -> list[Run]:
+    """Get the swapped copies of a run, oldest first"""
+    result = await db.execute(
+        select(Run)
+        .where(Run.swap_of_run_id == run_id)
+        .order_by(Run.created_at.asc())
+    )
+    return list(result.scalars().all())
+
+
 async def delete_run(db: AsyncSession, run_id: UUID) -> bool:
     """Delete a run (cascades to turns)"""
-    run = await db.get(Run, run_id)
-    if not run:
+    result = await db.execute(delete(Run).where(Run.run_id == run_id).returning(Run.run_id))
+    if result.scalar_one_or_none() is None:
         return False
 
-    await db.delete(run)
     await db.commit()
     return True
 
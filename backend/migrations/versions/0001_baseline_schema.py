@@ -0,0 +1,91 @@
+"""Baseline schema (docker/init.sql v1.0)
+
+Creates the agents, runs and turns tables as in the original ``init.sql``
+(without the turn and status indexes that 0002 replaces). Every statement
+is ``IF NOT EXISTS``, so databases created by ``init.sql`` are adopted as
+they are.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS "uuid-ossp"')
+
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS agents (
+          agent_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+          name VARCHAR(50) NOT NULL,
+          model VARCHAR(50) NOT NULL,
+          persona_json JSONB NOT NULL DEFAULT '{}',
+          params_json JSONB NOT NULL DEFAULT '{}',
+          created_at TIMESTAMP DEFAULT NOW(),
+          updated_at TIMESTAMP DEFAULT NOW()
+        )
+    """)
+    op.execute("CREATE INDEX IF NOT EXISTS idx_agents_created_at ON agents(created_at DESC)")
+
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS runs (
+          run_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+          topic TEXT NOT NULL,
+          agent_a_id UUID NOT NULL REFERENCES agents(agent_id),
+          agent_b_id UUID NOT NULL REFERENCES agents(agent_id),
+          agent_j_id UUID NOT NULL REFERENCES agents(agent_id),
+          position_a TEXT NOT NULL,
+          position_b TEXT NOT NULL,
+          config_json JSONB NOT NULL DEFAULT '{"rounds": 3}',
+          rubric_json JSONB NOT NULL DEFAULT '{}',
+          result_json JSONB,
+          status VARCHAR(20) NOT NULL DEFAULT 'pending',
+          created_at TIMESTAMP DEFAULT NOW(),
+          finished_at TIMESTAMP
+        )
+    """)
+    op.execute("CREATE INDEX IF NOT EXISTS idx_runs_created_at ON runs(created_at DESC)")
+
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS turns (
+          turn_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+          run_id UUID NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+          agent_id UUID NOT NULL REFERENCES agents(agent_id),
+          phase VARCHAR(30) NOT NULL,
+          role VARCHAR(20) NOT NULL,
+          content TEXT NOT NULL,
+          targets JSONB DEFAULT '[]',
+          metadata JSONB DEFAULT '{}',
+          created_at TIMESTAMP DEFAULT NOW()
+        )
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION update_updated_at_column()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            NEW.updated_at = NOW();
+            RETURN NEW;
+        END;
+        $$ language 'plpgsql'
+    """)
+    op.execute("DROP TRIGGER IF EXISTS update_agents_updated_at ON agents")
+    op.execute("""
+        CREATE TRIGGER update_agents_updated_at BEFORE UPDATE ON agents
+        FOR EACH ROW EXECUTE FUNCTION update_updated_at_column()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS turns")
+    op.execute("DROP TABLE IF EXISTS runs")
+    op.execute("DROP TABLE IF EXISTS agents")
+    op.execute("DROP FUNCTION IF EXISTS update_updated_at_column()")
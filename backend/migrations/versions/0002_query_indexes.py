@@ -0,0 +1,48 @@
+"""Indexes matching the query shapes
+
+Replaces the per-column turn indexes and the global status index with
+indexes shaped after the actual queries. All builds are concurrent, so the
+arena keeps serving debates while this runs.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+from app.db.migration_ops import create_index_concurrently, drop_index_concurrently
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE_RUNS = "status IN ('pending', 'running')"
+
+
+def upgrade() -> None:
+    # get_turns_by_run_id filters by run and orders by created_at
+    create_index_concurrently("idx_turns_run_id_created_at", "turns", ["run_id", "created_at"])
+    # Only unfinished runs are looked up by status (newest first)
+    create_index_concurrently("idx_runs_active", "runs", ["created_at DESC"], where=ACTIVE_RUNS)
+    # Agent history and leaderboard queries
+    for column in ("agent_a_id", "agent_b_id", "agent_j_id"):
+        create_index_concurrently(f"idx_runs_{column}", "runs", [column])
+
+    # Superseded: run_id is the composite index's prefix, created_at alone is
+    # never queried, and phase/status over all rows are too unselective to use
+    for name in ("idx_turns_run_id", "idx_turns_created_at", "idx_turns_phase", "idx_runs_status"):
+        drop_index_concurrently(name)
+
+
+def downgrade() -> None:
+    create_index_concurrently("idx_turns_run_id", "turns", ["run_id"])
+    create_index_concurrently("idx_turns_created_at", "turns", ["created_at"])
+    create_index_concurrently("idx_turns_phase", "turns", ["phase"])
+    create_index_concurrently("idx_runs_status", "runs", ["status"])
+
+    for name in (
+        "idx_turns_run_id_created_at", "idx_runs_active",
+        "idx_runs_agent_a_id", "idx_runs_agent_b_id", "idx_runs_agent_j_id",
+    ):
+        drop_index_concurrently(name)
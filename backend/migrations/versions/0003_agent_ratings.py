@@ -0,0 +1,43 @@
+"""Agent ratings table
+
+Precomputed Elo ratings behind the leaderboard, kept up to date by
+``update_run_status``. Runs completed before this revision are rated by
+``POST /api/leaderboard/recompute``.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.db.migration_ops import create_index_concurrently, drop_index_concurrently
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS agent_ratings (
+          agent_id UUID PRIMARY KEY REFERENCES agents(agent_id) ON DELETE CASCADE,
+          rating DOUBLE PRECISION NOT NULL,
+          games INTEGER NOT NULL DEFAULT 0,
+          wins INTEGER NOT NULL DEFAULT 0,
+          losses INTEGER NOT NULL DEFAULT 0,
+          draws INTEGER NOT NULL DEFAULT 0,
+          updated_at TIMESTAMP DEFAULT NOW()
+        )
+    """)
+    # Leaderboard pages: ordered by rating, agent_id breaks ties
+    create_index_concurrently(
+        "idx_agent_ratings_rating", "agent_ratings", ["rating DESC", "agent_id"]
+    )
+
+
+def downgrade() -> None:
+    drop_index_concurrently("idx_agent_ratings_rating")
+    op.execute("DROP TABLE IF EXISTS agent_ratings")
@@ -0,0 +1,58 @@
+"""Swap test lineage
+
+Adds ``runs.swap_of_run_id`` linking a position-swapped copy to its
+original, with a partial index for pair lookups. Existing swap tests are
+linked by a batched backfill: a run is the swap of the latest earlier run
+with the same topic and judge and mirrored agents and sides.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.db.migration_ops import (
+    backfill_in_batches, create_index_concurrently, drop_index_concurrently
+)
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Earlier run this run mirrors; "runs" is the row being updated (or checked)
+MIRRORED_RUN = """
+    SELECT o.run_id FROM runs o
+    WHERE o.topic = runs.topic
+      AND o.agent_j_id = runs.agent_j_id
+      AND o.agent_a_id = runs.agent_b_id
+      AND o.agent_b_id = runs.agent_a_id
+      AND o.position_a = runs.position_b
+      AND o.created_at < runs.created_at
+    ORDER BY o.created_at DESC
+    LIMIT 1
+"""
+
+
+def upgrade() -> None:
+    # Nullable without default: a catalog-only change
+    op.execute(
+        "ALTER TABLE runs ADD COLUMN IF NOT EXISTS swap_of_run_id UUID "
+        "REFERENCES runs(run_id) ON DELETE SET NULL"
+    )
+    create_index_concurrently(
+        "idx_runs_swap_of_run_id", "runs", ["swap_of_run_id"],
+        where="swap_of_run_id IS NOT NULL",
+    )
+    backfill_in_batches(
+        "runs", "run_id",
+        assignments=f"swap_of_run_id = ({MIRRORED_RUN})",
+        pending=f"swap_of_run_id IS NULL AND EXISTS ({MIRRORED_RUN})",
+    )
+
+
+def downgrade() -> None:
+    drop_index_concurrently("idx_runs_swap_of_run_id")
+    op.execute("ALTER TABLE runs DROP COLUMN IF EXISTS swap_of_run_id")
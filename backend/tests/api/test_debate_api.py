@@ -108,6 +108,92 @@ class TestStartDebate:
                 assert "stream_url" in data
                 assert f"/api/debate/stream/{mock_run.run_id}" in data["stream_url"]
 
+    @pytest.mark.asyncio
+    async def test_judge_list_starts_panel(self):
+        """A list of judges should store the primary judge and the panel in the config."""
+        agent_a = create_mock_agent()
+        agent_b = create_mock_agent(name="Agent B")
+        judges = [create_mock_agent(name=f"Judge {i}") for i in range(3)]
+        agent_lookup = {agent.agent_id: agent for agent in [agent_a, agent_b, *judges]}
+
+        async def mock_get_agent_by_id(db, agent_id):
+            return agent_lookup.get(agent_id)
+
+        with patch('app.api.endpoints.debate.agent_crud.get_agent_by_id',
+                   side_effect=mock_get_agent_by_id):
+            with patch('app.api.endpoints.debate.create_run',
+                       new_callable=AsyncMock, return_value=create_mock_run()) as create:
+                transport = ASGITransport(app=app)
+                async with AsyncClient(transport=transport, base_url="http://test") as client:
+                    response = await client.post("/api/debate/start", json={
+                        "topic": "AI will benefit humanity",
+                        "position_a": "FOR",
+                        "position_b": "AGAINST",
+                        "agent_a_id": str(agent_a.agent_id),
+                        "agent_b_id": str(agent_b.agent_id),
+                        "agent_j_id": [str(j.agent_id) for j in judges + judges[:1]],
+                        "config": {"rounds": 2, "panel_aggregation": "mean"}
+                    })
+
+        assert response.status_code == 201
+        kwargs = create.await_args.kwargs
+        assert kwargs["agent_j_id"] == judges[0].agent_id
+        assert kwargs["config"]["judge_panel"] == [str(j.agent_id) for j in judges]
+        assert kwargs["config"]["panel_aggregation"] == "mean"
+
+    @pytest.mark.asyncio
+    async def test_warms_models_of_the_run(self, model_residency):
+        """Starting a debate should load the debaters' and judges' models."""
+        agent_a = create_mock_agent()
+        agent_b = create_mock_agent(name="Agent B")
+        agent_b.model = "qwen2.5"
+        agent_lookup = {agent_a.agent_id: agent_a, agent_b.agent_id: agent_b}
+
+        async def mock_get_agent_by_id(db, agent_id):
+            return agent_lookup.get(agent_id)
+
+        with patch('app.api.endpoints.debate.agent_crud.get_agent_by_id',
+                   side_effect=mock_get_agent_by_id):
+            with patch('app.api.endpoints.debate.create_run',
+                       new_callable=AsyncMock, return_value=create_mock_run()):
+                transport = ASGITransport(app=app)
+                async with AsyncClient(transport=transport, base_url="http://test") as client:
+                    response = await client.post("/api/debate/start", json={
+                        "topic": "AI will benefit humanity",
+                        "position_a": "FOR",
+                        "position_b": "AGAINST",
+                        "agent_a_id": str(agent_a.agent_id),
+                        "agent_b_id": str(agent_b.agent_id),
+                        "agent_j_id": str(agent_b.agent_id)
+                    })
+
+        assert response.status_code == 201
+        model_residency.warm.assert_called_once_with([agent_a.model, "qwen2.5", "qwen2.5"])
+
+    @pytest.mark.asyncio
+    async def test_unknown_panel_judge_returns_404(self):
+        """Every judge of a panel must exist."""
+        agent = create_mock_agent()
+
+        async def mock_get_agent_by_id(db, agent_id):
+            return agent if agent_id == agent.agent_id else None
+
+        with patch('app.api.endpoints.debate.agent_crud.get_agent_by_id',
+                   side_effect=mock_get_agent_by_id):
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.post("/api/debate/start", json={
+                    "topic": "AI will benefit humanity",
+                    "position_a": "FOR",
+                    "position_b": "AGAINST",
+                    "agent_a_id": str(agent.agent_id),
+                    "agent_b_id": str(agent.agent_id),
+                    "agent_j_id": [str(agent.agent_id), str(uuid4())]
+                })
+
+        assert response.status_code == 404
+        assert "Judge agent" in response.json()["detail"]
+
     @pytest.mark.asyncio
     async def test_rejects_same_positions(self):
         """POST /api/debate/start should reject same positions."""
@@ -322,6 +408,41 @@ class TestSwapTest:
                 assert data["status"] == "pending"
 
 
+class TestGetRunSwaps:
+    """Tests for GET /api/debate/runs/{id}/swaps endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_lists_linked_swap_runs(self):
+        """GET /api/debate/runs/{id}/swaps should return runs linked to the original."""
+        original = create_mock_run(status="completed")
+        swap = create_mock_run(agent_a_id=original.agent_b_id, agent_b_id=original.agent_a_id)
+        swap.swap_of_run_id = original.run_id
+
+        with patch('app.api.endpoints.debate.get_run_by_id',
+                   new_callable=AsyncMock, return_value=original):
+            with patch('app.api.endpoints.debate.run_crud.get_swap_runs',
+                       new_callable=AsyncMock, return_value=[swap]):
+                transport = ASGITransport(app=app)
+                async with AsyncClient(transport=transport, base_url="http://test") as client:
+                    response = await client.get(f"/api/debate/runs/{original.run_id}/swaps")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [r["run_id"] for r in data] == [str(swap.run_id)]
+        assert data[0]["swap_of_run_id"] == str(original.run_id)
+
+    @pytest.mark.asyncio
+    async def test_returns_404_when_not_found(self):
+        """GET /api/debate/runs/{id}/swaps should return 404 for unknown ID."""
+        with patch('app.api.endpoints.debate.get_run_by_id',
+                   new_callable=AsyncMock, return_value=None):
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.get(f"/api/debate/runs/{uuid4()}/swaps")
+
+        assert response.status_code == 404
+
+
 class TestGetRunTurns:
     """Tests for GET /api/debate/runs/{id}/turns endpoint."""
 
@@ -523,3 +644,44 @@ class TestCompareSwapTest:
 
             assert response.status_code == 400
             assert "completed" in response.json()["detail"].lower()
+
+
+class TestScoringStats:
+    """Tests for GET /api/debate/scoring/stats endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_returns_parse_stats(self):
+        """Should return judge parse outcomes per model and stage."""
+        stats = [{"model": "llama3", "stage": "opening", "ok": 3, "repaired": 1, "failed": 0,
+                  "total": 4, "repair_rate": 0.25, "failure_rate": 0.0}]
+
+        with patch("app.api.endpoints.debate.get_parse_stats", return_value=stats):
+            async with AsyncClient(
+                transport=ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                response = await client.get("/api/debate/scoring/stats")
+
+        assert response.status_code == 200
+        assert response.json() == {"stats": stats}
+
+
+class TestBiasReport:
+    """Tests for GET /api/debate/bias/report endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_passes_filters(self):
+        """GET /api/debate/bias/report should forward judge, model and topics."""
+        judge_id = uuid4()
+        with patch('app.api.endpoints.debate.bias.position_bias_report',
+                   new_callable=AsyncMock, return_value={"runs": 0}) as mock:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.get(
+                    f"/api/debate/bias/report?judge_id={judge_id}&model=llama3&topic=t1&topic=t2"
+                )
+
+            assert response.status_code == 200
+            assert response.json() == {"runs": 0}
+            assert mock.await_args.kwargs == {
+                "judge_id": judge_id, "model": "llama3", "topics": ["t1", "t2"]
+            }
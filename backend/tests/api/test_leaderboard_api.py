@@ -0,0 +1,58 @@
+"""
+Tests for Leaderboard API endpoints
+"""
+import pytest
+from httpx import AsyncClient, ASGITransport
+from unittest.mock import patch, AsyncMock
+from uuid import uuid4
+
+from app.main import app
+
+
+class TestGetLeaderboard:
+    """Tests for GET /api/leaderboard/ endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_returns_ranked_entries(self):
+        """GET /api/leaderboard/ should return the precomputed ratings."""
+        entries = [
+            {"rank": 1, "agent_id": uuid4(), "name": "Agent 1", "model": "llama3",
+             "rating": 1016.0, "games": 1, "wins": 1, "losses": 0, "draws": 0},
+            {"rank": 2, "agent_id": uuid4(), "name": "Agent 2", "model": "qwen2.5",
+             "rating": 984.0, "games": 1, "wins": 0, "losses": 1, "draws": 0},
+        ]
+
+        with patch('app.api.endpoints.leaderboard.ratings.get_leaderboard',
+                   new_callable=AsyncMock, return_value=entries) as mock:
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.get("/api/leaderboard/?limit=10&offset=0")
+
+            assert response.status_code == 200
+            assert [e["name"] for e in response.json()] == ["Agent 1", "Agent 2"]
+            assert mock.await_args.kwargs == {"limit": 10, "offset": 0}
+
+    @pytest.mark.asyncio
+    async def test_rejects_invalid_limit(self):
+        """GET /api/leaderboard/ should validate the page size."""
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/api/leaderboard/?limit=0")
+
+        assert response.status_code == 422
+
+
+class TestRecomputeLeaderboard:
+    """Tests for POST /api/leaderboard/recompute endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_returns_counts(self):
+        """POST /api/leaderboard/recompute should report what was replayed."""
+        with patch('app.api.endpoints.leaderboard.ratings.recompute_ratings',
+                   new_callable=AsyncMock, return_value={"agents": 3, "runs": 12}):
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.post("/api/leaderboard/recompute")
+
+            assert response.status_code == 200
+            assert response.json() == {"agents": 3, "runs": 12}
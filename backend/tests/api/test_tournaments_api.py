@@ -0,0 +1,95 @@
+"""
+Tests for Tournament API endpoints
+"""
+import pytest
+from httpx import AsyncClient, ASGITransport
+from unittest.mock import patch, AsyncMock, MagicMock
+from uuid import uuid4
+
+from app.main import app
+from app.graph.tournament import Tournament
+
+
+class TestCreateTournament:
+    """Tests for POST /api/tournaments/ endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_starts_tournament_with_agent_models(self):
+        """POST /api/tournaments/ should start a tournament in the background."""
+        agent_ids = [uuid4(), uuid4()]
+        agent = MagicMock(model="llama3")
+
+        with patch('app.api.endpoints.tournaments.agent_crud.get_agent_by_id',
+                   new_callable=AsyncMock, return_value=agent):
+            with patch('app.api.endpoints.tournaments.start_tournament',
+                       side_effect=lambda t: t) as start:
+                transport = ASGITransport(app=app)
+                async with AsyncClient(transport=transport, base_url="http://test") as client:
+                    response = await client.post("/api/tournaments/", json={
+                        "agent_ids": [str(a) for a in agent_ids + agent_ids[:1]],
+                        "topics": ["AI will benefit humanity"],
+                        "agent_j_id": str(uuid4()),
+                        "format": "swiss",
+                    })
+
+            assert response.status_code == 201
+            data = response.json()
+            assert data["status"] == "pending"
+            assert data["format"] == "swiss"
+            tournament = start.call_args.args[0]
+            assert tournament.agents == {str(a): "llama3" for a in agent_ids}
+
+    @pytest.mark.asyncio
+    async def test_returns_404_for_unknown_agent(self):
+        """POST /api/tournaments/ should reject unknown agents."""
+        with patch('app.api.endpoints.tournaments.agent_crud.get_agent_by_id',
+                   new_callable=AsyncMock, return_value=None):
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.post("/api/tournaments/", json={
+                    "agent_ids": [str(uuid4()), str(uuid4())],
+                    "topics": ["Topic"],
+                    "agent_j_id": str(uuid4()),
+                })
+
+            assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_requires_two_different_agents(self):
+        """POST /api/tournaments/ should reject a single distinct agent."""
+        agent_id = str(uuid4())
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post("/api/tournaments/", json={
+                "agent_ids": [agent_id, agent_id],
+                "topics": ["Topic"],
+                "agent_j_id": str(uuid4()),
+            })
+
+        assert response.status_code == 400
+
+
+class TestGetTournament:
+    """Tests for GET /api/tournaments/{id} endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_returns_standings(self):
+        """GET /api/tournaments/{id} should return the snapshot."""
+        tournament = Tournament({str(uuid4()): "llama3", str(uuid4()): "qwen2.5"}, ["t"], str(uuid4()))
+
+        with patch('app.api.endpoints.tournaments.get_tournament', return_value=tournament):
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.get(f"/api/tournaments/{tournament.tournament_id}")
+
+        assert response.status_code == 200
+        assert len(response.json()["standings"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_returns_404_when_not_found(self):
+        """GET /api/tournaments/{id} should return 404 for unknown ID."""
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get(f"/api/tournaments/{uuid4()}")
+
+        assert response.status_code == 404
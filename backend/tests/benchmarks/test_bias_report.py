@@ -0,0 +1,47 @@
+"""
+Throughput benchmark for the batch position-bias report
+
+The report is one pass over score rows; an audit over tens of thousands of
+runs must stay well within an interactive request. The budget can be tuned
+per machine with ``BIAS_REPORT_BUDGET_MS``.
+"""
+import os
+import random
+import time
+from uuid import uuid4
+
+from app.services.bias import ScoreRow, analyze_score_rows
+
+BIAS_REPORT_BUDGET_MS = int(os.getenv("BIAS_REPORT_BUDGET_MS", "1000"))
+PAIRS = 25_000
+
+
+def generate_rows(pairs: int):
+    """Swap pairs with random verdicts, as joined by the report query."""
+    rng = random.Random(0)
+    rows = []
+    for _ in range(pairs):
+        results = []
+        for _ in range(2):
+            total_a, total_b = rng.randrange(40, 100), rng.randrange(40, 100)
+            winner = "DRAW" if abs(total_a - total_b) < 5 else ("A" if total_a > total_b else "B")
+            results.append((winner, total_a, total_b))
+        original = ScoreRow(uuid4(), None, "FOR", "AGAINST", *results[0])
+        rows.append(original)
+        rows.append(ScoreRow(uuid4(), original.run_id, "AGAINST", "FOR", *results[1], *results[0]))
+    return rows
+
+
+class TestBiasReportThroughput:
+    """The report over many runs should be computed in one fast pass."""
+
+    def test_report_over_50k_runs_within_budget(self):
+        rows = generate_rows(PAIRS)
+
+        start = time.perf_counter()
+        report = analyze_score_rows(rows)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        assert report["runs"] == 2 * PAIRS
+        assert report["pairs"]["total"] == PAIRS
+        assert elapsed_ms < BIAS_REPORT_BUDGET_MS, f"{elapsed_ms:.0f} ms for {2 * PAIRS} runs"
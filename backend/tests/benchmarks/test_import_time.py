@@ -0,0 +1,89 @@
+"""
+Startup-time benchmarks for the API worker
+
+Each test imports the app in a fresh interpreter with ``-X importtime`` so
+results are not affected by modules already loaded by the test session.
+The budget can be tuned per machine with ``IMPORT_TIME_BUDGET_MS``.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+IMPORT_TIME_BUDGET_MS = int(os.getenv("IMPORT_TIME_BUDGET_MS", "2000"))
+
+# Modules that must only be imported when a graph run actually needs them
+DEFERRED_PACKAGES = ("langgraph", "langchain", "langchain_core", "langchain_community")
+
+
+def measure_import_time(module: str) -> Dict[str, int]:
+    """
+    Import a module in a fresh interpreter and collect ``-X importtime`` data.
+
+    Args:
+        module: Dotted module name to import
+
+    Returns:
+        Cumulative import time in microseconds per imported module
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    timings: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        timings[name.strip()] = int(cumulative)
+    return timings
+
+
+def format_breakdown(timings: Dict[str, int], limit: int = 15) -> str:
+    """Format the slowest top-level imports for assertion messages."""
+    top_level = {name: us for name, us in timings.items() if "." not in name}
+    slowest = sorted(top_level.items(), key=lambda item: item[1], reverse=True)[:limit]
+    return "\n".join(f"{us / 1000:8.1f} ms  {name}" for name, us in slowest)
+
+
+class TestImportTime:
+    """Startup-time budget checks for app.main."""
+
+    @pytest.fixture(scope="class")
+    def timings(self):
+        """Import timings of app.main in a fresh interpreter."""
+        return measure_import_time("app.main")
+
+    def test_graph_packages_are_deferred(self, timings):
+        """Importing the API must not import LangGraph/LangChain."""
+        loaded = [
+            name for name in timings
+            if name.split(".")[0] in DEFERRED_PACKAGES
+        ]
+
+        assert loaded == [], f"Deferred packages imported at startup: {loaded[:10]}"
+
+    def test_app_import_within_budget(self, timings):
+        """app.main should import within the startup-time budget."""
+        total_ms = timings["app.main"] / 1000
+
+        assert total_ms <= IMPORT_TIME_BUDGET_MS, (
+            f"app.main imported in {total_ms:.0f} ms "
+            f"(budget {IMPORT_TIME_BUDGET_MS} ms). Slowest imports:\n"
+            f"{format_breakdown(timings)}"
+        )
+
+    def test_graph_package_import_is_lightweight(self):
+        """Importing app.graph should not compile or import the LangGraph graph."""
+        timings = measure_import_time("app.graph")
+
+        assert "app.graph.graph" not in timings
+        assert "langgraph" not in timings
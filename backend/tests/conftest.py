@@ -5,12 +5,26 @@ import pytest
 from uuid import uuid4
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy import Insert, Update, inspect
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.agent import Agent
 from app.models.run import Run
 from app.models.turn import Turn
 from app.models.schemas import AgentCreate, AgentUpdate, DebateStartRequest
+from app.services.residency import ModelResidency, residency
+
+
+@pytest.fixture(autouse=True)
+def model_residency(monkeypatch):
+    """
+    Give every test an empty model residency without background warm-ups.
+
+    ``model_residency.warm`` is a mock recording the models a test warmed.
+    """
+    monkeypatch.setattr(residency, "__dict__", ModelResidency().__dict__)
+    monkeypatch.setattr(residency, "warm", MagicMock(return_value=[]))
+    return residency
 
 
 @pytest.fixture
@@ -26,6 +40,53 @@ def mock_db():
     return session
 
 
+@pytest.fixture
+def returning_db(mock_db):
+    """
+    Mock AsyncSession emulating INSERT/UPDATE/DELETE ... RETURNING.
+
+    Rows live in ``returning_db.rows`` keyed by primary key; add existing
+    model instances there before updating or deleting them. The first WHERE
+    criterion selects the row by primary key; further criteria filter it.
+    """
+    mock_db.rows = {}
+
+    async def execute(stmt, *args, **kwargs):
+        model = stmt.entity_description["entity"]
+        pk_name = inspect(model).primary_key[0].name
+        columns = {c.name for c in model.__table__.columns}
+        params = {k: v for k, v in stmt.compile().params.items() if k in columns}
+        result = MagicMock()
+
+        if isinstance(stmt, Insert):
+            row = model(**params)
+            if "created_at" in columns:
+                row.created_at = datetime.utcnow()
+            mock_db.rows[params[pk_name]] = row
+            result.scalar_one.return_value = row
+            return result
+
+        key, *criteria = getattr(stmt.whereclause, "clauses", [stmt.whereclause])
+        key = key.right.value
+        row = mock_db.rows.get(key)
+        if row is not None and not all(
+            criterion.operator(getattr(row, criterion.left.name), criterion.right.value)
+            for criterion in criteria
+        ):
+            row = None
+        if isinstance(stmt, Update) and row is not None:
+            for name, value in params.items():
+                setattr(row, name, value)
+        elif row is not None:
+            del mock_db.rows[key]
+            row = key
+        result.scalar_one_or_none.return_value = row
+        return result
+
+    mock_db.execute = AsyncMock(side_effect=execute)
+    return mock_db
+
+
 @pytest.fixture
 def sample_agent_id():
     """Generate a sample agent UUID."""
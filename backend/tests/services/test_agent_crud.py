@@ -79,27 +79,23 @@ class TestCreateAgent:
     """Tests for create_agent function."""
 
     @pytest.mark.asyncio
-    async def test_creates_agent_successfully(self, mock_db, sample_agent_create):
+    async def test_creates_agent_successfully(self, returning_db, sample_agent_create):
         """create_agent should create and return new agent."""
-        # Mock refresh to simulate database behavior
-        async def mock_refresh(agent):
-            agent.created_at = datetime.utcnow()
-            agent.updated_at = datetime.utcnow()
-
-        mock_db.refresh = mock_refresh
-
-        agent = await create_agent(mock_db, sample_agent_create)
+        agent = await create_agent(returning_db, sample_agent_create)
 
         assert agent.name == sample_agent_create.name
         assert agent.model == sample_agent_create.model
         assert agent.persona_json == sample_agent_create.persona_json
         assert agent.params_json == sample_agent_create.params_json
         assert agent.agent_id is not None
-        mock_db.add.assert_called_once()
-        mock_db.commit.assert_called_once()
+        assert agent.created_at is not None
+        returning_db.execute.assert_awaited_once()
+        returning_db.commit.assert_called_once()
+        # RETURNING populates the row; no follow-up SELECT
+        returning_db.refresh.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_creates_agent_with_empty_json_fields(self, mock_db):
+    async def test_creates_agent_with_empty_json_fields(self, returning_db):
         """create_agent should handle empty persona and params."""
         from app.models.schemas import AgentCreate
 
@@ -110,13 +106,7 @@ class TestCreateAgent:
             params_json={}
         )
 
-        async def mock_refresh(agent):
-            agent.created_at = datetime.utcnow()
-            agent.updated_at = datetime.utcnow()
-
-        mock_db.refresh = mock_refresh
-
-        agent = await create_agent(mock_db, agent_data)
+        agent = await create_agent(returning_db, agent_data)
 
         assert agent.name == "Minimal Agent"
         assert agent.persona_json == {}
@@ -127,92 +117,86 @@ class TestUpdateAgent:
     """Tests for update_agent function."""
 
     @pytest.mark.asyncio
-    async def test_updates_only_provided_fields(self, mock_db, sample_agent):
+    async def test_updates_only_provided_fields(self, returning_db, sample_agent):
         """update_agent should only update provided fields."""
-        with patch('app.services.agent_crud.get_agent_by_id', return_value=sample_agent):
-            update_data = AgentUpdate(name="Updated Name")
-
-            async def mock_refresh(agent):
-                pass
+        returning_db.rows[sample_agent.agent_id] = sample_agent
+        update_data = AgentUpdate(name="Updated Name")
 
-            mock_db.refresh = mock_refresh
+        updated = await update_agent(returning_db, sample_agent.agent_id, update_data)
 
-            updated = await update_agent(mock_db, sample_agent.agent_id, update_data)
-
-            assert updated.name == "Updated Name"
-            # Original model should be unchanged
-            assert updated.model == "llama3"
+        assert updated.name == "Updated Name"
+        # Original model should be unchanged
+        assert updated.model == "llama3"
+        returning_db.execute.assert_awaited_once()
+        returning_db.refresh.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_returns_none_when_not_found(self, mock_db):
+    async def test_returns_none_when_not_found(self, returning_db):
         """update_agent should return None when agent not found."""
-        with patch('app.services.agent_crud.get_agent_by_id', return_value=None):
-            update_data = AgentUpdate(name="New Name")
+        update_data = AgentUpdate(name="New Name")
 
-            result = await update_agent(mock_db, uuid4(), update_data)
+        result = await update_agent(returning_db, uuid4(), update_data)
 
-            assert result is None
-            mock_db.commit.assert_not_called()
+        assert result is None
+        returning_db.commit.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_updates_multiple_fields(self, mock_db, sample_agent):
+    async def test_updates_multiple_fields(self, returning_db, sample_agent):
         """update_agent should update multiple fields at once."""
-        with patch('app.services.agent_crud.get_agent_by_id', return_value=sample_agent):
-            update_data = AgentUpdate(
-                name="New Name",
-                model="qwen2.5",
-                params_json={"temperature": 0.9}
-            )
+        returning_db.rows[sample_agent.agent_id] = sample_agent
+        update_data = AgentUpdate(
+            name="New Name",
+            model="qwen2.5",
+            params_json={"temperature": 0.9}
+        )
 
-            async def mock_refresh(agent):
-                pass
+        updated = await update_agent(returning_db, sample_agent.agent_id, update_data)
 
-            mock_db.refresh = mock_refresh
+        assert updated.name == "New Name"
+        assert updated.model == "qwen2.5"
+        assert updated.params_json == {"temperature": 0.9}
 
-            updated = await update_agent(mock_db, sample_agent.agent_id, update_data)
+    @pytest.mark.asyncio
+    async def test_empty_update_returns_current_agent(self, mock_db, sample_agent):
+        """update_agent without fields should not issue an UPDATE."""
+        with patch('app.services.agent_crud.get_agent_by_id', return_value=sample_agent):
+            result = await update_agent(mock_db, sample_agent.agent_id, AgentUpdate())
 
-            assert updated.name == "New Name"
-            assert updated.model == "qwen2.5"
-            assert updated.params_json == {"temperature": 0.9}
+            assert result is sample_agent
+            mock_db.commit.assert_not_called()
 
 
 class TestDeleteAgent:
     """Tests for delete_agent function."""
 
     @pytest.mark.asyncio
-    async def test_deletes_agent_successfully(self, mock_db, sample_agent):
+    async def test_deletes_agent_successfully(self, returning_db, sample_agent):
         """delete_agent should delete agent and return True."""
-        with patch('app.services.agent_crud.get_agent_by_id', return_value=sample_agent):
-            result = await delete_agent(mock_db, sample_agent.agent_id)
+        returning_db.rows[sample_agent.agent_id] = sample_agent
+
+        result = await delete_agent(returning_db, sample_agent.agent_id)
 
-            assert result is True
-            mock_db.delete.assert_called_once_with(sample_agent)
-            mock_db.commit.assert_called_once()
+        assert result is True
+        assert sample_agent.agent_id not in returning_db.rows
+        returning_db.commit.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_returns_false_when_not_found(self, mock_db):
+    async def test_returns_false_when_not_found(self, returning_db):
         """delete_agent should return False when agent not found."""
-        with patch('app.services.agent_crud.get_agent_by_id', return_value=None):
-            result = await delete_agent(mock_db, uuid4())
+        result = await delete_agent(returning_db, uuid4())
 
-            assert result is False
-            mock_db.delete.assert_not_called()
+        assert result is False
+        returning_db.commit.assert_not_called()
 
 
 class TestCloneAgent:
     """Tests for clone_agent function."""
 
     @pytest.mark.asyncio
-    async def test_clones_agent_with_copy_suffix(self, mock_db, sample_agent):
+    async def test_clones_agent_with_copy_suffix(self, returning_db, sample_agent):
         """clone_agent should append '(Copy)' to name."""
         with patch('app.services.agent_crud.get_agent_by_id', return_value=sample_agent):
-            async def mock_refresh(agent):
-                agent.created_at = datetime.utcnow()
-                agent.updated_at = datetime.utcnow()
-
-            mock_db.refresh = mock_refresh
-
-            cloned = await clone_agent(mock_db, sample_agent.agent_id)
+            cloned = await clone_agent(returning_db, sample_agent.agent_id)
 
             assert cloned is not None
             assert cloned.name == "Test Agent (Copy)"
@@ -228,19 +212,13 @@ class TestCloneAgent:
             result = await clone_agent(mock_db, uuid4())
 
             assert result is None
-            mock_db.add.assert_not_called()
+            mock_db.execute.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_clones_with_independent_json_copies(self, mock_db, sample_agent):
+    async def test_clones_with_independent_json_copies(self, returning_db, sample_agent):
         """clone_agent should create independent copies of JSON fields."""
         with patch('app.services.agent_crud.get_agent_by_id', return_value=sample_agent):
-            async def mock_refresh(agent):
-                agent.created_at = datetime.utcnow()
-                agent.updated_at = datetime.utcnow()
-
-            mock_db.refresh = mock_refresh
-
-            cloned = await clone_agent(mock_db, sample_agent.agent_id)
+            cloned = await clone_agent(returning_db, sample_agent.agent_id)
 
             # Modify cloned JSON to ensure independence
             cloned.persona_json["new_key"] = "new_value"
@@ -0,0 +1,115 @@
+"""
+Tests for the batch position-bias report
+"""
+from uuid import uuid4
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from sqlalchemy.dialects import postgresql
+
+from app.services.bias import ScoreRow, analyze_score_rows, position_bias_report, wilson_interval
+
+
+def _pair(original_winner, swap_winner, original_totals=(70, 60), swap_totals=(70, 60)):
+    """Score rows of a run (FOR in slot A) and its swap test."""
+    original = ScoreRow(uuid4(), None, "FOR", "AGAINST", original_winner, *original_totals)
+    swap = ScoreRow(uuid4(), original.run_id, "AGAINST", "FOR", swap_winner, *swap_totals,
+                    original_winner, *original_totals)
+    return [original, swap]
+
+
+class TestWilsonInterval:
+    """Tests for the proportion interval."""
+
+    def test_contains_rate_and_narrows_with_samples(self):
+        """The interval should contain the rate and shrink as n grows."""
+        low_small, high_small = wilson_interval(6, 10)
+        low_large, high_large = wilson_interval(600, 1000)
+
+        assert low_small < 0.6 < high_small
+        assert high_large - low_large < high_small - low_small
+
+    def test_no_trials(self):
+        assert wilson_interval(0, 0) == (None, None)
+
+
+class TestAnalyzeScoreRows:
+    """Tests for pair evaluation and aggregation."""
+
+    def test_slot_bias_is_detected(self):
+        """Slot A winning every run should show up as position bias toward A."""
+        rows = []
+        for _ in range(20):
+            rows += _pair("A", "A")
+
+        report = analyze_score_rows(rows)
+
+        assert report["pairs"]["total"] == 20
+        assert report["pairs"]["position_biased"] == 20
+        assert report["pairs"]["biased_toward"] == {"A": 20, "B": 0}
+        assert report["position_win_rate"]["A"]["rate"] == 1.0
+        assert report["position_win_rate"]["A"]["ci_low"] > 0.8
+        assert report["side_win_rate"]["FOR"]["rate"] == 0.5
+        assert report["score_delta"]["a_minus_b_paired"]["mean"] == 10
+
+    def test_consistent_winner_is_not_bias(self):
+        """The same agent winning both runs cancels out in the paired delta."""
+        rows = _pair("A", "B", original_totals=(80, 60), swap_totals=(60, 80))
+
+        report = analyze_score_rows(rows)
+
+        assert report["pairs"]["consistent"] == 1
+        assert report["pairs"]["position_biased"] == 0
+        assert report["score_delta"]["a_minus_b_paired"]["mean"] == 0
+        assert report["score_delta"]["for_minus_against"]["mean"] == 20
+
+    def test_unlinked_runs_and_draws(self):
+        """Runs without a swap stay unpaired; draws make a pair inconclusive."""
+        rows = _pair("DRAW", "A")
+        rows += _pair("A", "A")[:1]
+        # Swap whose original is not completed (no joined result)
+        rows += [_pair("B", "B")[1]._replace(original_winner=None)]
+
+        report = analyze_score_rows(rows)
+
+        assert report["pairs"]["total"] == 1
+        assert report["pairs"]["inconclusive"] == 1
+        assert report["pairs"]["unpaired_runs"] == 2
+        assert report["draws"] == 1
+        assert report["pairs"]["position_bias_rate"]["rate"] is None
+
+    def test_repeated_swap_tests_of_one_run(self):
+        """Each swap test forms its own pair with the shared original."""
+        original, first_swap = _pair("A", "A")
+        second_swap = first_swap._replace(run_id=uuid4(), winner="B")
+
+        report = analyze_score_rows([original, first_swap, second_swap])
+
+        assert report["pairs"]["total"] == 2
+        assert report["pairs"]["position_biased"] == 1
+        assert report["pairs"]["consistent"] == 1
+        assert report["pairs"]["unpaired_runs"] == 0
+
+
+class TestPositionBiasReport:
+    """Tests for the single-query fetch."""
+
+    @pytest.mark.asyncio
+    async def test_filters_in_one_narrow_query(self, mock_db):
+        """Filters should be applied in SQL, reading only score columns."""
+        result = MagicMock()
+        result.all.return_value = []
+        mock_db.execute = AsyncMock(return_value=result)
+        judge_id = uuid4()
+
+        report = await position_bias_report(mock_db, judge_id=judge_id, model="llama3", topics=["t"])
+
+        mock_db.execute.assert_awaited_once()
+        sql = str(mock_db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "runs.agent_j_id =" in sql
+        assert "agents.model =" in sql
+        assert "runs.topic IN" in sql
+        assert "LEFT OUTER JOIN runs AS runs_1 ON runs_1.run_id = runs.swap_of_run_id" in sql
+        assert "#>>" in sql and "runs.result_json," not in sql
+        assert report["runs"] == 0
+        assert report["filters"]["judge_id"] == str(judge_id)
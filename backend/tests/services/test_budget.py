@@ -0,0 +1,115 @@
+"""
+Tests for prompt token budgeting
+"""
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.graph import budget
+from app.graph.budget import (
+    compact_turns,
+    estimate_tokens,
+    extract_excerpt,
+    fit_transcript,
+    get_context_length,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_context_cache():
+    """Reset the per-model context length cache between tests."""
+    budget._context_lengths.clear()
+    yield
+    budget._context_lengths.clear()
+
+
+def _speech(label: str, sentences: int = 40) -> str:
+    return "\n".join(
+        f"{label} claim {i} is supported by a long line of careful reasoning. "
+        f"Evidence for {label} point {i} follows here."
+        for i in range(sentences)
+    )
+
+
+class TestGetContextLength:
+    """Tests for get_context_length function."""
+
+    @pytest.mark.asyncio
+    async def test_uses_num_ctx_parameter(self):
+        """num_ctx from the model parameters should win."""
+        info = {"parameters": "temperature 0.7\nnum_ctx 8192", "model_info": {}}
+        with patch("app.graph.budget.get_model_info", AsyncMock(return_value=info)):
+            assert await get_context_length("llama3") == 8192
+
+    @pytest.mark.asyncio
+    async def test_caps_model_context_at_ollama_default(self):
+        """Without num_ctx Ollama runs with its default context size."""
+        info = {"parameters": "", "model_info": {"llama.context_length": 131072}}
+        with patch("app.graph.budget.get_model_info", AsyncMock(return_value=info)), \
+             patch.object(budget.settings, "OLLAMA_DEFAULT_NUM_CTX", 4096):
+            assert await get_context_length("llama3") == 4096
+
+    @pytest.mark.asyncio
+    async def test_fetches_once_per_model(self):
+        """Model info should be fetched once and cached."""
+        mock_info = AsyncMock(return_value={"parameters": "num_ctx 2048"})
+        with patch("app.graph.budget.get_model_info", mock_info):
+            await get_context_length("llama3")
+            await get_context_length("llama3")
+
+        mock_info.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_model_info_unavailable(self):
+        """Missing model info should use the default context size without caching it."""
+        mock_info = AsyncMock(return_value=None)
+        with patch("app.graph.budget.get_model_info", mock_info), \
+             patch.object(budget.settings, "OLLAMA_DEFAULT_NUM_CTX", 4096):
+            assert await get_context_length("missing") == 4096
+            assert await get_context_length("missing") == 4096
+
+        assert mock_info.await_count == 2
+        assert "missing" not in budget._context_lengths
+
+
+class TestCompaction:
+    """Tests for extract_excerpt and compact_turns functions."""
+
+    def test_short_text_is_unchanged(self):
+        """Text within budget should be returned verbatim."""
+        assert extract_excerpt("Short turn.", 100) == "Short turn."
+
+    def test_excerpt_respects_budget_and_keeps_leads(self):
+        """Excerpts should fit the budget and prefer paragraph lead sentences."""
+        text = _speech("A", 10)
+        excerpt = extract_excerpt(text, 60)
+
+        assert estimate_tokens(excerpt) <= 60
+        assert excerpt.startswith("A claim 0")
+        assert "Evidence for A point 0" not in excerpt
+
+    def test_keeps_recent_turns_verbatim(self):
+        """Only older turns should be compacted when recent ones fit."""
+        turns = [_speech("A"), _speech("B"), "Recent A.", "Recent B."]
+        compacted = compact_turns(turns, 600)
+
+        assert compacted[-2:] == ["Recent A.", "Recent B."]
+        assert sum(estimate_tokens(t) for t in compacted) <= 600
+
+    def test_fits_budget_when_recent_turns_are_large(self):
+        """Every turn should be excerpted if recent turns alone are too large."""
+        turns = [_speech(label) for label in "ABCD"]
+        compacted = compact_turns(turns, 400)
+
+        assert len(compacted) == 4
+        assert sum(estimate_tokens(t) for t in compacted) <= 400
+
+    @pytest.mark.asyncio
+    async def test_fit_transcript_bounds_prompt_size(self):
+        """Transcript should shrink to the model's context minus reserved tokens."""
+        turns = [_speech(label, 80) for label in "ABABAB"]
+        with patch("app.graph.budget.get_model_info",
+                   AsyncMock(return_value={"parameters": "num_ctx 2048"})):
+            fitted = await fit_transcript("llama3", turns, reserved_tokens=1000)
+
+        total = sum(estimate_tokens(t) for t in fitted)
+        assert total <= 2048 - 1000 - budget.SAFETY_MARGIN_TOKENS
@@ -0,0 +1,302 @@
+"""
+Tests for debater node prompt construction
+"""
+import json
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.graph.budget import estimate_tokens
+from app.graph.plan import build_execution_plan
+from app.graph.nodes.debater import _build_conversation_messages, debater_node
+
+
+def _make_state(config):
+    agent = {"model": "llama3", "persona_json": {"name": "Debater"}, "params_json": {}}
+    turns = [
+        {"turn_id": f"t-{phase}", "agent_id": "x", "phase": phase, "role": "debater",
+         "content": f"{phase} speech", "targets": [], "metadata": {}}
+        for phase in ["opening_a", "opening_b", "rebuttal_a", "rebuttal_b", "summary_a"]
+    ]
+    return {
+        "topic": "Topic",
+        "position_a": "FOR",
+        "position_b": "AGAINST",
+        "agent_a": {**agent, "agent_id": "a", "name": "A"},
+        "agent_b": {**agent, "agent_id": "b", "name": "B"},
+        "config": config,
+        "turns": turns,
+    }
+
+
+class TestConversationMessages:
+    """Tests for _build_conversation_messages function."""
+
+    def test_history_alternates_requests_and_own_speeches(self):
+        """Earlier own speeches should appear as assistant replies."""
+        plan = build_execution_plan({"rounds": 3})
+        state = _make_state({"rounds": 3})
+
+        messages = _build_conversation_messages(plan["summary_a"], plan, state)
+
+        assert [m["role"] for m in messages] == [
+            "system", "user", "user", "assistant", "user", "assistant", "user"
+        ]
+        assert messages[3]["content"] == "opening_a speech"
+        assert messages[5]["content"] == "rebuttal_a speech"
+        # Each opponent speech is shown exactly once
+        assert "opening_b speech" in messages[4]["content"]
+        assert "rebuttal_b speech" in messages[6]["content"]
+        assert sum("opening_b speech" in m["content"] for m in messages) == 1
+
+    def test_earlier_turn_history_is_a_byte_identical_prefix(self):
+        """Later requests should extend the previous request unchanged."""
+        plan = build_execution_plan({"rounds": 3})
+        state = _make_state({"rounds": 3})
+
+        rebuttal = _build_conversation_messages(plan["rebuttal_b"], plan, state)
+        summary = _build_conversation_messages(plan["summary_b"], plan, state)
+
+        assert summary[:len(rebuttal)] == rebuttal
+        assert summary[len(rebuttal)] == {"role": "assistant", "content": "rebuttal_b speech"}
+
+
+class TestDebaterNodeConversationMode:
+    """Tests for debater_node in conversation mode."""
+
+    @pytest.fixture(autouse=True)
+    def model_info(self):
+        """Avoid fetching the context length from Ollama."""
+        with patch("app.graph.budget.get_model_info", AsyncMock(return_value=None)) as mock:
+            yield mock
+
+    @pytest.mark.asyncio
+    async def test_uses_chat_and_records_prompt_eval_count(self, model_info):
+        """Conversation mode should stream via messages and record Ollama stats."""
+        plan = build_execution_plan({"rounds": 3})
+        state = _make_state({"rounds": 3, "conversation_mode": True})
+        captured = {}
+
+        async def fake_stream(**kwargs):
+            captured.update(kwargs)
+            kwargs["stats"]["prompt_eval_count"] = 17
+            yield "text"
+
+        async def emit(event):
+            pass
+
+        with patch("app.graph.nodes.debater.stream_ollama_with_retry", side_effect=fake_stream):
+            update = await debater_node(plan["summary_b"], plan, state, emit)
+
+        turn = update["turns"][0]
+        assert captured["messages"][0]["role"] == "system"
+        assert turn["metadata"]["prompt_mode"] == "chat"
+        assert turn["metadata"]["ollama_stats"] == {"prompt_eval_count": 17}
+        # The /api/generate prompt is neither built nor fitted (one lookup for the history check)
+        assert captured["prompt"] == ""
+        model_info.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_history_over_context_budget_falls_back_to_fitted_prompt(self):
+        """A chat history that would overflow the context should not be sent."""
+        plan = build_execution_plan({"rounds": 3})
+        state = _make_state({"rounds": 3, "conversation_mode": True})
+        for turn in state["turns"]:
+            turn["content"] = "A long speech sentence. " * 200
+        captured = {}
+
+        async def fake_stream(**kwargs):
+            captured.update(kwargs)
+            yield "text"
+
+        async def emit(event):
+            pass
+
+        with patch("app.graph.nodes.debater.stream_ollama_with_retry", side_effect=fake_stream), \
+             patch("app.graph.budget.settings.DEBATE_CONTEXT_LENGTH", 2048):
+            update = await debater_node(plan["summary_b"], plan, state, emit)
+
+        assert captured["messages"] is None
+        assert update["turns"][0]["metadata"]["prompt_mode"] == "generate"
+        # The fallback prompt is compacted to the window
+        assert estimate_tokens(captured["prompt"]) + 1024 <= 2048
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("conversation_mode", [False, True])
+    async def test_targets_do_not_depend_on_prompt_mode(self, conversation_mode):
+        """Rebuttals should answer the opponent's previous speech in both prompt modes."""
+        plan = build_execution_plan({"rounds": 4})
+        state = _make_state({"rounds": 4, "conversation_mode": conversation_mode})
+
+        async def fake_stream(**kwargs):
+            yield "text"
+
+        async def emit(event):
+            pass
+
+        with patch("app.graph.nodes.debater.stream_ollama_with_retry", side_effect=fake_stream):
+            first = await debater_node(plan["rebuttal_b"], plan, state, emit)
+            second = await debater_node(plan["rebuttal2_b"], plan, state, emit)
+
+        assert first["turns"][0]["targets"] == ["t-opening_a"]
+        assert second["turns"][0]["targets"] == ["t-rebuttal_a"]
+
+    @pytest.mark.asyncio
+    async def test_generate_mode_by_default(self):
+        """Without conversation mode the rebuilt prompt should be used."""
+        plan = build_execution_plan({"rounds": 3})
+        state = _make_state({"rounds": 3})
+        captured = {}
+
+        async def fake_stream(**kwargs):
+            captured.update(kwargs)
+            yield "text"
+
+        async def emit(event):
+            pass
+
+        with patch("app.graph.nodes.debater.stream_ollama_with_retry", side_effect=fake_stream):
+            update = await debater_node(plan["rebuttal_a"], plan, state, emit)
+
+        assert captured["messages"] is None
+        assert update["turns"][0]["metadata"]["prompt_mode"] == "generate"
+
+
+class TestDebaterNodeEnforcement:
+    """Tests for live forbidden phrase enforcement in debater_node."""
+
+    @pytest.fixture(autouse=True)
+    def model_info(self):
+        """Avoid fetching the context length from Ollama."""
+        with patch("app.graph.budget.get_model_info", AsyncMock(return_value=None)):
+            yield
+
+    def _state(self, config):
+        state = _make_state({"rounds": 3, **config})
+        state["agent_a"]["persona_json"] = {"name": "A", "forbidden_phrases": ["obviously"]}
+        return state
+
+    async def _run(self, state, replies, node_name="opening_a", requests=None):
+        plan = build_execution_plan({"rounds": 3})
+        prompts = []
+        events = []
+
+        async def fake_stream(**kwargs):
+            prompts.append(kwargs["prompt"])
+            if requests is not None:
+                requests.append(kwargs)
+            for chunk in replies[len(prompts) - 1]:
+                yield chunk
+
+        async def emit(event):
+            events.append(event)
+
+        with patch("app.graph.nodes.debater.stream_ollama_with_retry", side_effect=fake_stream):
+            update = await debater_node(plan[node_name], plan, state, emit)
+        return update["turns"][0], prompts, events
+
+    @pytest.mark.asyncio
+    async def test_off_by_default(self):
+        """Violations are recorded but not emitted or regenerated by default."""
+        turn, prompts, events = await self._run(self._state({}), [["It is obvi", "ously true."]])
+
+        assert len(prompts) == 1
+        assert all(e["event"] == "token" for e in events)
+        assert turn["metadata"]["forbidden_phrases_detected"][0]["phrase"] == "obviously"
+        assert turn["metadata"]["regenerations"] == 0
+
+    @pytest.mark.asyncio
+    async def test_flag_emits_violation_events(self):
+        """Flag mode emits a violation event and keeps the speech."""
+        turn, prompts, events = await self._run(
+            self._state({"forbidden_phrase_enforcement": "flag"}),
+            [["It is obvi", "ously true. More text follows here."]]
+        )
+
+        violations = [json.loads(e["data"]) for e in events if e["event"] == "violation"]
+        assert len(prompts) == 1
+        assert [(v["phrase"], v["action"]) for v in violations] == [("obviously", "flag")]
+        assert turn["content"] == "It is obviously true. More text follows here."
+
+    @pytest.mark.asyncio
+    async def test_regenerate_stops_and_retries_without_phrase(self):
+        """Regenerate mode aborts the attempt and retries with the phrase named."""
+        turn, prompts, events = await self._run(
+            self._state({"forbidden_phrase_enforcement": "regenerate"}),
+            [["It is obviously true.", " never streamed"], ["It is ", "clearly true."]]
+        )
+
+        violations = [json.loads(e["data"]) for e in events if e["event"] == "violation"]
+        assert len(prompts) == 2
+        assert '"obviously"' in prompts[1] and '"obviously"' not in prompts[0]
+        assert violations[0]["action"] == "regenerate"
+        assert turn["content"] == "It is clearly true."
+        assert turn["metadata"]["regenerations"] == 1
+        assert turn["metadata"]["forbidden_phrases_detected"] == []
+        tokens = [json.loads(e["data"])["content"] for e in events if e["event"] == "token"]
+        assert " never streamed" not in tokens
+
+    @pytest.mark.asyncio
+    async def test_regenerate_resets_streamed_turn_before_retry(self):
+        """Clients get a turn_reset between the discarded and the regenerated tokens."""
+        turn, prompts, events = await self._run(
+            self._state({"forbidden_phrase_enforcement": "regenerate"}),
+            [["It is ", "obviously true."], ["It is ", "clearly true."]]
+        )
+
+        sequence = [
+            (e["event"], json.loads(e["data"]).get("content")) for e in events
+        ]
+        assert sequence == [
+            ("token", "It is "),
+            ("token", "obviously true."),
+            ("violation", None),
+            ("turn_reset", None),
+            ("token", "It is "),
+            ("token", "clearly true."),
+        ]
+        reset = json.loads(next(e["data"] for e in events if e["event"] == "turn_reset"))
+        assert reset == {
+            "turn_id": turn["turn_id"], "phase": "opening_a", "attempt": 2,
+            "reason": "forbidden_phrases", "phrases": ["obviously"],
+        }
+        # What is shown after the reset is what gets persisted
+        shown = "".join(content for event, content in sequence[4:])
+        assert shown == turn["content"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("conversation_mode", [False, True])
+    async def test_regeneration_extends_the_discarded_request(self, conversation_mode):
+        """The note follows the transcript, so the first request is a prefix of the retry."""
+        requests = []
+        await self._run(
+            self._state({"forbidden_phrase_enforcement": "regenerate", "conversation_mode": conversation_mode}),
+            [["obviously"], ["clearly"]],
+            node_name="summary_a",
+            requests=requests
+        )
+
+        first, retry = requests
+        assert retry["system"] == first["system"]
+        if conversation_mode:
+            assert retry["messages"][:-1] == first["messages"][:-1]
+            first_text, retry_text = first["messages"][-1]["content"], retry["messages"][-1]["content"]
+        else:
+            first_text, retry_text = first["prompt"], retry["prompt"]
+        assert "rebuttal_b speech" in first_text
+        assert retry_text.startswith(first_text)
+        assert retry_text[len(first_text):].startswith("\n\nIMPORTANT")
+
+    @pytest.mark.asyncio
+    async def test_regenerate_flags_when_attempts_exhausted(self):
+        """The last attempt is kept (and flagged) even if it still violates."""
+        turn, prompts, events = await self._run(
+            self._state({"forbidden_phrase_enforcement": "regenerate", "max_regenerations": 1}),
+            [["obviously"], ["obviously again"]]
+        )
+
+        actions = [json.loads(e["data"])["action"] for e in events if e["event"] == "violation"]
+        assert len(prompts) == 2
+        assert actions == ["regenerate", "flag"]
+        assert turn["content"] == "obviously again"
+        assert turn["metadata"]["regenerations"] == 1
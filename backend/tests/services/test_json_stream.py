@@ -0,0 +1,49 @@
+"""
+Tests for the incremental JSON object parser
+"""
+import json
+
+from app.graph.json_stream import IncrementalJSONParser
+
+
+def _feed_all(text, chunk_size):
+    parser = IncrementalJSONParser()
+    completed = []
+    for i in range(0, len(text), chunk_size):
+        completed.extend(parser.feed(text[i:i + chunk_size]))
+    return parser, completed
+
+
+class TestIncrementalJSONParser:
+    """Tests for IncrementalJSONParser class."""
+
+    def test_reports_members_in_order_for_any_chunking(self):
+        """Members should be reported once each, regardless of chunk size."""
+        data = {"a": {"x": [1, {"y": 2}]}, "b": "text, with {braces}", "c": 3, "d": True}
+        for chunk_size in (1, 2, 5, 1000):
+            parser, completed = _feed_all(json.dumps(data), chunk_size)
+
+            assert parser.complete
+            assert completed == list(data.items())
+
+    def test_nested_member_completes_when_it_closes(self):
+        """A nested object should be reported as soon as its brace closes."""
+        parser = IncrementalJSONParser()
+
+        assert parser.feed('{"delivery": {"clarity": 9') == []
+        assert parser.feed('}') == [("delivery", {"clarity": 9})]
+        assert parser.feed(', "total": 4') == []
+        assert parser.feed('5}') == [("total", 45)]
+
+    def test_ignores_text_around_object(self):
+        """Chatter before and after the object should be skipped."""
+        parser, completed = _feed_all('Scores: {"total": 1} Thanks! {"ignored": 2}', 3)
+
+        assert parser.members == {"total": 1}
+        assert completed == [("total", 1)]
+
+    def test_handles_escaped_quotes(self):
+        """Escaped quotes inside strings should not end the string."""
+        parser, _ = _feed_all(r'{"j": "said \"}, {\" loudly", "n": 1}', 4)
+
+        assert parser.members == {"j": 'said "}, {" loudly', "n": 1}
@@ -0,0 +1,142 @@
+"""
+Tests for Prometheus metrics
+"""
+import asyncio
+
+import httpx
+import pytest
+from httpx import AsyncClient, ASGITransport
+from unittest.mock import AsyncMock, patch
+
+from app.core import metrics
+from app.core.metrics import Registry, track_sse
+from app.graph.engine import node_phase_label
+from app.graph.nodes.utils import call_ollama_with_retry, parse_json_scores
+from app.graph.plan import build_execution_plan
+from app.main import app
+
+
+class TestRegistry:
+    """Tests for the text exposition format."""
+
+    def test_renders_counters_gauges_and_histograms(self):
+        registry = Registry()
+        calls = registry.counter("calls_total", "Calls", ("model",))
+        active = registry.gauge("active", "Active")
+        latency = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+
+        calls.inc(model='llama"3')
+        calls.inc(2, model='llama"3')
+        active.inc()
+        active.inc()
+        active.dec()
+        latency.observe(0.05)
+        latency.observe(0.5)
+
+        lines = registry.render().splitlines()
+
+        assert "# TYPE calls_total counter" in lines
+        assert 'calls_total{model="llama\\"3"} 3' in lines
+        assert "active 1" in lines
+        assert 'latency_seconds_bucket{le="0.1"} 1' in lines
+        assert 'latency_seconds_bucket{le="1"} 2' in lines
+        assert 'latency_seconds_bucket{le="+Inf"} 2' in lines
+        assert "latency_seconds_sum 0.55" in lines
+        assert "latency_seconds_count 2" in lines
+
+    def test_callback_gauges_are_read_when_scraped(self):
+        registry = Registry()
+        pool = {"size": 10}
+        registry.gauge("pool", "Pool", ("state",), callback=lambda: [({"state": "size"}, pool["size"])])
+
+        pool["size"] = 12
+
+        assert 'pool{state="size"} 12' in registry.render().splitlines()
+
+
+class TestInstrumentation:
+    """Tests for metrics recorded by Ollama wrappers, parsing and streams."""
+
+    @pytest.mark.asyncio
+    async def test_call_records_latency_speed_and_retries(self, model_residency):
+        """Retries and the successful call are labelled with the model and phase."""
+        retries = metrics.OLLAMA_RETRIES.value(model="metrics-model", reason="connect")
+
+        attempts = iter([httpx.ConnectError("refused")])
+
+        async def flaky_call(**kwargs):
+            for error in attempts:
+                raise error
+            kwargs["stats"].update({"eval_count": 50, "eval_duration": 1_000_000_000})
+            return "ok"
+
+        token = metrics.current_phase.set("opening")
+        try:
+            with patch("app.graph.nodes.utils.call_ollama", side_effect=flaky_call):
+                with patch("app.graph.nodes.utils.asyncio.sleep", AsyncMock()):
+                    assert await call_ollama_with_retry(model="metrics-model", prompt="Hi") == "ok"
+        finally:
+            metrics.current_phase.reset(token)
+
+        assert metrics.OLLAMA_RETRIES.value(model="metrics-model", reason="connect") == retries + 1
+        assert metrics.OLLAMA_CALL_SECONDS.count(model="metrics-model", phase="opening") == 1
+        assert metrics.OLLAMA_TOKENS_PER_SECOND.count(model="metrics-model", phase="opening") == 1
+
+    @pytest.mark.asyncio
+    async def test_final_failure_is_counted(self, model_residency):
+        failures = metrics.OLLAMA_FAILURES.value(model="metrics-model", reason="timeout")
+
+        with patch("app.graph.nodes.utils.call_ollama",
+                   AsyncMock(side_effect=httpx.ReadTimeout("slow"))):
+            with patch("app.graph.nodes.utils.asyncio.sleep", AsyncMock()):
+                with pytest.raises(httpx.TimeoutException):
+                    await call_ollama_with_retry(model="metrics-model", prompt="Hi", max_retries=2)
+
+        assert metrics.OLLAMA_FAILURES.value(model="metrics-model", reason="timeout") == failures + 1
+
+    def test_parse_fallback_is_counted(self):
+        fallbacks = metrics.SCORE_PARSE_FALLBACKS.value()
+
+        parse_json_scores("no json here")
+
+        assert metrics.SCORE_PARSE_FALLBACKS.value() == fallbacks + 1
+
+    @pytest.mark.asyncio
+    async def test_sse_subscribers_tracked_until_stream_closes(self):
+        before = metrics.SSE_SUBSCRIBERS.value(stream="test")
+
+        async def events():
+            yield {"event": "token", "data": "a"}
+            await asyncio.sleep(3600)
+
+        stream = track_sse(events(), "test")
+        await stream.__anext__()
+        assert metrics.SSE_SUBSCRIBERS.value(stream="test") == before + 1
+
+        await stream.aclose()
+        assert metrics.SSE_SUBSCRIBERS.value(stream="test") == before
+
+    def test_node_phase_labels(self):
+        plan = build_execution_plan({"rounds": 3})
+
+        labels = {node_phase_label(plan[name]) for name in plan.order}
+
+        assert labels == {
+            "judge_intro", "opening", "rebuttal", "summary", "judge_verdict",
+            "score_opening", "score_rebuttal", "score_summary",
+        }
+
+
+class TestMetricsEndpoint:
+    """Tests for GET /metrics."""
+
+    @pytest.mark.asyncio
+    async def test_exposes_prometheus_text(self):
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE arena_ollama_call_duration_seconds histogram" in response.text
+        assert "arena_db_pool_connections" in response.text
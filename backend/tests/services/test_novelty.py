@@ -0,0 +1,84 @@
+"""
+Tests for lexical new argument detection
+"""
+from app.graph.novelty import detect_new_content, split_sentences
+from app.graph.prompts.judge_prompts import build_scoring_prompt_summary
+
+PREVIOUS_TURNS = [
+    "Remote work improves productivity because employees avoid long commutes. "
+    "Studies from Stanford show remote workers complete more tasks per day.",
+    "Remote work harms collaboration since spontaneous hallway conversations disappear. "
+    "Junior staff lose mentoring opportunities when teams are distributed.",
+]
+
+
+class TestDetectNewContent:
+    """Tests for detect_new_content function."""
+
+    def test_restated_points_are_not_flagged(self):
+        """Sentences reusing earlier wording should pass."""
+        summary = (
+            "Remote work improves productivity because employees avoid long commutes. "
+            "Junior staff lose mentoring opportunities, as my opponent admitted."
+        )
+
+        assert detect_new_content(summary, PREVIOUS_TURNS) == []
+
+    def test_new_claim_is_flagged(self):
+        """A sentence with unseen wording should be flagged with its scores."""
+        summary = (
+            "Remote work improves productivity because employees avoid long commutes. "
+            "Furthermore, carbon emissions from office heating drop dramatically in winter."
+        )
+
+        flagged = detect_new_content(summary, PREVIOUS_TURNS)
+
+        assert [span["text"] for span in flagged] == [
+            "Furthermore, carbon emissions from office heating drop dramatically in winter."
+        ]
+        assert flagged[0]["shingle_containment"] == 0
+        assert flagged[0]["new_word_ratio"] >= 0.5
+
+    def test_short_sentences_are_ignored(self):
+        """Signposting and greetings should never be flagged."""
+        assert detect_new_content("Thank you, judges. In conclusion:", PREVIOUS_TURNS) == []
+
+    def test_without_previous_turns_everything_substantial_is_new(self):
+        """With no prior turns every substantial sentence is new."""
+        flagged = detect_new_content(PREVIOUS_TURNS[0], [])
+
+        assert len(flagged) == 2
+
+    def test_split_sentences_handles_lines(self):
+        """Sentence ends and line breaks should both split."""
+        assert split_sentences("One. Two!\n- Three") == ["One.", "Two!", "- Three"]
+
+
+class TestSummaryScoringPrompt:
+    """Tests for build_scoring_prompt_summary with flagged spans."""
+
+    def test_flagged_spans_replace_transcript(self):
+        """Only flagged spans should be sent to the judge."""
+        prompt = build_scoring_prompt_summary(
+            turn_content="Summary text",
+            rubric={},
+            agent_name="A",
+            all_previous_turns=PREVIOUS_TURNS,
+            flagged_spans=["Carbon emissions drop."]
+        )
+
+        assert "POTENTIALLY NEW CONTENT" in prompt
+        assert "Carbon emissions drop." in prompt
+        assert "Stanford" not in prompt
+
+    def test_transcript_used_without_flagged_spans(self):
+        """The full transcript is kept when lexical detection is not used."""
+        prompt = build_scoring_prompt_summary(
+            turn_content="Summary text",
+            rubric={},
+            agent_name="A",
+            all_previous_turns=PREVIOUS_TURNS
+        )
+
+        assert "PREVIOUS DEBATE TURNS" in prompt
+        assert "Stanford" in prompt
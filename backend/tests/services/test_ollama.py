@@ -5,7 +5,7 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 
-from app.services.ollama import call_ollama, stream_ollama, get_model_info
+from app.services.ollama import call_ollama, stream_ollama, stream_ollama_chat, get_model_info
 
 
 class TestCallOllama:
@@ -96,6 +96,65 @@ class TestCallOllama:
 
             assert result == ""
 
+    @pytest.mark.asyncio
+    async def test_collects_stats_when_requested(self):
+        """call_ollama should copy Ollama's counters into the stats dict."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {
+            "response": "Text",
+            "done": True,
+            "prompt_eval_count": 42,
+            "eval_count": 7,
+        }
+        mock_response.raise_for_status = MagicMock()
+
+        with patch('httpx.AsyncClient') as MockClient:
+            mock_client = AsyncMock()
+            mock_client.post = AsyncMock(return_value=mock_response)
+            MockClient.return_value.__aenter__.return_value = mock_client
+
+            stats = {}
+            await call_ollama("llama3", "Test prompt", stats=stats)
+
+            assert stats == {"prompt_eval_count": 42, "eval_count": 7}
+
+    @pytest.mark.asyncio
+    async def test_sends_response_format(self):
+        """call_ollama should pass response_format as Ollama's format option."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"response": "{}"}
+        mock_response.raise_for_status = MagicMock()
+        schema = {"type": "object"}
+
+        with patch('httpx.AsyncClient') as MockClient:
+            mock_client = AsyncMock()
+            mock_client.post = AsyncMock(return_value=mock_response)
+            MockClient.return_value.__aenter__.return_value = mock_client
+
+            await call_ollama("llama3", "Test prompt", response_format=schema)
+
+            payload = mock_client.post.call_args.kwargs["json"]
+            assert payload["format"] == schema
+
+
+def _mock_stream_client(MockClient, lines):
+    """Configure a patched httpx.AsyncClient to stream the given lines."""
+    async def mock_aiter_lines():
+        for line in lines:
+            yield line
+
+    mock_response = MagicMock()
+    mock_response.raise_for_status = MagicMock()
+    mock_response.aiter_lines = mock_aiter_lines
+
+    mock_client = AsyncMock()
+    mock_stream_context = AsyncMock()
+    mock_stream_context.__aenter__.return_value = mock_response
+    mock_stream_context.__aexit__.return_value = None
+    mock_client.stream = MagicMock(return_value=mock_stream_context)
+    MockClient.return_value.__aenter__.return_value = mock_client
+    return mock_client
+
 
 class TestStreamOllama:
     """Tests for stream_ollama function."""
@@ -195,6 +254,46 @@ class TestStreamOllama:
                     pass
 
 
+    @pytest.mark.asyncio
+    async def test_collects_stats_from_done_frame(self):
+        """stream_ollama should fill stats from the final frame."""
+        with patch('httpx.AsyncClient') as MockClient:
+            _mock_stream_client(MockClient, [
+                '{"response": "Hi", "done": false}',
+                '{"response": "", "done": true, "prompt_eval_count": 12, "eval_duration": 5}',
+            ])
+
+            stats = {}
+            async for _ in stream_ollama("llama3", "Test", stats=stats):
+                pass
+
+            assert stats == {"prompt_eval_count": 12, "eval_duration": 5}
+
+
+class TestStreamOllamaChat:
+    """Tests for stream_ollama_chat function."""
+
+    @pytest.mark.asyncio
+    async def test_yields_message_content(self):
+        """stream_ollama_chat should yield message content chunks from /api/chat."""
+        with patch('httpx.AsyncClient') as MockClient:
+            mock_client = _mock_stream_client(MockClient, [
+                '{"message": {"role": "assistant", "content": "Hello "}, "done": false}',
+                '{"message": {"role": "assistant", "content": "World"}, "done": true, '
+                '"prompt_eval_count": 3}',
+            ])
+            messages = [{"role": "user", "content": "Hi"}]
+
+            stats = {}
+            chunks = [c async for c in stream_ollama_chat("llama3", messages, stats=stats)]
+
+            assert chunks == ["Hello ", "World"]
+            assert stats == {"prompt_eval_count": 3}
+            args, kwargs = mock_client.stream.call_args
+            assert args[1].endswith("/api/chat")
+            assert kwargs["json"]["messages"] == messages
+
+
 class TestGetModelInfo:
     """Tests for get_model_info function."""
 
@@ -0,0 +1,203 @@
+"""
+Tests for judge panel scoring
+"""
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.graph.nodes.judge import _request_panel_scores, score_node, verdict_node
+from app.graph.panel import aggregate, aggregate_scores, panel_aggregation, score_variance, trimmed_mean
+from app.graph.plan import build_execution_plan
+
+
+def _opening(total, logic=7, new_arguments=False, phrases=()):
+    return {
+        "argumentation": {"logic": logic, "total": 3 * logic},
+        "total": total,
+        "new_arguments_detected": new_arguments,
+        "forbidden_phrases_detected": list(phrases),
+        "justification": f"total {total}",
+    }
+
+
+def _judge(agent_id, model):
+    return {"agent_id": agent_id, "name": agent_id, "model": model, "persona_json": {}}
+
+
+def _make_state(judges, config=None):
+    persona = {"persona_json": {}, "params_json": {}}
+    turns = [
+        {"turn_id": f"t-{phase}", "agent_id": "x", "phase": phase, "role": "debater",
+         "content": f"{phase} speech", "targets": [], "metadata": {}}
+        for phase in ["opening_a", "opening_b", "summary_a", "summary_b"]
+    ]
+    return {
+        "topic": "Topic",
+        "position_a": "FOR",
+        "position_b": "AGAINST",
+        "agent_a": {**persona, "agent_id": "a", "name": "A", "model": "llama3"},
+        "agent_b": {**persona, "agent_id": "b", "name": "B", "model": "llama3"},
+        "agent_j": judges[0],
+        "judge_panel": judges,
+        "config": config or {"rounds": 1},
+        "rubric": {},
+        "turns": turns,
+        "scores_a": {"total": 80},
+        "scores_b": {"total": 60},
+    }
+
+
+async def _discard_event(event):
+    return None
+
+
+class TestAggregation:
+    """Tests for combining per-judge scores."""
+
+    def test_methods(self):
+        values = [4, 6, 7, 30]
+        assert aggregate(values, "mean") == 11.75
+        assert aggregate(values, "median") == 6.5
+        assert aggregate(values, "trimmed_mean") == 6.5
+        # Fewer than three judges: nothing is trimmed
+        assert trimmed_mean([4, 30]) == 17
+
+    def test_unknown_method_falls_back_to_median(self):
+        assert panel_aggregation({"panel_aggregation": "mode"}) == "median"
+        assert panel_aggregation({"panel_aggregation": "mean"}) == "mean"
+
+    def test_scores_are_combined_per_field(self):
+        """Numbers are aggregated, flags voted, lists merged, text from the primary."""
+        scores = [
+            _opening(40, logic=6, new_arguments=True, phrases=["x"]),
+            _opening(50, logic=8, phrases=["y"]),
+            _opening(45, logic=7, new_arguments=True),
+        ]
+
+        combined = aggregate_scores(scores, "median")
+
+        assert combined["total"] == 45
+        assert combined["argumentation"] == {"logic": 7, "total": 21}
+        assert combined["new_arguments_detected"] is True
+        assert combined["forbidden_phrases_detected"] == ["x", "y"]
+        assert combined["justification"] == "total 40"
+
+    def test_variance_of_totals(self):
+        variance = score_variance([_opening(40, logic=6), _opening(50, logic=8)])
+
+        assert variance == {"total": 25, "argumentation": 9}
+
+
+class TestPanelScores:
+    """Tests for concurrent panel score requests."""
+
+    @pytest.mark.asyncio
+    async def test_judges_are_called_concurrently(self):
+        """All judges should be in flight at once, each with its model's prompt."""
+        judges = [_judge("j1", "llama3"), _judge("j2", "qwen2.5"), _judge("j3", "mistral")]
+        running, peak, prompts = 0, 0, {}
+
+        async def request(stage, model, prompt, system_prompt, on_partial, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            prompts[model] = prompt
+            return _opening({"llama3": 40, "qwen2.5": 50, "mistral": 60}[model])
+
+        with patch("app.graph.nodes.judge._request_scores", side_effect=request):
+            scores, panel = await _request_panel_scores(
+                "opening", judges, {j["model"]: f"prompt for {j['model']}" for j in judges},
+                "system", "mean"
+            )
+
+        assert peak == 3
+        assert prompts["qwen2.5"] == "prompt for qwen2.5"
+        assert scores["total"] == 50
+        assert panel["variance"]["total"] == pytest.approx(200 / 3)
+        assert [j["agent_id"] for j in panel["judges"]] == ["j1", "j2", "j3"]
+
+    @pytest.mark.asyncio
+    async def test_failed_judges_are_left_out(self):
+        """Unparseable and failing panel judges should not count."""
+        judges = [_judge("j1", "llama3"), _judge("j2", "qwen2.5"), _judge("j3", "mistral")]
+        replies = {
+            "llama3": _opening(40),
+            "qwen2.5": {**_opening(7), "parse_failed": True},
+            "mistral": RuntimeError("model not found"),
+        }
+
+        async def request(stage, model, prompt, system_prompt, on_partial, **kwargs):
+            if isinstance(replies[model], Exception):
+                raise replies[model]
+            return replies[model]
+
+        with patch("app.graph.nodes.judge._request_scores", side_effect=request):
+            scores, panel = await _request_panel_scores(
+                "opening", judges, {j["model"]: "prompt" for j in judges}, "system", "median"
+            )
+
+        assert scores["total"] == 40
+        assert "parse_failed" not in scores
+        assert panel["counted"] == 1
+        assert len(panel["judges"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_primary_judge_failure_is_raised(self):
+        judges = [_judge("j1", "llama3"), _judge("j2", "qwen2.5")]
+
+        with patch("app.graph.nodes.judge._request_scores",
+                   AsyncMock(side_effect=[RuntimeError("down"), _opening(40)])):
+            with pytest.raises(RuntimeError):
+                await _request_panel_scores("opening", judges, {"llama3": "p", "qwen2.5": "p"},
+                                            "system", "median")
+
+
+class TestPanelNodes:
+    """Tests for the scoring and verdict nodes in panel mode."""
+
+    @pytest.mark.asyncio
+    async def test_score_node_records_panel_metadata(self):
+        """The turn keeps the aggregated scores, each judge's scores and the variance."""
+        plan = build_execution_plan({"rounds": 1})
+        state = _make_state([_judge("j1", "llama3"), _judge("j2", "qwen2.5")],
+                            {"rounds": 1, "panel_aggregation": "mean"})
+        replies = {"llama3": _opening(40), "qwen2.5": _opening(50)}
+
+        async def request(stage, model, prompt, system_prompt, on_partial, **kwargs):
+            return replies[model]
+
+        with patch("app.graph.nodes.judge._request_scores", side_effect=request):
+            update = await score_node(plan["score_opening_a"], plan, state, _discard_event)
+
+        scored, = update["turns"]
+        assert scored["turn_id"] == state["turns"][0]["turn_id"]
+        assert "scores" not in state["turns"][0]["metadata"]
+        metadata = scored["metadata"]
+        assert metadata["scores"]["total"] == 45
+        assert metadata["panel"]["aggregation"] == "mean"
+        assert metadata["panel"]["variance"]["total"] == 25
+        assert update["scores_a"]["total"] == 45
+
+    @pytest.mark.asyncio
+    async def test_verdict_is_written_by_every_judge(self):
+        """The primary verdict is the run's; the others go to the metadata."""
+        plan = build_execution_plan({"rounds": 1})
+        state = _make_state([_judge("j1", "llama3"), _judge("j2", "qwen2.5")])
+
+        async def call(model, **kwargs):
+            return f"verdict of {model}"
+
+        with patch("app.graph.nodes.judge.fit_transcript",
+                   AsyncMock(side_effect=lambda model, turns, reserved: turns)):
+            with patch("app.graph.nodes.judge.call_ollama_with_retry", side_effect=call) as ollama:
+                update = await verdict_node(plan["judge_verdict"], plan, state, _discard_event)
+
+        assert ollama.call_count == 2
+        assert update["verdict"] == "verdict of llama3"
+        assert update["winner"] == "A"
+        panel_verdict, = update["turns"][0]["metadata"]["panel_verdicts"]
+        assert panel_verdict["agent_id"] == "j2"
+        assert panel_verdict["content"] == "verdict of qwen2.5"
@@ -0,0 +1,107 @@
+"""
+Tests for write-behind turn persistence
+"""
+import asyncio
+from uuid import uuid4
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.graph.persistence import TurnWriter
+
+
+def _turn(phase):
+    return {"turn_id": str(uuid4()), "agent_id": "x", "phase": phase, "role": "debater",
+            "content": "text", "targets": [], "metadata": {}}
+
+
+@pytest.fixture
+def write():
+    """Patch the batch write."""
+    with patch("app.graph.persistence.write_turn_batch", AsyncMock()) as mock:
+        yield mock
+
+
+class TestTurnWriter:
+    """Tests for TurnWriter buffering and flushing."""
+
+    @pytest.mark.asyncio
+    async def test_buffers_until_phase_complete(self, write):
+        """Writes should wait for the phase boundary and go out as one batch."""
+        writer = TurnWriter("run", AsyncMock(), mode="write_behind", flush_interval=60)
+        writer.add_turn(_turn("opening_a"))
+        await writer.node_finished(phase_complete=False)
+        assert write.await_count == 0
+
+        writer.add_turn(_turn("opening_b"))
+        await writer.node_finished(phase_complete=True)
+        await writer.close()
+
+        assert write.await_count == 1
+        assert [t["phase"] for t in write.await_args.args[2]] == ["opening_a", "opening_b"]
+
+    @pytest.mark.asyncio
+    async def test_patch_of_pending_turn_is_inserted_with_it(self, write):
+        """Scores patched before the flush should not need an UPDATE."""
+        writer = TurnWriter("run", AsyncMock(), mode="write_behind", flush_interval=60)
+        turn = _turn("opening_a")
+        writer.add_turn(turn)
+
+        writer.patch_metadata(turn["turn_id"], {"scores": {"total": 30}})
+        await writer.close()
+
+        _, _, turns, patches = write.await_args.args
+        assert turns[0]["metadata"] == {"scores": {"total": 30}}
+        assert patches == {}
+        # The state's turn is replaced in the buffer, not modified
+        assert turn["metadata"] == {}
+
+    @pytest.mark.asyncio
+    async def test_patch_of_flushed_turn_is_an_update(self, write):
+        """Turns already written should be patched by turn_id."""
+        writer = TurnWriter("run", AsyncMock(), mode="write_behind", flush_interval=60)
+        turn = _turn("opening_a")
+        writer.add_turn(turn)
+        await writer.flush(wait=True)
+
+        writer.patch_metadata(turn["turn_id"], {"scores": {}})
+        await writer.close()
+
+        assert write.await_args.args[2] == []
+        assert write.await_args.args[3] == {turn["turn_id"]: {"scores": {}}}
+
+    @pytest.mark.asyncio
+    async def test_timer_marks_buffer_due(self, write):
+        """A buffered write older than the flush interval is due."""
+        writer = TurnWriter("run", AsyncMock(), mode="write_behind", flush_interval=0.01)
+        assert writer.seconds_until_due() is None
+
+        writer.add_turn(_turn("opening_a"))
+        await asyncio.sleep(0.02)
+
+        assert writer.seconds_until_due() == 0
+        await writer.node_finished(phase_complete=False)
+        await writer.close()
+        assert write.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_synchronous_flush_waits_for_commit(self, write):
+        """Verdict flushes (and immediate mode) should await the write."""
+        writer = TurnWriter("run", AsyncMock(), mode="write_behind", flush_interval=60)
+        writer.add_turn(_turn("judge_verdict"))
+
+        await writer.node_finished(phase_complete=True, synchronous=True)
+
+        assert write.await_count == 1
+        assert writer.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_background_failure_is_reraised(self, write):
+        """A failed background flush should surface on the next flush."""
+        write.side_effect = RuntimeError("db down")
+        writer = TurnWriter("run", AsyncMock(), mode="write_behind", flush_interval=60)
+        writer.add_turn(_turn("opening_a"))
+        await writer.node_finished(phase_complete=True)
+
+        with pytest.raises(RuntimeError, match="db down"):
+            await writer.close()
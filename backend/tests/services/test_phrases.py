@@ -0,0 +1,95 @@
+"""
+Tests for the precompiled forbidden phrase matcher
+"""
+from app.graph.phrases import PhraseScanner, get_phrase_matcher, matcher_for_persona
+
+
+def _scan(matcher, text, chunk_size):
+    scanner = PhraseScanner(matcher)
+    live = []
+    for i in range(0, len(text), chunk_size):
+        live.extend(scanner.feed(text[i:i + chunk_size]))
+    live.extend(scanner.finish())
+    return scanner, live
+
+
+class TestPhraseMatcher:
+    """Tests for PhraseMatcher and get_phrase_matcher."""
+
+    def test_matcher_is_cached_per_phrase_set(self):
+        """The same phrase set should reuse one compiled matcher."""
+        assert get_phrase_matcher(("a", "b")) is get_phrase_matcher(("a", "b"))
+        assert get_phrase_matcher(("a", "b")) is not get_phrase_matcher(("a", "b"), True)
+
+    def test_reports_matches_in_text_order(self):
+        """Matches for different phrases should be reported by position."""
+        matcher = get_phrase_matcher(("banned", "forbidden"))
+
+        result = matcher.find("Forbidden first, then banned, then FORBIDDEN.")
+
+        assert [v["phrase"] for v in result] == ["forbidden", "banned", "forbidden"]
+
+    def test_prefers_longest_phrase_at_same_position(self):
+        """A longer phrase starting at the same position should win."""
+        matcher = get_phrase_matcher(("bad", "bad idea"))
+
+        assert [v["phrase"] for v in matcher.find("a bad idea")] == ["bad idea"]
+
+    def test_word_boundary_option(self):
+        """word_boundary should skip matches inside longer words."""
+        text = "The ban on banners."
+
+        assert len(get_phrase_matcher(("ban",)).find(text)) == 2
+        assert len(get_phrase_matcher(("ban",), word_boundary=True).find(text)) == 1
+
+    def test_unicode_casefolding(self):
+        """Case folding should match expanded forms and keep original context."""
+        result = get_phrase_matcher(("straße",)).find("Die STRASSE ist lang.")
+
+        assert len(result) == 1
+        assert "STRASSE" in result[0]["context"]
+
+    def test_casefold_can_be_disabled(self):
+        """casefold=False should match case-sensitively."""
+        assert len(get_phrase_matcher(("Bad",), casefold=False).find("bad Bad")) == 1
+
+    def test_matcher_for_persona_reads_options(self):
+        """Persona matching options should select the matcher."""
+        persona = {
+            "forbidden_phrases": ["ban"],
+            "forbidden_phrase_matching": {"word_boundary": True},
+        }
+
+        assert matcher_for_persona(persona).word_boundary is True
+        assert not matcher_for_persona({})
+
+
+class TestPhraseScanner:
+    """Tests for PhraseScanner class."""
+
+    def test_matches_across_chunk_boundaries(self):
+        """Streaming should find the same matches as a full scan."""
+        matcher = get_phrase_matcher(("bad idea", "bad", "straße"), word_boundary=True)
+        text = "A BAD IDEA on the Strasse; badly put, but bad."
+
+        for chunk_size in (1, 2, 3, 7, 100):
+            scanner, live = _scan(matcher, text, chunk_size)
+
+            assert [v["phrase"] for v in live] == ["bad idea", "straße", "bad"]
+            assert scanner.violations == matcher.find(text)
+
+    def test_reports_match_before_stream_ends(self):
+        """A match should be reported once enough text follows it."""
+        scanner = PhraseScanner(get_phrase_matcher(("bad",)))
+
+        assert scanner.feed("this is ba") == []
+        assert [v["phrase"] for v in scanner.feed("d and more text")] == ["bad"]
+        assert scanner.finish() == []
+
+    def test_no_phrases_keeps_text(self):
+        """A scanner without phrases should still collect the text."""
+        scanner = PhraseScanner(get_phrase_matcher(()))
+
+        assert scanner.feed("anything") == []
+        assert scanner.text == "anything"
+        assert scanner.violations == []
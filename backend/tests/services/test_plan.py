@@ -0,0 +1,357 @@
+"""
+Tests for the debate execution plan and its scheduler
+"""
+import asyncio
+import copy
+import json
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.graph.plan import build_execution_plan, phase_name
+from app.graph.engine import run_plan, NodeExecutionError
+from app.graph.graph import create_debate_graph
+
+
+CLASSIC_ORDER = [
+    "judge_intro",
+    "opening_a",
+    "score_opening_a",
+    "opening_b",
+    "score_opening_b",
+    "rebuttal_a",
+    "score_rebuttal_a",
+    "rebuttal_b",
+    "score_rebuttal_b",
+    "summary_a",
+    "score_summary_a",
+    "summary_b",
+    "score_summary_b",
+    "judge_verdict",
+]
+
+
+class TestBuildExecutionPlan:
+    """Tests for build_execution_plan function."""
+
+    def test_default_config_matches_classic_flow(self):
+        """Default config should produce the classic 14-node BP Lite order."""
+        plan = build_execution_plan({"rounds": 3, "max_tokens_per_turn": 1024})
+
+        assert plan.order == CLASSIC_ORDER
+        assert plan.rebuttal_rounds == 1
+
+    def test_empty_config_uses_defaults(self):
+        """Missing config should fall back to three rounds."""
+        assert build_execution_plan(None).order == CLASSIC_ORDER
+
+    def test_extra_rounds_add_rebuttal_rounds(self):
+        """Each extra round should add a numbered rebuttal round."""
+        plan = build_execution_plan({"rounds": 5})
+
+        assert plan.rebuttal_rounds == 3
+        for name in ["rebuttal_a", "rebuttal2_a", "rebuttal3_b", "score_rebuttal3_b"]:
+            assert name in plan
+        assert "rebuttal_a" in plan["rebuttal2_b"]["depends_on"]
+        assert "rebuttal_b" in plan["rebuttal2_a"]["depends_on"]
+
+    def test_two_rounds_skip_rebuttals(self):
+        """Two rounds should go straight from openings to summaries."""
+        plan = build_execution_plan({"rounds": 2})
+
+        assert plan.rebuttal_rounds == 0
+        assert not any(name.startswith("rebuttal") for name in plan.order)
+
+    def test_rounds_are_clamped(self):
+        """Out-of-range or invalid rounds should be clamped."""
+        assert build_execution_plan({"rounds": 0}).rebuttal_rounds == 0
+        assert build_execution_plan({"rounds": 99}).rebuttal_rounds == 8
+        assert build_execution_plan({"rounds": "bad"}).rebuttal_rounds == 1
+
+    def test_cross_examination_precedes_rebuttals(self):
+        """Cross-examination nodes should sit between openings and rebuttals."""
+        plan = build_execution_plan({"rounds": 3, "cross_examination": True})
+
+        assert "cross_exam_a" in plan and "cross_exam_b" in plan
+        assert set(plan["cross_exam_a"]["depends_on"]) == {"opening_a", "opening_b"}
+        assert "cross_exam_b" in plan["rebuttal_a"]["depends_on"]
+        assert "score_cross_exam_a" not in plan
+
+    def test_per_turn_scoring_can_be_disabled(self):
+        """Without per-turn scoring only summaries should be scored."""
+        plan = build_execution_plan({"rounds": 3, "score_each_turn": False})
+
+        score_nodes = [n for n in plan.order if plan[n]["kind"] == "score"]
+        assert score_nodes == ["score_summary_a", "score_summary_b"]
+
+    def test_independent_nodes_share_parallel_group(self):
+        """Both openings follow the judge intro and can run together."""
+        groups = build_execution_plan({"rounds": 3}).parallel_groups()
+
+        assert groups[0] == ["judge_intro"]
+        assert groups[1] == ["opening_a", "opening_b"]
+        assert groups[-1] == ["judge_verdict"]
+
+    def test_summary_b_depends_on_summary_a(self):
+        """B's summary answers A's summary, so it must wait for it."""
+        plan = build_execution_plan({"rounds": 3})
+
+        assert "summary_a" in plan["summary_b"]["depends_on"]
+        assert "summary_b" not in plan.ancestors("summary_a")
+
+    def test_ready_respects_dependencies(self):
+        """ready() should only return nodes whose dependencies are done."""
+        plan = build_execution_plan({"rounds": 3})
+
+        assert plan.ready([]) == ["judge_intro"]
+        assert plan.ready(["judge_intro"]) == ["opening_a", "opening_b"]
+        ready = plan.ready(["judge_intro", "opening_a", "opening_b"])
+        assert ready == ["score_opening_a", "score_opening_b", "rebuttal_a", "rebuttal_b"]
+
+    def test_phase_name(self):
+        """phase_name should keep historical names for the first round."""
+        assert phase_name("rebuttal", "A", 1) == "rebuttal_a"
+        assert phase_name("rebuttal", "B", 2) == "rebuttal2_b"
+        assert phase_name("summary", "A") == "summary_a"
+
+
+# Satisfies every stage's score model (extra criteria are ignored)
+VALID_SCORES = json.dumps({
+    "argumentation": {"logic": 5, "originality": 5, "evidence": 5, "consistency": 5, "synthesis": 5},
+    "delivery": {"clarity": 5, "structure": 5, "impact": 5},
+    "strategy": {"position_setup": 5, "weighing": 5},
+    "rebuttal": {"targeting": 5, "effectiveness": 5, "reconstruction": 5},
+    "total": 30,
+    "new_arguments_detected": False,
+})
+
+
+def _make_state(config=None):
+    agent = {
+        "agent_id": "agent",
+        "name": "Agent",
+        "model": "llama3",
+        "persona_json": {},
+        "params_json": {},
+    }
+    return {
+        "run_id": "00000000-0000-0000-0000-000000000000",
+        "topic": "Topic",
+        "position_a": "FOR",
+        "position_b": "AGAINST",
+        "agent_a": {**agent, "agent_id": "a", "name": "A"},
+        "agent_b": {**agent, "agent_id": "b", "name": "B"},
+        "agent_j": {**agent, "agent_id": "j", "name": "J"},
+        "config": config or {"rounds": 3},
+        "rubric": {},
+        "current_phase": "judge_intro",
+        "turns": [],
+        "scores_a": {},
+        "scores_b": {},
+        "winner": None,
+        "verdict": None,
+        "status": "pending",
+    }
+
+
+class TestRunPlan:
+    """Tests for the engine's DAG scheduler."""
+
+    @pytest.fixture
+    def ollama(self):
+        """Patch Ollama calls and persistence used by the executor."""
+        async def fake_stream(**kwargs):
+            yield "chunk"
+
+        async def fake_score_stream(**kwargs):
+            for i in range(0, len(VALID_SCORES), 16):
+                yield VALID_SCORES[i:i + 16]
+
+        with patch("app.graph.nodes.debater.stream_ollama_with_retry", side_effect=fake_stream), \
+             patch("app.graph.nodes.judge.stream_ollama_with_retry", side_effect=fake_score_stream), \
+             patch("app.graph.nodes.judge.call_ollama_with_retry",
+                   AsyncMock(return_value=VALID_SCORES)) as call, \
+             patch("app.graph.persistence.write_turn_batch", AsyncMock()) as write, \
+             patch("app.graph.budget.get_model_info", AsyncMock(return_value=None)):
+            yield {"call": call, "write": write}
+
+    @pytest.mark.asyncio
+    async def test_executes_every_node(self, ollama):
+        """_run_plan should run all nodes and persist every turn."""
+        plan = build_execution_plan({"rounds": 3})
+        events = []
+
+        async def emit(event):
+            events.append(event)
+
+        state = await run_plan(plan, _make_state(), AsyncMock(), emit)
+
+        assert [t["phase"] for t in state["turns"] if t["role"] == "debater"] == [
+            "opening_a", "opening_b", "rebuttal_a", "rebuttal_b", "summary_a", "summary_b"
+        ]
+        written = [t for c in ollama["write"].await_args_list for t in c.args[2]]
+        assert [t["phase"] for t in written] == [t["phase"] for t in state["turns"]]
+        # Batched per phase (intro, openings, rebuttals, summaries, verdict)
+        assert ollama["write"].await_count <= 5
+        assert written[-1]["phase"] == "judge_verdict"
+        assert state["status"] == "completed"
+        # Three scored turns per side, 30 points each
+        assert state["scores_a"]["total"] == 90
+        assert state["scores_b"]["total"] == 90
+        assert sum(e["event"] == "phase_start" for e in events) == len(plan)
+
+    @pytest.mark.asyncio
+    async def test_records_node_timing_and_run_rollup(self, ollama):
+        """Turns get the executor's timing and Ollama counters; the run gets a rollup."""
+        async def stream_with_stats(**kwargs):
+            yield "chunk"
+            kwargs["stats"].update(eval_count=50, eval_duration=500_000_000, load_duration=2_000_000)
+
+        plan = build_execution_plan({"rounds": 2})
+        with patch("app.graph.nodes.debater.stream_ollama_with_retry", side_effect=stream_with_stats):
+            state = await run_plan(plan, _make_state({"rounds": 2}), AsyncMock())
+
+        opening = next(t for t in state["turns"] if t["phase"] == "opening_a")
+        assert opening["metadata"]["timing"]["time_to_first_token_ms"] is not None
+        assert opening["metadata"]["score_timing"]["latency_ms"] >= 0
+        assert "score_ollama_stats" in opening["metadata"]
+
+        timing = state["timing"]
+        assert set(timing["nodes"]) == set(plan.order)
+        assert timing["by_kind"]["debater"]["nodes"] == 4
+        assert timing["by_kind"]["debater"]["ollama"]["eval_count"] == 200
+        assert timing["ollama"]["tokens_per_second"] == 100
+        assert timing["ollama"]["load_ms"] == 8
+        json.dumps(timing)
+
+    @pytest.mark.asyncio
+    async def test_persisted_turns_keep_timing_and_scores(self, ollama):
+        """Buffered turns are never modified; scores and timing reach the rows as patches."""
+        snapshots = []
+
+        async def write(db, run_id, turns, patches):
+            snapshots.append(copy.deepcopy((turns, patches)))
+
+        ollama["write"].side_effect = write
+        plan = build_execution_plan({"rounds": 2})
+        state = await run_plan(plan, _make_state({"rounds": 2}), AsyncMock())
+
+        # Nothing handed to the writer was changed after the write
+        assert [c.args[2:] for c in ollama["write"].await_args_list] == snapshots
+        rows = {}
+        for turns, patches in snapshots:
+            rows.update({t["turn_id"]: t["metadata"] for t in turns})
+            rows.update(patches)
+        for turn in state["turns"]:
+            assert rows[turn["turn_id"]] == turn["metadata"]
+        opening = rows[state["turns"].by_phase("opening_a")["turn_id"]]
+        assert {"timing", "scores", "score_timing", "score_ollama_stats"} <= set(opening)
+
+    @pytest.mark.asyncio
+    async def test_immediate_mode_flushes_every_node(self, ollama):
+        """persistence_mode=immediate should commit after each node."""
+        plan = build_execution_plan({"rounds": 3})
+
+        async def emit(event):
+            pass
+
+        await run_plan(plan, _make_state({"rounds": 3, "persistence_mode": "immediate"}),
+                       AsyncMock(), emit)
+
+        assert ollama["write"].await_count == len(plan)
+
+    @pytest.mark.asyncio
+    async def test_sequential_cap_keeps_canonical_order(self, ollama):
+        """max_parallel_nodes=1 should reproduce the classic sequential order."""
+        plan = build_execution_plan({"rounds": 3})
+        started = []
+
+        async def emit(event):
+            if event["event"] == "phase_start":
+                started.append(event["data"])
+
+        await run_plan(plan, _make_state({"rounds": 3, "max_parallel_nodes": 1}), AsyncMock(), emit)
+
+        assert [json.loads(s)["phase"] for s in started] == CLASSIC_ORDER
+
+    @pytest.mark.asyncio
+    async def test_sequential_order_ignores_model_residency(self, ollama, model_residency):
+        """One node at a time should keep the canonical order even with mixed, resident models."""
+        plan = build_execution_plan({"rounds": 3})
+        state = _make_state({"rounds": 3})
+        for side, model in (("agent_a", "model-a"), ("agent_b", "model-b"), ("agent_j", "model-j")):
+            state[side] = {**state[side], "model": model}
+        # Another debate just used B's model
+        model_residency.record_call("model-b", {})
+        started = []
+
+        async def stream(**kwargs):
+            model_residency.record_call(kwargs["model"], {})
+            yield "chunk"
+
+        async def emit(event):
+            if event["event"] == "phase_start":
+                started.append(json.loads(event["data"])["phase"])
+
+        with patch("app.graph.nodes.debater.stream_ollama_with_retry", side_effect=stream):
+            await run_plan(plan, state, AsyncMock(), emit)
+
+        assert started == CLASSIC_ORDER == plan.order
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("max_parallel_nodes, expected_peak", [(None, 1), (0, 2)])
+    async def test_independent_nodes_run_concurrently_when_opted_in(self, ollama, max_parallel_nodes, expected_peak):
+        """Nodes without mutual dependencies overlap only with parallelism enabled (default: one at a time)."""
+        config = {"rounds": 2}
+        if max_parallel_nodes is not None:
+            config["max_parallel_nodes"] = max_parallel_nodes
+        plan = build_execution_plan(config)
+        in_flight = 0
+        peak = 0
+
+        async def slow_stream(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            yield "chunk"
+
+        async def emit(event):
+            pass
+
+        with patch("app.graph.nodes.debater.stream_ollama_with_retry", side_effect=slow_stream):
+            await run_plan(plan, _make_state(config), AsyncMock(), emit)
+
+        assert peak == expected_peak
+
+    @pytest.mark.asyncio
+    async def test_node_failure_reports_phase(self, ollama):
+        """A failing node should surface as NodeExecutionError with its phase."""
+        plan = build_execution_plan({"rounds": 3, "max_parallel_nodes": 1})
+        ollama["call"].side_effect = RuntimeError("judge down")
+
+        async def emit(event):
+            pass
+
+        with pytest.raises(NodeExecutionError) as exc_info:
+            await run_plan(plan, _make_state({"rounds": 3, "max_parallel_nodes": 1}),
+                            AsyncMock(), emit)
+
+        assert exc_info.value.phase == "judge_intro"
+        assert "judge down" in str(exc_info.value)
+
+    @pytest.mark.asyncio
+    async def test_langgraph_graph_runs_same_nodes(self, ollama):
+        """The compiled LangGraph graph should execute the shared node implementations."""
+        graph = create_debate_graph({"rounds": 4, "cross_examination": True})
+
+        state = await graph.ainvoke(_make_state({"rounds": 4, "cross_examination": True}))
+
+        phases = [t["phase"] for t in state["turns"]]
+        assert phases.count("judge_verdict") == 1
+        for phase in ["cross_exam_a", "rebuttal2_b", "summary_b"]:
+            assert phase in phases
+        # Two openings, two rebuttal rounds and one summary scored per side
+        assert state["scores_a"]["total"] == 120
+        assert state["winner"] == "DRAW"
+        ollama["write"].assert_not_awaited()
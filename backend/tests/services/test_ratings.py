@@ -0,0 +1,156 @@
+"""
+Tests for the Elo ratings
+"""
+from uuid import uuid4
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from sqlalchemy.dialects import postgresql
+
+from app.core.config import settings
+from app.models.rating import AgentRating
+from app.models.run import Run
+from app.services.ratings import (
+    apply_result,
+    expected_score,
+    new_record,
+    recompute_ratings,
+    record_result,
+    replay_results,
+)
+
+
+def _completed_run(agent_a_id, agent_b_id, winner):
+    return Run(
+        run_id=uuid4(), agent_a_id=agent_a_id, agent_b_id=agent_b_id, agent_j_id=uuid4(),
+        status="completed", result_json={"winner": winner},
+    )
+
+
+class TestElo:
+    """Tests for the rating math."""
+
+    def test_expected_score_is_symmetric(self):
+        """Equal ratings are a coin flip; expectations sum to one."""
+        assert expected_score(1000, 1000) == 0.5
+        assert expected_score(1200, 1000) + expected_score(1000, 1200) == pytest.approx(1.0)
+        assert expected_score(1200, 1000) > 0.5
+
+    def test_win_moves_half_k_between_equal_agents(self):
+        """A win between equal agents transfers K/2 points."""
+        a, b = new_record(uuid4()), new_record(uuid4())
+
+        apply_result(a, b, "A", k_factor=32)
+
+        assert a["rating"] == settings.RATING_INITIAL + 16
+        assert b["rating"] == settings.RATING_INITIAL - 16
+        assert (a["wins"], a["losses"], b["wins"], b["losses"]) == (1, 0, 0, 1)
+        assert a["games"] == b["games"] == 1
+
+    def test_draw_favours_lower_rated_agent(self):
+        """A draw should move the underdog up."""
+        a, b = new_record(uuid4()), new_record(uuid4())
+        a["rating"] = 1200
+
+        apply_result(a, b, "DRAW")
+
+        assert a["rating"] < 1200
+        assert b["rating"] > settings.RATING_INITIAL
+        assert a["draws"] == b["draws"] == 1
+
+    def test_replay_skips_unrated_runs(self):
+        """Runs without a verdict or against oneself should not count."""
+        a, b = uuid4(), uuid4()
+
+        records = replay_results([(a, b, None), (a, a, "A"), (a, b, "B")])
+
+        assert records[a]["games"] == 1
+        assert records[b]["wins"] == 1
+
+
+class TestRecordResult:
+    """Tests for the incremental update."""
+
+    @pytest.mark.asyncio
+    async def test_incremental_updates_match_recompute(self, mock_db):
+        """Folding runs one by one should equal replaying the history."""
+        a, b, c = uuid4(), uuid4(), uuid4()
+        history = [(a, b, "A"), (b, c, "DRAW"), (c, a, "A"), (a, b, "B")]
+        table = {}
+
+        async def execute(stmt, *args, **kwargs):
+            result = MagicMock()
+            result.scalars.return_value.all.return_value = [
+                AgentRating(**record) for record in table.values()
+            ]
+            return result
+
+        def insert_missing(agent_ids):
+            for agent_id in agent_ids:
+                table.setdefault(agent_id, new_record(agent_id))
+
+        def upsert(records):
+            table.update({record["agent_id"]: dict(record) for record in records})
+
+        mock_db.execute = AsyncMock(side_effect=execute)
+        with patch("app.services.ratings._insert_missing", side_effect=insert_missing), \
+             patch("app.services.ratings._upsert", side_effect=upsert):
+            for agent_a_id, agent_b_id, winner in history:
+                await record_result(mock_db, _completed_run(agent_a_id, agent_b_id, winner))
+
+        expected = replay_results(history)
+        for agent_id, record in expected.items():
+            assert table[agent_id]["rating"] == pytest.approx(record["rating"])
+            assert table[agent_id]["games"] == record["games"]
+
+    @pytest.mark.asyncio
+    async def test_run_without_verdict_is_ignored(self, mock_db):
+        """Completed runs without a winner should not query the ratings."""
+        run = _completed_run(uuid4(), uuid4(), None)
+        run.result_json = None
+
+        await record_result(mock_db, run)
+
+        mock_db.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_locks_rows_and_does_not_commit(self, mock_db):
+        """The caller's transaction should own the rating update."""
+        a, b = uuid4(), uuid4()
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = [AgentRating(**new_record(a)), AgentRating(**new_record(b))]
+        mock_db.execute = AsyncMock(return_value=result)
+
+        await record_result(mock_db, _completed_run(a, b, "A"))
+
+        insert_sql, select_sql, upsert_sql = (
+            str(call.args[0].compile(dialect=postgresql.dialect())) for call in mock_db.execute.await_args_list
+        )
+        assert "ON CONFLICT (agent_id) DO NOTHING" in insert_sql
+        assert "FOR UPDATE" in select_sql
+        assert mock_db.execute.await_args_list[1].args[0].get_execution_options()["populate_existing"]
+        assert "ON CONFLICT (agent_id) DO UPDATE" in upsert_sql
+        mock_db.commit.assert_not_called()
+
+
+class TestRecomputeRatings:
+    """Tests for the full recompute."""
+
+    @pytest.mark.asyncio
+    async def test_replaces_table_in_one_pass(self, mock_db):
+        """One column-only read, one delete, one bulk insert, one commit."""
+        a, b = uuid4(), uuid4()
+        history = MagicMock()
+        history.all.return_value = [(a, b, "A"), (b, a, "A")]
+        mock_db.execute = AsyncMock(side_effect=[MagicMock(), history, MagicMock(), MagicMock()])
+
+        counts = await recompute_ratings(mock_db)
+
+        assert counts == {"agents": 2, "runs": 2}
+        lock, read, clear, write = [call.args for call in mock_db.execute.await_args_list]
+        assert str(lock[0]) == "LOCK TABLE agent_ratings IN EXCLUSIVE MODE"
+        read_sql = str(read[0].compile(dialect=postgresql.dialect()))
+        assert "result_json" in read_sql and "ORDER BY runs.finished_at" in read_sql
+        assert "DELETE FROM agent_ratings" in str(clear[0])
+        assert {record["agent_id"] for record in write[1]} == {a, b}
+        mock_db.commit.assert_called_once()
@@ -0,0 +1,96 @@
+"""
+Tests for model residency management
+"""
+import asyncio
+import json
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.ollama import load_model
+from app.services.residency import ModelResidency
+
+
+class TestLoadModel:
+    """Tests for the empty-prompt warm-up request."""
+
+    @pytest.mark.asyncio
+    async def test_sends_empty_prompt_with_keep_alive(self):
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"done": True, "load_duration": 2_500_000_000}
+        mock_response.raise_for_status = MagicMock()
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client.post.return_value = mock_response
+            mock_client_class.return_value.__aenter__.return_value = mock_client
+
+            stats = await load_model("llama3", keep_alive="-1")
+
+        payload = mock_client.post.call_args.kwargs["json"]
+        assert payload == {"model": "llama3", "prompt": "", "stream": False, "keep_alive": "-1"}
+        assert stats == {"load_duration": 2_500_000_000}
+
+
+class TestModelResidency:
+    """Tests for warm-ups, load tracking and work ordering."""
+
+    @pytest.mark.asyncio
+    async def test_warm_loads_each_model_once(self):
+        """Duplicate and in-flight models should not be requested again."""
+        residency = ModelResidency()
+        load = AsyncMock(return_value={"load_duration": 3_000_000_000})
+
+        with patch("app.services.residency.load_model", load):
+            tasks = residency.warm(["llama3", "qwen2.5", "llama3"])
+            assert residency.warm(["qwen2.5"]) == []
+            await asyncio.gather(*tasks)
+
+        assert [call.args[0] for call in load.await_args_list] == ["llama3", "qwen2.5"]
+        snapshot = {entry["model"]: entry for entry in residency.snapshot()}
+        assert snapshot["llama3"]["cold_loads"] == 1
+        assert snapshot["llama3"]["last_load_ms"] == 3000
+        assert not snapshot["qwen2.5"]["warming"]
+
+    @pytest.mark.asyncio
+    async def test_failed_warm_up_is_ignored(self):
+        residency = ModelResidency()
+
+        with patch("app.services.residency.load_model", AsyncMock(side_effect=RuntimeError("no model"))):
+            await asyncio.gather(*residency.warm(["missing"]))
+
+        assert residency.snapshot() == []
+
+    def test_prefer_resident_puts_recent_models_first(self):
+        """Work on the most recently used model runs first; ties keep their order."""
+        residency = ModelResidency()
+        residency.record_call("qwen2.5", {"load_duration": 1_000})
+        residency.record_call("llama3", {"load_duration": 1_000})
+        models = {"opening_a": "qwen2.5", "opening_b": "llama3", "intro": "mistral", "score": "llama3"}
+
+        ordered = residency.prefer_resident(list(models), models.get)
+
+        assert ordered == ["opening_b", "score", "opening_a", "intro"]
+        assert all(entry["cold_loads"] == 0 for entry in residency.snapshot())
+
+
+class TestCallTracking:
+    """Tests for recording Ollama calls made by the nodes."""
+
+    @pytest.mark.asyncio
+    async def test_streamed_calls_report_load_duration(self, model_residency):
+        """Stats of a streamed call should reach the residency, even without a caller dict."""
+        from app.graph.nodes.utils import stream_ollama_with_retry
+
+        async def stream(**kwargs):
+            yield "Hello"
+            kwargs["stats"]["load_duration"] = 900_000_000
+
+        with patch("app.graph.nodes.utils.stream_ollama", side_effect=stream):
+            chunks = [chunk async for chunk in stream_ollama_with_retry(model="llama3", prompt="Hi")]
+
+        assert chunks == ["Hello"]
+        entry, = model_residency.snapshot()
+        assert entry["model"] == "llama3"
+        assert entry["cold_loads"] == 1
+        assert json.dumps(entry)
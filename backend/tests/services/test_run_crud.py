@@ -12,8 +12,12 @@ from app.services.run_crud import (
     get_run_with_agents,
     update_run_status,
     get_all_runs,
+    get_active_runs,
+    get_runs_for_agent,
     delete_run,
-    get_turns_by_run_id
+    get_turns_by_run_id,
+    get_swap_runs,
+    swapped_run_kwargs
 )
 from app.models.run import Run
 from app.models.agent import Agent
@@ -23,19 +27,14 @@ class TestCreateRun:
     """Tests for create_run function."""
 
     @pytest.mark.asyncio
-    async def test_creates_run_with_defaults(self, mock_db):
+    async def test_creates_run_with_defaults(self, returning_db):
         """create_run should apply default config and rubric when not provided."""
         agent_a_id = uuid4()
         agent_b_id = uuid4()
         agent_j_id = uuid4()
 
-        async def mock_refresh(run):
-            run.created_at = datetime.utcnow()
-
-        mock_db.refresh = mock_refresh
-
         run = await create_run(
-            db=mock_db,
+            db=returning_db,
             topic="Test topic",
             agent_a_id=agent_a_id,
             agent_b_id=agent_b_id,
@@ -48,22 +47,19 @@ class TestCreateRun:
         assert run.status == "pending"
         assert run.config_json == {"rounds": 3, "max_tokens_per_turn": 1024}
         assert run.rubric_json["argumentation_weight"] == 35
-        mock_db.add.assert_called_once()
-        mock_db.commit.assert_called_once()
+        assert run.created_at is not None
+        returning_db.execute.assert_awaited_once()
+        returning_db.commit.assert_called_once()
+        returning_db.refresh.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_creates_run_with_custom_config(self, mock_db):
+    async def test_creates_run_with_custom_config(self, returning_db):
         """create_run should use provided config and rubric."""
         custom_config = {"rounds": 5, "max_tokens_per_turn": 2048}
         custom_rubric = {"argumentation_weight": 50, "rebuttal_weight": 50}
 
-        async def mock_refresh(run):
-            run.created_at = datetime.utcnow()
-
-        mock_db.refresh = mock_refresh
-
         run = await create_run(
-            db=mock_db,
+            db=returning_db,
             topic="Custom topic",
             agent_a_id=uuid4(),
             agent_b_id=uuid4(),
@@ -77,6 +73,18 @@ class TestCreateRun:
         assert run.config_json == custom_config
         assert run.rubric_json == custom_rubric
 
+    @pytest.mark.asyncio
+    async def test_swap_copy_records_its_original(self, returning_db, sample_completed_run):
+        """A swap test should mirror agents and positions and link back."""
+        original = sample_completed_run
+
+        swap = await create_run(db=returning_db, **swapped_run_kwargs(original))
+
+        assert (swap.agent_a_id, swap.agent_b_id) == (original.agent_b_id, original.agent_a_id)
+        assert (swap.position_a, swap.position_b) == (original.position_b, original.position_a)
+        assert swap.agent_j_id == original.agent_j_id
+        assert swap.swap_of_run_id == original.run_id
+
 
 class TestGetRunById:
     """Tests for get_run_by_id function."""
@@ -108,63 +116,107 @@ class TestGetRunById:
 class TestUpdateRunStatus:
     """Tests for update_run_status function."""
 
-    @pytest.mark.asyncio
-    async def test_updates_status(self, mock_db, sample_run):
-        """update_run_status should update status field."""
-        mock_db.get = AsyncMock(return_value=sample_run)
+    @pytest.fixture(autouse=True)
+    def record_result(self):
+        """Patch the rating update."""
+        with patch("app.services.run_crud.ratings.record_result", AsyncMock()) as mock:
+            yield mock
 
-        async def mock_refresh(run):
-            pass
-
-        mock_db.refresh = mock_refresh
+    @pytest.mark.asyncio
+    async def test_updates_status(self, returning_db, sample_run):
+        """update_run_status should update status field in one round-trip."""
+        returning_db.rows[sample_run.run_id] = sample_run
 
-        updated = await update_run_status(mock_db, sample_run.run_id, "running")
+        updated = await update_run_status(returning_db, sample_run.run_id, "running")
 
         assert updated.status == "running"
-        mock_db.commit.assert_called_once()
+        returning_db.execute.assert_awaited_once()
+        returning_db.commit.assert_called_once()
+        returning_db.refresh.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_sets_finished_at_when_completed(self, mock_db, sample_run):
+    async def test_sets_finished_at_when_completed(self, returning_db, sample_run):
         """update_run_status should set finished_at when status is completed."""
-        mock_db.get = AsyncMock(return_value=sample_run)
+        returning_db.rows[sample_run.run_id] = sample_run
         sample_run.finished_at = None
 
-        async def mock_refresh(run):
-            pass
-
-        mock_db.refresh = mock_refresh
-
-        updated = await update_run_status(mock_db, sample_run.run_id, "completed")
+        updated = await update_run_status(returning_db, sample_run.run_id, "completed")
 
         assert updated.status == "completed"
         assert updated.finished_at is not None
 
     @pytest.mark.asyncio
-    async def test_updates_result_json(self, mock_db, sample_run):
+    async def test_updates_result_json(self, returning_db, sample_run):
         """update_run_status should update result_json when provided."""
-        mock_db.get = AsyncMock(return_value=sample_run)
+        returning_db.rows[sample_run.run_id] = sample_run
         result_data = {"winner": "A", "total_a": 80, "total_b": 70}
 
-        async def mock_refresh(run):
-            pass
-
-        mock_db.refresh = mock_refresh
-
         updated = await update_run_status(
-            mock_db, sample_run.run_id, "completed", result_json=result_data
+            returning_db, sample_run.run_id, "completed", result_json=result_data
         )
 
         assert updated.result_json == result_data
 
     @pytest.mark.asyncio
-    async def test_returns_none_when_not_found(self, mock_db):
-        """update_run_status should return None when run not found."""
-        mock_db.get = AsyncMock(return_value=None)
+    async def test_completion_updates_ratings_before_commit(self, returning_db, sample_run, record_result):
+        """Completing a run should rate it in the same transaction."""
+        returning_db.rows[sample_run.run_id] = sample_run
+        record_result.side_effect = lambda db, run: db.commit.assert_not_called()
 
-        result = await update_run_status(mock_db, uuid4(), "completed")
+        await update_run_status(
+            returning_db, sample_run.run_id, "completed", result_json={"winner": "A"}
+        )
+
+        record_result.assert_awaited_once_with(returning_db, sample_run)
+        returning_db.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_repeated_completion_is_not_rated_twice(self, returning_db, sample_run, record_result):
+        """Completing an already completed run should neither update nor re-rate it."""
+        returning_db.rows[sample_run.run_id] = sample_run
+
+        first = await update_run_status(returning_db, sample_run.run_id, "completed", result_json={"winner": "A"})
+        finished_at = first.finished_at
+        second = await update_run_status(returning_db, sample_run.run_id, "completed", result_json={"winner": "A"})
+
+        assert second is None
+        assert sample_run.finished_at == finished_at
+        record_result.assert_awaited_once()
+        update_sql = str(returning_db.execute.await_args.args[0].compile())
+        assert "runs.status != :status_1" in update_sql
+
+    @pytest.mark.asyncio
+    async def test_other_statuses_do_not_touch_ratings(self, returning_db, sample_run, record_result):
+        """Only completed runs should be rated."""
+        returning_db.rows[sample_run.run_id] = sample_run
+
+        await update_run_status(returning_db, sample_run.run_id, "failed")
+
+        record_result.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_returns_none_when_not_found(self, returning_db):
+        """update_run_status should return None when run not found."""
+        result = await update_run_status(returning_db, uuid4(), "completed")
 
         assert result is None
-        mock_db.commit.assert_not_called()
+        returning_db.commit.assert_not_called()
+
+
+class TestGetSwapRuns:
+    """Tests for get_swap_runs function."""
+
+    @pytest.mark.asyncio
+    async def test_filters_by_lineage(self, mock_db, sample_run):
+        """get_swap_runs should look runs up by swap_of_run_id."""
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [sample_run]
+        mock_db.execute = AsyncMock(return_value=mock_result)
+
+        runs = await get_swap_runs(mock_db, uuid4())
+
+        assert runs == [sample_run]
+        assert "runs.swap_of_run_id =" in str(mock_db.execute.await_args.args[0])
 
 
 class TestGetAllRuns:
@@ -194,29 +246,59 @@ class TestGetAllRuns:
         assert runs == []
 
 
+class TestRunQueries:
+    """Tests for get_active_runs and get_runs_for_agent functions."""
+
+    @pytest.mark.asyncio
+    async def test_active_runs_filter_unfinished_statuses(self, mock_db, sample_run):
+        """get_active_runs should only select pending and running runs."""
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [sample_run]
+        mock_db.execute = AsyncMock(return_value=mock_result)
+
+        runs = await get_active_runs(mock_db)
+
+        sql = str(mock_db.execute.await_args.args[0])
+        assert runs == [sample_run]
+        assert "runs.status IN" in sql
+        assert "ORDER BY runs.created_at DESC" in sql
+
+    @pytest.mark.asyncio
+    async def test_runs_for_agent_match_any_role(self, mock_db, sample_run):
+        """get_runs_for_agent should match the agent as A, B or judge."""
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [sample_run]
+        mock_db.execute = AsyncMock(return_value=mock_result)
+
+        runs = await get_runs_for_agent(mock_db, sample_run.agent_a_id)
+
+        sql = str(mock_db.execute.await_args.args[0])
+        assert runs == [sample_run]
+        for column in ("agent_a_id", "agent_b_id", "agent_j_id"):
+            assert f"runs.{column} =" in sql
+
+
 class TestDeleteRun:
     """Tests for delete_run function."""
 
     @pytest.mark.asyncio
-    async def test_deletes_run_successfully(self, mock_db, sample_run):
+    async def test_deletes_run_successfully(self, returning_db, sample_run):
         """delete_run should delete run and return True."""
-        mock_db.get = AsyncMock(return_value=sample_run)
+        returning_db.rows[sample_run.run_id] = sample_run
 
-        result = await delete_run(mock_db, sample_run.run_id)
+        result = await delete_run(returning_db, sample_run.run_id)
 
         assert result is True
-        mock_db.delete.assert_called_once_with(sample_run)
-        mock_db.commit.assert_called_once()
+        assert sample_run.run_id not in returning_db.rows
+        returning_db.commit.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_returns_false_when_not_found(self, mock_db):
+    async def test_returns_false_when_not_found(self, returning_db):
         """delete_run should return False when run not found."""
-        mock_db.get = AsyncMock(return_value=None)
-
-        result = await delete_run(mock_db, uuid4())
+        result = await delete_run(returning_db, uuid4())
 
         assert result is False
-        mock_db.delete.assert_not_called()
+        returning_db.commit.assert_not_called()
 
 
 class TestGetTurnsByRunId:
@@ -304,3 +386,24 @@ class TestGetRunWithAgents:
         result = await get_run_with_agents(mock_db, sample_run.run_id)
 
         assert result is None
+
+    @pytest.mark.asyncio
+    async def test_loads_judge_panel(self, mock_db, sample_run, sample_agent_list):
+        """Panel judges should follow the primary judge; missing ones are skipped."""
+        agents = sample_agent_list
+        sample_run.config_json = {
+            "rounds": 3,
+            "judge_panel": [str(agents[0].agent_id), str(agents[1].agent_id), str(uuid4())],
+        }
+
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = sample_run
+        mock_db.execute = AsyncMock(return_value=mock_result)
+        mock_db.get = AsyncMock(side_effect=[agents[0], agents[1], agents[0], agents[1], None])
+
+        result = await get_run_with_agents(mock_db, sample_run.run_id)
+
+        assert [j["agent_id"] for j in result["judge_panel"]] == [
+            str(agents[0].agent_id), str(agents[1].agent_id)
+        ]
+        assert result["agent_j"] is result["judge_panel"][0]
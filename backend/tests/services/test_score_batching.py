@@ -0,0 +1,162 @@
+"""
+Tests for batched judge scoring
+"""
+import asyncio
+import json
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.graph import scoring
+from app.graph.nodes.judge import _request_scores
+from app.graph.engine import NodeExecutionError, run_plan
+from app.graph.plan import build_execution_plan
+from app.graph.score_batching import ScoreBatcher, score_batcher
+from app.graph.scoring import batch_score_json_schema
+from tests.services.test_plan import _make_state
+
+OPENING_ITEM = {
+    "argumentation": {"logic": 8, "originality": 7, "evidence": 6},
+    "delivery": {"clarity": 9, "structure": 8},
+    "strategy": {"position_setup": 7, "forbidden_phrase_penalty": 0},
+    "total": 45,
+    "justification": "Solid.",
+}
+
+
+@pytest.fixture(autouse=True)
+def reset_parse_stats():
+    """Isolate parse outcome counters between tests."""
+    scoring._parse_outcomes.clear()
+    yield
+    scoring._parse_outcomes.clear()
+
+
+def _reply(*items):
+    return json.dumps({"items": list(items)})
+
+
+def _batcher(window, max_batch=8, debates=3, model="llama3"):
+    """Score batcher with ``debates`` running debates judged by ``model``."""
+    batcher = ScoreBatcher(window=window, max_batch=max_batch)
+    for _ in range(debates):
+        batcher.join([model])
+    return batcher
+
+
+class TestScoreBatcher:
+    """Tests for collecting and demultiplexing scoring requests."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_call(self):
+        """Requests within the window go out together and get their own item back."""
+        batcher = _batcher(window=0.01)
+        reply = _reply(OPENING_ITEM, {**OPENING_ITEM, "total": 30}, {**OPENING_ITEM, "total": 20})
+
+        with patch("app.graph.score_batching.call_ollama_with_retry",
+                   AsyncMock(return_value=reply)) as ollama:
+            results = await asyncio.gather(*(
+                batcher.score("opening", "llama3", f"prompt {i}", "system") for i in range(3)
+            ))
+
+        ollama.assert_awaited_once()
+        kwargs = ollama.await_args.kwargs
+        assert kwargs["response_format"] == batch_score_json_schema("opening", 3)
+        assert "=== ITEM 3 ===\nprompt 2" in kwargs["prompt"]
+        assert [r["total"] for r in results] == [45, 30, 20]
+        assert results[0]["argumentation"]["total"] == 21
+        assert not batcher._tasks
+
+    @pytest.mark.asyncio
+    async def test_full_batch_is_sent_without_waiting(self):
+        """Reaching max_batch dispatches before the window ends."""
+        batcher = _batcher(window=60, max_batch=2)
+
+        with patch("app.graph.score_batching.call_ollama_with_retry",
+                   AsyncMock(return_value=_reply(OPENING_ITEM, OPENING_ITEM))):
+            results = await asyncio.wait_for(asyncio.gather(
+                batcher.score("opening", "llama3", "a", "system"),
+                batcher.score("opening", "llama3", "b", "system"),
+            ), timeout=1)
+
+        assert all(r is not None for r in results)
+
+    @pytest.mark.asyncio
+    async def test_lone_request_and_other_models_are_not_batched(self):
+        """A request alone in its window (per model) is handed back."""
+        batcher = _batcher(window=0.001, debates=2)
+
+        with patch("app.graph.score_batching.call_ollama_with_retry", AsyncMock()) as ollama:
+            results = await asyncio.gather(
+                batcher.score("opening", "llama3", "a", "system"),
+                batcher.score("opening", "qwen2.5", "b", "system"),
+            )
+
+        assert results == [None, None]
+        ollama.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_only_debate_on_a_model_does_not_wait(self):
+        """Without another debate on the judge model, the window is skipped."""
+        batcher = _batcher(window=60, debates=1)
+        batcher.join(["qwen2.5"])
+
+        result = await asyncio.wait_for(batcher.score("opening", "llama3", "a", "system"), timeout=1)
+
+        assert result is None
+        assert not batcher._pending
+        batcher.leave(["llama3"])
+        batcher.leave(["qwen2.5"])
+        assert not batcher._debates
+
+    @pytest.mark.asyncio
+    async def test_run_plan_registers_batched_judge_models(self):
+        """The engine registers a run's judge model while it runs with batching."""
+        seen = []
+
+        async def fake_execute(node, plan, state, emit):
+            seen.append(dict(score_batcher._debates))
+            raise RuntimeError("stop")
+
+        plan = build_execution_plan({"rounds": 2})
+        with patch("app.graph.engine.execute_node", side_effect=fake_execute):
+            for config in ({"rounds": 2, "score_batching": True}, {"rounds": 2}):
+                with pytest.raises(NodeExecutionError):
+                    await run_plan(plan, _make_state(config), AsyncMock())
+
+        assert seen == [{"llama3": 1}, {}]
+        assert not score_batcher._debates
+
+    @pytest.mark.asyncio
+    async def test_invalid_items_and_failures_fall_back(self):
+        """Invalid items come back as None; a failed call returns None for all."""
+        batcher = _batcher(window=0.001)
+
+        with patch("app.graph.score_batching.call_ollama_with_retry",
+                   AsyncMock(return_value=_reply(OPENING_ITEM, {"total": "high"}))):
+            results = await asyncio.gather(*(
+                batcher.score("opening", "llama3", p, "system") for p in "abc"
+            ))
+        assert results[0]["total"] == 45
+        assert results[1:] == [None, None]
+
+        with patch("app.graph.score_batching.call_ollama_with_retry",
+                   AsyncMock(side_effect=RuntimeError("ollama down"))):
+            results = await asyncio.gather(*(
+                batcher.score("opening", "llama3", p, "system") for p in "ab"
+            ))
+        assert results == [None, None]
+
+    @pytest.mark.asyncio
+    async def test_request_scores_falls_back_to_single_request(self):
+        """_request_scores should stream on its own when the batcher gives up."""
+        async def stream(**kwargs):
+            yield json.dumps(OPENING_ITEM)
+
+        with patch("app.graph.nodes.judge.score_batcher.score",
+                   AsyncMock(return_value=None)) as batched:
+            with patch("app.graph.nodes.judge.stream_ollama_with_retry", side_effect=stream):
+                scores = await _request_scores("opening", "llama3", "prompt", "system", batched=True)
+
+        batched.assert_awaited_once_with("opening", "llama3", "prompt", "system")
+        assert scores["total"] == 45
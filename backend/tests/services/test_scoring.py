@@ -0,0 +1,162 @@
+"""
+Tests for structured judge scoring
+"""
+import json
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.graph import scoring
+from app.graph.scoring import (
+    ScoreParseError,
+    extract_json_object,
+    get_parse_stats,
+    parse_stage_scores,
+    score_json_schema,
+)
+from app.graph.nodes.judge import _request_scores
+
+OPENING_REPLY = {
+    "argumentation": {"logic": 8, "originality": 7, "evidence": 6},
+    "delivery": {"clarity": 9, "structure": 8},
+    "strategy": {"position_setup": 7, "forbidden_phrase_penalty": -2},
+    "total": 45,
+    "justification": "Solid.",
+}
+
+
+@pytest.fixture(autouse=True)
+def reset_parse_stats():
+    """Isolate parse outcome counters between tests."""
+    scoring._parse_outcomes.clear()
+    yield
+    scoring._parse_outcomes.clear()
+
+
+class TestParseStageScores:
+    """Tests for parse_stage_scores function."""
+
+    def test_fills_category_totals(self):
+        """Category totals should be the sum of their criteria."""
+        scores = parse_stage_scores("opening", json.dumps(OPENING_REPLY))
+
+        assert scores["argumentation"]["total"] == 21
+        assert scores["strategy"]["total"] == 5
+        assert scores["total"] == 45
+
+    def test_extracts_nested_object_from_text(self):
+        """Nested JSON embedded in prose should be found."""
+        response = f"Scores follow: {json.dumps(OPENING_REPLY)} Done."
+
+        assert parse_stage_scores("opening", response)["delivery"]["clarity"] == 9
+
+    def test_rejects_out_of_range_criteria(self):
+        """Criteria outside 0-10 should fail validation with the field path."""
+        reply = {**OPENING_REPLY, "delivery": {"clarity": 12, "structure": 8}}
+
+        with pytest.raises(ScoreParseError) as exc_info:
+            parse_stage_scores("opening", json.dumps(reply))
+
+        assert "delivery.clarity" in str(exc_info.value)
+
+    def test_rejects_missing_object(self):
+        """Replies without JSON should raise ScoreParseError."""
+        with pytest.raises(ScoreParseError):
+            extract_json_object("no scores here")
+
+    def test_schema_omits_category_totals(self):
+        """The schema sent to Ollama should not ask for computed totals."""
+        schema = score_json_schema("summary")
+
+        assert "total" in schema["required"]
+        assert "new_arguments_detected" in schema["properties"]
+        for definition in schema["$defs"].values():
+            assert "total" not in definition["properties"]
+
+    @pytest.mark.parametrize("stage", ["opening", "rebuttal", "summary"])
+    def test_schema_lists_criteria_before_total(self, stage):
+        """The judge should write the criteria before their total and the justification."""
+        properties = list(score_json_schema(stage)["properties"])
+
+        assert properties[-2:] == ["total", "justification"]
+        assert properties[-3] == "forbidden_phrases_detected"
+
+
+def _streamed(*replies):
+    """Fake stream_ollama_with_retry yielding each reply in small chunks."""
+    replies = list(replies)
+    calls = []
+
+    async def stream(**kwargs):
+        calls.append(kwargs)
+        reply = replies.pop(0)
+        for i in range(0, len(reply), 8):
+            yield reply[i:i + 8]
+
+    return stream, calls
+
+
+class TestRequestScores:
+    """Tests for the judge's schema-constrained score request."""
+
+    @pytest.mark.asyncio
+    async def test_streams_with_schema_as_format(self):
+        """The stage schema should be sent as Ollama's format option."""
+        stream, calls = _streamed(json.dumps(OPENING_REPLY))
+        with patch("app.graph.nodes.judge.stream_ollama_with_retry", side_effect=stream):
+            scores = await _request_scores("opening", "llama3", "prompt", "system")
+
+        assert calls[0]["response_format"] == score_json_schema("opening")
+        assert scores["argumentation"]["total"] == 21
+        assert get_parse_stats()[0]["ok"] == 1
+
+    @pytest.mark.asyncio
+    async def test_reports_partial_fields_and_stops_early(self):
+        """Each completed field should be reported; trailing output is not consumed."""
+        reply = json.dumps(OPENING_REPLY)[:-1] + ', "trailing": "' + "x" * 400 + '"}'
+        consumed = []
+
+        async def stream(**kwargs):
+            for i in range(0, len(reply), 8):
+                consumed.append(i)
+                yield reply[i:i + 8]
+
+        partials = []
+
+        async def on_partial(scores):
+            partials.append(list(scores))
+
+        with patch("app.graph.nodes.judge.stream_ollama_with_retry", side_effect=stream):
+            await _request_scores("opening", "llama3", "prompt", "system", on_partial=on_partial)
+
+        assert partials[0] == ["argumentation"]
+        assert partials[-1] == ["argumentation", "delivery", "strategy", "total"]
+        assert len(consumed) * 8 < len(reply) - 300
+
+    @pytest.mark.asyncio
+    async def test_single_repair_retry(self):
+        """An invalid reply should trigger exactly one repair request."""
+        stream, _ = _streamed('{"total": 40}')
+        call = AsyncMock(return_value=json.dumps(OPENING_REPLY))
+        with patch("app.graph.nodes.judge.stream_ollama_with_retry", side_effect=stream), \
+             patch("app.graph.nodes.judge.call_ollama_with_retry", call):
+            scores = await _request_scores("opening", "llama3", "prompt", "system")
+
+        call.assert_awaited_once()
+        assert "argumentation" in call.await_args.kwargs["prompt"]
+        assert scores["total"] == 45
+        assert get_parse_stats()[0]["repaired"] == 1
+
+    @pytest.mark.asyncio
+    async def test_flags_default_scores_after_failed_repair(self):
+        """Unrepairable replies should fall back to flagged default scores."""
+        stream, _ = _streamed("not json")
+        call = AsyncMock(return_value="not json")
+        with patch("app.graph.nodes.judge.stream_ollama_with_retry", side_effect=stream), \
+             patch("app.graph.nodes.judge.call_ollama_with_retry", call):
+            scores = await _request_scores("rebuttal", "llama3", "prompt", "system")
+
+        call.assert_awaited_once()
+        assert scores["parse_failed"] is True
+        stats = get_parse_stats()[0]
+        assert stats["failed"] == 1
+        assert stats["failure_rate"] == 1.0
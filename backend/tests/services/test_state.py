@@ -0,0 +1,84 @@
+"""
+Tests for debate state reducers and the indexed turn log
+"""
+import pytest
+
+from app.graph.state import TurnLog, append_turns, apply_update
+
+
+def _turn(phase, role="debater"):
+    return {"turn_id": f"id-{phase}", "agent_id": "x", "phase": phase, "role": role,
+            "content": f"{phase} speech", "targets": [], "metadata": {}}
+
+
+class TestTurnLog:
+    """Tests for TurnLog indexes and append semantics."""
+
+    def test_lookups_by_phase_id_and_role(self):
+        """Turns should be found through every index."""
+        log = TurnLog([_turn("judge_intro", "judge"), _turn("opening_a"), _turn("opening_b")])
+
+        assert log.by_phase("opening_b")["turn_id"] == "id-opening_b"
+        assert log.by_id("id-opening_a")["phase"] == "opening_a"
+        assert [t["phase"] for t in log.by_role("debater")] == ["opening_a", "opening_b"]
+        assert log.by_phase("summary_a") is None
+
+    def test_extend_leaves_earlier_log_unchanged(self):
+        """Appending shares storage but earlier logs keep their view."""
+        first = TurnLog([_turn("opening_a")])
+        second = first.extend([_turn("opening_b")])
+
+        assert len(first) == 1 and len(second) == 2
+        assert first.by_phase("opening_b") is None
+        assert first.by_role("debater") == [first[0]]
+        assert second.by_phase("opening_b") is second[1]
+
+    def test_extending_an_older_log_copies(self):
+        """Branching from an older log must not affect the newer one."""
+        base = TurnLog([_turn("opening_a")])
+        newer = base.extend([_turn("opening_b")])
+        branch = base.extend([_turn("rebuttal_a")])
+
+        assert [t["phase"] for t in newer] == ["opening_a", "opening_b"]
+        assert [t["phase"] for t in branch] == ["opening_a", "rebuttal_a"]
+        assert newer.by_phase("rebuttal_a") is None
+
+    def test_turn_with_logged_id_replaces_it(self):
+        """A scored turn should replace its logged turn without changing earlier logs."""
+        log = TurnLog([_turn("opening_a"), _turn("opening_b")])
+        scored = {**log[0], "metadata": {"scores": {"total": 30}}}
+
+        patched = log.extend([scored])
+
+        assert len(patched) == 2
+        assert patched.by_id("id-opening_a") is scored
+        assert patched.by_role("debater")[0] is scored
+        assert log[0]["metadata"] == {}
+        assert log.extend([_turn("rebuttal_a")]).by_phase("opening_a")["metadata"] == {}
+
+    def test_compares_equal_to_list(self):
+        """A log should compare equal to the plain list of its turns."""
+        turns = [_turn("opening_a"), _turn("opening_b")]
+
+        assert TurnLog(turns) == turns
+
+
+class TestReducers:
+    """Tests for append_turns and apply_update."""
+
+    def test_append_turns_accepts_plain_lists(self):
+        """LangGraph may pass the initial turns as a list."""
+        log = append_turns([_turn("opening_a")], [_turn("opening_b")])
+
+        assert isinstance(log, TurnLog)
+        assert log.by_phase("opening_b") is not None
+
+    def test_apply_update_appends_turns_and_adds_scores(self):
+        """apply_update should use the same reducers as the graph."""
+        state = {"turns": TurnLog(), "scores_a": {"total": 10}, "scores_b": {}, "status": "running"}
+
+        merged = apply_update(state, {"turns": [_turn("opening_a")], "scores_a": {"total": 5}})
+
+        assert len(state["turns"]) == 0
+        assert merged["turns"].by_phase("opening_a") is not None
+        assert merged["scores_a"] == {"total": 15}
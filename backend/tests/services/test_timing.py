@@ -0,0 +1,66 @@
+"""
+Tests for debate timing collection
+"""
+import asyncio
+
+import pytest
+
+from app.graph.timing import NodeTimer, add_stats, summarize_run_timing
+
+
+class TestNodeTimer:
+    """Tests for the executor's per-node measurements."""
+
+    @pytest.mark.asyncio
+    async def test_first_output_and_latency(self):
+        """Only streamed output events count as the first token."""
+        events = []
+
+        async def emit(event):
+            events.append(event)
+
+        timer = NodeTimer()
+        timed_emit = timer.wrap(emit)
+        await timed_emit({"event": "violation", "data": "{}"})
+        assert timer.to_dict()["time_to_first_token_ms"] is None
+
+        await asyncio.sleep(0.01)
+        await timed_emit({"event": "token", "data": "{}"})
+        timer.stop()
+
+        timing = timer.to_dict()
+        assert len(events) == 2
+        assert 5 <= timing["time_to_first_token_ms"] <= timing["latency_ms"]
+        assert timer.to_dict() == timing
+
+
+class TestRunRollup:
+    """Tests for summing stats per node kind."""
+
+    def test_add_stats_sums_counters(self):
+        total = add_stats({}, {"eval_count": 10, "eval_duration": 100})
+        add_stats(total, {"eval_count": 5, "load_duration": 7})
+        add_stats(total, None)
+
+        assert total == {"eval_count": 15, "eval_duration": 100, "load_duration": 7}
+
+    def test_summary_splits_ollama_time(self):
+        nodes = {
+            "opening_a": {"kind": "debater", "latency_ms": 1200.0, "time_to_first_token_ms": 300.0,
+                          "ollama_stats": {"total_duration": 1_100_000_000, "load_duration": 200_000_000,
+                                           "prompt_eval_duration": 100_000_000, "eval_duration": 800_000_000,
+                                           "prompt_eval_count": 120, "eval_count": 40}},
+            "score_opening_a": {"kind": "score", "latency_ms": 400.0, "time_to_first_token_ms": None,
+                                "ollama_stats": {}},
+        }
+
+        summary = summarize_run_timing(nodes, 1700.0)
+
+        assert summary["wall_ms"] == 1700.0
+        assert summary["ollama"]["load_ms"] == 200
+        assert summary["ollama"]["eval_ms"] == 800
+        assert summary["ollama"]["tokens_per_second"] == 50
+        assert summary["by_kind"]["score"]["ollama"]["tokens_per_second"] is None
+        assert summary["nodes"]["opening_a"] == {
+            "kind": "debater", "latency_ms": 1200.0, "time_to_first_token_ms": 300.0
+        }
@@ -0,0 +1,220 @@
+"""
+Tests for the tournament runner
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.graph import tournament as tournament_module
+from app.graph.tournament import (
+    Tournament,
+    default_swiss_rounds,
+    get_tournament,
+    list_tournaments,
+    order_by_model,
+    round_robin_pairings,
+    shutdown_tournaments,
+    start_tournament,
+    swiss_pairings,
+)
+
+
+def _standing(agent_id, points=0.0, byes=0):
+    return {"agent_id": agent_id, "points": points, "wins": 0, "losses": 0,
+            "draws": 0, "byes": byes, "runs": 0}
+
+
+def _agents(*models):
+    return {str(uuid4()): model for model in models}
+
+
+@asynccontextmanager
+async def fake_session():
+    yield MagicMock()
+
+
+@pytest.fixture
+def create_run():
+    """Patch run creation to return runs echoing their arguments."""
+    async def create(db, **kwargs):
+        run = MagicMock(run_id=uuid4(), config_json=kwargs["config"], rubric_json=kwargs["rubric"],
+                        swap_of_run_id=None)
+        for key, value in kwargs.items():
+            setattr(run, key, value)
+        return run
+
+    with patch("app.graph.tournament.create_run", AsyncMock(side_effect=create)) as mock:
+        yield mock
+
+
+class TestPairings:
+    """Tests for the pairing functions."""
+
+    def test_round_robin_pairs_everyone_once(self):
+        """n agents should give n*(n-1)/2 distinct pairings."""
+        pairings = round_robin_pairings(["a", "b", "c", "d"])
+
+        assert len(pairings) == 6
+        assert len({frozenset(p) for p in pairings}) == 6
+
+    def test_swiss_pairs_neighbours_and_avoids_rematches(self):
+        """Top agents meet each other unless they already did."""
+        ranking = [_standing("a", 2), _standing("b", 2), _standing("c", 1), _standing("d", 0)]
+
+        assert swiss_pairings(ranking, set())[0] == [("a", "b"), ("c", "d")]
+        assert swiss_pairings(ranking, {frozenset("ab")})[0] == [("a", "c"), ("b", "d")]
+
+    def test_swiss_bye_goes_to_lowest_without_bye(self):
+        """Odd fields give the bye to the lowest-ranked agent that had none."""
+        ranking = [_standing("a", 1), _standing("b", 1), _standing("c", 0, byes=1)]
+
+        pairings, bye = swiss_pairings(ranking, set())
+
+        assert bye == "b"
+        assert pairings == [("a", "c")]
+
+    def test_default_swiss_rounds(self):
+        assert default_swiss_rounds(2) == 1
+        assert default_swiss_rounds(8) == 3
+        assert default_swiss_rounds(9) == 4
+
+    def test_order_by_model_groups_same_models(self):
+        """Pairings using the same models should be adjacent."""
+        models = {"a": "llama3", "b": "qwen2.5", "c": "llama3", "d": "qwen2.5"}
+        pairings = round_robin_pairings(["a", "b", "c", "d"])
+
+        ordered = order_by_model(pairings, models)
+
+        keys = [tuple(sorted(models[x] for x in p)) for p in ordered]
+        assert keys == sorted(keys)
+        assert ordered[0] == ("a", "c")
+
+
+class TestTournamentRun:
+    """Tests for scheduling and standings."""
+
+    @pytest.mark.asyncio
+    async def test_round_robin_with_swaps(self, create_run):
+        """Every pairing runs per topic and swapped; results fill the standings."""
+        agents = _agents("llama3", "qwen2.5", "llama3")
+        tournament = Tournament(agents, ["t1", "t2"], str(uuid4()), max_parallel_runs=2)
+
+        with patch("app.graph.tournament.run_debate",
+                   AsyncMock(return_value={"winner": "A"})):
+            await tournament.run(session_factory=fake_session)
+
+        assert tournament.status == "completed"
+        assert len(tournament.runs) == 3 * 2 * 2
+        for original, swapped in zip(tournament.runs[::2], tournament.runs[1::2]):
+            assert original["swap_of_run_id"] is None
+            assert swapped["swap_of_run_id"] == original["run_id"]
+            assert (swapped["agent_a_id"], swapped["agent_b_id"]) == (
+                original["agent_b_id"], original["agent_a_id"])
+        # Side A always wins, so every pairing splits its swapped pair
+        assert {s["points"] for s in tournament.standings.values()} == {4.0}
+        assert all(r["status"] == "completed" for r in tournament.runs)
+
+    @pytest.mark.asyncio
+    async def test_parallelism_budget_is_respected(self, create_run):
+        """No more than max_parallel_runs debates should run at once."""
+        running, peak = 0, 0
+
+        async def run_debate(run_id, db):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            return {"winner": "DRAW"}
+
+        tournament = Tournament(_agents("m", "m", "m", "m"), ["t"], str(uuid4()), max_parallel_runs=3)
+        with patch("app.graph.tournament.run_debate", side_effect=run_debate):
+            await tournament.run(session_factory=fake_session)
+
+        assert peak == 3
+        assert all(s["draws"] == 6 for s in tournament.standings.values())
+
+    @pytest.mark.asyncio
+    async def test_failed_runs_do_not_stop_the_tournament(self, create_run):
+        """A failed debate is reported and the remaining runs still execute."""
+        tournament = Tournament(_agents("m", "m"), ["t"], str(uuid4()))
+
+        with patch("app.graph.tournament.run_debate",
+                   AsyncMock(side_effect=[RuntimeError("ollama down"), {"winner": "B"}])):
+            await tournament.run(session_factory=fake_session)
+
+        assert [r["status"] for r in tournament.runs] == ["failed", "completed"]
+        assert sum(s["runs"] for s in tournament.standings.values()) == 2
+
+    @pytest.mark.asyncio
+    async def test_swiss_rounds_and_events(self, create_run):
+        """Swiss plays its rounds without rematches and publishes progress."""
+        agents = _agents("m", "m", "m", "m")
+        tournament = Tournament(agents, ["t"], str(uuid4()), format="swiss", swap_positions=False)
+        events = tournament.subscribe()
+
+        with patch("app.graph.tournament.run_debate",
+                   AsyncMock(return_value={"winner": "A"})):
+            await tournament.run(session_factory=fake_session)
+
+        assert tournament.total_rounds == 2
+        pairs = [frozenset((r["agent_a_id"], r["agent_b_id"])) for r in tournament.runs]
+        assert len(pairs) == 4 and len(set(pairs)) == 4
+
+        names = []
+        while (event := events.get_nowait()) is not None:
+            names.append(event["event"])
+        assert names.count("round_start") == 2
+        assert names.count("run_result") == 4
+        assert names[-1] == "tournament_complete"
+
+
+class TestRegistry:
+    """Tests for the in-memory tournament registry."""
+
+    @pytest.fixture(autouse=True)
+    def registry(self, monkeypatch):
+        """Start each test with an empty registry."""
+        monkeypatch.setattr(tournament_module, "_tournaments", {})
+        monkeypatch.setattr(tournament_module, "_tasks", set())
+
+    def test_finished_tournaments_are_evicted_after_retention(self):
+        """Only tournaments finished longer ago than the retention are dropped."""
+        old, recent, running = (Tournament(_agents("m", "m"), ["t"], str(uuid4())) for _ in range(3))
+        old.finished_at = datetime.utcnow() - timedelta(hours=2)
+        recent.finished_at = datetime.utcnow()
+        for tournament in (old, recent, running):
+            tournament_module._tournaments[tournament.tournament_id] = tournament
+
+        with patch.object(tournament_module.settings, "TOURNAMENT_RETENTION_SECONDS", 3600):
+            assert set(list_tournaments()) == {recent, running}
+            assert get_tournament(old.tournament_id) is None
+
+    @pytest.mark.asyncio
+    async def test_shutdown_cancels_and_awaits_workers(self, create_run):
+        """Shutdown cancels running debates and ends the tournament as failed."""
+        started = asyncio.Event()
+        cancelled = []
+
+        async def slow_debate(run_id, db):
+            started.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.append(run_id)
+                raise
+
+        tournament = Tournament(_agents("m", "m", "m"), ["t"], str(uuid4()), swap_positions=False)
+        with patch("app.graph.tournament.run_debate", side_effect=slow_debate):
+            start_tournament(tournament, session_factory=fake_session)
+            await asyncio.wait_for(started.wait(), timeout=1)
+            await asyncio.wait_for(shutdown_tournaments(), timeout=1)
+
+        assert len(cancelled) == tournament.max_parallel_runs
+        assert tournament.status == "failed"
+        assert tournament.finished_at is not None
+        assert not tournament_module._tasks
@@ -0,0 +1,233 @@
+"""
+Tests for debate tracing
+"""
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.core import tracing
+from app.core.tracing import otlp_payload
+from app.graph.engine import run_plan
+from app.graph.executor import execute_debate_with_streaming
+from app.graph.nodes.utils import call_ollama_with_retry, stream_ollama_with_retry
+from app.graph.plan import build_execution_plan
+from tests.services.test_plan import VALID_SCORES, _make_state
+
+RUN_ID = "00000000-0000-0000-0000-000000000000"
+
+
+@pytest.fixture
+def trace_file(tmp_path):
+    """Export spans to a JSON Lines file; returns a reader of the exported spans."""
+    path = tmp_path / "traces.jsonl"
+    with patch.object(tracing.settings, "TRACING_EXPORTER", "json"), \
+         patch.object(tracing.settings, "TRACING_JSON_PATH", str(path)):
+        async def read():
+            await tracing.flush()
+            return [json.loads(line) for line in path.read_text().splitlines()] if path.exists() else []
+        yield read
+
+
+class TestSpans:
+    """Tests for span nesting and export."""
+
+    @pytest.mark.asyncio
+    async def test_nested_spans_share_the_run_trace(self, trace_file):
+        with tracing.span("debate.run", trace_id=tracing.run_trace_id(RUN_ID), run_id=RUN_ID):
+            with tracing.span("opening_a", kind="debater"):
+                tracing.end_ollama_span(
+                    tracing.start_span("ollama.generate", start_ns=time.time_ns() - 10_000_000, model="llama3"),
+                    {"load_duration": 2_000_000, "prompt_eval_duration": 1_000_000,
+                     "eval_duration": 3_000_000, "eval_count": 12},
+                )
+
+        spans = {s["name"]: s for s in await trace_file()}
+
+        assert set(spans) == {
+            "debate.run", "opening_a", "ollama.generate",
+            "ollama.load", "ollama.prompt_eval", "ollama.eval",
+        }
+        assert {s["trace_id"] for s in spans.values()} == {RUN_ID.replace("-", "")}
+        assert spans["opening_a"]["parent_span_id"] == spans["debate.run"]["span_id"]
+        assert spans["ollama.generate"]["parent_span_id"] == spans["opening_a"]["span_id"]
+        assert spans["ollama.generate"]["attributes"] == {"run_id": RUN_ID, "model": "llama3", "eval_count": 12}
+        assert spans["ollama.eval"]["end_time_unix_nano"] == spans["ollama.generate"]["end_time_unix_nano"]
+        assert spans["ollama.load"]["duration_ms"] == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_recorded(self, trace_file):
+        with pytest.raises(RuntimeError):
+            with tracing.span("debate.run", trace_id=tracing.run_trace_id(RUN_ID)):
+                raise RuntimeError("judge failed")
+
+        span, = await trace_file()
+        assert span["status"] == "error"
+        assert span["error"] == "RuntimeError: judge failed"
+
+    @pytest.mark.asyncio
+    async def test_nothing_recorded_outside_a_trace_or_when_disabled(self, trace_file):
+        """Spans without a run trace (previews, API requests) are not recorded."""
+        with tracing.span("db.update_run_status") as span:
+            assert span is tracing.NOOP_SPAN
+        assert await trace_file() == []
+
+        with patch.object(tracing.settings, "TRACING_EXPORTER", ""):
+            assert tracing.start_span("debate.run", trace_id="ab" * 16) is tracing.NOOP_SPAN
+
+    @pytest.mark.asyncio
+    async def test_plan_nodes_ollama_calls_and_writes_are_traced(self, trace_file, model_residency):
+        """A run breaks down into node spans with their Ollama calls and DB writes."""
+        async def fake_stream(**kwargs):
+            yield VALID_SCORES if kwargs.get("response_format") else "chunk"
+            kwargs["stats"].update(eval_count=10, eval_duration=100_000_000)
+
+        plan = build_execution_plan({"rounds": 3})
+        with patch("app.graph.nodes.utils.stream_ollama", side_effect=fake_stream), \
+             patch("app.graph.nodes.utils.call_ollama", AsyncMock(return_value=VALID_SCORES)), \
+             patch("app.graph.persistence.write_turn_batch", AsyncMock()), \
+             patch("app.graph.budget.get_model_info", AsyncMock(return_value=None)):
+            with tracing.span("debate.run", trace_id=tracing.run_trace_id(RUN_ID), run_id=RUN_ID):
+                await run_plan(plan, _make_state({"rounds": 3}), AsyncMock())
+
+        spans = await trace_file()
+        by_id = {s["span_id"]: s for s in spans}
+        nodes = {s["name"]: s for s in spans if s["name"] in plan.order}
+
+        assert set(nodes) == set(plan.order)
+        score = nodes["score_rebuttal_a"]
+        assert score["attributes"]["phase"] == "score_rebuttal"
+        assert score["attributes"]["queue_ms"] >= 0
+        calls = [s for s in spans if s["name"].startswith("ollama.") and s["parent_span_id"] == score["span_id"]]
+        assert [c["name"] for c in calls] == ["ollama.stream"]
+        assert any(by_id[s["parent_span_id"]]["name"] == "debate.run"
+                   for s in spans if s["name"] == "db.write_turns")
+        assert all(s["attributes"]["run_id"] == RUN_ID for s in spans if not s["name"].startswith("ollama."))
+
+
+class TestRetries:
+    """One Ollama span per call, covering its retries."""
+
+    @pytest.mark.asyncio
+    async def test_retried_stream_ends_its_span_once_with_the_final_attempt(self, trace_file):
+        attempts = []
+
+        async def flaky_stream(**kwargs):
+            attempts.append(kwargs)
+            if len(attempts) == 1:
+                raise httpx.ConnectError("refused")
+            yield "Hello"
+
+        with patch("app.graph.nodes.utils.stream_ollama", side_effect=flaky_stream), \
+             patch("app.graph.nodes.utils.asyncio.sleep", AsyncMock()):
+            with tracing.span("debate.run", trace_id=tracing.run_trace_id(RUN_ID)):
+                assert [c async for c in stream_ollama_with_retry(model="llama3", prompt="Hi")] == ["Hello"]
+
+        stream, = [s for s in await trace_file() if s["name"] == "ollama.stream"]
+        assert stream["status"] == "ok"
+        assert stream["attributes"]["attempts"] == 2
+
+    @pytest.mark.asyncio
+    async def test_exhausted_retries_end_the_span_as_error(self, trace_file):
+        with patch("app.graph.nodes.utils.call_ollama", AsyncMock(side_effect=httpx.ReadTimeout("slow"))), \
+             patch("app.graph.nodes.utils.asyncio.sleep", AsyncMock()):
+            with tracing.span("debate.run", trace_id=tracing.run_trace_id(RUN_ID)):
+                with pytest.raises(httpx.ReadTimeout):
+                    await call_ollama_with_retry(model="llama3", prompt="Hi", max_retries=2)
+
+        call, = [s for s in await trace_file() if s["name"] == "ollama.generate"]
+        assert call["error"] == "ReadTimeout: slow"
+        assert call["attributes"]["attempts"] == 2
+
+
+class TestDisconnects:
+    """Spans of streams that are abandoned before their first chunk."""
+
+    @pytest.mark.asyncio
+    async def test_cancelled_ollama_stream_ends_its_span(self, trace_file):
+        async def stalled_stream(**kwargs):
+            await asyncio.sleep(60)
+            yield "never"
+
+        async def consume():
+            async for _ in stream_ollama_with_retry(model="llama3", prompt="Hi"):
+                pass
+
+        with patch("app.graph.nodes.utils.stream_ollama", side_effect=stalled_stream):
+            with tracing.span("debate.run", trace_id=tracing.run_trace_id(RUN_ID)):
+                task = asyncio.create_task(consume())
+                await asyncio.sleep(0.01)
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+
+        spans = {s["name"]: s for s in await trace_file()}
+        assert spans["ollama.stream"]["error"].startswith("CancelledError")
+        assert spans["ollama.stream"]["end_time_unix_nano"] is not None
+
+    @pytest.mark.asyncio
+    async def test_relay_span_ends_when_client_leaves_before_first_event(self, trace_file):
+        run_cancelled = asyncio.Event()
+
+        async def stalled_run(run_id, db, emit):
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                run_cancelled.set()
+                raise
+
+        with patch("app.graph.executor.run_debate", side_effect=stalled_run):
+            response = await execute_debate_with_streaming(RUN_ID, AsyncMock())
+            task = asyncio.create_task(response.body_iterator.__anext__())
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        await asyncio.wait_for(run_cancelled.wait(), timeout=1)
+        relay, = [s for s in await trace_file() if s["name"] == "sse.relay"]
+        assert relay["attributes"]["disconnected"] is True
+        assert relay["attributes"]["events"] == 0
+
+
+class TestOtlpExport:
+    """Tests for the OTLP/HTTP JSON encoding."""
+
+    def test_payload_follows_otlp_json_mapping(self):
+        root = tracing.Span("debate.run", "ab" * 16, attributes={"run_id": RUN_ID, "queue_ms": 1.5})
+        child = tracing.Span("opening_a", root.trace_id, root, attributes={"eval_count": 3, "chat": True})
+        child.error = "RuntimeError: boom"
+        child.end_ns = root.end_ns = child.start_ns + 1
+
+        payload = otlp_payload([child, root], "vs-arena-backend")
+
+        resource, = payload["resourceSpans"]
+        assert resource["resource"]["attributes"] == [
+            {"key": "service.name", "value": {"stringValue": "vs-arena-backend"}}
+        ]
+        encoded_child, encoded_root = resource["scopeSpans"][0]["spans"]
+        assert encoded_child["parentSpanId"] == root.span_id
+        assert "parentSpanId" not in encoded_root
+        assert encoded_child["attributes"] == [
+            {"key": "eval_count", "value": {"intValue": "3"}},
+            {"key": "chat", "value": {"boolValue": True}},
+        ]
+        assert encoded_root["attributes"][1] == {"key": "queue_ms", "value": {"doubleValue": 1.5}}
+        assert encoded_child["status"] == {"code": 2, "message": "RuntimeError: boom"}
+        assert encoded_root["startTimeUnixNano"] == str(root.start_ns)
+
+    def test_exporter_posts_to_traces_endpoint(self):
+        span = tracing.Span("debate.run", "ab" * 16)
+        span.end_ns = span.start_ns
+        response = MagicMock()
+
+        with patch("app.core.tracing.httpx.post", return_value=response) as post:
+            tracing.OtlpHttpExporter("http://collector:4318/", "vs-arena-backend")([span])
+
+        assert post.call_args.args[0] == "http://collector:4318/v1/traces"
+        response.raise_for_status.side_effect = httpx.HTTPError("unavailable")
+        with patch("app.core.tracing.httpx.post", return_value=response):
+            tracing.OtlpHttpExporter("http://collector:4318", "vs-arena-backend")([span])
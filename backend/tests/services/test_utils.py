@@ -10,6 +10,7 @@ from app.graph.nodes.utils import (
     get_agent_for_phase,
     parse_json_scores,
     detect_forbidden_phrases,
+    stream_ollama_with_retry,
 )
 
 
@@ -308,3 +309,49 @@ class TestDetectForbiddenPhrases:
 
         # Should match "forbidden" within "unforbidden"
         assert len(result) == 1
+
+
+class TestStreamOllamaWithRetry:
+    """Tests for retrying streamed Ollama calls."""
+
+    @pytest.mark.asyncio
+    async def test_failure_before_first_chunk_is_retried(self):
+        """A connection error before any chunk should be retried."""
+        attempts = []
+
+        async def stream(**kwargs):
+            attempts.append(kwargs)
+            if len(attempts) == 1:
+                raise httpx.ConnectError("refused")
+            yield "Hello"
+
+        with patch("app.graph.nodes.utils.stream_ollama", side_effect=stream), \
+             patch("app.graph.nodes.utils.asyncio.sleep", AsyncMock()):
+            chunks = [chunk async for chunk in stream_ollama_with_retry(model="llama3", prompt="Hi")]
+
+        assert chunks == ["Hello"]
+        assert len(attempts) == 2
+
+    @pytest.mark.asyncio
+    async def test_mid_stream_failure_is_raised_without_retry(self):
+        """A failure after chunks were yielded should not replay the reply or count as a success."""
+        attempts = []
+
+        async def stream(**kwargs):
+            attempts.append(kwargs)
+            yield "Hel"
+            raise httpx.ReadTimeout("stalled")
+
+        chunks = []
+        with patch("app.graph.nodes.utils.stream_ollama", side_effect=stream), \
+             patch("app.graph.nodes.utils.asyncio.sleep", AsyncMock()), \
+             patch("app.graph.nodes.utils.observe_ollama_call") as observe, \
+             patch("app.graph.nodes.utils.residency.record_call") as record_call:
+            with pytest.raises(httpx.ReadTimeout):
+                async for chunk in stream_ollama_with_retry(model="llama3", prompt="Hi"):
+                    chunks.append(chunk)
+
+        assert chunks == ["Hel"]
+        assert len(attempts) == 1
+        observe.assert_not_called()
+        record_call.assert_not_called()
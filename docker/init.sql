@@ -32,11 +32,16 @@ CREATE TABLE runs (
   result_json JSONB,
   status VARCHAR(20) NOT NULL DEFAULT 'pending',
   created_at TIMESTAMP DEFAULT NOW(),
-  finished_at TIMESTAMP
+  finished_at TIMESTAMP,
+  swap_of_run_id UUID REFERENCES runs(run_id) ON DELETE SET NULL
 );
 
-CREATE INDEX idx_runs_status ON runs(status);
 CREATE INDEX idx_runs_created_at ON runs(created_at DESC);
+CREATE INDEX idx_runs_active ON runs(created_at DESC) WHERE status IN ('pending', 'running');
+CREATE INDEX idx_runs_agent_a_id ON runs(agent_a_id);
+CREATE INDEX idx_runs_agent_b_id ON runs(agent_b_id);
+CREATE INDEX idx_runs_agent_j_id ON runs(agent_j_id);
+CREATE INDEX idx_runs_swap_of_run_id ON runs(swap_of_run_id) WHERE swap_of_run_id IS NOT NULL;
 
 -- Turns Table
 CREATE TABLE turns (
@@ -51,9 +56,20 @@ CREATE TABLE turns (
   created_at TIMESTAMP DEFAULT NOW()
 );
 
-CREATE INDEX idx_turns_run_id ON turns(run_id);
-CREATE INDEX idx_turns_phase ON turns(phase);
-CREATE INDEX idx_turns_created_at ON turns(created_at);
+CREATE INDEX idx_turns_run_id_created_at ON turns(run_id, created_at);
+
+-- Agent Ratings Table (Elo leaderboard)
+CREATE TABLE agent_ratings (
+  agent_id UUID PRIMARY KEY REFERENCES agents(agent_id) ON DELETE CASCADE,
+  rating DOUBLE PRECISION NOT NULL,
+  games INTEGER NOT NULL DEFAULT 0,
+  wins INTEGER NOT NULL DEFAULT 0,
+  losses INTEGER NOT NULL DEFAULT 0,
+  draws INTEGER NOT NULL DEFAULT 0,
+  updated_at TIMESTAMP DEFAULT NOW()
+);
+
+CREATE INDEX idx_agent_ratings_rating ON agent_ratings(rating DESC, agent_id);
 
 -- Update updated_at trigger for agents
 CREATE OR REPLACE FUNCTION update_updated_at_column()
@@ -218,6 +218,28 @@ export function useDebateFlow({ run, onLayoutChange }: UseDebateFlowOptions) {
     [setNodes]
   );
 
+  // Handle turn reset - discard a regenerated turn's streamed content
+  const handleTurnReset = useCallback(
+    (phase: DebatePhase) => {
+      if (currentPhaseRef.current === phase) {
+        tokenBufferRef.current = "";
+        if (rafIdRef.current) {
+          cancelAnimationFrame(rafIdRef.current);
+          rafIdRef.current = null;
+        }
+      }
+
+      setNodes((nds) =>
+        nds.map((node) =>
+          node.id === phase
+            ? { ...node, data: { ...node.data, content: "" } }
+            : node
+        ) as DebateFlowNode[]
+      );
+    },
+    [setNodes]
+  );
+
   // Handle phase end - mark node complete
   const handlePhaseEnd = useCallback(
     (phase: DebatePhase) => {
@@ -405,6 +427,13 @@ export function useDebateFlow({ run, onLayoutChange }: UseDebateFlowOptions) {
               } catch (e) {
                 console.error("Failed to parse token data:", e);
               }
+            } else if (eventType === "turn_reset") {
+              try {
+                const data = JSON.parse(eventData);
+                handleTurnReset(data.phase as DebatePhase);
+              } catch (e) {
+                console.error("Failed to parse turn_reset data:", e);
+              }
             } else if (eventType === "phase_end") {
               try {
                 const data = JSON.parse(eventData);
@@ -502,7 +531,7 @@ export function useDebateFlow({ run, onLayoutChange }: UseDebateFlowOptions) {
         }
       }
     },
-    [handlePhaseStart, handleToken, handlePhaseEnd, handleScore, handleVerdict, resetConnectionTimeout, attemptReconnect]
+    [handlePhaseStart, handleToken, handleTurnReset, handlePhaseEnd, handleScore, handleVerdict, resetConnectionTimeout, attemptReconnect]
   );
 
   // Sync ref to break circular dependency with attemptReconnect
@@ -42,6 +42,8 @@ export function useDebateStream() {
   const currentRunIdRef = useRef<string | null>(null);
   const connectionTimeoutRef = useRef<NodeJS.Timeout | null>(null);
   const lastPhaseRef = useRef<DebatePhase | null>(null);
+  // Length of content before the current phase's tokens (for turn_reset)
+  const phaseContentStartRef = useRef(0);
 
   // Refs to avoid stale closures in timeout/reconnect callbacks
   const isStreamingRef = useRef(false);
@@ -231,11 +233,11 @@ export function useDebateStream() {
               const data = JSON.parse(eventData);
               const phase = data.phase as DebatePhase;
               lastPhaseRef.current = phase;
-              setState((prev) => ({
-                ...prev,
-                currentPhase: phase,
-                content: prev.content + `\n\n=== ${data.phase} ===\n`,
-              }));
+              setState((prev) => {
+                const content = prev.content + `\n\n=== ${data.phase} ===\n`;
+                phaseContentStartRef.current = content.length;
+                return { ...prev, currentPhase: phase, content };
+              });
             } catch (e) {
               console.error("Failed to parse phase_start data:", e);
             }
@@ -249,6 +251,12 @@ export function useDebateStream() {
             } catch (e) {
               console.error("Failed to parse token data:", e);
             }
+          } else if (eventType === "turn_reset") {
+            // The streamed attempt was discarded and is being regenerated
+            setState((prev) => ({
+              ...prev,
+              content: prev.content.slice(0, phaseContentStartRef.current),
+            }));
           } else if (eventType === "phase_end") {
             try {
               const data = JSON.parse(eventData);